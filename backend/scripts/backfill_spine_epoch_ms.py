@@ -0,0 +1,145 @@
+"""One-time backfill: add epoch-millisecond fields to existing spine documents.
+
+Spine documents now carry `ts_ms` (events, correlation rows, status
+history) and `last_updated_ms` (segment state) next to their ISO
+timestamps, and SpineRepository range filters / ORDER BY use the numeric
+fields. Rows written before that change have no numeric field and are
+invisible to those queries until this script patches them.
+
+Each missing field is added with a single-path patch (cheaper than a full
+replace). Re-running is safe: only documents still lacking the field are
+touched. Documents still within TTL are all that matter, so the script can
+be skipped entirely if deploying more than 30 days after the change.
+
+Prerequisites:
+  - Run `az login` first (uses DefaultAzureCredential)
+  - Set COSMOS_ENDPOINT environment variable
+  - Run right AFTER deploying the backend that writes the numeric fields
+
+Usage:
+  python3 backend/scripts/backfill_spine_epoch_ms.py [--dry-run]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+from datetime import UTC, datetime
+
+from azure.cosmos.aio import ContainerProxy, CosmosClient
+from azure.cosmos.exceptions import CosmosResourceNotFoundError
+from azure.identity.aio import DefaultAzureCredential
+
+logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+DATABASE_NAME = "second-brain"
+CONCURRENCY = 16
+
+# (container, partition key field, ISO source field, numeric target field)
+BACKFILLS: list[tuple[str, str, str, str]] = [
+    ("spine_events", "segment_id", "timestamp", "ts_ms"),
+    ("spine_correlation", "correlation_kind", "timestamp", "ts_ms"),
+    ("spine_status_history", "segment_id", "timestamp", "ts_ms"),
+    ("spine_segment_state", "segment_id", "last_updated", "last_updated_ms"),
+]
+
+
+def _epoch_ms(iso: str) -> int:
+    dt = datetime.fromisoformat(iso.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return int(dt.timestamp() * 1000)
+
+
+async def backfill_container(
+    container: ContainerProxy,
+    pk_field: str,
+    source: str,
+    target: str,
+    dry_run: bool,
+) -> int:
+    """Patch every document lacking `target`; returns the number patched."""
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    patched = 0
+
+    async def _patch(doc: dict) -> None:
+        nonlocal patched
+        async with semaphore:
+            try:
+                await container.patch_item(
+                    item=doc["id"],
+                    partition_key=doc[pk_field],
+                    patch_operations=[
+                        {
+                            "op": "add",
+                            "path": f"/{target}",
+                            "value": _epoch_ms(doc[source]),
+                        }
+                    ],
+                )
+                patched += 1
+            except CosmosResourceNotFoundError:
+                pass  # expired by TTL since the query ran
+
+    pending: list[asyncio.Task] = []
+    async for doc in container.query_items(
+        query=(
+            f"SELECT c.id, c.{pk_field}, c.{source} FROM c"
+            f" WHERE NOT IS_DEFINED(c.{target}) AND IS_DEFINED(c.{source})"
+        ),
+    ):
+        if dry_run:
+            patched += 1
+            continue
+        pending.append(asyncio.create_task(_patch(doc)))
+        if len(pending) >= CONCURRENCY * 8:
+            await asyncio.gather(*pending)
+            pending = []
+    await asyncio.gather(*pending)
+    return patched
+
+
+async def backfill(dry_run: bool) -> None:
+    """Backfill numeric timestamp fields across the spine containers."""
+    endpoint = os.environ.get("COSMOS_ENDPOINT")
+    if not endpoint:
+        logger.error("COSMOS_ENDPOINT environment variable is not set")
+        sys.exit(1)
+
+    credential = DefaultAzureCredential()
+    client = CosmosClient(url=endpoint, credential=credential)
+    try:
+        database = client.get_database_client(DATABASE_NAME)
+        for name, pk_field, source, target in BACKFILLS:
+            count = await backfill_container(
+                database.get_container_client(name),
+                pk_field,
+                source,
+                target,
+                dry_run,
+            )
+            logger.info(
+                "%s: %s %d documents (%s)",
+                name,
+                "would patch" if dry_run else "patched",
+                count,
+                target,
+            )
+    finally:
+        await client.close()
+        await credential.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--dry-run", action="store_true", help="count documents without patching"
+    )
+    args = parser.parse_args()
+    asyncio.run(backfill(args.dry_run))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Benchmark: GET /api/errands latency against a simulated Cosmos account.
+
+Every query_items call on the fake containers sleeps --latency-ms before
+yielding its rows (one round trip per query, the shape of a small
+single-partition read). Compares:
+
+  - sequential: the previous listing flow -- Destinations read, one
+    awaited query per destination partition plus 'unrouted', then two
+    separate Inbox queries
+  - current: the real endpoint (routing cache, bounded-concurrency
+    partition fan-out, one merged Inbox query), driven in-process through
+    httpx.ASGITransport
+
+Usage:
+  python3 backend/scripts/bench_errands_listing.py [--destinations 50]
+      [--latency-ms 8] [--requests 20]
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+from fastapi import FastAPI
+
+from second_brain.api.errands import router as errands_router
+
+
+class _Container:
+    def __init__(self, latency: float, rows_for) -> None:
+        self._latency = latency
+        self._rows_for = rows_for
+        self.queries = 0
+
+    async def _iter(self, kwargs: dict):
+        self.queries += 1
+        await asyncio.sleep(self._latency)
+        for row in self._rows_for(kwargs):
+            yield row
+
+    def query_items(self, **kwargs):
+        return self._iter(kwargs)
+
+
+class _Manager:
+    def __init__(self, destinations: int, latency: float) -> None:
+        self.slugs = [f"store_{i}" for i in range(destinations)]
+        docs = [
+            {"id": f"d{i}", "userId": "will", "slug": s, "displayName": s.title()}
+            for i, s in enumerate(self.slugs)
+        ]
+        items = {
+            slug: [
+                {"id": f"{slug}-{n}", "name": f"item {n}", "destination": slug}
+                for n in range(i % 4)
+            ]
+            for i, slug in enumerate([*self.slugs, "unrouted"])
+        }
+        self.containers = {
+            "Destinations": _Container(latency, lambda kw: docs),
+            "Errands": _Container(
+                latency, lambda kw: items.get(kw.get("partition_key"), [])
+            ),
+            "Inbox": _Container(latency, lambda kw: []),
+        }
+
+    def get_container(self, name: str) -> _Container:
+        return self.containers[name]
+
+
+async def _sequential(manager: _Manager) -> int:
+    """The pre-fan-out listing flow, query for query."""
+    total = 0
+    destinations = [
+        d async for d in manager.get_container("Destinations").query_items(query="")
+    ]
+    errands = manager.get_container("Errands")
+    for slug in [*(d["slug"] for d in destinations), "unrouted"]:
+        total += len(
+            [i async for i in errands.query_items(query="", partition_key=slug)]
+        )
+    inbox = manager.get_container("Inbox")
+    for _ in range(2):  # unprocessed Admin items, then notifications
+        [i async for i in inbox.query_items(query="", partition_key="will")]
+    return total
+
+
+async def _current(client: httpx.AsyncClient) -> int:
+    response = await client.get("/api/errands")
+    response.raise_for_status()
+    return response.json()["totalCount"]
+
+
+async def _run(destinations: int, latency: float, requests: int) -> None:
+    manager = _Manager(destinations, latency)
+    app = FastAPI()
+    app.include_router(errands_router)
+    app.state.cosmos_manager = manager
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        expected = await _sequential(manager)
+    sequential = (time.perf_counter() - start) / requests
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://b") as client:
+        assert await _current(client) == expected  # also warms the routing cache
+        for container in manager.containers.values():
+            container.queries = 0
+        start = time.perf_counter()
+        for _ in range(requests):
+            assert await _current(client) == expected
+        current = (time.perf_counter() - start) / requests
+
+    queries = sum(c.queries for c in manager.containers.values()) / requests
+    print(f"destinations: {destinations}  latency: {latency * 1000:.0f} ms/query")
+    print(
+        f"sequential: {sequential * 1000:7.1f} ms/request  ({destinations + 4} queries)"
+    )
+    print(f"current:    {current * 1000:7.1f} ms/request  ({queries:.0f} queries)")
+    print(f"speedup:    {sequential / current:.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--destinations", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=8.0)
+    parser.add_argument("--requests", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(_run(args.destinations, args.latency_ms / 1000, args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Microbenchmark: per-request overhead of the API key + spine middlewares.
+
+Compares three stacks on the same trivial FastAPI route, driven in-process
+through httpx.ASGITransport (no sockets, so middleware cost dominates):
+
+  - bare:   no middleware
+  - legacy: BaseHTTPMiddleware versions of APIKeyMiddleware and
+            SpineWorkloadMiddleware (the shape they had before the rewrite)
+  - asgi:   the current raw ASGI middlewares
+
+The spine repo is a no-op stub so only middleware overhead is measured.
+
+Usage:
+  python3 backend/scripts/bench_middleware.py [--requests 5000]
+"""
+
+import argparse
+import asyncio
+import hmac
+import time
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from second_brain.auth import APIKeyMiddleware
+from second_brain.spine.middleware import SpineWorkloadMiddleware
+
+API_KEY = "bench-key"
+
+
+class _NoopRepo:
+    async def record_event(self, event) -> None:
+        return None
+
+
+class _LegacyAuth(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        auth = request.headers.get("authorization", "")
+        key = request.app.state.api_key
+        if not auth.startswith("Bearer ") or not hmac.compare_digest(auth[7:], key):
+            return JSONResponse(status_code=401, content={"detail": "no"})
+        return await call_next(request)
+
+
+class _LegacySpine(BaseHTTPMiddleware):
+    def __init__(self, app, repo) -> None:
+        super().__init__(app)
+        self._asgi = SpineWorkloadMiddleware(app, repo=repo)
+
+    async def dispatch(self, request, call_next):
+        start = time.perf_counter()
+        response = await call_next(request)
+        outcome = "success" if response.status_code < 500 else "failure"
+        duration_ms = int((time.perf_counter() - start) * 1000)
+        await self._asgi._record(request, outcome, duration_ms, None)
+        return response
+
+
+def _app(stack: str) -> FastAPI:
+    app = FastAPI()
+    app.state.api_key = API_KEY
+
+    @app.get("/ping")
+    async def ping() -> dict:
+        return {"ok": True}
+
+    repo = _NoopRepo()
+    if stack == "legacy":
+        app.add_middleware(_LegacySpine, repo=repo)
+        app.add_middleware(_LegacyAuth)
+    elif stack == "asgi":
+        app.add_middleware(SpineWorkloadMiddleware, repo=repo)
+        app.add_middleware(APIKeyMiddleware)
+    return app
+
+
+async def _run(stack: str, requests: int) -> float:
+    transport = httpx.ASGITransport(app=_app(stack))
+    headers = {"Authorization": f"Bearer {API_KEY}"}
+    async with httpx.AsyncClient(transport=transport, base_url="http://b") as c:
+        for _ in range(200):  # warm up
+            await c.get("/ping", headers=headers)
+        start = time.perf_counter()
+        for _ in range(requests):
+            await c.get("/ping", headers=headers)
+        return (time.perf_counter() - start) / requests * 1e6
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    results = {s: await _run(s, args.requests) for s in ("bare", "legacy", "asgi")}
+    for stack, us in results.items():
+        print(f"{stack:>6}: {us:8.1f} us/request")
+    legacy = results["legacy"] - results["bare"]
+    asgi = results["asgi"] - results["bare"]
+    print(f"middleware overhead: legacy {legacy:.1f} us, asgi {asgi:.1f} us")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,187 @@
+"""Benchmark: legacy vs. compact (v2) spine_events documents.
+
+Offline, on synthetic rows with the production event mix:
+
+  - bytes per stored event (document JSON plus Cosmos system properties)
+  - indexed terms per event (leaf values under the default index-everything
+    policy), which with size drives the RU charge of a write
+  - encode + decode time per event
+
+With --live it also creates --rows events of each shape in a scratch
+partition (segment_id "bench_encoding") of spine_events, reports the mean
+x-ms-request-charge per create, and deletes them again.
+
+Prerequisites for --live:
+  - Run `az login` first (uses DefaultAzureCredential)
+  - Set COSMOS_ENDPOINT environment variable
+
+Usage:
+  python3 backend/scripts/bench_spine_encoding.py [--rows 5000] [--live]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from datetime import UTC, datetime, timedelta
+
+from second_brain.spine.encoding import decode_event, encode_event
+from second_brain.spine.models import IngestEvent
+from second_brain.spine.storage import build_event_documents
+
+DATABASE_NAME = "second-brain"
+BENCH_SEGMENT = "bench_encoding"
+
+OPERATIONS = [
+    "POST /api/capture",
+    "GET /api/inbox",
+    "classify_text",
+    "process_capture",
+    "fetch_recipe:tier1",
+]
+
+# Cosmos adds these to every stored document.
+_SYSTEM_FIELDS = {
+    "_rid": "AbCdEfGhIjKBAAAAAAAAAA==",
+    "_self": "dbs/AbCdEf==/colls/AbCdEfGh=/docs/AbCdEfGhIjKBAAAAAAAAAA==/",
+    "_etag": '"0000a1b2-0000-0800-0000-66f0c0de0000"',
+    "_attachments": "attachments/",
+    "_ts": 1776168000,
+}
+
+
+def _event(i: int, ts: datetime, segment_id: str) -> IngestEvent:
+    if i % 20 == 0:
+        body = {"event_type": "liveness", "payload": {"instance_id": "replica-0"}}
+    elif i % 20 == 1:
+        body = {
+            "event_type": "readiness",
+            "payload": {
+                "checks": [
+                    {"name": "cosmos", "status": "ok"},
+                    {"name": "foundry", "status": "ok"},
+                ]
+            },
+        }
+    else:
+        failed = random.random() < 0.05
+        body = {
+            "event_type": "workload",
+            "payload": {
+                "operation": random.choice(OPERATIONS),
+                "outcome": "failure" if failed else "success",
+                "duration_ms": random.randint(5, 900),
+                "correlation_kind": "capture" if i % 3 else None,
+                "correlation_id": f"trace-{i:012d}" if i % 3 else None,
+                "error_class": "HTTP_500" if failed else None,
+            },
+        }
+    return IngestEvent.model_validate(
+        {**body, "segment_id": segment_id, "timestamp": ts.isoformat()}
+    )
+
+
+def _indexed_terms(value: object) -> int:
+    if isinstance(value, dict):
+        return sum(_indexed_terms(v) for k, v in value.items() if k != "id")
+    if isinstance(value, list):
+        return sum(_indexed_terms(v) for v in value)
+    return 1
+
+
+def _stored_bytes(doc: dict) -> int:
+    return len(json.dumps({**doc, **_SYSTEM_FIELDS}, separators=(",", ":")))
+
+
+def _time(fn, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+async def _live_charges(bodies: list[dict]) -> float:
+    from azure.cosmos.aio import CosmosClient
+    from azure.identity.aio import DefaultAzureCredential
+
+    endpoint = os.environ.get("COSMOS_ENDPOINT")
+    if not endpoint:
+        sys.exit("COSMOS_ENDPOINT environment variable is not set")
+    charges: list[float] = []
+
+    def _hook(headers: dict, _: object) -> None:
+        charges.append(float(headers["x-ms-request-charge"]))
+
+    credential = DefaultAzureCredential()
+    async with CosmosClient(url=endpoint, credential=credential) as client:
+        container = client.get_database_client(DATABASE_NAME).get_container_client(
+            "spine_events"
+        )
+        try:
+            for body in bodies:
+                await container.create_item(body=body, response_hook=_hook)
+        finally:
+            for body in bodies:
+                await container.delete_item(
+                    item=body["id"], partition_key=BENCH_SEGMENT
+                )
+    await credential.close()
+    return sum(charges) / len(charges)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--live", action="store_true")
+    args = parser.parse_args()
+
+    base = datetime.now(UTC) - timedelta(minutes=5)
+    legacy = [
+        build_event_documents(
+            _event(i, base + timedelta(milliseconds=i * 50), BENCH_SEGMENT)
+        )[0]
+        for i in range(args.rows)
+    ]
+    operation_ids = {op: i for i, op in enumerate(OPERATIONS)}
+    operation_names = {i: op for op, i in operation_ids.items()}
+    compact = [encode_event(body, operation_ids) for body in legacy]
+    assert all(
+        decode_event(c, operation_names)["payload"] == b["payload"]
+        for c, b in zip(compact, legacy, strict=True)
+    )
+
+    def _mean(docs: list[dict], measure) -> float:
+        return sum(measure(d) for d in docs) / len(docs)
+
+    old_bytes, new_bytes = _mean(legacy, _stored_bytes), _mean(compact, _stored_bytes)
+    print(f"events: {args.rows}")
+    print(
+        f"bytes/event: legacy {old_bytes:.0f}  compact {new_bytes:.0f}"
+        f"  ({1 - new_bytes / old_bytes:.0%} smaller)"
+    )
+    print(
+        f"indexed terms/event: legacy {_mean(legacy, _indexed_terms):.1f}"
+        f"  compact {_mean(compact, _indexed_terms):.1f}"
+    )
+    t_encode = _time(lambda: [encode_event(b, operation_ids) for b in legacy])
+    t_decode = _time(lambda: [decode_event(c, operation_names) for c in compact])
+    print(
+        f"encode {t_encode / args.rows * 1e6:.2f} us/event"
+        f"  decode {t_decode / args.rows * 1e6:.2f} us/event"
+    )
+    if args.live:
+        old_ru = asyncio.run(_live_charges(legacy))
+        new_ru = asyncio.run(_live_charges(compact))
+        print(
+            f"RU/write: legacy {old_ru:.2f}  compact {new_ru:.2f}"
+            f"  ({1 - new_ru / old_ru:.0%} lower)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""Offline benchmark: full spine_events rows vs. projected epoch-ms rows.
+
+Compares what the evaluator reads per sweep before and after the switch to
+`ts_ms` + EVALUATOR_FIELDS projection, on synthetic rows:
+
+  - bytes per row on the wire (JSON size of the returned document)
+  - client time to decode the page and find the newest row
+    (ISO parse per row vs. an integer max and one conversion)
+
+Offline mode measures payload size and client decode time only; it says
+nothing about RU. With --live it also creates --rows events in a scratch
+partition (segment_id "bench_queries") of spine_events, runs both query
+shapes over them (the old `SELECT *` with an ISO `timestamp` range, the new
+EVALUATOR_FIELDS projection with a `ts_ms` range), reports the summed
+x-ms-request-charge of each across all pages, and deletes the rows again.
+
+Prerequisites for --live:
+  - Run `az login` first (uses DefaultAzureCredential)
+  - Set COSMOS_ENDPOINT environment variable
+
+Usage:
+  python3 backend/scripts/bench_spine_queries.py [--rows 5000] [--repeat 20]
+      [--live]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from datetime import UTC, datetime, timedelta
+
+from second_brain.spine.models import (
+    epoch_ms,
+    from_epoch_ms,
+    parse_cosmos_ts,
+    row_epoch_ms,
+)
+from second_brain.spine.storage import EVALUATOR_FIELDS
+
+DATABASE_NAME = "second-brain"
+BENCH_SEGMENT = "bench_queries"
+
+OLD_QUERY = "SELECT * FROM c WHERE c.segment_id = @sid AND c.timestamp >= @cutoff"
+NEW_QUERY = (
+    f"SELECT {EVALUATOR_FIELDS} FROM c WHERE c.segment_id = @sid AND c.ts_ms >= @cutoff"
+)
+
+
+def _full_row(i: int, ts: datetime) -> dict:
+    return {
+        "id": f"{i:032x}",
+        "segment_id": "backend_api",
+        "event_type": "workload",
+        "timestamp": ts.isoformat(),
+        "ts_ms": epoch_ms(ts),
+        "ttl": 2592000,
+        "payload": {
+            "operation": "GET /api/inbox",
+            "outcome": random.choice(["success"] * 9 + ["failure"]),
+            "duration_ms": random.randint(5, 900),
+            "correlation_kind": "request",
+            "correlation_id": f"req-{i:012d}",
+            "error_class": None,
+            "sample_weight": 1,
+        },
+        "_rid": "AbCdEfGhIjKBAAAAAAAAAA==",
+        "_self": "dbs/AbCdEf==/colls/AbCdEfGh=/docs/AbCdEfGhIjKBAAAAAAAAAA==/",
+        "_etag": '"0000a1b2-0000-0800-0000-66f0c0de0000"',
+        "_attachments": "attachments/",
+        "_ts": int(ts.timestamp()),
+    }
+
+
+def _projected(row: dict) -> dict:
+    p = row["payload"]
+    return {
+        "id": row["id"],
+        "segment_id": row["segment_id"],
+        "event_type": row["event_type"],
+        "timestamp": row["timestamp"],
+        "ts_ms": row["ts_ms"],
+        "payload": {
+            "outcome": p["outcome"],
+            "operation": p["operation"],
+            "duration_ms": p["duration_ms"],
+            "sample_weight": p["sample_weight"],
+        },
+    }
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+async def _live_charges(rows: list[dict], cutoff: datetime) -> tuple[float, float]:
+    """Summed RU of the old and new query over `rows` in a scratch partition."""
+    from azure.cosmos.aio import CosmosClient
+    from azure.identity.aio import DefaultAzureCredential
+
+    endpoint = os.environ.get("COSMOS_ENDPOINT")
+    if not endpoint:
+        sys.exit("COSMOS_ENDPOINT environment variable is not set")
+    bodies = [
+        {
+            **{k: v for k, v in row.items() if not k.startswith("_")},
+            "segment_id": BENCH_SEGMENT,
+        }
+        for row in rows
+    ]
+
+    async def _charge(container, query: str, cutoff_value: object) -> float:
+        charges: list[float] = []
+
+        def _hook(headers: dict, _: object) -> None:
+            charges.append(float(headers["x-ms-request-charge"]))
+
+        async for _ in container.query_items(
+            query=query,
+            parameters=[
+                {"name": "@sid", "value": BENCH_SEGMENT},
+                {"name": "@cutoff", "value": cutoff_value},
+            ],
+            partition_key=BENCH_SEGMENT,
+            response_hook=_hook,
+        ):
+            pass
+        return sum(charges)
+
+    credential = DefaultAzureCredential()
+    async with CosmosClient(url=endpoint, credential=credential) as client:
+        container = client.get_database_client(DATABASE_NAME).get_container_client(
+            "spine_events"
+        )
+        try:
+            for body in bodies:
+                await container.create_item(body=body)
+            old_ru = await _charge(container, OLD_QUERY, cutoff.isoformat())
+            new_ru = await _charge(container, NEW_QUERY, epoch_ms(cutoff))
+        finally:
+            for body in bodies:
+                await container.delete_item(
+                    item=body["id"], partition_key=BENCH_SEGMENT
+                )
+    await credential.close()
+    return old_ru, new_ru
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--live", action="store_true")
+    args = parser.parse_args()
+
+    base = datetime.now(UTC) - timedelta(minutes=5)
+    full = [
+        _full_row(i, base + timedelta(milliseconds=i * 50)) for i in range(args.rows)
+    ]
+    full_page = json.dumps(full)
+    slim_page = json.dumps([_projected(r) for r in full])
+
+    def old() -> datetime:
+        rows = json.loads(full_page)
+        return max(parse_cosmos_ts(r["timestamp"]) for r in rows)
+
+    def new() -> datetime:
+        rows = json.loads(slim_page)
+        return from_epoch_ms(max(row_epoch_ms(r) for r in rows))
+
+    assert epoch_ms(old()) == epoch_ms(new())
+    t_old, t_new = _time(old, args.repeat), _time(new, args.repeat)
+    print(f"rows: {args.rows}")
+    print(
+        f"bytes/row: full {len(full_page) / args.rows:.0f}"
+        f"  projected {len(slim_page) / args.rows:.0f}"
+        f"  ({1 - len(slim_page) / len(full_page):.0%} smaller)"
+    )
+    print(
+        f"decode + newest: full/ISO {t_old * 1000:.2f} ms"
+        f"  projected/ts_ms {t_new * 1000:.2f} ms  ({t_old / t_new:.1f}x)"
+    )
+    if args.live:
+        old_ru, new_ru = asyncio.run(_live_charges(full, base))
+        print(
+            f"RU/query: full/ISO {old_ru:.2f}  projected/ts_ms {new_ru:.2f}"
+            f"  ({1 - new_ru / old_ru:.0%} lower)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,7 @@ from fastapi import APIRouter, HTTPException, Query, Request, Response
 from pydantic import BaseModel, Field
 
 from second_brain.config import get_settings
+from second_brain.db.snapshots import content_etag, etag_matches, list_snapshots
 from second_brain.models.documents import (
     AffinityRuleDocument,
     FeedbackDocument,
@@ -25,6 +26,7 @@ from second_brain.processing.admin_handoff import (
     process_admin_capture,
     process_admin_captures_batch,
 )
+from second_brain.tools.routing_cache import routing_cache
 
 logger = logging.getLogger(__name__)
 
@@ -75,13 +77,79 @@ class RouteItemBody(BaseModel):
     saveRule: bool = True  # noqa: N815
 
 
+# Errand listing fans out one single-partition query per destination; at
+# most this many run at once so a large destination list cannot flood the
+# Cosmos client's connection pool.
+PARTITION_CONCURRENCY = 8
+
+_ERRAND_FIELDS = (
+    "SELECT c.id, c.name, c.destination, c.needsRouting, c.sourceName, "
+    "c.sourceUrl FROM c"
+)
+
+# One Inbox query serves both side channels of GET /api/errands: Admin items
+# still waiting for the Admin Agent, and completed items whose agent
+# response is a notification for the user. Rows are split in Python.
+_ADMIN_INBOX_QUERY = (
+    "SELECT c.id, c.rawText, c.captureTraceId, c.adminProcessingStatus, "
+    "c.adminAgentResponse FROM c "
+    "WHERE c.userId = @userId "
+    "AND ((c.classificationMeta.bucket = 'Admin' "
+    "      AND (NOT IS_DEFINED(c.adminProcessingStatus) "
+    "           OR IS_NULL(c.adminProcessingStatus) "
+    "           OR c.adminProcessingStatus = 'failed' "
+    "           OR c.adminProcessingStatus = 'pending')) "
+    "  OR (c.adminProcessingStatus = 'completed' "
+    "      AND IS_DEFINED(c.adminAgentResponse) "
+    "      AND NOT IS_NULL(c.adminAgentResponse)))"
+)
+
+
+async def _list_partition(container, slug: str, limit: asyncio.Semaphore) -> list[dict]:
+    async with limit:
+        return [
+            item
+            async for item in container.query_items(
+                query=_ERRAND_FIELDS,
+                partition_key=slug,
+            )
+        ]
+
+
+async def _list_admin_inbox(cosmos_manager) -> list[dict] | None:
+    """Rows of the merged admin Inbox query, or None if it failed."""
+    try:
+        inbox_container = cosmos_manager.get_container("Inbox")
+        return [
+            item
+            async for item in inbox_container.query_items(
+                query=_ADMIN_INBOX_QUERY,
+                parameters=[{"name": "@userId", "value": "will"}],
+                partition_key="will",
+            )
+        ]
+    except Exception:
+        logger.warning("Failed to query admin inbox items", exc_info=True)
+        return None
+
+
+def _is_notification(row: dict) -> bool:
+    return (
+        row.get("adminProcessingStatus") == "completed"
+        and row.get("adminAgentResponse") is not None
+    )
+
+
 @router.get("/api/errands", response_model=ErrandsResponse)
-async def get_errands(request: Request) -> ErrandsResponse:
+async def get_errands(request: Request, response: Response) -> ErrandsResponse:
     """List all errand items grouped by destination.
 
-    Queries destinations dynamically from the Destinations container, then
-    fetches errand items per destination partition. Returns sections sorted
-    by item count descending (most items first). Empty destinations are
+    Served from the in-memory listing snapshot (weak ETag, 304 on
+    If-None-Match) while it is valid. Otherwise destinations come from the
+    shared routing cache, and every destination partition plus 'unrouted'
+    is read concurrently (at most PARTITION_CONCURRENCY at a time),
+    alongside the single admin Inbox query. Returns sections sorted by
+    item count descending (most items first). Empty destinations are
     excluded from the response. Unrouted items appear as a special section.
     """
     cosmos_manager = getattr(request.app.state, "cosmos_manager", None)
@@ -91,57 +159,59 @@ async def get_errands(request: Request) -> ErrandsResponse:
             detail="Cosmos DB not configured. Errands unavailable.",
         )
 
-    container = cosmos_manager.get_container("Errands")
+    snapshots = list_snapshots(cosmos_manager)
+    if_none_match = request.headers.get("if-none-match")
+    cached = snapshots.get("errands")
+    if cached is not None:
+        if etag_matches(if_none_match, cached.etag):
+            return Response(status_code=304, headers={"ETag": cached.etag})
+        response.headers["ETag"] = cached.etag
+        return cached.value
+    generation = snapshots.generation("errands")
 
-    # Load destinations dynamically from Cosmos
-    dest_container = cosmos_manager.get_container("Destinations")
-    destinations: list[dict] = []
-    async for doc in dest_container.query_items(
-        query="SELECT * FROM c",
-        partition_key="will",
-    ):
-        destinations.append(doc)
+    container = cosmos_manager.get_container("Errands")
+    destinations = await routing_cache(cosmos_manager).get("Destinations")
+
+    limit = asyncio.Semaphore(PARTITION_CONCURRENCY)
+    slugs = [dest["slug"] for dest in destinations]
+    *partitions, admin_rows = await asyncio.gather(
+        *(_list_partition(container, slug, limit) for slug in slugs),
+        _list_partition(container, "unrouted", limit),
+        _list_admin_inbox(cosmos_manager),
+    )
+    unrouted_docs = partitions.pop()
 
     sections: list[DestinationSection] = []
     total_count = 0
 
-    for dest in destinations:
+    for dest, docs in zip(destinations, partitions, strict=True):
         slug = dest["slug"]
-        items: list[ErrandItemResponse] = []
-        async for item in container.query_items(
-            query="SELECT * FROM c",
-            partition_key=slug,
-        ):
-            items.append(
-                ErrandItemResponse(
-                    id=item["id"],
-                    name=item["name"],
-                    destination=item.get("destination", slug),
-                    needsRouting=item.get("needsRouting", False),
-                    sourceName=item.get("sourceName"),
-                    sourceUrl=item.get("sourceUrl"),
-                )
+        if not docs:
+            continue
+        items = [
+            ErrandItemResponse(
+                id=item["id"],
+                name=item["name"],
+                destination=item.get("destination", slug),
+                needsRouting=item.get("needsRouting", False),
+                sourceName=item.get("sourceName"),
+                sourceUrl=item.get("sourceUrl"),
             )
-
-        if items:
-            sections.append(
-                DestinationSection(
-                    destination=slug,
-                    displayName=dest["displayName"],
-                    type=dest.get("type", "physical"),
-                    items=items,
-                    count=len(items),
-                )
+            for item in docs
+        ]
+        sections.append(
+            DestinationSection(
+                destination=slug,
+                displayName=dest["displayName"],
+                type=dest.get("type", "physical"),
+                items=items,
+                count=len(items),
             )
-            total_count += len(items)
+        )
+        total_count += len(items)
 
-    # Check for unrouted items
-    unrouted_items: list[ErrandItemResponse] = []
-    async for item in container.query_items(
-        query="SELECT * FROM c",
-        partition_key="unrouted",
-    ):
-        unrouted_items.append(
+    if unrouted_docs:
+        unrouted_items = [
             ErrandItemResponse(
                 id=item["id"],
                 name=item["name"],
@@ -150,9 +220,8 @@ async def get_errands(request: Request) -> ErrandsResponse:
                 sourceName=item.get("sourceName"),
                 sourceUrl=item.get("sourceUrl"),
             )
-        )
-
-    if unrouted_items:
+            for item in unrouted_docs
+        ]
         sections.append(
             DestinationSection(
                 destination="unrouted",
@@ -167,33 +236,18 @@ async def get_errands(request: Request) -> ErrandsResponse:
     # Sort by item count descending (most items first)
     sections.sort(key=lambda s: s.count, reverse=True)
 
+    notifications = [
+        AdminNotification(inboxItemId=row["id"], message=row["adminAgentResponse"])
+        for row in admin_rows or []
+        if _is_notification(row)
+    ]
+    unprocessed = [row for row in admin_rows or [] if not _is_notification(row)]
+
     # Side effect: trigger Admin Agent processing for unprocessed items
     processing_count = 0
     try:
         admin_agent = getattr(request.app.state, "admin_agent", None)
         if admin_agent is not None:
-            inbox_container = cosmos_manager.get_container("Inbox")
-            query = (
-                "SELECT c.id, c.rawText, c.captureTraceId FROM c "
-                "WHERE c.userId = @userId "
-                "AND c.classificationMeta.bucket = 'Admin' "
-                "AND (NOT IS_DEFINED(c.adminProcessingStatus) "
-                "     OR IS_NULL(c.adminProcessingStatus) "
-                "     OR c.adminProcessingStatus = 'failed' "
-                "     OR c.adminProcessingStatus = 'pending')"
-            )
-            parameters: list[dict[str, object]] = [
-                {"name": "@userId", "value": "will"},
-            ]
-
-            unprocessed: list[dict] = []
-            async for item in inbox_container.query_items(
-                query=query,
-                parameters=parameters,
-                partition_key="will",
-            ):
-                unprocessed.append(item)
-
             # Filter out items already being processed in-flight
             in_flight: set = getattr(request.app.state, "admin_processing_ids", set())
             new_items = [i for i in unprocessed if i["id"] not in in_flight]
@@ -257,49 +311,30 @@ async def get_errands(request: Request) -> ErrandsResponse:
             exc_info=True,
         )
 
-    # Query for completed admin items with responses to deliver
-    notifications: list[AdminNotification] = []
-    try:
-        inbox_container = cosmos_manager.get_container("Inbox")
-        notify_query = (
-            "SELECT c.id, c.adminAgentResponse FROM c "
-            "WHERE c.userId = @userId "
-            "AND c.adminProcessingStatus = 'completed' "
-            "AND IS_DEFINED(c.adminAgentResponse) "
-            "AND NOT IS_NULL(c.adminAgentResponse)"
-        )
-        notify_params: list[dict[str, object]] = [
-            {"name": "@userId", "value": "will"},
-        ]
-        async for item in inbox_container.query_items(
-            query=notify_query,
-            parameters=notify_params,
-            partition_key="will",
-        ):
-            notifications.append(
-                AdminNotification(
-                    inboxItemId=item["id"],
-                    message=item["adminAgentResponse"],
-                )
-            )
-    except Exception:
-        logger.warning(
-            "Failed to query admin notifications",
-            exc_info=True,
-        )
-
     logger.debug(
         "Errands: %d destinations, %d total items, %d notifications",
         len(sections),
         total_count,
         len(notifications),
     )
-    return ErrandsResponse(
+    result = ErrandsResponse(
         destinations=sections,
         totalCount=total_count,
         processingCount=processing_count,
         adminNotifications=notifications,
     )
+    # While Admin items are unprocessed the listing is about to change (and
+    # each poll must retry the trigger), so only a settled listing is kept.
+    # A failed Inbox query also leaves nothing worth caching.
+    payload = result.model_dump_json()
+    if processing_count == 0 and admin_rows is not None:
+        etag = snapshots.put("errands", generation, result, payload)
+    else:
+        etag = content_etag(payload)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return result
 
 
 @router.delete("/api/errands/{item_id}", status_code=204)
@@ -329,6 +364,7 @@ async def delete_errand_item(
             status_code=404,
             detail=f"Errand item {item_id} not found in destination '{destination}'",
         ) from exc
+    list_snapshots(cosmos_manager).invalidate("errands")
 
     logger.info("Deleted errand item %s from destination '%s'", item_id, destination)
     return Response(status_code=204)
@@ -396,6 +432,7 @@ async def route_errand_item(
 
     # Delete from unrouted
     await container.delete_item(item=item_id, partition_key="unrouted")
+    list_snapshots(cosmos_manager).invalidate("errands")
 
     # --- Feedback signal (fire-and-forget) ---
     try:
@@ -426,6 +463,7 @@ async def route_errand_item(
             autoSaved=True,
         )
         await rules_container.create_item(body=rule.model_dump(mode="json"))
+        routing_cache(cosmos_manager).invalidate("AffinityRules")
 
     logger.info(
         "Routed errand item %s ('%s') to %s (rule saved: %s)",
@@ -485,6 +523,7 @@ async def dismiss_admin_notification(
     doc["adminProcessingStatus"] = "completed"
     doc["ttl"] = ttl_seconds
     await inbox_container.upsert_item(body=doc)
+    list_snapshots(cosmos_manager).invalidate("errands")
 
     logger.info("Dismissed admin notification %s (filed)", inbox_item_id)
     return Response(status_code=204)
@@ -13,6 +13,8 @@ from fastapi import APIRouter, HTTPException, Query, Request, Response
 from opentelemetry import trace
 from pydantic import BaseModel
 
+from second_brain.db.paging import MAX_PAGE_SIZE, InvalidCursorError, query_page
+from second_brain.db.snapshots import list_snapshots
 from second_brain.models.documents import (
     CONTAINER_MODELS,
     VALID_BUCKETS,
@@ -51,18 +53,34 @@ class InboxListResponse(BaseModel):
 
     items: list[InboxItemResponse]
     count: int
+    nextCursor: str | None = None  # noqa: N815
+
+
+_INBOX_LIST_QUERY = (
+    "SELECT * FROM c WHERE c.userId = @userId "
+    "AND (NOT IS_DEFINED(c.status) OR c.status != 'filed') "
+    "ORDER BY c.createdAt DESC"
+)
 
 
 @router.get("/api/inbox", response_model=InboxListResponse)
 async def list_inbox(
     request: Request,
-    limit: int = Query(default=20, ge=1, le=100),
-    offset: int = Query(default=0, ge=0),
+    limit: int = Query(default=20, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(
+        default=0, ge=0, description="Deprecated: page with cursor instead"
+    ),
+    cursor: str | None = Query(
+        default=None, description="nextCursor from the previous page"
+    ),
 ) -> InboxListResponse:
     """List recent Inbox captures ordered by creation time (newest first).
 
     Queries the Cosmos DB Inbox container for the authenticated user,
-    returning classification metadata with each item.
+    returning classification metadata with each item. Pages are chained
+    with continuation cursors (nextCursor is null on the last page). A
+    non-zero offset without a cursor still uses OFFSET/LIMIT, for app
+    builds that predate cursors.
     """
     cosmos_manager = getattr(request.app.state, "cosmos_manager", None)
     if cosmos_manager is None:
@@ -72,45 +90,57 @@ async def list_inbox(
         )
 
     container = cosmos_manager.get_container("Inbox")
-
-    query = (
-        "SELECT * FROM c WHERE c.userId = @userId "
-        "AND (NOT IS_DEFINED(c.status) OR c.status != 'filed') "
-        "ORDER BY c.createdAt DESC "
-        "OFFSET @offset LIMIT @limit"
-    )
-    parameters: list[dict[str, object]] = [
-        {"name": "@userId", "value": "will"},
-        {"name": "@offset", "value": offset},
-        {"name": "@limit", "value": limit},
-    ]
-
-    items: list[InboxItemResponse] = []
-    async for item in container.query_items(
-        query=query,
-        parameters=parameters,
-        partition_key="will",
-    ):
-        items.append(
-            InboxItemResponse(
-                id=item["id"],
-                rawText=item.get("rawText", ""),
-                title=item.get("title"),
-                status=item.get("status", "unknown"),
-                createdAt=item.get("createdAt", ""),
-                classificationMeta=item.get("classificationMeta"),
-                clarificationText=item.get("clarificationText"),
-                adminProcessingStatus=item.get("adminProcessingStatus"),
+    parameters: list[dict[str, object]] = [{"name": "@userId", "value": "will"}]
+
+    next_cursor: str | None = None
+    if offset and cursor is None:
+        rows = [
+            item
+            async for item in container.query_items(
+                query=f"{_INBOX_LIST_QUERY} OFFSET @offset LIMIT @limit",
+                parameters=[
+                    *parameters,
+                    {"name": "@offset", "value": offset},
+                    {"name": "@limit", "value": limit},
+                ],
+                partition_key="will",
             )
+        ]
+    else:
+        try:
+            rows, next_cursor = await query_page(
+                container,
+                query=_INBOX_LIST_QUERY,
+                parameters=parameters,
+                partition_key="will",
+                page_size=limit,
+                cursor=cursor,
+            )
+        except InvalidCursorError as exc:
+            raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+
+    items = [
+        InboxItemResponse(
+            id=item["id"],
+            rawText=item.get("rawText", ""),
+            title=item.get("title"),
+            status=item.get("status", "unknown"),
+            createdAt=item.get("createdAt", ""),
+            classificationMeta=item.get("classificationMeta"),
+            clarificationText=item.get("clarificationText"),
+            adminProcessingStatus=item.get("adminProcessingStatus"),
         )
+        for item in rows
+    ]
 
     logger.debug(
-        "Inbox list: returned %d items (offset=%d, limit=%d)",
+        "Inbox list: returned %d items (offset=%d, limit=%d, more=%s)",
         len(items),
         offset,
         limit,
+        next_cursor is not None,
     )
-    return InboxListResponse(items=items, count=len(items))
+    return InboxListResponse(items=items, count=len(items), nextCursor=next_cursor)
 
 
 @router.get("/api/inbox/{item_id}")
@@ -193,6 +223,8 @@ async def delete_inbox_item(request: Request, item_id: str) -> Response:
 
     # Delete the inbox document
     await inbox_container.delete_item(item=item_id, partition_key="will")
+    if bucket_name == "Admin":
+        list_snapshots(cosmos_manager).invalidate("errands")
     logger.info("Deleted inbox item %s", item_id)
 
     return Response(status_code=204)
@@ -325,6 +357,8 @@ async def recategorize_inbox_item(
             item["status"] = "classified"
             item["updatedAt"] = datetime.now(UTC).isoformat()
             await inbox_container.upsert_item(body=item)
+            if "Admin" in (old_bucket, body.new_bucket):
+                list_snapshots(cosmos_manager).invalidate("errands")
 
             # --- Feedback signal (fire-and-forget) ---
             try:
@@ -4,16 +4,21 @@ Queries the Cosmos DB Tasks container which uses /userId as partition key.
 Tasks are actionable to-dos routed from Admin captures that aren't errands
 (e.g., appointments, expenses, phone calls).
 
-GET /api/tasks returns all tasks for the user.
+GET /api/tasks returns every task (served from the in-memory listing
+snapshot, with a weak ETag, while it is valid); passing `limit` or
+`cursor` opts in to continuation-token pages.
 DELETE /api/tasks/{item_id} removes a completed task.
 """
 
 import logging
 
 from azure.cosmos.exceptions import CosmosResourceNotFoundError
-from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from pydantic import BaseModel
 
+from second_brain.db.paging import MAX_PAGE_SIZE, InvalidCursorError, query_page
+from second_brain.db.snapshots import content_etag, etag_matches, list_snapshots
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
@@ -28,17 +33,32 @@ class TaskItemResponse(BaseModel):
 
 
 class TasksResponse(BaseModel):
-    """Full tasks response."""
+    """Tasks response (one page of it when nextCursor is set)."""
 
     tasks: list[TaskItemResponse]
     totalCount: int  # noqa: N815
+    nextCursor: str | None = None  # noqa: N815
 
 
-@router.get("/api/tasks", response_model=TasksResponse)
-async def get_tasks(request: Request) -> TasksResponse:
-    """List all task items for the user.
+_TASKS_QUERY = "SELECT c.id, c.name, c.createdAt FROM c ORDER BY c.createdAt DESC"
 
-    Returns tasks sorted by creation date (newest first).
+
+@router.get("/api/tasks", response_model=TasksResponse)
+async def get_tasks(
+    request: Request,
+    response: Response,
+    limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(
+        default=None, description="nextCursor from the previous page"
+    ),
+) -> TasksResponse:
+    """List task items for the user, newest first.
+
+    Without `limit` or `cursor` every task is returned, as before paging;
+    that listing is snapshotted and answers 304 when If-None-Match carries
+    its ETag. With either, returns up to `limit` tasks (default
+    MAX_PAGE_SIZE) and a nextCursor that is null on the last page.
+    totalCount is always the number of tasks overall.
     """
     cosmos_manager = getattr(request.app.state, "cosmos_manager", None)
     if cosmos_manager is None:
@@ -47,23 +67,64 @@ async def get_tasks(request: Request) -> TasksResponse:
             detail="Cosmos DB not configured. Tasks unavailable.",
         )
 
+    paged = limit is not None or cursor is not None
+    snapshots = list_snapshots(cosmos_manager)
+    if_none_match = request.headers.get("if-none-match")
+    cached = None if paged else snapshots.get("tasks")
+    if cached is not None:
+        if etag_matches(if_none_match, cached.etag):
+            return Response(status_code=304, headers={"ETag": cached.etag})
+        response.headers["ETag"] = cached.etag
+        return cached.value
+    generation = snapshots.generation("tasks")
+
     container = cosmos_manager.get_container("Tasks")
 
-    items: list[TaskItemResponse] = []
-    async for item in container.query_items(
-        query="SELECT * FROM c ORDER BY c.createdAt DESC",
-        partition_key="will",
-    ):
-        items.append(
-            TaskItemResponse(
-                id=item["id"],
-                name=item["name"],
-                createdAt=item.get("createdAt"),
+    next_cursor: str | None = None
+    if paged:
+        try:
+            rows, next_cursor = await query_page(
+                container,
+                query=_TASKS_QUERY,
+                partition_key="will",
+                page_size=limit or MAX_PAGE_SIZE,
+                cursor=cursor,
             )
+        except InvalidCursorError as exc:
+            raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+        total = 0
+        async for count in container.query_items(
+            query="SELECT VALUE COUNT(1) FROM c", partition_key="will"
+        ):
+            total = count
+    else:
+        rows = [
+            item
+            async for item in container.query_items(
+                query=_TASKS_QUERY, partition_key="will"
+            )
+        ]
+        total = len(rows)
+    items = [
+        TaskItemResponse(
+            id=item["id"],
+            name=item["name"],
+            createdAt=item.get("createdAt"),
         )
-
-    logger.debug("Tasks: %d items", len(items))
-    return TasksResponse(tasks=items, totalCount=len(items))
+        for item in rows
+    ]
+
+    logger.debug("Tasks: %d of %d items", len(items), total)
+    result = TasksResponse(tasks=items, totalCount=total, nextCursor=next_cursor)
+    payload = result.model_dump_json()
+    if paged:
+        etag = content_etag(payload)
+    else:
+        etag = snapshots.put("tasks", generation, result, payload)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return result
 
 
 @router.delete("/api/tasks/{item_id}", status_code=204)
@@ -91,6 +152,7 @@ async def delete_task_item(
             status_code=404,
             detail=f"Task item {item_id} not found",
         ) from exc
+    list_snapshots(cosmos_manager).invalidate("tasks")
 
     logger.info("Deleted task item %s", item_id)
     return Response(status_code=204)
@@ -1,6 +1,8 @@
 """API key authentication middleware with security logging.
 
-Uses Starlette BaseHTTPMiddleware (justified per CLAUDE.md -- framework pattern).
+Raw ASGI middleware (framework pattern, per CLAUDE.md): unlike
+BaseHTTPMiddleware it adds no per-request task or response-stream wrapping,
+which matters for the SSE endpoints.
 Key passed via Authorization: Bearer <key> header (per locked CONTEXT.md decision).
 Failed auth attempts logged with IP/timestamp for security auditing.
 """
@@ -11,8 +13,7 @@ from datetime import UTC, datetime
 
 from fastapi import Request
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 logger = logging.getLogger("second_brain.auth")
 
@@ -20,7 +21,7 @@ logger = logging.getLogger("second_brain.auth")
 PUBLIC_PATHS: frozenset[str] = frozenset({"/health"})
 
 
-class APIKeyMiddleware(BaseHTTPMiddleware):
+class APIKeyMiddleware:
     """Middleware that validates API key from Authorization: Bearer <key> header.
 
     Public paths (/health) bypass authentication.
@@ -31,17 +32,22 @@ class APIKeyMiddleware(BaseHTTPMiddleware):
     the key from Azure Key Vault.
     """
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        """Validate the API key on each request.
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Validate the API key on each HTTP request.
 
         Allows public paths without auth. Extracts the key from the
-        Authorization: Bearer <key> header format.
+        Authorization: Bearer <key> header format. Non-HTTP scopes
+        (lifespan) pass straight through.
         """
         # Allow public paths without authentication
-        if request.url.path in PUBLIC_PATHS:
-            return await call_next(request)
+        if scope["type"] != "http" or scope["path"] in PUBLIC_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
 
         # Read API key lazily from app.state (set by lifespan after Key Vault fetch)
         api_key = getattr(request.app.state, "api_key", None)
@@ -52,21 +58,17 @@ class APIKeyMiddleware(BaseHTTPMiddleware):
         # Validate Bearer format and key
         if not auth_header.startswith("Bearer "):
             self._log_auth_failure(request, "missing or malformed Authorization header")
-            return JSONResponse(
-                status_code=401,
-                content={"detail": "Invalid or missing API key"},
-            )
+            await _unauthorized(scope, receive, send)
+            return
 
         provided_key = auth_header[7:]  # Strip "Bearer " prefix
 
         if api_key is None or not hmac.compare_digest(provided_key, api_key):
             self._log_auth_failure(request, "invalid API key")
-            return JSONResponse(
-                status_code=401,
-                content={"detail": "Invalid or missing API key"},
-            )
+            await _unauthorized(scope, receive, send)
+            return
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
 
     def _log_auth_failure(self, request: Request, reason: str) -> None:
         """Log a failed authentication attempt with security context."""
@@ -80,3 +82,11 @@ class APIKeyMiddleware(BaseHTTPMiddleware):
             request.url.path,
             reason,
         )
+
+
+async def _unauthorized(scope: Scope, receive: Receive, send: Send) -> None:
+    response = JSONResponse(
+        status_code=401,
+        content={"detail": "Invalid or missing API key"},
+    )
+    await response(scope, receive, send)
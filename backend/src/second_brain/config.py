@@ -42,9 +42,73 @@ class Settings(BaseSettings):
     agent_warmup_enabled: bool = True
     agent_warmup_interval_minutes: int = 5
 
+    # Spine write-behind: request-path spine events are queued and flushed in
+    # per-partition batches instead of two inline Cosmos writes per request.
+    spine_write_behind_enabled: bool = True
+    spine_write_queue_size: int = Field(default=5000, ge=1)
+    spine_write_batch_size: int = Field(default=200, ge=1)
+    spine_write_flush_interval_seconds: float = Field(default=1.0, gt=0)
+
+    # Spine workload rollups: minute/hour/day bucket deltas merged into
+    # spine_rollups every N seconds.
+    spine_rollups_enabled: bool = True
+    spine_rollup_flush_interval_seconds: float = Field(default=30.0, gt=0)
+
+    # Spine workload sampling: the request middleware keeps uncorrelated
+    # successes 1-in-round(1/rate) with a sample_weight; failures and
+    # correlated events are always kept. Overrides are keyed "segment_id"
+    # or "segment_id METHOD /path".
+    spine_sampling_enabled: bool = True
+    spine_sample_rate: float = Field(default=0.1, ge=0.001, le=1)
+    spine_sample_rates: dict[str, float] = Field(default_factory=dict)
+
+    # Leader election: the status evaluator and agent warmup run on the one
+    # replica holding their spine_leases lease; others take over on expiry.
+    spine_leader_election_enabled: bool = True
+    spine_lease_ttl_seconds: int = Field(default=30, ge=5)
+
+    # Spine cold archive: rows written more than N hours ago are exported as
+    # gzip NDJSON to spine_archive_dir, or else to this blob container on
+    # blob_storage_url. Runs on the lease holder only.
+    spine_archive_enabled: bool = False
+    spine_archive_dir: str = ""
+    spine_archive_blob_container: str = "spine-archive"
+    spine_archive_after_hours: int = Field(default=48, ge=1)
+    spine_archive_interval_minutes: int = Field(default=60, ge=1)
+
+    # Spine segment detail cache: adapter responses are served for ttl
+    # seconds, then stale for up to stale seconds while one refresh runs.
+    spine_detail_cache_enabled: bool = True
+    spine_detail_cache_ttl_seconds: float = Field(default=30.0, ge=0)
+    spine_detail_cache_stale_seconds: float = Field(default=300.0, ge=0)
+
+    # Spine heartbeats: liveness upserts one spine_heartbeats doc per
+    # segment + instance; spine_events only gets a row when an instance
+    # appears or returns after a gap.
+    spine_heartbeats_enabled: bool = True
+
+    # Spine compact events: write new spine_events rows in the compact v2
+    # schema (short keys, interned operations). Reads accept both shapes,
+    # so enable once every replica runs a build that can decode them.
+    spine_compact_events_enabled: bool = False
+
+    # Spine SLO burn rates: in-memory windows are reseeded from spine_rollups
+    # this often to fold in other replicas' traffic.
+    spine_slo_resync_interval_seconds: int = Field(default=300, ge=30)
+
+    # Spine analytics: mirror workload rows into an embedded DuckDB (needs
+    # the `analytics` extra). Empty path = in-memory, refilled on start.
+    spine_analytics_enabled: bool = False
+    spine_analytics_path: str = ""
+    spine_analytics_backfill_days: int = Field(default=7, ge=1)
+
     # Classification
     classification_threshold: float = 0.6
 
+    # Admin pre-routing: errand list items an affinity rule covers
+    # unambiguously are routed without the Admin Agent.
+    admin_prerouting_enabled: bool = True
+
     # Inbox filed-doc retention (Phase 25). Per-doc Cosmos TTL value =
     # this * 86400 seconds. Cosmos container `defaultTtl` must be -1 for
     # this to take effect (one-time infra step in Plan 02). Minimum 1 day
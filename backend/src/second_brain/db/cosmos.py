@@ -32,6 +32,9 @@ CONTAINER_NAMES: list[str] = [
     "spine_segment_state",
     "spine_status_history",
     "spine_correlation",
+    "spine_rollups",
+    "spine_leases",
+    "spine_heartbeats",
 ]
 
 
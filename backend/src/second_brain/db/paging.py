@@ -0,0 +1,68 @@
+"""Continuation-token pagination for single-partition Cosmos listings.
+
+`OFFSET n LIMIT m` makes Cosmos read and discard the first n rows, so a
+deep page costs as much RU as everything above it. query_page instead
+resumes from the SDK's continuation token, so every page costs the same
+as the first.
+
+The token is handed to clients as an opaque URL-safe cursor. A page may
+hold fewer than page_size items while more remain (Cosmos ends a page
+early on its own RU/size budget); clients stop when nextCursor is null,
+not on a short page.
+"""
+
+import base64
+import binascii
+
+from azure.cosmos.aio import ContainerProxy
+from azure.cosmos.exceptions import CosmosHttpResponseError
+
+MAX_PAGE_SIZE = 100
+
+
+class InvalidCursorError(ValueError):
+    """A cursor that is malformed or does not belong to this query."""
+
+
+def encode_cursor(continuation_token: str | None) -> str | None:
+    if continuation_token is None:
+        return None
+    return base64.urlsafe_b64encode(continuation_token.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> str:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        token = base64.b64decode(padded, altchars=b"-_", validate=True).decode()
+    except (binascii.Error, UnicodeError) as exc:
+        raise InvalidCursorError(cursor) from exc
+    if not token:
+        raise InvalidCursorError(cursor)
+    return token
+
+
+async def query_page(
+    container: ContainerProxy,
+    *,
+    query: str,
+    partition_key: str,
+    page_size: int,
+    cursor: str | None = None,
+    parameters: list[dict[str, object]] | None = None,
+) -> tuple[list[dict], str | None]:
+    """One page of a query and the cursor for the next (None on the last)."""
+    token = decode_cursor(cursor) if cursor else None
+    pager = container.query_items(
+        query=query,
+        parameters=parameters,
+        partition_key=partition_key,
+        max_item_count=page_size,
+    ).by_page(token)
+    try:
+        page = await anext(pager, None)
+        items = [item async for item in page] if page is not None else []
+    except CosmosHttpResponseError as exc:
+        if token is not None and exc.status_code == 400:
+            raise InvalidCursorError(cursor) from exc
+        raise
+    return items, encode_cursor(pager.continuation_token)
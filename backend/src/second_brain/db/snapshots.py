@@ -0,0 +1,103 @@
+"""Materialized snapshots of the polled errands and tasks listings.
+
+The mobile app polls GET /api/errands and GET /api/tasks; almost every
+poll sees the same lists. ListSnapshots keeps the last built response of
+each listing in memory per CosmosManager, so a repeat poll is served
+without touching Cosmos:
+
+- every write path that changes a listing (errand/task add, delete and
+  route, destination edits, Admin inbox status changes) calls
+  invalidate(), so the next poll on this replica rebuilds it
+- a snapshot older than max_age_seconds is rebuilt anyway, which bounds
+  how long a write made on another replica can go unseen
+- the ETag is a hash of the response content, not a counter, so it is the
+  same on every replica and across rebuilds; a client holding it gets a
+  304 even after an expired snapshot was rebuilt
+
+There is a single user, so a listing name is the whole key.
+"""
+
+import hashlib
+import time
+import weakref
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from second_brain.db.cosmos import CosmosManager
+
+MAX_AGE_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class ListSnapshot:
+    """A built listing response and its weak ETag."""
+
+    value: Any
+    etag: str
+    built_at: float
+
+
+def content_etag(payload: str) -> str:
+    """Weak ETag for a serialized response body."""
+    return f'W/"{hashlib.sha1(payload.encode()).hexdigest()[:16]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an If-None-Match header value covers etag."""
+    tags = {tag.strip() for tag in (if_none_match or "").split(",")}
+    return etag in tags or "*" in tags
+
+
+class ListSnapshots:
+    """Latest errands/tasks responses for one CosmosManager."""
+
+    def __init__(
+        self,
+        max_age_seconds: float = MAX_AGE_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_age = max_age_seconds
+        self._clock = clock
+        self._snapshots: dict[str, ListSnapshot] = {}
+        self._generations: dict[str, int] = {}
+
+    def get(self, name: str) -> ListSnapshot | None:
+        """The current snapshot, or None if missing, invalidated or expired."""
+        snapshot = self._snapshots.get(name)
+        if snapshot is None or self._clock() - snapshot.built_at >= self._max_age:
+            return None
+        return snapshot
+
+    def generation(self, name: str) -> int:
+        """Token to take before a rebuild and hand back to put()."""
+        return self._generations.get(name, 0)
+
+    def put(self, name: str, generation: int, value: Any, payload: str) -> str:
+        """Store a rebuilt listing; returns its ETag.
+
+        A build that overlapped an invalidate() (its generation is stale)
+        may hold pre-write data, so it is not stored.
+        """
+        etag = content_etag(payload)
+        if generation == self.generation(name):
+            self._snapshots[name] = ListSnapshot(value, etag, self._clock())
+        return etag
+
+    def invalidate(self, name: str) -> None:
+        """Drop a listing after a write; the next poll rebuilds it."""
+        self._generations[name] = self.generation(name) + 1
+        self._snapshots.pop(name, None)
+
+
+_snapshots: "weakref.WeakKeyDictionary[CosmosManager, ListSnapshots]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def list_snapshots(cosmos_manager: CosmosManager) -> ListSnapshots:
+    """The process-wide ListSnapshots for a CosmosManager (created lazily)."""
+    snapshots = _snapshots.get(cosmos_manager)
+    if snapshots is None:
+        snapshots = _snapshots[cosmos_manager] = ListSnapshots()
+    return snapshots
@@ -91,7 +91,11 @@ async def _wire_spine(
 
     evaluator_task is None when spine wiring is skipped or fails.
     liveness_tasks is empty when spine wiring is skipped or fails.
-    Sets app.state.spine_repo (or None on skip/failure).
+    Sets app.state.spine_repo, app.state.spine_writer,
+    app.state.spine_rollups, app.state.spine_leases, app.state.spine_archive,
+    app.state.spine_archive_task and app.state.spine_analytics (or None on
+    skip/failure). The writer, the rollup aggregator and the analytics mirror
+    are flushed, and the archive task cancelled, by the lifespan on shutdown.
     """
     from functools import partial
 
@@ -105,13 +109,32 @@ async def _wire_spine(
     from second_brain.spine.adapters.registry import AdapterRegistry
     from second_brain.spine.api import build_spine_router
     from second_brain.spine.auth import spine_auth
-    from second_brain.spine.background import evaluator_loop, liveness_emitter
-    from second_brain.spine.evaluator import StatusEvaluator
+    from second_brain.spine.background import (
+        evaluator_loop,
+        follow_segment_states,
+        liveness_emitter,
+    )
+    from second_brain.spine.incremental import IncrementalStatusEvaluator
+    from second_brain.spine.leader import EVALUATOR_LEASE, LeaseElector, run_as_leader
     from second_brain.spine.registry import get_default_registry
+    from second_brain.spine.rollups import WorkloadRollupAggregator
+    from second_brain.spine.sampling import WorkloadSampler
+    from second_brain.spine.slo import SloEngine
+    from second_brain.spine.snapshot import StatusSnapshot
     from second_brain.spine.storage import SpineRepository
+    from second_brain.spine.writer import SpineEventWriter
 
     spine_evaluator_task: asyncio.Task | None = None
     spine_liveness_tasks: list[asyncio.Task] = []
+    spine_writer: SpineEventWriter | None = None
+    spine_rollups: WorkloadRollupAggregator | None = None
+    app.state.spine_writer = None
+    app.state.spine_rollups = None
+    app.state.spine_leases = None
+    app.state.spine_archive = None
+    app.state.spine_archive_task = None
+    app.state.spine_analytics = None
+    spine_archive_task: asyncio.Task | None = None
 
     try:
         if app.state.cosmos_manager is None:
@@ -131,11 +154,99 @@ async def _wire_spine(
             correlation_container=cosmos_mgr_for_spine.get_container(
                 "spine_correlation"
             ),
+            rollups_container=cosmos_mgr_for_spine.get_container("spine_rollups"),
+            heartbeats_container=(
+                cosmos_mgr_for_spine.get_container("spine_heartbeats")
+                if getattr(settings, "spine_heartbeats_enabled", True)
+                else None
+            ),
+            compact_events=getattr(settings, "spine_compact_events_enabled", False),
         )
         app.state.spine_repo = spine_repo
 
+        # Write-behind: record_event becomes an in-memory enqueue; the
+        # writer's flusher persists batches grouped by partition.
+        if getattr(settings, "spine_write_behind_enabled", True):
+            spine_writer = SpineEventWriter(
+                repo=spine_repo,
+                max_queue_size=getattr(settings, "spine_write_queue_size", 5000),
+                batch_size=getattr(settings, "spine_write_batch_size", 200),
+                flush_interval_seconds=getattr(
+                    settings, "spine_write_flush_interval_seconds", 1.0
+                ),
+            )
+            spine_writer.start()
+            spine_repo.attach_writer(spine_writer)
+            app.state.spine_writer = spine_writer
+            logger.info("Spine write-behind writer started")
+
+        # Request-middleware sampling of routine successes (weights keep the
+        # evaluator's counts and rates unbiased).
+        app.state.spine_sampler = (
+            WorkloadSampler(
+                default_rate=getattr(settings, "spine_sample_rate", 1.0),
+                rates=getattr(settings, "spine_sample_rates", None),
+            )
+            if getattr(settings, "spine_sampling_enabled", False)
+            else None
+        )
+
         spine_registry = get_default_registry()
-        spine_evaluator = StatusEvaluator(repo=spine_repo, registry=spine_registry)
+        # In-memory sliding windows fed by record_event; the first tick per
+        # segment rebuilds from Cosmos, then each tick fetches only rows past
+        # the newest Cosmos `_ts` seen (other replicas' ingest never reaches
+        # observe).
+        spine_evaluator = IncrementalStatusEvaluator(
+            repo=spine_repo, registry=spine_registry
+        )
+        spine_repo.add_listener(spine_evaluator.observe)
+
+        # Minute/hour/day workload rollups for the time-series views.
+        if getattr(settings, "spine_rollups_enabled", True):
+            spine_rollups = WorkloadRollupAggregator(
+                repo=spine_repo,
+                flush_interval_seconds=getattr(
+                    settings, "spine_rollup_flush_interval_seconds", 30.0
+                ),
+            )
+            spine_rollups.start()
+            spine_repo.add_listener(spine_rollups.observe)
+            app.state.spine_rollups = spine_rollups
+
+        # SLO burn rates: windowed counters fed by record_event and reseeded
+        # from spine_rollups plus this replica's unflushed rollup deltas,
+        # never from raw spine_events.
+        spine_slo = SloEngine(
+            repo=spine_repo,
+            registry=spine_registry,
+            resync_interval_seconds=getattr(
+                settings, "spine_slo_resync_interval_seconds", 300
+            ),
+            rollups=spine_rollups,
+        )
+        spine_repo.add_listener(spine_slo.observe)
+
+        # Optional DuckDB mirror of workload rows for /api/spine/analytics.
+        spine_analytics = None
+        if getattr(settings, "spine_analytics_enabled", False):
+            try:
+                from second_brain.spine.analytics import SpineAnalytics
+
+                spine_analytics = SpineAnalytics(
+                    repo=spine_repo,
+                    segment_ids=[cfg.segment_id for cfg in spine_registry.all()],
+                    path=getattr(settings, "spine_analytics_path", ""),
+                    backfill_days=getattr(settings, "spine_analytics_backfill_days", 7),
+                )
+            except ImportError:
+                logger.warning(
+                    "spine_analytics_enabled but duckdb is not installed "
+                    "(install the 'analytics' extra) -- analytics disabled"
+                )
+            else:
+                spine_analytics.start()
+                spine_repo.add_listener(spine_analytics.observe)
+                app.state.spine_analytics = spine_analytics
 
         # The backend_api adapter requires the LogsQueryClient; if init
         # earlier was non-fatal-failed, ship spine without the adapter
@@ -340,15 +451,63 @@ async def _wire_spine(
         adapters.extend([mobile_ui_composite, mobile_capture_composite])
         logger.info("Spine mobile composite adapters wired")
 
+        if getattr(settings, "spine_detail_cache_enabled", False):
+            from second_brain.spine.adapters.cache import CachedAdapter
+
+            adapters = [
+                CachedAdapter(
+                    a,
+                    ttl_seconds=getattr(settings, "spine_detail_cache_ttl_seconds", 30),
+                    stale_seconds=getattr(
+                        settings, "spine_detail_cache_stale_seconds", 300
+                    ),
+                )
+                for a in adapters
+            ]
         adapter_registry = AdapterRegistry(adapters)
         app.state.spine_adapter_registry = adapter_registry
 
         # Create background tasks BEFORE mounting the router so that a
         # failure in task creation cannot leave routes mounted against a
         # repo that the `except` below resets to None (I2 fix).
-        spine_evaluator_task = asyncio.create_task(
-            evaluator_loop(spine_evaluator, spine_repo, spine_registry)
-        )
+        # The evaluator loop keeps this snapshot current; /status is served
+        # from it and /status/stream pushes its transitions.
+        spine_snapshot = StatusSnapshot()
+
+        def _run_evaluator():
+            return evaluator_loop(
+                spine_evaluator,
+                spine_repo,
+                spine_registry,
+                snapshot=spine_snapshot,
+            )
+
+        # With leader election only the lease holder sweeps segments; the
+        # other replicas drop their windows and refresh their snapshot from
+        # spine_segment_state.
+        def _standby():
+            spine_evaluator.reset()
+            return follow_segment_states(spine_repo, spine_snapshot)
+
+        if getattr(settings, "spine_leader_election_enabled", True):
+            spine_leases = cosmos_mgr_for_spine.get_container("spine_leases")
+            spine_evaluator_task = asyncio.create_task(
+                run_as_leader(
+                    LeaseElector(
+                        spine_leases,
+                        EVALUATOR_LEASE,
+                        ttl_seconds=getattr(settings, "spine_lease_ttl_seconds", 30),
+                    ),
+                    _run_evaluator,
+                    standby=_standby,
+                )
+            )
+            app.state.spine_leases = spine_leases
+        else:
+            spine_evaluator_task = asyncio.create_task(_run_evaluator())
+
+        if getattr(settings, "spine_archive_enabled", False):
+            spine_archive_task = _start_spine_archive(app, settings, spine_repo)
         # Liveness emitters for all registered segments
         for seg_cfg in spine_registry.all():
             spine_liveness_tasks.append(
@@ -363,8 +522,11 @@ async def _wire_spine(
 
         from second_brain.observability.queries import (
             fetch_audit_cosmos_diagnostics_for_correlation,
+            fetch_audit_cosmos_diagnostics_for_correlations,
             fetch_audit_exceptions_for_correlation,
+            fetch_audit_exceptions_for_correlations,
             fetch_audit_spans_for_correlation,
+            fetch_audit_spans_for_correlations,
         )
         from second_brain.spine.audit.native_lookup import NativeLookup
         from second_brain.spine.audit.walker import CorrelationAuditor
@@ -386,6 +548,21 @@ async def _wire_spine(
                     app.state.logs_client,
                     settings.log_analytics_workspace_id,
                 ),
+                spans_batch_fetcher=partial(
+                    fetch_audit_spans_for_correlations,
+                    app.state.logs_client,
+                    settings.log_analytics_workspace_id,
+                ),
+                exceptions_batch_fetcher=partial(
+                    fetch_audit_exceptions_for_correlations,
+                    app.state.logs_client,
+                    settings.log_analytics_workspace_id,
+                ),
+                cosmos_batch_fetcher=partial(
+                    fetch_audit_cosmos_diagnostics_for_correlations,
+                    app.state.logs_client,
+                    settings.log_analytics_workspace_id,
+                ),
             )
         else:
             audit_lookup = NativeLookup(
@@ -403,14 +580,32 @@ async def _wire_spine(
                 segment_registry=spine_registry,
                 auth_dependency=spine_auth,
                 auditor=spine_auditor,
+                writer=spine_writer,
+                snapshot=spine_snapshot,
+                slo_engine=spine_slo,
+                analytics=spine_analytics,
             )
         )
         logger.info("Spine lifespan wiring complete")
     except Exception:
         logger.warning("Spine wiring failed -- spine unavailable", exc_info=True)
-        for _task in [spine_evaluator_task, *spine_liveness_tasks]:
+        for _task in [spine_evaluator_task, spine_archive_task, *spine_liveness_tasks]:
             if _task is not None:
                 _task.cancel()
+        if app.state.spine_archive is not None:
+            await app.state.spine_archive.store.close()
+        if spine_rollups is not None:
+            await spine_rollups.close()
+        if spine_writer is not None:
+            await spine_writer.close()
+        if app.state.spine_analytics is not None:
+            await app.state.spine_analytics.close()
+        app.state.spine_analytics = None
+        app.state.spine_writer = None
+        app.state.spine_rollups = None
+        app.state.spine_leases = None
+        app.state.spine_archive = None
+        app.state.spine_archive_task = None
         app.state.spine_repo = None
         app.state.spine_adapter_registry = None
         spine_evaluator_task = None
@@ -419,6 +614,55 @@ async def _wire_spine(
     return spine_evaluator_task, spine_liveness_tasks
 
 
+def _start_spine_archive(app: FastAPI, settings, spine_repo) -> asyncio.Task:
+    """Attach the cold archive to the repo and start the export job."""
+    from second_brain.spine.archive import (
+        BlobArchiveStore,
+        LocalArchiveStore,
+        SpineArchive,
+        SpineArchiver,
+    )
+    from second_brain.spine.leader import ARCHIVE_LEASE, LeaseElector, run_as_leader
+
+    if settings.spine_archive_dir:
+        store = LocalArchiveStore(settings.spine_archive_dir)
+    else:
+        from azure.storage.blob.aio import BlobServiceClient
+
+        store = BlobArchiveStore(
+            BlobServiceClient(
+                account_url=settings.blob_storage_url,
+                credential=app.state.credential,
+            ).get_container_client(settings.spine_archive_blob_container)
+        )
+    archive = SpineArchive(store)
+    spine_repo.attach_archive(archive)
+    app.state.spine_archive = archive
+
+    archiver = SpineArchiver(
+        spine_repo,
+        archive,
+        archive_after_seconds=settings.spine_archive_after_hours * 3600,
+        interval_seconds=settings.spine_archive_interval_minutes * 60,
+    )
+    if app.state.spine_leases is not None:
+        task = asyncio.create_task(
+            run_as_leader(
+                LeaseElector(
+                    app.state.spine_leases,
+                    ARCHIVE_LEASE,
+                    ttl_seconds=getattr(settings, "spine_lease_ttl_seconds", 30),
+                ),
+                archiver.run,
+            )
+        )
+    else:
+        task = asyncio.create_task(archiver.run())
+    app.state.spine_archive_task = task
+    logger.info("Spine archive export started")
+    return task
+
+
 # ---------------------------------------------------------------------------
 # Lifespan
 # ---------------------------------------------------------------------------
@@ -871,14 +1115,35 @@ async def lifespan(app: FastAPI):
                 setattr(app.state, attr, new_agent)
                 logger.info("app.state.%s replaced by warmup self-heal", attr)
 
-            warmup_task = asyncio.create_task(
-                agent_warmup_loop(
+            def _run_warmup():
+                return agent_warmup_loop(
                     agents=warmup_agents,
                     interval_seconds=settings.agent_warmup_interval_minutes * 60,
                     agent_factories=warmup_factories,
                     on_recreate=_on_recreate,
                 )
-            )
+
+            # Foundry agents are shared by every replica, so one replica
+            # pinging them keeps them all warm.
+            if getattr(app.state, "spine_leases", None) is not None:
+                from second_brain.spine.leader import (
+                    WARMUP_LEASE,
+                    LeaseElector,
+                    run_as_leader,
+                )
+
+                warmup_task = asyncio.create_task(
+                    run_as_leader(
+                        LeaseElector(
+                            app.state.spine_leases,
+                            WARMUP_LEASE,
+                            ttl_seconds=settings.spine_lease_ttl_seconds,
+                        ),
+                        _run_warmup,
+                    )
+                )
+            else:
+                warmup_task = asyncio.create_task(_run_warmup())
             logger.info(
                 "Agent warmup started: interval=%dm agents=%d",
                 settings.agent_warmup_interval_minutes,
@@ -890,6 +1155,9 @@ async def lifespan(app: FastAPI):
         # Cleanup in reverse order
         if warmup_task is not None:
             warmup_task.cancel()
+            # Let run_as_leader release its lease before Cosmos closes.
+            with contextlib.suppress(asyncio.CancelledError):
+                await warmup_task
 
         # Cancel spine background tasks
         all_spine_tasks = [spine_evaluator_task, *spine_liveness_tasks]
@@ -901,6 +1169,22 @@ async def lifespan(app: FastAPI):
                 with contextlib.suppress(asyncio.CancelledError):
                     await task
 
+        archive_task = getattr(app.state, "spine_archive_task", None)
+        if archive_task is not None:
+            archive_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await archive_task
+        if getattr(app.state, "spine_archive", None) is not None:
+            await app.state.spine_archive.store.close()
+
+        # Flush queued spine events and rollups while Cosmos is still open.
+        if getattr(app.state, "spine_rollups", None) is not None:
+            await app.state.spine_rollups.close()
+        if getattr(app.state, "spine_writer", None) is not None:
+            await app.state.spine_writer.close()
+        if getattr(app.state, "spine_analytics", None) is not None:
+            await app.state.spine_analytics.close()
+
         if getattr(app.state, "browser", None) is not None:
             await app.state.browser.close()
         if getattr(app.state, "playwright", None) is not None:
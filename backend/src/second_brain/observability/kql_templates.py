@@ -592,3 +592,60 @@ AzureDiagnostics
     collectionName_s
 | order by timestamp asc
 """
+
+# Batched variants for sampled audits: one query per source for a whole
+# sample. {correlation_ids} is a KQL dynamic array literal; MatchedId names
+# the sampled id a row belongs to so the caller can split rows per trace.
+
+AUDIT_SPANS_BY_CORRELATIONS = """\
+let cids = dynamic({correlation_ids});
+union AppRequests, AppDependencies
+| extend _cid = tostring(Properties.correlation_id),
+    _tid = tostring(Properties.capture_trace_id)
+| where _cid in (cids) or _tid in (cids)
+| project
+    timestamp = TimeGenerated,
+    Name,
+    Component = tostring(Properties.component),
+    DurationMs,
+    ResultCode = tostring(ResultCode),
+    CorrelationId = coalesce(_cid, _tid),
+    CorrelationKind = tostring(Properties.correlation_kind),
+    MatchedId = iff(_cid in (cids), _cid, _tid)
+| order by timestamp asc
+"""
+
+AUDIT_EXCEPTIONS_BY_CORRELATIONS = """\
+let cids = dynamic({correlation_ids});
+AppExceptions
+| extend _cid = tostring(Properties.correlation_id),
+    _tid = tostring(Properties.capture_trace_id)
+| where _cid in (cids) or _tid in (cids)
+| project
+    timestamp = TimeGenerated,
+    Component = tostring(Properties.component),
+    ExceptionType,
+    OuterMessage,
+    OuterType,
+    InnermostMessage,
+    Details = tostring(Details),
+    CorrelationId = coalesce(_cid, _tid),
+    MatchedId = iff(_cid in (cids), _cid, _tid)
+| order by timestamp asc
+"""
+
+AUDIT_COSMOS_BY_CORRELATIONS = """\
+let cids = dynamic({correlation_ids});
+AzureDiagnostics
+| where Category == "DataPlaneRequests"
+| where activityId_g in (cids)
+| project
+    timestamp = TimeGenerated,
+    OperationName,
+    statusCode_s,
+    duration_s,
+    activityId_g,
+    collectionName_s,
+    MatchedId = activityId_g
+| order by timestamp asc
+"""
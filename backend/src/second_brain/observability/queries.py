@@ -1,5 +1,6 @@
 """Async query functions for App Insights via Log Analytics workspace."""
 
+import json
 import logging
 import re
 from datetime import timedelta
@@ -11,8 +12,11 @@ from second_brain.observability.kql_templates import (
     ADMIN_AUDIT_LOG,
     AGENT_RUNS,
     AUDIT_COSMOS_BY_CORRELATION,
+    AUDIT_COSMOS_BY_CORRELATIONS,
     AUDIT_EXCEPTIONS_BY_CORRELATION,
+    AUDIT_EXCEPTIONS_BY_CORRELATIONS,
     AUDIT_SPANS_BY_CORRELATION,
+    AUDIT_SPANS_BY_CORRELATIONS,
     BACKEND_API_FAILURES,
     BACKEND_API_REQUESTS,
     CAPTURE_TRACE,
@@ -770,3 +774,92 @@ async def fetch_audit_cosmos_diagnostics_for_correlation(
     if not result.tables or not result.tables[0]:
         return []
     return list(result.tables[0])
+
+
+# Keeps each batched audit query well under the KQL text size limit.
+AUDIT_BATCH_MAX_IDS = 100
+
+
+async def _fetch_audit_rows_by_correlations(
+    client: LogsQueryClient,
+    workspace_id: str,
+    template: str,
+    correlation_ids: list[str],
+    time_range_seconds: int,
+) -> dict[str, list[dict]]:
+    """Run a batched audit template and split its rows per correlation_id.
+
+    Every requested id is present in the result (an empty list when the
+    source had nothing for it). The template's MatchedId column is dropped
+    so per-trace rows look exactly like the single-id fetchers' rows.
+    """
+    for correlation_id in correlation_ids:
+        if not _TRACE_ID_RE.fullmatch(correlation_id):
+            raise ValueError(f"Invalid correlation_id: {correlation_id!r}")
+
+    ids = list(dict.fromkeys(correlation_ids))
+    by_id: dict[str, list[dict]] = {cid: [] for cid in ids}
+    for start in range(0, len(ids), AUDIT_BATCH_MAX_IDS):
+        chunk = ids[start : start + AUDIT_BATCH_MAX_IDS]
+        query = template.format(correlation_ids=json.dumps(chunk))
+        result = await execute_kql(
+            client,
+            workspace_id,
+            query,
+            timespan=timedelta(seconds=time_range_seconds),
+        )
+        if not result.tables or not result.tables[0]:
+            continue
+        for row in result.tables[0]:
+            matched = row.pop("MatchedId", None)
+            if matched in by_id:
+                by_id[matched].append(row)
+    return by_id
+
+
+async def fetch_audit_spans_for_correlations(
+    client: LogsQueryClient,
+    workspace_id: str,
+    correlation_ids: list[str],
+    time_range_seconds: int,
+) -> dict[str, list[dict]]:
+    """Batched fetch_audit_spans_for_correlation: one KQL query per sample."""
+    return await _fetch_audit_rows_by_correlations(
+        client,
+        workspace_id,
+        AUDIT_SPANS_BY_CORRELATIONS,
+        correlation_ids,
+        time_range_seconds,
+    )
+
+
+async def fetch_audit_exceptions_for_correlations(
+    client: LogsQueryClient,
+    workspace_id: str,
+    correlation_ids: list[str],
+    time_range_seconds: int,
+) -> dict[str, list[dict]]:
+    """Batched fetch_audit_exceptions_for_correlation."""
+    return await _fetch_audit_rows_by_correlations(
+        client,
+        workspace_id,
+        AUDIT_EXCEPTIONS_BY_CORRELATIONS,
+        correlation_ids,
+        time_range_seconds,
+    )
+
+
+async def fetch_audit_cosmos_diagnostics_for_correlations(
+    client: LogsQueryClient,
+    workspace_id: str,
+    correlation_ids: list[str],
+    time_range_seconds: int,
+) -> dict[str, list[dict]]:
+    """Batched fetch_audit_cosmos_diagnostics_for_correlation."""
+    return await _fetch_audit_rows_by_correlations(
+        client,
+        workspace_id,
+        AUDIT_COSMOS_BY_CORRELATIONS,
+        correlation_ids,
+        time_range_seconds,
+    )
@@ -19,6 +19,7 @@ Phase 24 task group 23.2 (GA migration):
 
 import asyncio
 import logging
+import re
 import time
 
 from agent_framework import Agent, ChatOptions
@@ -26,10 +27,17 @@ from azure.cosmos.exceptions import CosmosResourceNotFoundError
 
 from second_brain.config import get_settings
 from second_brain.db.cosmos import CosmosManager
+from second_brain.db.snapshots import list_snapshots
 from second_brain.spine.agent_emitter import emit_agent_workload
 from second_brain.spine.cosmos_request_id import trace_headers
 from second_brain.spine.storage import SpineRepository
-from second_brain.tools.admin import admin_inbox_item_id_var, build_routing_context
+from second_brain.tools.admin import (
+    AdminTools,
+    admin_inbox_item_id_var,
+    build_routing_context,
+)
+from second_brain.tools.affinity_matcher import AffinityMatcher
+from second_brain.tools.routing_cache import routing_cache
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +54,64 @@ _OUTPUT_TOOL_NAMES = {
 }
 
 
+# Deterministic pre-routing only touches captures that read as a plain
+# item list: no URLs, questions or rule/destination language, and short
+# comma/semicolon/newline separated parts. " and " is never split on
+# ("mac and cheese"); a part naming two destinations stays with the agent.
+_LIST_LEAD = re.compile(
+    r"^(?:please\s+)?(?:i\s+)?(?:need(?:\s+to\s+(?:buy|get))?|buy|get|grab"
+    r"|pick\s+up|add)\s+",
+    re.IGNORECASE,
+)
+_NOT_A_LIST = re.compile(
+    r"https?://|\?|\b(?:goes?|route|rules?|always|never|instead|from|at"
+    r"|remind|destination)\b",
+    re.IGNORECASE,
+)
+_MAX_ITEM_WORDS = 6
+
+
+def _split_errand_list(raw_text: str) -> list[str] | None:
+    """The items of a capture that is a plain errand list, else None.
+
+    Parts keep the user's text; AffinityMatcher.route normalizes for
+    matching.
+    """
+    if _NOT_A_LIST.search(raw_text):
+        return None
+    text = _LIST_LEAD.sub("", raw_text.strip())
+    parts = [
+        re.sub(r"^and\s+", "", part.strip(" .!"), flags=re.IGNORECASE)
+        for part in re.split(r"[,;\n]+", text)
+    ]
+    parts = [part for part in parts if part]
+    if not parts or any(len(part.split()) > _MAX_ITEM_WORDS for part in parts):
+        return None
+    return parts
+
+
+def pre_route_capture(
+    raw_text: str, matcher: AffinityMatcher
+) -> tuple[list[dict], list[str]]:
+    """Split a capture into rule-routed errand items and parts for the agent.
+
+    Returns (items for add_errand_items, remaining parts). A capture that
+    is not a plain list comes back whole as the single remaining part.
+    """
+    parts = _split_errand_list(raw_text)
+    if parts is None:
+        return [], [raw_text]
+    routed: list[dict] = []
+    remaining: list[str] = []
+    for part in parts:
+        match = matcher.route(part)
+        if match is None:
+            remaining.append(part)
+        else:
+            routed.append({"name": part, "destination": match.destination})
+    return routed, remaining
+
+
 def _output_tool_called(response) -> tuple[bool, set[str]]:
     """Inspect response.messages for tool calls.
 
@@ -178,6 +244,53 @@ async def _mark_inbox_failed(
         )
 
 
+async def _file_inbox_item(
+    inbox_container,
+    inbox_item_id: str,
+    th: dict,
+    log_extra: dict,
+) -> None:
+    """Soft-delete a processed inbox item by filing it (best-effort).
+
+    Setting status="filed" + adminProcessingStatus="completed" + ttl in ONE
+    upsert is critical: the api/errands.py:174 unprocessed query gates on
+    adminProcessingStatus, so partial writes would re-fire the agent on a
+    filed doc (Landmine #4). Container TTL must already be enabled
+    (defaultTtl=-1) for the per-doc ttl to take effect (Plan 02 one-time
+    infra step).
+    """
+    try:
+        settings = get_settings()
+        ttl_seconds = settings.inbox_filed_retention_days * 86400
+        doc = await inbox_container.read_item(
+            item=inbox_item_id, partition_key="will", **th
+        )
+        doc["status"] = "filed"
+        doc["adminProcessingStatus"] = "completed"
+        doc["ttl"] = ttl_seconds
+        await inbox_container.upsert_item(body=doc, **th)
+        logger.info(
+            "Filed processed inbox item %s. outcome=filed",
+            inbox_item_id,
+            extra=log_extra,
+        )
+    except CosmosResourceNotFoundError:
+        # User may have swipe-deleted while processing
+        logger.info(
+            "Inbox item %s already deleted (user may have removed it)",
+            inbox_item_id,
+            extra=log_extra,
+        )
+    except Exception as file_exc:
+        # Non-fatal: errand items are the durable output
+        logger.warning(
+            "Failed to file processed inbox item %s: %s",
+            inbox_item_id,
+            file_exc,
+            extra=log_extra,
+        )
+
+
 async def process_admin_capture(
     admin_agent: Agent,
     cosmos_manager: CosmosManager,
@@ -191,7 +304,10 @@ async def process_admin_capture(
     Calls the Admin Agent (non-streaming) with routing context (destinations
     and affinity rules) prepended to the user's capture text. Routes errand
     items to destinations via tools that are pre-registered on the Agent
-    at lifespan construction time (D-05). After processing:
+    at lifespan construction time (D-05). List items an affinity rule
+    covers unambiguously are routed first without the agent (see
+    pre_route_capture); a capture made only of such items never calls it.
+    After processing:
 
     - If the response needs user attention (rule queries, conflicts, etc.),
       the inbox item is kept with status "completed" and the response stored.
@@ -260,10 +376,38 @@ async def process_admin_capture(
         return  # Cannot proceed without the inbox item
 
     try:
+        # Deterministic pre-routing: list items an affinity rule clearly
+        # covers skip the agent; only the rest of the capture is sent to it.
+        pre_routed: list[dict] = []
+        agent_text = raw_text
+        if get_settings().admin_prerouting_enabled:
+            try:
+                matcher = await routing_cache(cosmos_manager).matcher()
+                pre_routed, remaining = pre_route_capture(raw_text, matcher)
+                if pre_routed:
+                    agent_text = ", ".join(remaining)
+            except Exception as route_exc:
+                logger.warning(
+                    "Pre-routing failed for %s: %s. Sending the capture to the agent.",
+                    inbox_item_id,
+                    route_exc,
+                    extra=log_extra,
+                )
+        if pre_routed and not agent_text:
+            result = await AdminTools(cosmos_manager).add_errand_items(items=pre_routed)
+            logger.info(
+                "Pre-routed inbox item %s without the agent: %s. outcome=pre_routed",
+                inbox_item_id,
+                result,
+                extra=log_extra,
+            )
+            await _file_inbox_item(inbox_container, inbox_item_id, th, log_extra)
+            return
+
         # Build routing context (destinations + rules)
         try:
             routing_context = await build_routing_context(cosmos_manager)
-            enriched_text = f"{routing_context}\n\n---\nUser capture: {raw_text}"
+            enriched_text = f"{routing_context}\n\n---\nUser capture: {agent_text}"
         except Exception as ctx_exc:
             logger.warning(
                 "Failed to build routing context for %s: %s. Falling back to raw text.",
@@ -271,7 +415,7 @@ async def process_admin_capture(
                 ctx_exc,
                 extra=log_extra,
             )
-            enriched_text = raw_text
+            enriched_text = agent_text
 
         # D-07 EXPLICIT JUSTIFICATION (CONTEXT D-11):
         # 1. Framework primitive considered: tool_choice='required' (forces
@@ -371,6 +515,22 @@ async def process_admin_capture(
                 extra=log_extra,
             )
 
+        # The agent handled its part; write the items pre-routed above. A
+        # failure here must not mark the capture failed: the agent's items
+        # are already written, so a retry would duplicate them.
+        if pre_routed:
+            try:
+                await AdminTools(cosmos_manager).add_errand_items(items=pre_routed)
+            except Exception as write_exc:
+                logger.error(
+                    "Failed to write pre-routed items for %s: %s. items=%s",
+                    inbox_item_id,
+                    write_exc,
+                    [item["name"] for item in pre_routed],
+                    exc_info=True,
+                    extra=log_extra,
+                )
+
         # Tool was called -- decide whether to keep or delete inbox item
         response_text = response.text if response.text else None
 
@@ -399,42 +559,7 @@ async def process_admin_capture(
                 )
         else:
             # Simple confirmation -- soft-delete by filing the inbox item.
-            # Setting status="filed" + adminProcessingStatus="completed" + ttl
-            # in ONE upsert is critical: the api/errands.py:174 unprocessed
-            # query gates on adminProcessingStatus, so partial writes would
-            # re-fire the agent on a filed doc (Landmine #4). Container TTL
-            # must already be enabled (defaultTtl=-1) for the per-doc ttl to
-            # take effect (Plan 02 one-time infra step).
-            try:
-                settings = get_settings()
-                ttl_seconds = settings.inbox_filed_retention_days * 86400
-                doc = await inbox_container.read_item(
-                    item=inbox_item_id, partition_key="will", **th
-                )
-                doc["status"] = "filed"
-                doc["adminProcessingStatus"] = "completed"
-                doc["ttl"] = ttl_seconds
-                await inbox_container.upsert_item(body=doc, **th)
-                logger.info(
-                    "Filed processed inbox item %s. outcome=filed",
-                    inbox_item_id,
-                    extra=log_extra,
-                )
-            except CosmosResourceNotFoundError:
-                # User may have swipe-deleted while processing
-                logger.info(
-                    "Inbox item %s already deleted (user may have removed it)",
-                    inbox_item_id,
-                    extra=log_extra,
-                )
-            except Exception as file_exc:
-                # Non-fatal: errand items are the durable output
-                logger.warning(
-                    "Failed to file processed inbox item %s: %s",
-                    inbox_item_id,
-                    file_exc,
-                    extra=log_extra,
-                )
+            await _file_inbox_item(inbox_container, inbox_item_id, th, log_extra)
 
         logger.info(
             "Admin Agent processed inbox item %s: %s",
@@ -460,6 +585,11 @@ async def process_admin_capture(
                 inbox_container, inbox_item_id, None, capture_trace_id
             )
     finally:
+        # Errands/tasks and the inbox item's status (the errands listing's
+        # notifications) may all have changed, whatever the outcome.
+        snapshots = list_snapshots(cosmos_manager)
+        snapshots.invalidate("errands")
+        snapshots.invalidate("tasks")
         if spine_repo:
             _duration = int((time.perf_counter() - _spine_start) * 1000)
             await emit_agent_workload(
@@ -0,0 +1,133 @@
+"""Stale-while-revalidate response cache around a SegmentAdapter.
+
+Dashboard refreshes request the same segment detail over and over, and
+each one used to fan out live to Log Analytics / Sentry / Cosmos.
+CachedAdapter keeps the last response per (correlation_kind,
+correlation_id, time-range bucket):
+
+- fresh (age < ttl): served from cache
+- stale (age < ttl + stale): served from cache while one background
+  refresh runs
+- older, or missing: fetched inline; concurrent misses for the same key
+  share a single in-flight fetch
+
+A failed background refresh keeps the stale entry (it expires normally);
+a failed inline fetch propagates to every caller waiting on it. The age of
+the served response is returned so the endpoint can report it as
+ResponseEnvelope.freshness_seconds.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from second_brain.spine.adapters.base import SegmentAdapter
+from second_brain.spine.models import CorrelationKind
+
+logger = logging.getLogger(__name__)
+
+RANGE_BUCKET_SECONDS = 60
+"""time_range_seconds is rounded up to this, so near-identical ranges share."""
+
+CacheKey = tuple[str | None, str | None, int]
+
+
+def range_bucket(time_range_seconds: int) -> int:
+    return -(-time_range_seconds // RANGE_BUCKET_SECONDS) * RANGE_BUCKET_SECONDS
+
+
+class CachedAdapter:
+    """SegmentAdapter wrapper adding a per-adapter SWR cache."""
+
+    def __init__(
+        self,
+        adapter: SegmentAdapter,
+        ttl_seconds: float = 30.0,
+        stale_seconds: float = 300.0,
+        max_entries: int = 256,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._adapter = adapter
+        self.segment_id = adapter.segment_id
+        self.native_url_template = adapter.native_url_template
+        self._ttl = ttl_seconds
+        self._stale = stale_seconds
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[CacheKey, tuple[float, dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._inflight: dict[CacheKey, asyncio.Task[dict[str, Any]]] = {}
+
+    async def fetch_detail(
+        self,
+        correlation_kind: CorrelationKind | None = None,
+        correlation_id: str | None = None,
+        time_range_seconds: int = 3600,
+    ) -> dict[str, Any]:
+        data, _ = await self.fetch_detail_with_age(
+            correlation_kind, correlation_id, time_range_seconds
+        )
+        return data
+
+    async def fetch_detail_with_age(
+        self,
+        correlation_kind: CorrelationKind | None = None,
+        correlation_id: str | None = None,
+        time_range_seconds: int = 3600,
+    ) -> tuple[dict[str, Any], float]:
+        """Return (detail, seconds since it was fetched)."""
+        bucket = range_bucket(time_range_seconds)
+        key: CacheKey = (correlation_kind, correlation_id, bucket)
+        entry = self._entries.get(key)
+        if entry is not None:
+            fetched_at, data = entry
+            age = self._clock() - fetched_at
+            if age < self._ttl:
+                self._entries.move_to_end(key)
+                return data, age
+            if age < self._ttl + self._stale:
+                self._entries.move_to_end(key)
+                if key not in self._inflight:
+                    self._start_fetch(key).add_done_callback(_log_refresh_failure)
+                return data, age
+
+        task = self._inflight.get(key) or self._start_fetch(key)
+        data = await asyncio.shield(task)
+        return data, 0.0
+
+    def _start_fetch(self, key: CacheKey) -> asyncio.Task[dict[str, Any]]:
+        task = asyncio.create_task(self._fetch(key))
+        self._inflight[key] = task
+        return task
+
+    async def _fetch(self, key: CacheKey) -> dict[str, Any]:
+        correlation_kind, correlation_id, bucket = key
+        try:
+            data = await self._adapter.fetch_detail(
+                correlation_kind=correlation_kind,
+                correlation_id=correlation_id,
+                time_range_seconds=bucket,
+            )
+        finally:
+            self._inflight.pop(key, None)
+        self._entries[key] = (self._clock(), data)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return data
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _log_refresh_failure(task: asyncio.Task[dict[str, Any]]) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(
+            "Segment detail background refresh failed", exc_info=task.exception()
+        )
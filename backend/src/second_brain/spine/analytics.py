@@ -0,0 +1,255 @@
+"""Embedded columnar analytics over spine workload events (DuckDB).
+
+Questions like "slowest operations per segment last week" or "failure rate
+by hour" otherwise need KQL round trips or full spine_events scans.
+SpineAnalytics mirrors workload rows into a DuckDB table on this node:
+
+- backfill: on start, each segment's rows since the newest one already in
+  the table (or `backfill_days` ago) are read once through
+  SpineRepository.get_events_between, which fills in archived rows past
+  Cosmos TTL when the archive is attached
+- live: observe() is a SpineRepository listener that only buffers rows;
+  the flush task inserts them every flush_interval_seconds
+
+Rows are keyed on (segment_id, id), so a row seen by both paths is stored
+once. With `path` set the table persists across restarts and the backfill
+only covers the gap. DuckDB is an optional dependency (the `analytics`
+extra) and is imported when a SpineAnalytics is constructed.
+
+Results cover this node only: observe() sees this replica's ingest, and
+rows other replicas record reach the table only through the start-up
+backfill. Queries are therefore capped at window_days (backfill_days), the
+span every replica loaded from Cosmos; a longer `days` is clamped.
+
+Only the fixed, parameterized queries in ANALYTICS_QUERIES are exposed;
+times come back as epoch ms (`*_ms`), like the spine documents' ts_ms.
+Sampled rows count sample_weight times in totals; latency quantiles are
+over the stored rows.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any, Literal
+
+from second_brain.spine.models import from_epoch_ms, row_epoch_ms
+from second_brain.spine.sampling import sample_weight
+
+if TYPE_CHECKING:
+    from second_brain.spine.storage import SpineRepository
+
+logger = logging.getLogger(__name__)
+
+AnalyticsQuery = Literal["slowest_operations", "failure_rate_by_hour", "top_errors"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS workload (
+    segment_id VARCHAR NOT NULL,
+    id VARCHAR NOT NULL,
+    ts_ms BIGINT NOT NULL,
+    operation VARCHAR,
+    outcome VARCHAR,
+    duration_ms BIGINT,
+    sample_weight INTEGER NOT NULL,
+    error_class VARCHAR,
+    PRIMARY KEY (segment_id, id)
+)
+"""
+
+_INSERT = "INSERT OR IGNORE INTO workload VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+
+# Every query takes (since_ms, segment_id, segment_id, limit).
+_SEGMENT_FILTER = "ts_ms >= ? AND (? IS NULL OR segment_id = ?)"
+
+ANALYTICS_QUERIES: dict[str, str] = {
+    "slowest_operations": f"""
+        SELECT segment_id, operation,
+               SUM(sample_weight) AS count,
+               ROUND(SUM(duration_ms * sample_weight) / SUM(sample_weight))
+                   AS avg_ms,
+               quantile_cont(duration_ms, 0.95) AS p95_ms,
+               MAX(duration_ms) AS max_ms
+        FROM workload
+        WHERE {_SEGMENT_FILTER} AND duration_ms IS NOT NULL
+        GROUP BY segment_id, operation
+        ORDER BY p95_ms DESC
+        LIMIT ?
+    """,
+    "failure_rate_by_hour": f"""
+        SELECT segment_id,
+               ts_ms // 3600000 * 3600000 AS hour_ms,
+               SUM(sample_weight) AS total,
+               COALESCE(SUM(sample_weight) FILTER (WHERE outcome = 'failure'), 0)
+                   AS failures,
+               failures / total AS failure_rate
+        FROM workload
+        WHERE {_SEGMENT_FILTER}
+        GROUP BY segment_id, hour_ms
+        ORDER BY hour_ms DESC, segment_id
+        LIMIT ?
+    """,
+    "top_errors": f"""
+        SELECT segment_id, operation, error_class,
+               SUM(sample_weight) AS failures,
+               MAX(ts_ms) AS last_seen_ms
+        FROM workload
+        WHERE {_SEGMENT_FILTER} AND outcome = 'failure'
+        GROUP BY segment_id, operation, error_class
+        ORDER BY failures DESC
+        LIMIT ?
+    """,
+}
+
+
+def _record(row: dict[str, Any]) -> tuple[Any, ...]:
+    payload = row.get("payload", {})
+    return (
+        row["segment_id"],
+        row["id"],
+        row_epoch_ms(row),
+        payload.get("operation"),
+        payload.get("outcome"),
+        payload.get("duration_ms"),
+        sample_weight(payload),
+        payload.get("error_class"),
+    )
+
+
+class SpineAnalytics:
+    """DuckDB mirror of spine workload events with a fixed query set."""
+
+    def __init__(
+        self,
+        repo: SpineRepository,
+        segment_ids: list[str],
+        path: str = "",
+        backfill_days: int = 7,
+        flush_interval_seconds: float = 5.0,
+        max_pending: int = 50_000,
+    ) -> None:
+        import duckdb
+
+        self._repo = repo
+        self._segment_ids = segment_ids
+        self.window_days = backfill_days
+        self._backfill = timedelta(days=backfill_days)
+        self._flush_interval = flush_interval_seconds
+        self._max_pending = max_pending
+        self._conn = duckdb.connect(path or ":memory:")
+        self._conn.execute(_SCHEMA)
+        self._lock = asyncio.Lock()
+        self._pending: list[tuple[Any, ...]] = []
+        self._dropped = 0
+        self._flushed_at: float | None = None
+        self._task: asyncio.Task | None = None
+
+    def observe(self, row: dict[str, Any]) -> None:
+        """Ingest-path hook: buffer a workload row for the next flush."""
+        if row.get("event_type") != "workload":
+            return
+        if len(self._pending) >= self._max_pending:
+            self._dropped += 1
+            return
+        self._pending.append(_record(row))
+
+    @property
+    def freshness_seconds(self) -> int:
+        if self._flushed_at is None:
+            return 0
+        return int(time.monotonic() - self._flushed_at)
+
+    def start(self) -> asyncio.Task:
+        """Backfill, then flush buffered rows periodically. Idempotent."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        return self._task
+
+    async def backfill(self, now: datetime | None = None) -> int:
+        """Load each segment's rows since its newest stored one; return count."""
+        now = now or datetime.now(UTC)
+        newest = dict(
+            await self._execute(
+                "SELECT segment_id, MAX(ts_ms) FROM workload GROUP BY segment_id"
+            )
+        )
+        loaded = 0
+        for segment_id in self._segment_ids:
+            start = now - self._backfill
+            if segment_id in newest:
+                start = max(start, from_epoch_ms(newest[segment_id]))
+            rows = await self._repo.get_events_between(segment_id, start, now)
+            records = [_record(r) for r in rows if r.get("event_type") == "workload"]
+            if records:
+                await self._executemany(_INSERT, records)
+                loaded += len(records)
+        return loaded
+
+    async def flush(self) -> int:
+        """Insert buffered live rows; return how many were flushed."""
+        records, self._pending = self._pending, []
+        if records:
+            await self._executemany(_INSERT, records)
+        self._flushed_at = time.monotonic()
+        if self._dropped:
+            logger.warning(
+                "Spine analytics dropped %d rows (buffer full)", self._dropped
+            )
+            self._dropped = 0
+        return len(records)
+
+    async def query(
+        self,
+        name: AnalyticsQuery,
+        days: int = 7,
+        segment_id: str | None = None,
+        limit: int = 50,
+    ) -> list[dict[str, Any]]:
+        """Run one of ANALYTICS_QUERIES over the last `days` days (at most
+        window_days)."""
+        days = min(days, self.window_days)
+        since_ms = int((datetime.now(UTC) - timedelta(days=days)).timestamp() * 1000)
+        async with self._lock:
+            return await asyncio.to_thread(
+                self._fetch_dicts,
+                ANALYTICS_QUERIES[name],
+                [since_ms, segment_id, segment_id, limit],
+            )
+
+    async def close(self) -> None:
+        """Stop the task, flush what is buffered and close the database."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        await self.flush()
+        self._conn.close()
+
+    async def _run(self) -> None:
+        try:
+            loaded = await self.backfill()
+            logger.info("Spine analytics backfilled %d workload rows", loaded)
+        except Exception:  # noqa: BLE001 - live rows still flow in
+            logger.warning("Spine analytics backfill failed", exc_info=True)
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            try:
+                await self.flush()
+            except Exception:  # noqa: BLE001 - never let the flusher die
+                logger.warning("Spine analytics flush failed", exc_info=True)
+
+    async def _execute(self, sql: str) -> list[tuple[Any, ...]]:
+        async with self._lock:
+            return await asyncio.to_thread(lambda: self._conn.execute(sql).fetchall())
+
+    async def _executemany(self, sql: str, records: list[tuple[Any, ...]]) -> None:
+        async with self._lock:
+            await asyncio.to_thread(self._conn.executemany, sql, records)
+
+    def _fetch_dicts(self, sql: str, params: list[Any]) -> list[dict[str, Any]]:
+        cursor = self._conn.execute(sql, params)
+        columns = [d[0] for d in cursor.description]
+        return [dict(zip(columns, row, strict=True)) for row in cursor.fetchall()]
@@ -3,59 +3,160 @@
 from __future__ import annotations
 
 import time
-from collections.abc import Awaitable, Callable
-from datetime import UTC, datetime
-from typing import Any
+from collections import Counter
+from collections.abc import AsyncIterator, Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, model_validator
 
+from second_brain.spine.adapters.cache import CachedAdapter
 from second_brain.spine.adapters.registry import AdapterRegistry
-from second_brain.spine.audit.models import AuditReport, build_summary
+from second_brain.spine.analytics import AnalyticsQuery, SpineAnalytics
+from second_brain.spine.audit.models import (
+    AuditReport,
+    AuditStreamSummary,
+    AuditStreamTrace,
+    build_summary,
+)
 from second_brain.spine.audit.walker import CorrelationAuditor
 from second_brain.spine.evaluator import StatusEvaluator
-from second_brain.spine.ledger_policy import (
-    LEDGER_EXPECTED_CHAINS,
-    ledger_metadata_for,
+from second_brain.spine.incremental import IncrementalStatusEvaluator
+from second_brain.spine.ingest import (
+    MAX_DECODED_BYTES,
+    MAX_ENCODED_BYTES,
+    BatchDecodeError,
+    IngestDeduper,
+    decode_batch_body,
+    server_weighted,
+    validate_batch,
 )
+from second_brain.spine.ledger_policy import chain_gaps, ledger_metadata_for
 from second_brain.spine.models import (
     STALE_FRESHNESS_SECONDS,
+    AnalyticsResponse,
+    BatchIngestResponse,
     CorrelationEvent,
     CorrelationKind,
     CorrelationResponse,
     IngestEvent,
+    IngestEventResult,
     ResponseEnvelope,
     RollupInfo,
     SegmentDetailResponse,
     SegmentLedgerResponse,
     SegmentStatus,
     SegmentStatusResponse,
+    SegmentTimeline,
+    SloResponse,
     StatusBoardResponse,
+    TimelineResponse,
+    TimelineSpan,
     TransactionEvent,
     TransactionLedgerRow,
     TransactionPathResponse,
+    WorkloadBucket,
+    WorkloadRollupResponse,
+    epoch_ms,
+    from_epoch_ms,
     parse_cosmos_ts,
+    row_epoch_ms,
 )
 from second_brain.spine.registry import SegmentRegistry
+from second_brain.spine.rollups import (
+    ALL_OPERATIONS,
+    GRANULARITY_SECONDS,
+    RollupGranularity,
+    bucket_start,
+)
+from second_brain.spine.slo import SloEngine
+from second_brain.spine.snapshot import StatusSnapshot, status_change_events
 from second_brain.spine.storage import SpineRepository
+from second_brain.spine.timeline import build_intervals, downsample, time_in_status
+from second_brain.spine.writer import SpineEventWriter
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
+
+MAX_ROLLUP_BUCKETS = 1440
+MAX_TIMELINE_BUCKETS = 1440
+_BUCKET_FIELDS = tuple(f for f in WorkloadBucket.model_fields if f != "bucket_start")
+
+
+MAX_AUDIT_SAMPLE = 20
+MAX_STREAMED_AUDIT_SAMPLE = 200
 
 
 class AuditRequest(BaseModel):
-    """Request body for POST /api/spine/audit/correlation."""
+    """Request body for POST /api/spine/audit/correlation.
+
+    `stream` switches the response to one record per line (NDJSON) or per
+    SSE event: each finished trace, then the summary. Streamed samples may
+    be larger since nothing is held back until the end.
+    """
 
     correlation_kind: CorrelationKind
     correlation_id: str | None = None
-    sample_size: int = Field(5, ge=1, le=20)
+    sample_size: int = Field(5, ge=1, le=MAX_STREAMED_AUDIT_SAMPLE)
     time_range_seconds: int = Field(86400, ge=60, le=604800)  # 1min - 7d
+    stream: Literal["ndjson", "sse"] | None = None
+
+    @model_validator(mode="after")
+    def _cap_unstreamed_sample(self) -> AuditRequest:
+        if self.stream is None and self.sample_size > MAX_AUDIT_SAMPLE:
+            raise ValueError(
+                f"sample_size above {MAX_AUDIT_SAMPLE} requires stream mode"
+            )
+        return self
+
+
+async def _audit_stream_body(
+    records: AsyncIterator[AuditStreamTrace | AuditStreamSummary],
+    fmt: Literal["ndjson", "sse"],
+) -> AsyncIterator[str]:
+    async for record in records:
+        data = record.model_dump_json()
+        if fmt == "ndjson":
+            yield f"{data}\n"
+        else:
+            yield f"event: {record.record}\ndata: {data}\n\n"
+
+
+async def _single_audit_records(
+    auditor: CorrelationAuditor, req: AuditRequest
+) -> AsyncIterator[AuditStreamTrace | AuditStreamSummary]:
+    trace = await auditor.audit(
+        kind=req.correlation_kind,
+        correlation_id=req.correlation_id,
+        time_range_seconds=req.time_range_seconds,
+    )
+    yield AuditStreamTrace(trace=trace)
+    yield AuditStreamSummary(
+        correlation_kind=req.correlation_kind,
+        sample_size_requested=1,
+        sample_size_returned=1,
+        time_range_seconds=req.time_range_seconds,
+        summary=build_summary([trace]),
+    )
 
 
 def build_spine_router(
     repo: SpineRepository,
-    evaluator: StatusEvaluator,
+    evaluator: StatusEvaluator | IncrementalStatusEvaluator,
     adapter_registry: AdapterRegistry,
     segment_registry: SegmentRegistry,
     auth_dependency: Callable[..., Awaitable[None]],
     auditor: CorrelationAuditor | None = None,
+    writer: SpineEventWriter | None = None,
+    snapshot: StatusSnapshot | None = None,
+    deduper: IngestDeduper | None = None,
+    slo_engine: SloEngine | None = None,
+    analytics: SpineAnalytics | None = None,
 ) -> APIRouter:
     """Build the /api/spine router with injected dependencies."""
 
@@ -64,20 +165,103 @@ def build_spine_router(
     # segment_state container instead of evaluating on demand.
 
     router = APIRouter(prefix="/api/spine", tags=["spine"])
+    replays = deduper if deduper is not None else IngestDeduper()
 
     @router.post("/ingest", status_code=204, dependencies=[Depends(auth_dependency)])
     async def ingest(event: IngestEvent) -> None:
-        await repo.record_event(event)
+        await repo.record_event(server_weighted(event))
         return None
 
+    @router.post(
+        "/ingest/batch",
+        response_model=BatchIngestResponse,
+        dependencies=[Depends(auth_dependency)],
+    )
+    async def ingest_batch(request: Request) -> BatchIngestResponse:
+        """Ingest a JSON array of events (gzip allowed) with per-event results.
+
+        Events carrying an event_id are idempotent: recent replays are dropped
+        by the in-process dedupe window, older ones by the Cosmos id conflict.
+        """
+        # Stop reading one byte past the largest body decode_batch_body takes.
+        limit = max(MAX_DECODED_BYTES, MAX_ENCODED_BYTES) + 1
+        raw = bytearray()
+        async for chunk in request.stream():
+            raw += chunk
+            if len(raw) >= limit:
+                break
+        try:
+            items = decode_batch_body(
+                bytes(raw), request.headers.get("content-encoding")
+            )
+        except BatchDecodeError as exc:
+            raise HTTPException(400, str(exc)) from exc
+
+        valid, results = validate_batch(items)
+        to_write: list[tuple[int, IngestEvent]] = []
+        batch_keys: set[tuple[str, str]] = set()
+        for index, event in valid:
+            inner = event.root
+            if inner.event_id is not None:
+                key = (inner.segment_id, inner.event_id)
+                if key in replays or key in batch_keys:
+                    results.append(
+                        IngestEventResult(
+                            index=index, event_id=inner.event_id, status="duplicate"
+                        )
+                    )
+                    continue
+                batch_keys.add(key)
+            to_write.append((index, event))
+
+        outcomes = await repo.record_event_batch([event for _, event in to_write])
+        for (index, event), outcome in zip(to_write, outcomes, strict=True):
+            inner = event.root
+            if inner.event_id is not None and outcome != "failed":
+                replays.add((inner.segment_id, inner.event_id))
+            results.append(
+                IngestEventResult(
+                    index=index,
+                    event_id=inner.event_id,
+                    status="accepted" if outcome == "written" else outcome,
+                    error="write failed; retry" if outcome == "failed" else None,
+                )
+            )
+
+        results.sort(key=lambda r: r.index)
+        counts = Counter(r.status for r in results)
+        return BatchIngestResponse(
+            accepted=counts["accepted"],
+            duplicates=counts["duplicate"],
+            invalid=counts["invalid"],
+            failed=counts["failed"],
+            results=results,
+        )
+
+    @router.get("/writer", dependencies=[Depends(auth_dependency)])
+    async def writer_stats() -> dict[str, Any]:
+        """Write-behind queue counters (depth, drops, written, failed)."""
+        if writer is None:
+            return {"enabled": False}
+        return {"enabled": True, **writer.stats()}
+
     @router.get(
         "/status",
         response_model=StatusBoardResponse,
         dependencies=[Depends(auth_dependency)],
     )
-    async def status() -> StatusBoardResponse:
+    async def status(request: Request, response: Response) -> StatusBoardResponse:
+        """Status board. Served from the evaluator's in-memory snapshot (with a
+        weak ETag / If-None-Match) once loaded; from Cosmos until then."""
         start = time.perf_counter()
-        states = await repo.get_all_segment_states()
+        if snapshot is not None and snapshot.loaded:
+            etag = snapshot.etag
+            if etag in _if_none_match(request):
+                return Response(status_code=304, headers={"ETag": etag})
+            response.headers["ETag"] = etag
+            states = snapshot.states()
+        else:
+            states = await repo.get_all_segment_states()
         states_by_id = {s["segment_id"]: s for s in states}
 
         # Determine which segments are hosted by a red host (suppression)
@@ -110,7 +294,12 @@ def build_spine_router(
                 continue
 
             raw_status: SegmentStatus = state["status"]
-            last_updated = parse_cosmos_ts(state["last_updated"])
+            last_updated_ms = state.get("last_updated_ms")
+            last_updated = (
+                from_epoch_ms(last_updated_ms)
+                if last_updated_ms is not None
+                else parse_cosmos_ts(state["last_updated"])
+            )
             freshness = int((now - last_updated).total_seconds())
             max_freshness = max(max_freshness, freshness)
 
@@ -148,6 +337,17 @@ def build_spine_router(
             ),
         )
 
+    @router.get("/status/stream", dependencies=[Depends(auth_dependency)])
+    async def status_stream() -> StreamingResponse:
+        """Server-sent status transitions (one event per record_status_change)."""
+        if snapshot is None:
+            raise HTTPException(503, "Status stream not configured")
+        return StreamingResponse(
+            status_change_events(snapshot),
+            media_type="text/event-stream",
+            headers=SSE_HEADERS,
+        )
+
     @router.get(
         "/correlation/{kind}/{correlation_id}",
         response_model=CorrelationResponse,
@@ -196,31 +396,263 @@ def build_spine_router(
                 404, f"No adapter registered for segment '{segment_id}'"
             )
         start = time.perf_counter()
-        data = await adapter.fetch_detail(
-            correlation_kind=correlation_kind,
-            correlation_id=correlation_id,
-            time_range_seconds=time_range_seconds,
-        )
+        age = 0.0
+        if isinstance(adapter, CachedAdapter):
+            data, age = await adapter.fetch_detail_with_age(
+                correlation_kind=correlation_kind,
+                correlation_id=correlation_id,
+                time_range_seconds=time_range_seconds,
+            )
+        else:
+            data = await adapter.fetch_detail(
+                correlation_kind=correlation_kind,
+                correlation_id=correlation_id,
+                time_range_seconds=time_range_seconds,
+            )
         latency_ms = int((time.perf_counter() - start) * 1000)
         return SegmentDetailResponse(
             data=data,
             envelope=ResponseEnvelope(
                 generated_at=datetime.now(UTC),
-                freshness_seconds=0,
+                freshness_seconds=int(age),
                 partial_sources=[],
                 query_latency_ms=latency_ms,
                 native_url=data.get("native_url"),
             ),
         )
 
+    @router.get(
+        "/segment/{segment_id}/rollups",
+        response_model=WorkloadRollupResponse,
+        dependencies=[Depends(auth_dependency)],
+    )
+    async def segment_rollups(
+        segment_id: str,
+        granularity: RollupGranularity = "minute",
+        window_seconds: int = Query(3600, ge=60, le=2592000),  # 1 min - 30 days
+        operation: str = ALL_OPERATIONS,
+    ) -> WorkloadRollupResponse:
+        """Pre-aggregated workload time series for charting segment history.
+
+        One single-partition query over spine_rollups; no raw-event scan.
+        """
+        step = GRANULARITY_SECONDS[granularity]
+        if window_seconds // step > MAX_ROLLUP_BUCKETS:
+            raise HTTPException(
+                400,
+                f"window_seconds={window_seconds} spans more than "
+                f"{MAX_ROLLUP_BUCKETS} {granularity} buckets",
+            )
+        start = time.perf_counter()
+        now = datetime.now(UTC)
+        first = bucket_start(now - timedelta(seconds=window_seconds), granularity)
+        end = bucket_start(now, granularity) + timedelta(seconds=step)
+        rows = await repo.get_rollups(
+            segment_id, granularity, first, end, operation=operation
+        )
+        by_start = {parse_cosmos_ts(r["bucket_start"]): r for r in rows}
+        buckets: list[WorkloadBucket] = []
+        cursor = first
+        while cursor < end:
+            row = by_start.get(cursor, {})
+            buckets.append(
+                WorkloadBucket(
+                    bucket_start=cursor,
+                    **{k: row[k] for k in _BUCKET_FIELDS if k in row},
+                )
+            )
+            cursor += timedelta(seconds=step)
+        latency_ms = int((time.perf_counter() - start) * 1000)
+        return WorkloadRollupResponse(
+            segment_id=segment_id,
+            granularity=granularity,
+            operation=operation,
+            buckets=buckets,
+            envelope=ResponseEnvelope(
+                generated_at=now,
+                freshness_seconds=0,
+                partial_sources=[],
+                query_latency_ms=latency_ms,
+            ),
+        )
+
+    @router.get(
+        "/timeline",
+        response_model=TimelineResponse,
+        dependencies=[Depends(auth_dependency)],
+    )
+    async def timeline(
+        window_seconds: int = Query(2592000, ge=60, le=2592000),  # 1 min - 30 days
+        resolution_seconds: int = Query(3600, ge=60),
+        segment_id: str | None = None,
+    ) -> TimelineResponse:
+        """Status spans per segment over the window, downsampled to the
+        resolution, with time-in-status percentages.
+
+        Two reads for every segment: the window's transitions (projected,
+        one query) and the current segment states for segments that did
+        not change in the window.
+        """
+        if window_seconds // resolution_seconds > MAX_TIMELINE_BUCKETS:
+            raise HTTPException(
+                400,
+                f"window_seconds={window_seconds} spans more than "
+                f"{MAX_TIMELINE_BUCKETS} buckets of {resolution_seconds}s",
+            )
+        if segment_id is not None:
+            try:
+                configs = [segment_registry.get(segment_id)]
+            except KeyError:
+                raise HTTPException(404, f"Unknown segment '{segment_id}'") from None
+        else:
+            configs = segment_registry.all()
+        started = time.perf_counter()
+        now = datetime.now(UTC)
+        start = now - timedelta(seconds=window_seconds)
+        rows = await repo.get_status_transitions(start, now, segment_id=segment_id)
+        by_segment: dict[str, list[dict[str, Any]]] = {}
+        for row in rows:
+            by_segment.setdefault(row["segment_id"], []).append(row)
+        current: dict[str, Any] = {}
+        if any(cfg.segment_id not in by_segment for cfg in configs):
+            current = {
+                s["segment_id"]: s.get("status")
+                for s in await repo.get_all_segment_states()
+            }
+
+        start_ms, end_ms = epoch_ms(start), epoch_ms(now)
+        segments: list[SegmentTimeline] = []
+        for cfg in configs:
+            intervals = build_intervals(
+                by_segment.get(cfg.segment_id, []),
+                current.get(cfg.segment_id),
+                start_ms,
+                end_ms,
+            )
+            spans = downsample(intervals, start_ms, end_ms, resolution_seconds * 1000)
+            segments.append(
+                SegmentTimeline(
+                    segment_id=cfg.segment_id,
+                    name=cfg.name_or_id(),
+                    spans=[
+                        TimelineSpan(
+                            start=from_epoch_ms(a),
+                            end=from_epoch_ms(b),
+                            status=status,
+                        )
+                        for a, b, status in spans
+                    ],
+                    time_in_status=time_in_status(intervals),
+                )
+            )
+        return TimelineResponse(
+            start=start,
+            end=now,
+            resolution_seconds=resolution_seconds,
+            segments=segments,
+            envelope=ResponseEnvelope(
+                generated_at=now,
+                freshness_seconds=0,
+                partial_sources=[],
+                query_latency_ms=int((time.perf_counter() - started) * 1000),
+            ),
+        )
+
+    @router.get(
+        "/analytics/{query}",
+        response_model=AnalyticsResponse,
+        dependencies=[Depends(auth_dependency)],
+    )
+    async def analytics_query(
+        query: AnalyticsQuery,
+        days: int = Query(7, ge=1, le=90),
+        segment_id: str | None = None,
+        limit: int = Query(50, ge=1, le=1000),
+    ) -> AnalyticsResponse:
+        """Aggregate workload questions answered from the local DuckDB mirror
+        (no Log Analytics or Cosmos round trip). Covers this node's ingest
+        plus its backfill; `days` is capped at the backfill window and the
+        response reports the window actually used."""
+        if analytics is None:
+            raise HTTPException(503, "Spine analytics not configured")
+        start = time.perf_counter()
+        days = min(days, analytics.window_days)
+        rows = await analytics.query(
+            query, days=days, segment_id=segment_id, limit=limit
+        )
+        return AnalyticsResponse(
+            query=query,
+            days=days,
+            segment_id=segment_id,
+            rows=rows,
+            envelope=ResponseEnvelope(
+                generated_at=datetime.now(UTC),
+                freshness_seconds=analytics.freshness_seconds,
+                partial_sources=[],
+                query_latency_ms=int((time.perf_counter() - start) * 1000),
+            ),
+        )
+
+    @router.get(
+        "/slo",
+        response_model=SloResponse,
+        dependencies=[Depends(auth_dependency)],
+    )
+    async def slo(segment_id: str | None = None) -> SloResponse:
+        """Error-budget burn rates (1 h, 6 h, SLO period) per segment.
+
+        Served from the SLO engine's in-memory windows; a segment is only
+        reseeded from spine_rollups when its resync interval has passed.
+        """
+        if slo_engine is None:
+            raise HTTPException(503, "SLO engine not configured")
+        start = time.perf_counter()
+        if segment_id is None:
+            segment_ids = [cfg.segment_id for cfg in slo_engine.configs()]
+        elif any(cfg.segment_id == segment_id for cfg in slo_engine.configs()):
+            segment_ids = [segment_id]
+        else:
+            raise HTTPException(404, f"No SLO declared for segment '{segment_id}'")
+        segments = [await slo_engine.report(sid) for sid in segment_ids]
+        return SloResponse(
+            segments=segments,
+            envelope=ResponseEnvelope(
+                generated_at=datetime.now(UTC),
+                freshness_seconds=max(
+                    (slo_engine.synced_age_seconds(sid) for sid in segment_ids),
+                    default=0,
+                ),
+                partial_sources=[],
+                query_latency_ms=int((time.perf_counter() - start) * 1000),
+            ),
+        )
+
     @router.post(
         "/audit/correlation",
         response_model=AuditReport,
         dependencies=[Depends(auth_dependency)],
     )
-    async def audit_correlation(req: AuditRequest) -> AuditReport:
+    async def audit_correlation(req: AuditRequest) -> AuditReport | Response:
         if auditor is None:
             raise HTTPException(503, "Audit not configured")
+        if req.stream is not None:
+            if req.correlation_id:
+                records = _single_audit_records(auditor, req)
+            else:
+                records = auditor.audit_sample_stream(
+                    kind=req.correlation_kind,
+                    sample_size=req.sample_size,
+                    time_range_seconds=req.time_range_seconds,
+                )
+            return StreamingResponse(
+                _audit_stream_body(records, req.stream),
+                media_type=(
+                    "application/x-ndjson"
+                    if req.stream == "ndjson"
+                    else "text/event-stream"
+                ),
+                headers=SSE_HEADERS,
+            )
         if req.correlation_id:
             trace = await auditor.audit(
                 kind=req.correlation_kind,
@@ -275,7 +707,7 @@ def build_spine_router(
             rows.append(
                 TransactionLedgerRow(
                     segment_id=r["segment_id"],
-                    timestamp=parse_cosmos_ts(r["timestamp"]),
+                    timestamp=from_epoch_ms(row_epoch_ms(r)),
                     operation=payload["operation"],
                     outcome=payload["outcome"],
                     duration_ms=payload["duration_ms"],
@@ -310,9 +742,11 @@ def build_spine_router(
     ) -> TransactionPathResponse:
         """Return the full cross-segment transaction path for one correlation id.
 
-        RESEARCH Option A enrichment: join `spine_correlation` (which segments)
-        with `spine_events` (duration/operation) in the read path — no schema
-        change to the correlation container.
+        Served from one single-partition read of `spine_correlation`: rows
+        carry operation/duration/outcome/error_class and the correlation
+        summary doc carries the segments seen. Rows written before that
+        denormalization fall back to joining `spine_events` by
+        (segment_id, timestamp) within `window_seconds`.
 
         Gaps are reported explicitly via `missing_required` /
         `present_optional` / `unexpected` derived from
@@ -320,25 +754,24 @@ def build_spine_router(
         raw audit registry).
         """
         start = time.perf_counter()
-        # "Which segments" — from spine_correlation (sorted ASC by timestamp
-        # by the repository).
-        corr_rows = await repo.get_correlation_events(kind, correlation_id)
-        # "Operation/duration enrichment" — from spine_events filtered by
-        # correlation within the window.
-        raw_events = await repo.get_workload_events_for_correlation(
-            correlation_kind=kind,
-            correlation_id=correlation_id,
-            window_seconds=window_seconds,
-        )
-        # Index raw events by (segment_id, timestamp) for the enrichment join.
-        raw_by_segment_ts: dict[tuple[str, str], dict[str, Any]] = {
-            (e["segment_id"], e["timestamp"]): e for e in raw_events
-        }
+        corr_rows, summary = await repo.get_correlation_path(kind, correlation_id)
+        raw_by_segment_ts: dict[tuple[str, str], dict[str, Any]] = {}
+        if any("operation" not in cr for cr in corr_rows):
+            raw_events = await repo.get_workload_events_for_correlation(
+                correlation_kind=kind,
+                correlation_id=correlation_id,
+                window_seconds=window_seconds,
+            )
+            raw_by_segment_ts = {
+                (e["segment_id"], e["timestamp"]): e for e in raw_events
+            }
         events: list[TransactionEvent] = []
         for cr in corr_rows:
-            key = (cr["segment_id"], cr["timestamp"])
-            raw = raw_by_segment_ts.get(key)
-            payload = raw.get("payload", {}) if raw else {}
+            if "operation" in cr:
+                payload = cr
+            else:
+                raw = raw_by_segment_ts.get((cr["segment_id"], cr["timestamp"]))
+                payload = raw.get("payload", {}) if raw else {}
             events.append(
                 TransactionEvent(
                     segment_id=cr["segment_id"],
@@ -352,22 +785,18 @@ def build_spine_router(
                 )
             )
         # Explicit gap reporting — use operator-facing ledger policy.
-        chain = LEDGER_EXPECTED_CHAINS[kind]
-        chain_ids = {s.segment_id for s in chain}
-        required = {s.segment_id for s in chain if s.required}
-        optional = {s.segment_id for s in chain if not s.required}
         segments_seen = {e.segment_id for e in events}
-        missing_required = sorted(required - segments_seen)
-        present_optional = sorted(optional & segments_seen)
-        unexpected = sorted(segments_seen - chain_ids)
+        if summary is not None:
+            segments_seen.update(summary.get("segments_seen", []))
+        gaps = chain_gaps(kind, segments_seen)
         latency_ms = int((time.perf_counter() - start) * 1000)
         return TransactionPathResponse(
             correlation_kind=kind,
             correlation_id=correlation_id,
             events=events,
-            missing_required=missing_required,
-            present_optional=present_optional,
-            unexpected=unexpected,
+            missing_required=gaps["missing_required"],
+            present_optional=gaps["present_optional"],
+            unexpected=gaps["unexpected"],
             envelope=ResponseEnvelope(
                 generated_at=datetime.now(UTC),
                 freshness_seconds=0,
@@ -377,3 +806,8 @@ def build_spine_router(
         )
 
     return router
+
+
+def _if_none_match(request: Request) -> set[str]:
+    header = request.headers.get("if-none-match", "")
+    return {tag.strip() for tag in header.split(",") if tag.strip()}
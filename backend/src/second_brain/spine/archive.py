@@ -0,0 +1,302 @@
+"""Cold archive for aged spine rows (gzip NDJSON, date-partitioned).
+
+Hot retention stays with Cosmos TTL; the archive is what keeps history past
+it. SpineArchiver periodically exports every row written to spine_events,
+spine_status_history and spine_correlation more than `archive_after_seconds`
+ago (by the Cosmos `_ts` write time, so late-arriving rows are never
+skipped) into files laid out as
+
+    {kind}/{partition}/{YYYY-MM-DD}/{run}.ndjson.gz
+
+where partition is the container's partition key value (segment_id, or
+correlation_kind for correlation rows) and the date is the row's own
+`timestamp`. A per-kind watermark file records how far exports have got,
+so a restarted archiver resumes instead of re-exporting. Files are
+immutable; re-running an export window writes the same file name again.
+
+Once the archive is running, container TTLs can be shortened to a little
+more than `archive_after_seconds`: hot size and query RU then stay bounded
+however long the history is, and SpineRepository's range reads fill in
+older rows from here.
+
+NDJSON rather than Parquet: no columnar dependency is installed, rows are
+heterogeneous payload dicts, and gzip gets most of the size win.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import logging
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
+
+from azure.core.exceptions import ResourceNotFoundError
+
+from second_brain.spine.models import parse_cosmos_ts
+
+if TYPE_CHECKING:
+    from azure.storage.blob.aio import ContainerClient
+
+    from second_brain.spine.storage import SpineRepository
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_KINDS: dict[str, str] = {
+    "events": "segment_id",
+    "status_history": "segment_id",
+    "correlation": "correlation_kind",
+}
+"""Archived row kind -> the field its files are partitioned on."""
+
+_SYSTEM_FIELDS = ("_rid", "_self", "_etag", "_attachments", "_lsn")
+_EXPORT_STEP_SECONDS = 3600
+_WATERMARK_CACHE_SECONDS = 60.0
+
+
+# ---------------------------------------------------------------------------
+# Stores
+# ---------------------------------------------------------------------------
+
+
+class ArchiveStore(Protocol):
+    """Minimal object store the archive needs: put / get / list by prefix."""
+
+    async def put(self, path: str, data: bytes) -> None: ...
+
+    async def get(self, path: str) -> bytes | None:
+        """File contents, or None if there is no file at path."""
+        ...
+
+    async def list(self, prefix: str) -> list[str]:
+        """Paths of every file under prefix."""
+        ...
+
+    async def close(self) -> None: ...
+
+
+class LocalArchiveStore:
+    """Archive files under a local directory (dev, tests, mounted volumes)."""
+
+    def __init__(self, root: str | Path) -> None:
+        self._root = Path(root)
+
+    def _put(self, path: str, data: bytes) -> None:
+        target = self._root / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_suffix(target.suffix + ".tmp")
+        tmp.write_bytes(data)
+        tmp.replace(target)
+
+    def _get(self, path: str) -> bytes | None:
+        target = self._root / path
+        return target.read_bytes() if target.is_file() else None
+
+    def _list(self, prefix: str) -> list[str]:
+        base = self._root / prefix
+        if not base.is_dir():
+            return []
+        return sorted(
+            p.relative_to(self._root).as_posix()
+            for p in base.rglob("*")
+            if p.is_file() and not p.name.endswith(".tmp")
+        )
+
+    async def put(self, path: str, data: bytes) -> None:
+        await asyncio.to_thread(self._put, path, data)
+
+    async def get(self, path: str) -> bytes | None:
+        return await asyncio.to_thread(self._get, path)
+
+    async def list(self, prefix: str) -> list[str]:
+        return await asyncio.to_thread(self._list, prefix)
+
+    async def close(self) -> None:
+        return None
+
+
+class BlobArchiveStore:
+    """Archive files as block blobs in one Azure Blob Storage container."""
+
+    def __init__(self, container: ContainerClient) -> None:
+        self._container = container
+
+    async def put(self, path: str, data: bytes) -> None:
+        await self._container.upload_blob(path, data, overwrite=True)
+
+    async def get(self, path: str) -> bytes | None:
+        try:
+            downloader = await self._container.download_blob(path)
+        except ResourceNotFoundError:
+            return None
+        return await downloader.readall()
+
+    async def list(self, prefix: str) -> list[str]:
+        return [
+            blob.name
+            async for blob in self._container.list_blobs(name_starts_with=prefix)
+        ]
+
+    async def close(self) -> None:
+        await self._container.close()
+
+
+# ---------------------------------------------------------------------------
+# Encoding + layout
+# ---------------------------------------------------------------------------
+
+
+def encode_rows(rows: list[dict[str, Any]]) -> bytes:
+    lines = "".join(json.dumps(row, separators=(",", ":")) + "\n" for row in rows)
+    return gzip.compress(lines.encode(), compresslevel=6)
+
+
+def decode_rows(data: bytes) -> list[dict[str, Any]]:
+    return [json.loads(line) for line in gzip.decompress(data).splitlines() if line]
+
+
+def archive_path(kind: str, partition: str, day: date, run: str) -> str:
+    return f"{kind}/{partition}/{day.isoformat()}/{run}.ndjson.gz"
+
+
+def row_time(row: dict[str, Any]) -> datetime:
+    ts = parse_cosmos_ts(row["timestamp"])
+    return ts if ts.tzinfo is not None else ts.replace(tzinfo=UTC)
+
+
+class SpineArchive:
+    """Reads and writes archive files on an ArchiveStore."""
+
+    def __init__(
+        self,
+        store: ArchiveStore,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.store = store
+        self._clock = clock
+        self._watermarks: dict[str, tuple[float, int]] = {}
+
+    async def watermark(self, kind: str) -> int:
+        """Cosmos `_ts` up to which rows of `kind` are archived (0 = none)."""
+        cached = self._watermarks.get(kind)
+        if cached is not None and self._clock() - cached[0] < _WATERMARK_CACHE_SECONDS:
+            return cached[1]
+        raw = await self.store.get(f"{kind}/_watermark.json")
+        value = json.loads(raw)["archived_through_ts"] if raw else 0
+        self._watermarks[kind] = (self._clock(), value)
+        return value
+
+    async def set_watermark(self, kind: str, ts: int) -> None:
+        body = {"archived_through_ts": ts, "updated_at": datetime.now(UTC).isoformat()}
+        await self.store.put(f"{kind}/_watermark.json", json.dumps(body).encode())
+        self._watermarks[kind] = (self._clock(), ts)
+
+    async def export(self, kind: str, rows: list[dict[str, Any]], run: str) -> int:
+        """Write rows as one file per (partition, day); returns files written."""
+        field = ARCHIVE_KINDS[kind]
+        groups: dict[tuple[str, date], list[dict[str, Any]]] = defaultdict(list)
+        for row in rows:
+            clean = {k: v for k, v in row.items() if k not in _SYSTEM_FIELDS}
+            day = row_time(row).date()
+            groups[(str(row.get(field)), day)].append(clean)
+        for (partition, day), group in groups.items():
+            group.sort(key=lambda r: r["timestamp"])
+            await self.store.put(
+                archive_path(kind, partition, day, run), encode_rows(group)
+            )
+        return len(groups)
+
+    async def read(
+        self,
+        kind: str,
+        partition: str,
+        start: datetime,
+        end: datetime,
+    ) -> list[dict[str, Any]]:
+        """Archived rows of one partition with start <= timestamp < end.
+
+        Lists only the day prefixes the range covers, not the partition's
+        whole history.
+        """
+        days = [
+            start.date() + timedelta(days=n)
+            for n in range((end.date() - start.date()).days + 1)
+        ]
+        listings = await asyncio.gather(
+            *(self.store.list(f"{kind}/{partition}/{day.isoformat()}/") for day in days)
+        )
+        rows: list[dict[str, Any]] = []
+        for path in (p for listing in listings for p in listing):
+            data = await self.store.get(path)
+            if data is None:
+                continue
+            for row in decode_rows(data):
+                if start <= row_time(row) < end:
+                    rows.append(row)
+        return rows
+
+
+# ---------------------------------------------------------------------------
+# Archiver job
+# ---------------------------------------------------------------------------
+
+
+class SpineArchiver:
+    """Exports aged spine rows to the archive on an interval."""
+
+    def __init__(
+        self,
+        repo: SpineRepository,
+        archive: SpineArchive,
+        archive_after_seconds: int = 2 * 86400,
+        interval_seconds: float = 3600.0,
+    ) -> None:
+        self._repo = repo
+        self._archive = archive
+        self._archive_after = archive_after_seconds
+        self._interval = interval_seconds
+
+    async def run_once(self, now: datetime | None = None) -> dict[str, int]:
+        """Export everything newly past the archive age; returns rows per kind."""
+        upper = int((now or datetime.now(UTC)).timestamp()) - self._archive_after
+        exported: dict[str, int] = {}
+        for kind in ARCHIVE_KINDS:
+            mark = await self._archive.watermark(kind)
+            if mark == 0:
+                # First run: start from the oldest row still in Cosmos.
+                oldest = await self._repo.get_oldest_write_ts(kind)
+                mark = oldest - 1 if oldest else upper
+            total = 0
+            while mark < upper:
+                step_end = min(mark + _EXPORT_STEP_SECONDS, upper)
+                rows = await self._repo.get_rows_written_between(kind, mark, step_end)
+                if rows:
+                    await self._archive.export(kind, rows, run=f"{mark + 1}-{step_end}")
+                await self._archive.set_watermark(kind, step_end)
+                total += len(rows)
+                mark = step_end
+            exported[kind] = total
+        return exported
+
+    async def run(self) -> None:
+        while True:
+            try:
+                exported = await self.run_once()
+                logger.info("Spine archive export complete: %s", exported)
+            except Exception:  # noqa: BLE001 - retried next interval from the watermark
+                logger.warning("Spine archive export failed", exc_info=True)
+            await asyncio.sleep(self._interval)
+
+
+def merge_hot_and_archived(
+    hot: list[dict[str, Any]], archived: list[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """Union by id (hot copy wins), sorted by timestamp."""
+    by_id = {row["id"]: row for row in archived}
+    by_id.update((row["id"], row) for row in hot)
+    return sorted(by_id.values(), key=lambda r: r["timestamp"])
@@ -93,6 +93,25 @@ class AuditReport(BaseModel):
     instrumentation_warning: str | None = None
 
 
+class AuditStreamTrace(BaseModel):
+    """One streamed line of a sampled audit: a finished trace."""
+
+    record: Literal["trace"] = "trace"
+    trace: TraceAudit
+
+
+class AuditStreamSummary(BaseModel):
+    """Final streamed line of a sampled audit: the AuditReport minus traces."""
+
+    record: Literal["summary"] = "summary"
+    correlation_kind: CorrelationKind
+    sample_size_requested: int
+    sample_size_returned: int
+    time_range_seconds: int
+    summary: AuditSummary
+    instrumentation_warning: str | None = None
+
+
 def roll_up_trace_verdict(
     *,
     missing_required: list[str],
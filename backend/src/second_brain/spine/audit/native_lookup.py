@@ -5,10 +5,15 @@ dependency to inject and tests have a single mock surface. When a fetcher is
 None (e.g. LogsQueryClient unavailable at app startup), the corresponding
 method returns an empty list — keeps the audit endpoint from 500-ing in
 degraded environments.
+
+Sampled audits use the `*_for_many` methods: with batch fetchers wired, a
+whole sample costs one query per native source; without them they fall
+back to one single-id call per correlation_id.
 """
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any, Protocol
 
 
@@ -28,6 +33,17 @@ class NativeFetcher(Protocol):
     ) -> list[dict[str, Any]]: ...
 
 
+class NativeBatchFetcher(Protocol):
+    """Batched fetcher: rows for many correlation_ids, keyed by id."""
+
+    async def __call__(
+        self,
+        *,
+        correlation_ids: list[str],
+        time_range_seconds: int,
+    ) -> dict[str, list[dict[str, Any]]]: ...
+
+
 class NativeLookup:
     """Thin facade around the three native-source query helpers."""
 
@@ -37,10 +53,16 @@ class NativeLookup:
         spans_fetcher: NativeFetcher | None,
         exceptions_fetcher: NativeFetcher | None,
         cosmos_fetcher: NativeFetcher | None,
+        spans_batch_fetcher: NativeBatchFetcher | None = None,
+        exceptions_batch_fetcher: NativeBatchFetcher | None = None,
+        cosmos_batch_fetcher: NativeBatchFetcher | None = None,
     ) -> None:
         self._spans = spans_fetcher
         self._exceptions = exceptions_fetcher
         self._cosmos = cosmos_fetcher
+        self._spans_batch = spans_batch_fetcher
+        self._exceptions_batch = exceptions_batch_fetcher
+        self._cosmos_batch = cosmos_batch_fetcher
 
     async def spans(
         self, correlation_id: str, *, time_range_seconds: int
@@ -71,3 +93,53 @@ class NativeLookup:
             correlation_id=correlation_id,
             time_range_seconds=time_range_seconds,
         )
+
+    async def spans_for_many(
+        self, correlation_ids: list[str], *, time_range_seconds: int
+    ) -> dict[str, list[dict[str, Any]]]:
+        return await _for_many(
+            self._spans_batch, self._spans, correlation_ids, time_range_seconds
+        )
+
+    async def exceptions_for_many(
+        self, correlation_ids: list[str], *, time_range_seconds: int
+    ) -> dict[str, list[dict[str, Any]]]:
+        return await _for_many(
+            self._exceptions_batch,
+            self._exceptions,
+            correlation_ids,
+            time_range_seconds,
+        )
+
+    async def cosmos_for_many(
+        self, correlation_ids: list[str], *, time_range_seconds: int
+    ) -> dict[str, list[dict[str, Any]]]:
+        return await _for_many(
+            self._cosmos_batch, self._cosmos, correlation_ids, time_range_seconds
+        )
+
+
+async def _for_many(
+    batch: NativeBatchFetcher | None,
+    single: NativeFetcher | None,
+    correlation_ids: list[str],
+    time_range_seconds: int,
+) -> dict[str, list[dict[str, Any]]]:
+    """Rows per correlation_id; every requested id is a key."""
+    if not correlation_ids:
+        return {}
+    if batch is not None:
+        rows = await batch(
+            correlation_ids=correlation_ids,
+            time_range_seconds=time_range_seconds,
+        )
+        return {cid: rows.get(cid, []) for cid in correlation_ids}
+    if single is None:
+        return {cid: [] for cid in correlation_ids}
+    results = await asyncio.gather(
+        *(
+            single(correlation_id=cid, time_range_seconds=time_range_seconds)
+            for cid in correlation_ids
+        )
+    )
+    return dict(zip(correlation_ids, results, strict=True))
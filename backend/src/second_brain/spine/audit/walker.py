@@ -4,6 +4,8 @@ Public surface:
   - CorrelationAuditor.audit(kind, id, time_range_seconds) -> TraceAudit
   - CorrelationAuditor.audit_sample(kind, sample_size, time_range_seconds)
     -> AuditReport
+  - CorrelationAuditor.audit_sample_stream(...) -> async iterator of
+    AuditStreamTrace records, then one AuditStreamSummary
 
 Implements three checks per trace:
   1. Correlation integrity   — required vs. optional vs. unexpected segments
@@ -16,13 +18,15 @@ See docs/superpowers/specs/2026-04-18-per-segment-correlation-audit-design.md.
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable
+from collections.abc import AsyncIterator, Callable, Iterable
 from datetime import UTC, datetime
 from typing import Any
 
 from second_brain.spine.audit.chains import EXPECTED_CHAINS
 from second_brain.spine.audit.models import (
     AuditReport,
+    AuditStreamSummary,
+    AuditStreamTrace,
     Misattribution,
     OrphanReport,
     TimeWindow,
@@ -62,6 +66,10 @@ _APPINSIGHTS_SEGMENTS: frozenset[str] = frozenset(
     }
 )
 
+# audit_sample_stream: ids per batched lookup, and batches in flight at once.
+STREAM_BATCH_SIZE = 5
+STREAM_CONCURRENCY = 2
+
 # Tracks per-trace which segments had any native data returned by the lookup.
 # Keyed by correlation_id → set of segment_ids with non-empty native results.
 SegmentNativeMap = dict[str, set[str]]
@@ -103,6 +111,50 @@ class CorrelationAuditor:
     ) -> tuple[TraceAudit, set[str]]:
         """Internal: returns the audit + which segments had any native data."""
         records = await self._repo.get_correlation_events(kind, correlation_id)
+        spans = await self._lookup.spans(
+            correlation_id, time_range_seconds=time_range_seconds
+        )
+        exceptions = await self._lookup.exceptions(
+            correlation_id, time_range_seconds=time_range_seconds
+        )
+        cosmos_rows = await self._lookup.cosmos(
+            correlation_id, time_range_seconds=time_range_seconds
+        )
+
+        chain_ids = {s.segment_id for s in EXPECTED_CHAINS[kind]}
+        workload_by_segment: dict[str, list[dict[str, Any]]] = {}
+        for segment_id in {r["segment_id"] for r in records} & chain_ids:
+            workload_by_segment[segment_id] = await self._workload_events_for(
+                segment_id=segment_id,
+                correlation_id=correlation_id,
+                time_range_seconds=time_range_seconds,
+            )
+        return self._evaluate_trace(
+            kind,
+            correlation_id,
+            records=records,
+            workload_by_segment=workload_by_segment,
+            spans=spans,
+            exceptions=exceptions,
+            cosmos_rows=cosmos_rows,
+        )
+
+    def _evaluate_trace(
+        self,
+        kind: CorrelationKind,
+        correlation_id: str,
+        *,
+        records: list[dict[str, Any]],
+        workload_by_segment: dict[str, list[dict[str, Any]]],
+        spans: list[dict[str, Any]],
+        exceptions: list[dict[str, Any]],
+        cosmos_rows: list[dict[str, Any]],
+    ) -> tuple[TraceAudit, set[str]]:
+        """Run the three checks on already-fetched spine + native rows.
+
+        `workload_by_segment` holds this trace's workload events for each
+        segment that is both in the spine records and in the expected chain.
+        """
         segments_seen: dict[str, list[dict[str, Any]]] = {}
         for r in records:
             segments_seen.setdefault(r["segment_id"], []).append(r)
@@ -127,27 +179,11 @@ class CorrelationAuditor:
             window = TimeWindow(start=now, end=now)
 
         # ---- Check 2: mis-attribution ----
-        spans = await self._lookup.spans(
-            correlation_id, time_range_seconds=time_range_seconds
-        )
-        exceptions = await self._lookup.exceptions(
-            correlation_id, time_range_seconds=time_range_seconds
-        )
-        cosmos_rows = await self._lookup.cosmos(
-            correlation_id, time_range_seconds=time_range_seconds
-        )
-
-        workload_by_segment: dict[str, list[dict[str, Any]]] = {}
         misattributions: list[Misattribution] = []
         native_present: set[str] = set()
 
         for segment_id in segments_seen.keys() & chain_ids:
-            workload_events = await self._workload_events_for(
-                segment_id=segment_id,
-                correlation_id=correlation_id,
-                time_range_seconds=time_range_seconds,
-            )
-            workload_by_segment[segment_id] = workload_events
+            workload_events = workload_by_segment.get(segment_id, [])
             if _segment_has_native_data(segment_id, spans, exceptions, cosmos_rows):
                 native_present.add(segment_id)
             misattributions.extend(
@@ -162,10 +198,10 @@ class CorrelationAuditor:
 
         # ---- Check 3: orphans ----
         orphans: list[OrphanReport] = []
-        for segment_id, workload_events in workload_by_segment.items():
+        for segment_id in segments_seen.keys() & chain_ids:
             orphan_report = _detect_orphans(
                 segment_id=segment_id,
-                workload_events=workload_events,
+                workload_events=workload_by_segment.get(segment_id, []),
                 spans=spans,
             )
             if orphan_report and orphan_report.orphan_count > 0:
@@ -213,26 +249,64 @@ class CorrelationAuditor:
             and e.get("payload", {}).get("correlation_id") == correlation_id
         ]
 
+    async def _audit_batch(
+        self,
+        kind: CorrelationKind,
+        ids: list[str],
+        time_range_seconds: int,
+    ) -> list[tuple[TraceAudit, set[str]]]:
+        """Audit `ids` with two spine queries and one query per native source."""
+        (
+            records_by_id,
+            workload_by_id,
+            spans_by_id,
+            exceptions_by_id,
+            cosmos_by_id,
+        ) = await asyncio.gather(
+            self._repo.get_correlation_events_for_ids(kind, ids),
+            self._repo.get_workload_events_for_correlations(ids, time_range_seconds),
+            self._lookup.spans_for_many(ids, time_range_seconds=time_range_seconds),
+            self._lookup.exceptions_for_many(
+                ids, time_range_seconds=time_range_seconds
+            ),
+            self._lookup.cosmos_for_many(ids, time_range_seconds=time_range_seconds),
+        )
+
+        results = []
+        for cid in ids:
+            workload_by_segment: dict[str, list[dict[str, Any]]] = {}
+            for event in workload_by_id.get(cid, []):
+                workload_by_segment.setdefault(event["segment_id"], []).append(event)
+            results.append(
+                self._evaluate_trace(
+                    kind,
+                    cid,
+                    records=records_by_id.get(cid, []),
+                    workload_by_segment=workload_by_segment,
+                    spans=spans_by_id.get(cid, []),
+                    exceptions=exceptions_by_id.get(cid, []),
+                    cosmos_rows=cosmos_by_id.get(cid, []),
+                )
+            )
+        return results
+
     async def audit_sample(
         self,
         kind: CorrelationKind,
         sample_size: int,
         time_range_seconds: int,
     ) -> AuditReport:
-        """Sample the most-recent correlation_ids and audit each."""
+        """Sample the most-recent correlation_ids and audit each.
+
+        Fetches are batched across the sample: two spine queries and one
+        query per native source, however many traces are sampled.
+        """
         ids = await self._repo.get_recent_correlation_ids(
             kind=kind,
             time_range_seconds=time_range_seconds,
             limit=sample_size,
         )
-        results = await asyncio.gather(
-            *(
-                self._audit_with_native_presence(
-                    kind, cid, time_range_seconds=time_range_seconds
-                )
-                for cid in ids
-            )
-        )
+        results = await self._audit_batch(kind, ids, time_range_seconds)
         traces = [trace for trace, _ in results]
         per_trace_native = [native_present for _, native_present in results]
 
@@ -247,6 +321,63 @@ class CorrelationAuditor:
             instrumentation_warning=warning,
         )
 
+    async def audit_sample_stream(
+        self,
+        kind: CorrelationKind,
+        sample_size: int,
+        time_range_seconds: int,
+        *,
+        batch_size: int = STREAM_BATCH_SIZE,
+        concurrency: int = STREAM_CONCURRENCY,
+    ) -> AsyncIterator[AuditStreamTrace | AuditStreamSummary]:
+        """Streaming audit_sample: each trace as soon as its batch completes.
+
+        The sample is audited in batches of `batch_size` ids with at most
+        `concurrency` batches in flight, so a large sample runs at a steady
+        query rate. Traces arrive in completion order; the last record is
+        the summary (the AuditReport minus its traces).
+        """
+        ids = await self._repo.get_recent_correlation_ids(
+            kind=kind,
+            time_range_seconds=time_range_seconds,
+            limit=sample_size,
+        )
+        batches = [ids[i : i + batch_size] for i in range(0, len(ids), batch_size)]
+        traces: list[TraceAudit] = []
+        per_trace_native: list[set[str]] = []
+        pending: set[asyncio.Task] = set()
+        try:
+            while batches or pending:
+                while batches and len(pending) < concurrency:
+                    pending.add(
+                        asyncio.create_task(
+                            self._audit_batch(kind, batches.pop(0), time_range_seconds)
+                        )
+                    )
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    for trace, native_present in task.result():
+                        traces.append(trace)
+                        per_trace_native.append(native_present)
+                        yield AuditStreamTrace(trace=trace)
+        finally:
+            # Client disconnected mid-stream (or a batch failed): stop the rest.
+            for task in pending:
+                task.cancel()
+
+        yield AuditStreamSummary(
+            correlation_kind=kind,
+            sample_size_requested=sample_size,
+            sample_size_returned=len(traces),
+            time_range_seconds=time_range_seconds,
+            summary=build_summary(traces),
+            instrumentation_warning=_instrumentation_warning(
+                kind, traces, per_trace_native
+            ),
+        )
+
 
 def _native_links_for(segment_ids: Iterable[str]) -> dict[str, str]:
     return {
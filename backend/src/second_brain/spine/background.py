@@ -1,4 +1,4 @@
-"""Background tasks: status evaluator loop + self-liveness emitter."""
+"""Background tasks: status evaluator loop, follower refresh, self-liveness."""
 
 from __future__ import annotations
 
@@ -8,40 +8,59 @@ import socket
 from datetime import UTC, datetime
 
 from second_brain.spine.evaluator import StatusEvaluator
+from second_brain.spine.incremental import IncrementalStatusEvaluator
 from second_brain.spine.models import IngestEvent, LivenessPayload, _LivenessEvent
 from second_brain.spine.registry import SegmentRegistry
+from second_brain.spine.snapshot import StatusSnapshot
 from second_brain.spine.storage import SpineRepository
 
 logger = logging.getLogger(__name__)
 
 
 async def evaluator_loop(
-    evaluator: StatusEvaluator,
+    evaluator: StatusEvaluator | IncrementalStatusEvaluator,
     repo: SpineRepository,
     registry: SegmentRegistry,
     interval_seconds: int = 30,
+    snapshot: StatusSnapshot | None = None,
 ) -> None:
     """Run the evaluator for every registered segment every N seconds.
 
     Per-segment isolation: if one segment's tick fails, the remaining segments
     in the same sweep still run. This is load-bearing for a health monitor.
+
+    With a snapshot, every upserted state and status transition is also
+    published to it, and the previous status comes from the snapshot rather
+    than a Cosmos point read once this process has written the segment.
     """
+    if snapshot is not None and not snapshot.loaded:
+        try:
+            for state in await repo.get_all_segment_states():
+                snapshot.update(state)
+            snapshot.mark_loaded()
+        except Exception:
+            logger.warning("Status snapshot prime failed", exc_info=True)
     while True:
         for cfg in registry.all():
             try:
                 result = await evaluator.evaluate(cfg.segment_id)
-                prev = await repo.get_segment_state(cfg.segment_id)
+                prev = snapshot.get(cfg.segment_id) if snapshot else None
+                if prev is None:
+                    prev = await repo.get_segment_state(cfg.segment_id)
                 prev_status = prev.get("status") if prev else None
                 now = datetime.now(UTC)
-                await repo.upsert_segment_state(
+                state = await repo.upsert_segment_state(
                     segment_id=cfg.segment_id,
                     status=result.status,
                     headline=result.headline,
                     last_updated=now,
                     evaluator_inputs=result.evaluator_inputs,
+                    latency_sketches=result.latency_sketches,
                 )
+                if snapshot is not None:
+                    snapshot.update(state)
                 if prev_status != result.status:
-                    await repo.record_status_change(
+                    transition = await repo.record_status_change(
                         segment_id=cfg.segment_id,
                         status=result.status,
                         prev_status=prev_status,
@@ -49,12 +68,48 @@ async def evaluator_loop(
                         evaluator_outputs=result.evaluator_inputs,
                         timestamp=now,
                     )
+                    if snapshot is not None:
+                        snapshot.publish(transition)
             except Exception:
                 logger.warning(
                     "Evaluator tick failed for segment_id=%s",
                     cfg.segment_id,
                     exc_info=True,
                 )
+        if snapshot is not None:
+            snapshot.mark_loaded()
+        await asyncio.sleep(interval_seconds)
+
+
+async def follow_segment_states(
+    repo: SpineRepository,
+    snapshot: StatusSnapshot,
+    interval_seconds: int = 30,
+) -> None:
+    """Keep a follower replica's snapshot current while another one evaluates.
+
+    One spine_segment_state read per interval replaces the per-segment
+    evaluate + upsert sweep; status changes seen between reads are published
+    to the snapshot so SSE clients on this replica still get transitions.
+    """
+    while True:
+        try:
+            for state in await repo.get_all_segment_states():
+                prev = snapshot.get(state["segment_id"])
+                snapshot.update(state)
+                if prev is not None and prev.get("status") != state.get("status"):
+                    snapshot.publish(
+                        {
+                            "segment_id": state["segment_id"],
+                            "status": state.get("status"),
+                            "prev_status": prev.get("status"),
+                            "headline": state.get("headline"),
+                            "timestamp": state.get("last_updated"),
+                        }
+                    )
+            snapshot.mark_loaded()
+        except Exception:
+            logger.warning("Status snapshot refresh failed", exc_info=True)
         await asyncio.sleep(interval_seconds)
 
 
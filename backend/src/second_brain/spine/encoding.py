@@ -0,0 +1,140 @@
+"""Compact (v2) spine_events document schema.
+
+A legacy spine_events row repeats long key names, an ISO timestamp next to
+`ts_ms`, an `ingested_at` stamp and every optional payload field as null.
+Workload rows are most of the container, so those bytes are most of its
+storage and of every write's RU charge. The compact schema keeps only:
+
+- `id`, `segment_id` (the partition key) and `ts_ms`, unchanged, so point
+  reads, partitioning and every ts_ms range filter work on both shapes
+- `v`: schema version (COMPACT_SCHEMA_VERSION)
+- `t`: event type code (EVENT_TYPE_CODES)
+- `p`: the payload under short keys, optional fields omitted when unset:
+  workload `o` operation, `r` outcome code (OUTCOME_CODES), `d` duration_ms,
+  `ck`/`ci` correlation kind/id, `e` error_class, `w` sample_weight (only
+  when > 1); liveness `i` instance_id; readiness `c` checks as
+  [name, status code, detail?]
+
+`o` is the operation's interned id in the segment's operation dictionary
+(an int) or, when the operation could not be interned, the operation
+string itself. SpineRepository owns the dictionary; this module only maps
+between the two shapes. decode_event rebuilds the legacy row shape, so
+nothing past the repository sees compact rows. Legacy rows pass through.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from second_brain.spine.models import from_epoch_ms
+
+COMPACT_SCHEMA_VERSION = 2
+
+EVENT_TYPE_CODES: dict[str, int] = {"liveness": 0, "readiness": 1, "workload": 2}
+OUTCOME_CODES: dict[str, int] = {"success": 0, "failure": 1, "degraded": 2}
+CHECK_STATUS_CODES: dict[str, int] = {"ok": 0, "failing": 1}
+
+_EVENT_TYPES = {code: name for name, code in EVENT_TYPE_CODES.items()}
+_OUTCOMES = {code: name for name, code in OUTCOME_CODES.items()}
+_CHECK_STATUSES = {code: name for name, code in CHECK_STATUS_CODES.items()}
+
+
+def is_compact(row: dict[str, Any]) -> bool:
+    return row.get("v") == COMPACT_SCHEMA_VERSION
+
+
+def encode_event(body: dict[str, Any], operation_ids: dict[str, int]) -> dict[str, Any]:
+    """Compact document for a legacy-shaped spine_events body.
+
+    `operation_ids` is the segment's operation dictionary; an operation not
+    in it is stored as its string.
+    """
+    event_type = body["event_type"]
+    payload = body["payload"]
+    if event_type == "workload":
+        operation = payload["operation"]
+        compact: dict[str, Any] = {
+            "o": operation_ids.get(operation, operation),
+            "r": OUTCOME_CODES[payload["outcome"]],
+            "d": payload["duration_ms"],
+        }
+        for key, field in (
+            ("ck", "correlation_kind"),
+            ("ci", "correlation_id"),
+            ("e", "error_class"),
+        ):
+            if payload.get(field) is not None:
+                compact[key] = payload[field]
+        if payload.get("sample_weight", 1) != 1:
+            compact["w"] = payload["sample_weight"]
+    elif event_type == "liveness":
+        compact = {"i": payload["instance_id"]}
+    else:
+        compact = {
+            "c": [
+                [check["name"], CHECK_STATUS_CODES[check["status"]]]
+                + ([check["detail"]] if check.get("detail") is not None else [])
+                for check in payload["checks"]
+            ]
+        }
+    return {
+        "id": body["id"],
+        "segment_id": body["segment_id"],
+        "ts_ms": body["ts_ms"],
+        "v": COMPACT_SCHEMA_VERSION,
+        "t": EVENT_TYPE_CODES[event_type],
+        "p": compact,
+    }
+
+
+def interned_operation_id(row: dict[str, Any]) -> int | None:
+    """The interned operation id of a compact workload row, if it has one."""
+    if not is_compact(row):
+        return None
+    operation = row.get("p", {}).get("o")
+    return operation if isinstance(operation, int) else None
+
+
+def decode_event(
+    row: dict[str, Any], operation_names: dict[int, str]
+) -> dict[str, Any]:
+    """Legacy-shaped row for a compact one; legacy rows are returned as is.
+
+    `timestamp` is rebuilt from ts_ms (millisecond precision). Other
+    projected columns on the row are kept.
+    """
+    if not is_compact(row):
+        return row
+    decoded = {k: v for k, v in row.items() if k not in ("v", "t", "p")}
+    event_type = _EVENT_TYPES[row["t"]]
+    compact = row.get("p", {})
+    if event_type == "workload":
+        operation = compact.get("o")
+        if isinstance(operation, int):
+            operation = operation_names.get(operation, f"#{operation}")
+        payload: dict[str, Any] = {
+            "operation": operation,
+            "outcome": _OUTCOMES[compact["r"]],
+            "duration_ms": compact.get("d"),
+            "correlation_kind": compact.get("ck"),
+            "correlation_id": compact.get("ci"),
+            "error_class": compact.get("e"),
+            "sample_weight": compact.get("w", 1),
+        }
+    elif event_type == "liveness":
+        payload = {"instance_id": compact.get("i")}
+    else:
+        payload = {
+            "checks": [
+                {
+                    "name": check[0],
+                    "status": _CHECK_STATUSES[check[1]],
+                    "detail": check[2] if len(check) > 2 else None,
+                }
+                for check in compact.get("c", [])
+            ]
+        }
+    decoded["event_type"] = event_type
+    decoded["timestamp"] = from_epoch_ms(row["ts_ms"]).isoformat()
+    decoded["payload"] = payload
+    return decoded
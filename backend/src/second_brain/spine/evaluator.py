@@ -3,24 +3,36 @@
 Hard rules:
 - Status precedence: red > yellow > green > stale.
 - No-data behavior: a segment with no liveness in 2x interval is stale.
+  Liveness is the newer of the window's liveness rows and the segment's
+  spine_heartbeats documents (which hold steady-state liveness).
 - Source-lag handling: acceptable_lag_seconds is added to the staleness window.
+- Latency: workload duration_ms feeds per-operation DDSketches; the
+  segment-wide p50/p95/p99 are evaluator inputs, so `latency_p95_ms` etc.
+  can be used as yellow/red thresholds.
+- Sampling: each workload row counts as payload.sample_weight events in
+  totals, failures and latency sketches (the streak counts rows; failures
+  are never sampled).
 """
 
 from __future__ import annotations
 
 import logging
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
 
 from second_brain.spine.models import (
     STALE_FRESHNESS_SECONDS,
     SegmentStatus,
-    parse_cosmos_ts,
+    from_epoch_ms,
+    row_epoch_ms,
 )
 from second_brain.spine.registry import EvaluatorConfig, SegmentRegistry
-from second_brain.spine.storage import SpineRepository
+from second_brain.spine.rollups import ALL_OPERATIONS
+from second_brain.spine.sampling import sample_weight
+from second_brain.spine.sketch import LATENCY_QUANTILES, LatencySketch, latency_inputs
+from second_brain.spine.storage import EVALUATOR_FIELDS, SpineRepository
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +47,8 @@ class EvaluationResult:
     last_event_at: datetime | None
     freshness_seconds: int
     evaluator_inputs: dict[str, Any]
+    # Serialized window sketches keyed by operation ("*" = whole segment).
+    latency_sketches: dict[str, dict[str, Any]] = field(default_factory=dict)
 
 
 class StatusEvaluator:
@@ -55,48 +69,31 @@ class StatusEvaluator:
         events = await self._repo.get_recent_events(
             segment_id=segment_id,
             window_seconds=cfg.workload_window_seconds,
+            fields=EVALUATOR_FIELDS,
         )
 
+        heartbeat = await self._repo.get_latest_heartbeat(segment_id)
+
         # Compute freshness from most recent event of any type
-        most_recent = max(
-            (parse_cosmos_ts(e["timestamp"]) for e in events),
-            default=None,
-        )
+        most_recent = _newest(_latest(events), heartbeat)
         now = self._now()
-        freshness = (
-            int((now - most_recent).total_seconds())
-            if most_recent
-            else STALE_FRESHNESS_SECONDS
-        )
+        freshness = _freshness(now, most_recent)
 
         # Stale check (precedes all other status logic)
-        stale_window = cfg.liveness_interval_seconds * 2 + cfg.acceptable_lag_seconds
         liveness_events = [e for e in events if e["event_type"] == "liveness"]
-        most_recent_liveness = max(
-            (parse_cosmos_ts(e["timestamp"]) for e in liveness_events),
-            default=None,
-        )
-        if (
-            most_recent_liveness is None
-            or (now - most_recent_liveness).total_seconds() > stale_window
-        ):
-            return EvaluationResult(
-                segment_id=segment_id,
-                status="stale",
-                headline="No recent liveness signal",
-                last_event_at=most_recent,
-                freshness_seconds=freshness,
-                evaluator_inputs={"reason": "stale"},
-            )
+        most_recent_liveness = _newest(_latest(liveness_events), heartbeat)
+        if _is_stale(cfg, now, most_recent_liveness):
+            return _stale_result(segment_id, most_recent, freshness)
 
         # Compute workload metrics
         workload_events = [e for e in events if e["event_type"] == "workload"]
-        workload_events.sort(key=lambda e: e["timestamp"])
-        total = len(workload_events)
+        workload_events.sort(key=row_epoch_ms)
+        total = sum(sample_weight(e["payload"]) for e in workload_events)
         failures = sum(
-            1 for e in workload_events if e["payload"]["outcome"] == "failure"
+            sample_weight(e["payload"])
+            for e in workload_events
+            if e["payload"]["outcome"] == "failure"
         )
-        rate = failures / total if total > 0 else 0.0
 
         # Consecutive failures (most recent N)
         consecutive_failures = 0
@@ -113,43 +110,50 @@ class StatusEvaluator:
             for e in readiness_events
         )
 
-        inputs = {
-            "workload_total": total,
-            "workload_failures": failures,
-            "workload_failure_rate": rate,
-            "consecutive_failures": consecutive_failures,
-            "any_readiness_failed": any_readiness_failed,
-        }
+        sketches: dict[str, LatencySketch] = {}
+        for e in workload_events:
+            _add_latency(sketches, e["payload"])
 
+        inputs = _workload_inputs(
+            total,
+            failures,
+            consecutive_failures,
+            any_readiness_failed,
+            sketches.get(ALL_OPERATIONS),
+        )
+        return self.classify(
+            cfg, inputs, most_recent, freshness, _serialize_sketches(sketches)
+        )
+
+    def classify(
+        self,
+        cfg: EvaluatorConfig,
+        inputs: dict[str, Any],
+        last_event_at: datetime | None,
+        freshness_seconds: int,
+        latency_sketches: dict[str, dict[str, Any]] | None = None,
+    ) -> EvaluationResult:
+        """Apply red, then yellow thresholds to non-stale evaluator inputs."""
         # Apply red thresholds first
         if self._exceeds(cfg.red_thresholds, inputs):
-            return EvaluationResult(
-                segment_id=segment_id,
-                status="red",
-                headline=self._red_headline(inputs, cfg),
-                last_event_at=most_recent,
-                freshness_seconds=freshness,
-                evaluator_inputs=inputs,
-            )
-
+            status: SegmentStatus = "red"
+            headline = self._red_headline(inputs, cfg)
         # Then yellow
-        if self._exceeds(cfg.yellow_thresholds, inputs):
-            return EvaluationResult(
-                segment_id=segment_id,
-                status="yellow",
-                headline=self._yellow_headline(inputs),
-                last_event_at=most_recent,
-                freshness_seconds=freshness,
-                evaluator_inputs=inputs,
-            )
+        elif self._exceeds(cfg.yellow_thresholds, inputs):
+            status = "yellow"
+            headline = self._yellow_headline(inputs, cfg)
+        else:
+            status = "green"
+            headline = self._green_headline(inputs, cfg)
 
         return EvaluationResult(
-            segment_id=segment_id,
-            status="green",
-            headline=self._green_headline(inputs, cfg),
-            last_event_at=most_recent,
-            freshness_seconds=freshness,
+            segment_id=cfg.segment_id,
+            status=status,
+            headline=headline,
+            last_event_at=last_event_at,
+            freshness_seconds=freshness_seconds,
             evaluator_inputs=inputs,
+            latency_sketches=latency_sketches or {},
         )
 
     @staticmethod
@@ -177,15 +181,21 @@ class StatusEvaluator:
         consec = inputs.get("consecutive_failures", 0)
         if isinstance(consec_threshold, (int, float)) and consec >= consec_threshold:
             return f"{consec} consecutive failures"
+        latency = _latency_breach(cfg.red_thresholds, inputs)
+        if latency is not None:
+            return latency
         rate_pct = int(inputs.get("workload_failure_rate", 0) * 100)
         fails = inputs["workload_failures"]
         total = inputs["workload_total"]
         return f"{rate_pct}% failure rate ({fails}/{total})"
 
     @staticmethod
-    def _yellow_headline(inputs: dict[str, Any]) -> str:
+    def _yellow_headline(inputs: dict[str, Any], cfg: EvaluatorConfig) -> str:
         if inputs.get("any_readiness_failed"):
             return "Dependency check failing"
+        latency = _latency_breach(cfg.yellow_thresholds, inputs)
+        if latency is not None:
+            return latency
         rate_pct = int(inputs.get("workload_failure_rate", 0) * 100)
         fails = inputs["workload_failures"]
         total = inputs["workload_total"]
@@ -200,6 +210,112 @@ class StatusEvaluator:
         return f"{total} ops, 0 failures in last {window_label}"
 
 
+def _is_stale(
+    cfg: EvaluatorConfig,
+    now: datetime,
+    most_recent_liveness: datetime | None,
+) -> bool:
+    """No liveness within liveness_interval * 2 + acceptable_lag means stale."""
+    stale_window = cfg.liveness_interval_seconds * 2 + cfg.acceptable_lag_seconds
+    return (
+        most_recent_liveness is None
+        or (now - most_recent_liveness).total_seconds() > stale_window
+    )
+
+
+def _stale_result(
+    segment_id: str,
+    last_event_at: datetime | None,
+    freshness_seconds: int,
+) -> EvaluationResult:
+    return EvaluationResult(
+        segment_id=segment_id,
+        status="stale",
+        headline="No recent liveness signal",
+        last_event_at=last_event_at,
+        freshness_seconds=freshness_seconds,
+        evaluator_inputs={"reason": "stale"},
+    )
+
+
+def _workload_inputs(
+    total: int,
+    failures: int,
+    consecutive_failures: int,
+    any_readiness_failed: bool,
+    latency: LatencySketch | None = None,
+) -> dict[str, Any]:
+    """The evaluator_inputs dict persisted on segment state."""
+    return {
+        "workload_total": total,
+        "workload_failures": failures,
+        "workload_failure_rate": failures / total if total > 0 else 0.0,
+        "consecutive_failures": consecutive_failures,
+        "any_readiness_failed": any_readiness_failed,
+        **latency_inputs(latency),
+    }
+
+
+def _add_latency(sketches: dict[str, LatencySketch], payload: dict[str, Any]) -> None:
+    """Record one workload duration under its operation and the segment total."""
+    duration_ms = payload.get("duration_ms")
+    if duration_ms is None:
+        return
+    weight = sample_weight(payload)
+    for key in (payload.get("operation") or "unknown", ALL_OPERATIONS):
+        sketch = sketches.get(key)
+        if sketch is None:
+            sketch = sketches[key] = LatencySketch()
+        sketch.add(duration_ms, weight)
+
+
+def _serialize_sketches(
+    sketches: dict[str, LatencySketch],
+) -> dict[str, dict[str, Any]]:
+    return {op: s.to_dict() for op, s in sorted(sketches.items()) if s.count > 0}
+
+
+def _latency_breach(thresholds: dict[str, Any], inputs: dict[str, Any]) -> str | None:
+    """Headline for the first latency threshold exceeded, if any.
+
+    Only used when a failure-rate threshold was not also exceeded, so an
+    outage still reads as an outage rather than as a slow segment.
+    """
+    rate_threshold = thresholds.get("workload_failure_rate")
+    if (
+        isinstance(rate_threshold, (int, float))
+        and inputs.get("workload_failure_rate", 0) >= rate_threshold
+    ):
+        return None
+    for key in LATENCY_QUANTILES:
+        threshold = thresholds.get(key)
+        value = inputs.get(key)
+        if threshold is not None and value is not None and value >= threshold:
+            label = key.removeprefix("latency_").removesuffix("_ms")
+            return f"{label} latency {value}ms (threshold {threshold}ms)"
+    return None
+
+
+def _latest(rows: list[dict[str, Any]]) -> datetime | None:
+    """Newest row time: compared as epoch ms, converted once."""
+    newest = max((row_epoch_ms(r) for r in rows), default=None)
+    return from_epoch_ms(newest) if newest is not None else None
+
+
+def _newest(a: datetime | None, b: datetime | None) -> datetime | None:
+    if a is None or b is None:
+        return a or b
+    return max(a, b)
+
+
+def _freshness(now: datetime, most_recent: datetime | None) -> int:
+    return (
+        int((now - most_recent).total_seconds())
+        if most_recent
+        else STALE_FRESHNESS_SECONDS
+    )
+
+
 def _humanize_window(seconds: int) -> str:
     """Human label for the workload window (e.g. 300 → '5min', 90 → '90s')."""
     if seconds >= 60 and seconds % 60 == 0:
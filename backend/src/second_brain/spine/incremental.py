@@ -0,0 +1,343 @@
+"""Incremental status evaluator fed by the spine ingest path.
+
+StatusEvaluator re-queries every event in a segment's workload window on
+each tick. IncrementalStatusEvaluator instead keeps per-segment sliding-window
+aggregates in memory and updates them as SpineRepository.record_event sees
+each row:
+
+- workload: (timestamp, is_failure, duration_ms, operation, sample_weight)
+  deque + running weighted total and failure count + the
+  consecutive-failure streak at the newest end +
+  per-operation latency sketches (rows are removed from the sketch on
+  eviction, so it always covers exactly the window)
+- readiness: (timestamp, any_check_failing) deque + running failing count
+- liveness / any event: newest timestamp only (the window is always at least
+  the stale window, so the max is all the stale check needs); the newest
+  spine_heartbeats time is folded in on rebuild, and re-read before a
+  segment is reported stale, since other replicas' heartbeats never pass
+  through this process
+
+Appends and evictions are O(1) (out-of-order rows fall back to a sorted
+insert). A segment's status is only re-derived when its aggregates changed
+or its liveness crossed the stale boundary; otherwise the cached result is
+returned with a refreshed freshness value.
+
+Cold start: the first evaluate() for a segment rebuilds its window from
+get_recent_events — the exact rows StatusEvaluator would read — so results
+are identical. Rows recorded while that query is in flight are merged by id.
+
+Other replicas: every replica records spine_events, but the ingest hook
+only sees this process's rows. So every later evaluate() first catches up
+with get_events_written_since: only rows whose Cosmos `_ts` (server write
+time, so no replica clock skew or write-behind delay matters) is at or
+past the newest `_ts` already fetched. The query returns the new rows plus
+those written in that same second, which are merged by id, so a row
+another replica wrote is in the next evaluate() and the cost of a tick
+tracks new writes, not the window. A periodic full rebuild is optional
+(resync_interval_seconds, off by default).
+
+Only the evaluator lease holder evaluates (main.py runs evaluator_loop under
+run_as_leader); a replica that stands by calls reset(), so it neither keeps
+stale windows nor grows them from its own ingest until it leads again.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+from collections import deque
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from second_brain.spine.evaluator import (
+    EvaluationResult,
+    StatusEvaluator,
+    _add_latency,
+    _freshness,
+    _is_stale,
+    _serialize_sketches,
+    _stale_result,
+    _workload_inputs,
+)
+from second_brain.spine.models import from_epoch_ms, row_epoch_ms
+from second_brain.spine.registry import EvaluatorConfig, SegmentRegistry
+from second_brain.spine.rollups import ALL_OPERATIONS
+from second_brain.spine.sampling import sample_weight
+from second_brain.spine.sketch import LatencySketch
+from second_brain.spine.storage import EVALUATOR_FIELDS, SpineRepository
+
+logger = logging.getLogger(__name__)
+
+EMPTY_WINDOW_SKEW_SECONDS = 60
+
+
+def _row_ts(row: dict[str, Any]) -> datetime:
+    return from_epoch_ms(row_epoch_ms(row))
+
+
+def _newest_ts(rows: list[dict[str, Any]]) -> int | None:
+    """Newest Cosmos `_ts` (write time, epoch seconds) among fetched rows."""
+    return max((row["_ts"] for row in rows if "_ts" in row), default=None)
+
+
+# (timestamp, is_failure, duration_ms, operation, sample_weight)
+_WorkloadEntry = tuple[datetime, bool, int | None, str, int]
+
+
+class SegmentWindow:
+    """Sliding-window aggregates for one segment."""
+
+    def __init__(self) -> None:
+        self._workload: deque[_WorkloadEntry] = deque()
+        self._total = 0
+        self._failures = 0
+        self._streak = 0
+        self._latency: dict[str, LatencySketch] = {}
+        self._readiness: deque[tuple[datetime, bool]] = deque()
+        self._readiness_failed = 0
+        self.latest_liveness: datetime | None = None
+        self.latest_any: datetime | None = None
+        self.version = 0
+        # (timestamp, id) of every row in the window, for merging by id
+        self._ids: deque[tuple[datetime, str]] = deque()
+        self._id_set: set[str] = set()
+
+    def add(self, row: dict[str, Any]) -> None:
+        """Fold one spine_events row into the aggregates (once per id)."""
+        ts = _row_ts(row)
+        row_id = row.get("id")
+        if row_id is not None:
+            if row_id in self._id_set:
+                return
+            self._id_set.add(row_id)
+            self._insert(self._ids, (ts, row_id))
+        event_type = row["event_type"]
+        payload = row.get("payload", {})
+        if event_type == "workload":
+            self._add_workload(
+                (
+                    ts,
+                    payload["outcome"] == "failure",
+                    payload.get("duration_ms"),
+                    payload.get("operation") or "unknown",
+                    sample_weight(payload),
+                )
+            )
+            _add_latency(self._latency, payload)
+        elif event_type == "readiness":
+            failing = any(c["status"] == "failing" for c in payload["checks"])
+            self._insert(self._readiness, (ts, failing))
+            self._readiness_failed += failing
+        elif event_type == "liveness" and (
+            self.latest_liveness is None or ts > self.latest_liveness
+        ):
+            self.latest_liveness = ts
+        if self.latest_any is None or ts > self.latest_any:
+            self.latest_any = ts
+        self.version += 1
+
+    def add_heartbeat(self, ts: datetime) -> None:
+        """Fold a spine_heartbeats last-seen time in as liveness."""
+        if self.latest_liveness is not None and ts <= self.latest_liveness:
+            return
+        self.latest_liveness = ts
+        if self.latest_any is None or ts > self.latest_any:
+            self.latest_any = ts
+        self.version += 1
+
+    def evict(self, cutoff: datetime) -> None:
+        """Drop rows older than cutoff (the query's `timestamp >= cutoff`)."""
+        changed = False
+        while self._workload and self._workload[0][0] < cutoff:
+            _, failed, duration_ms, operation, weight = self._workload.popleft()
+            self._total -= weight
+            self._failures -= failed * weight
+            if duration_ms is not None:
+                for key in (operation, ALL_OPERATIONS):
+                    self._latency[key].remove(duration_ms, weight)
+                    if self._latency[key].count <= 0:
+                        del self._latency[key]
+            changed = True
+        self._streak = min(self._streak, len(self._workload))
+        while self._readiness and self._readiness[0][0] < cutoff:
+            _, failing = self._readiness.popleft()
+            self._readiness_failed -= failing
+            changed = True
+        if self.latest_liveness is not None and self.latest_liveness < cutoff:
+            self.latest_liveness = None
+            changed = True
+        if self.latest_any is not None and self.latest_any < cutoff:
+            self.latest_any = None
+            changed = True
+        while self._ids and self._ids[0][0] < cutoff:
+            self._id_set.discard(self._ids.popleft()[1])
+        if changed:
+            self.version += 1
+
+    def inputs(self) -> dict[str, Any]:
+        return _workload_inputs(
+            total=self._total,
+            failures=self._failures,
+            consecutive_failures=self._streak,
+            any_readiness_failed=self._readiness_failed > 0,
+            latency=self._latency.get(ALL_OPERATIONS),
+        )
+
+    def latency_sketches(self) -> dict[str, dict[str, Any]]:
+        return _serialize_sketches(self._latency)
+
+    def _add_workload(self, entry: _WorkloadEntry) -> None:
+        failed, weight = entry[1], entry[4]
+        in_order = self._insert(self._workload, entry)
+        self._total += weight
+        self._failures += failed * weight
+        if in_order:
+            self._streak = self._streak + 1 if failed else 0
+            return
+        # Late row landed mid-window: recount the streak from the newest end.
+        streak = 0
+        for _, f, *_ in reversed(self._workload):
+            if not f:
+                break
+            streak += 1
+        self._streak = streak
+
+    @staticmethod
+    def _insert(entries: deque[Any], entry: tuple[Any, ...]) -> bool:
+        """Keep `entries` timestamp-sorted; True when appended at the end."""
+        if not entries or entries[-1][0] <= entry[0]:
+            entries.append(entry)
+            return True
+        idx = bisect.bisect_right(entries, entry[0], key=lambda e: e[0])
+        entries.insert(idx, entry)
+        return False
+
+
+class IncrementalStatusEvaluator:
+    """Drop-in replacement for StatusEvaluator backed by in-memory windows."""
+
+    def __init__(
+        self,
+        repo: SpineRepository,
+        registry: SegmentRegistry,
+        now: Callable[[], datetime] | None = None,
+        resync_interval_seconds: int | None = None,
+    ) -> None:
+        self._repo = repo
+        self._registry = registry
+        self._now = now or (lambda: datetime.now(UTC))
+        self._resync_interval = (
+            timedelta(seconds=resync_interval_seconds)
+            if resync_interval_seconds is not None
+            else None
+        )
+        self._classifier = StatusEvaluator(repo, registry, now=self._now)
+        self._windows: dict[str, SegmentWindow] = {}
+        self._synced_at: dict[str, datetime] = {}
+        self._written_ts: dict[str, int] = {}
+        self._inflight: dict[str, list[dict[str, Any]]] = {}
+        self._cache: dict[str, tuple[tuple[int, bool], EvaluationResult]] = {}
+
+    def observe(self, row: dict[str, Any]) -> None:
+        """Ingest-path hook: fold a freshly recorded spine_events row in."""
+        segment_id = row.get("segment_id")
+        if segment_id is None:
+            return
+        pending = self._inflight.get(segment_id)
+        if pending is not None:
+            pending.append(row)
+        window = self._windows.get(segment_id)
+        if window is not None:
+            window.add(row)
+
+    def reset(self) -> None:
+        """Drop every window (this replica stopped evaluating)."""
+        self._windows.clear()
+        self._synced_at.clear()
+        self._written_ts.clear()
+        self._cache.clear()
+
+    async def rebuild(self, segment_id: str) -> None:
+        """Reload a segment's window from Cosmos (cold start / resync)."""
+        cfg = self._registry.get(segment_id)
+        synced_at = self._now()
+        self._inflight[segment_id] = []
+        try:
+            rows = await self._repo.get_recent_events(
+                segment_id=segment_id,
+                window_seconds=cfg.workload_window_seconds,
+                fields=EVALUATOR_FIELDS,
+            )
+            window = SegmentWindow()
+            for row in [*rows, *self._inflight[segment_id]]:
+                window.add(row)  # merged by id
+            heartbeat = await self._repo.get_latest_heartbeat(segment_id)
+            if heartbeat is not None:
+                window.add_heartbeat(heartbeat)
+        finally:
+            del self._inflight[segment_id]
+        self._windows[segment_id] = window
+        self._synced_at[segment_id] = synced_at
+        # An empty window has no `_ts` to resume from; start from this
+        # replica's clock, pulled back to cover skew against Cosmos.
+        self._written_ts[segment_id] = _newest_ts(rows) or (
+            int(synced_at.timestamp()) - EMPTY_WINDOW_SKEW_SECONDS
+        )
+        self._cache.pop(segment_id, None)
+
+    async def catch_up(self, segment_id: str) -> None:
+        """Fold in rows written (by any replica) since the last Cosmos fetch."""
+        since_ts = self._written_ts[segment_id]
+        rows = await self._repo.get_events_written_since(
+            segment_id=segment_id, since_ts=since_ts, fields=EVALUATOR_FIELDS
+        )
+        window = self._windows[segment_id]
+        for row in rows:
+            window.add(row)  # merged by id
+        self._written_ts[segment_id] = max(since_ts, _newest_ts(rows) or since_ts)
+
+    async def evaluate(self, segment_id: str) -> EvaluationResult:
+        cfg = self._registry.get(segment_id)
+        now = self._now()
+        synced_at = self._synced_at.get(segment_id)
+        if synced_at is None or (
+            self._resync_interval is not None
+            and now - synced_at >= self._resync_interval
+        ):
+            await self.rebuild(segment_id)
+        else:
+            await self.catch_up(segment_id)
+            window = self._windows.get(segment_id)
+            if window is not None and _is_stale(cfg, now, window.latest_liveness):
+                heartbeat = await self._repo.get_latest_heartbeat(segment_id)
+                if heartbeat is not None:
+                    window.add_heartbeat(heartbeat)
+        return self.evaluate_cached(cfg, now)
+
+    def evaluate_cached(self, cfg: EvaluatorConfig, now: datetime) -> EvaluationResult:
+        """Evaluate from the in-memory window without touching Cosmos."""
+        window = self._windows.setdefault(cfg.segment_id, SegmentWindow())
+        window.evict(now - timedelta(seconds=cfg.workload_window_seconds))
+        freshness = _freshness(now, window.latest_any)
+        stale = _is_stale(cfg, now, window.latest_liveness)
+
+        key = (window.version, stale)
+        cached = self._cache.get(cfg.segment_id)
+        if cached is not None and cached[0] == key:
+            result = cached[1]
+            result.freshness_seconds = freshness
+            return result
+
+        if stale:
+            result = _stale_result(cfg.segment_id, window.latest_any, freshness)
+        else:
+            result = self._classifier.classify(
+                cfg,
+                window.inputs(),
+                window.latest_any,
+                freshness,
+                window.latency_sketches(),
+            )
+        self._cache[cfg.segment_id] = (key, result)
+        return result
@@ -0,0 +1,141 @@
+"""Batch ingest: body decoding, per-event validation and replay dedupe.
+
+POST /api/spine/ingest/batch takes a JSON array of ingest events (or
+{"events": [...]}), optionally gzip-encoded. Events may carry a
+client-supplied `event_id`; it becomes the spine_events document id, so a
+replayed event conflicts in Cosmos instead of being counted twice. The
+in-process IngestDeduper short-circuits recent replays before they cost a
+write. Without an event_id an event is always written.
+
+sample_weight is server-assigned (spine.sampling): a client-supplied weight
+would let one event stand for millions, so both ingest routes reset it.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import ValidationError
+
+from second_brain.spine.models import (
+    IngestEvent,
+    IngestEventResult,
+    WorkloadPayload,
+)
+
+MAX_BATCH_EVENTS = 500
+MAX_DECODED_BYTES = 5 * 1024 * 1024
+MAX_ENCODED_BYTES = 1024 * 1024
+"""Cap on a gzip body as sent; JSON event batches compress well past 5:1."""
+
+
+class BatchDecodeError(ValueError):
+    """The request body is not a (gzip-encoded) JSON array of events."""
+
+
+def decode_batch_body(raw: bytes, content_encoding: str | None) -> list[Any]:
+    """Return the raw event list from a request body (gzip-aware, size-capped)."""
+    if content_encoding and content_encoding.strip().lower() == "gzip":
+        if len(raw) > MAX_ENCODED_BYTES:
+            raise BatchDecodeError(f"gzip body exceeds {MAX_ENCODED_BYTES} bytes")
+        inflater = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+        try:
+            raw = inflater.decompress(raw, MAX_DECODED_BYTES)
+        except zlib.error as exc:
+            raise BatchDecodeError(f"invalid gzip body: {exc}") from exc
+        if inflater.unconsumed_tail:
+            raise BatchDecodeError(f"decoded body exceeds {MAX_DECODED_BYTES} bytes")
+    elif content_encoding and content_encoding.strip().lower() != "identity":
+        raise BatchDecodeError(f"unsupported Content-Encoding: {content_encoding}")
+    elif len(raw) > MAX_DECODED_BYTES:
+        raise BatchDecodeError(f"body exceeds {MAX_DECODED_BYTES} bytes")
+    try:
+        body = json.loads(raw)
+    except ValueError as exc:
+        raise BatchDecodeError(f"invalid JSON: {exc}") from exc
+    if isinstance(body, dict):
+        body = body.get("events")
+    if not isinstance(body, list):
+        raise BatchDecodeError("expected a JSON array of events")
+    if len(body) > MAX_BATCH_EVENTS:
+        raise BatchDecodeError(f"batch exceeds {MAX_BATCH_EVENTS} events")
+    return body
+
+
+def server_weighted(event: IngestEvent) -> IngestEvent:
+    """Reset a client-supplied workload sample_weight to 1 (one real event)."""
+    payload = event.root.payload
+    if isinstance(payload, WorkloadPayload):
+        payload.sample_weight = 1
+    return event
+
+
+def validate_batch(
+    items: list[Any],
+) -> tuple[list[tuple[int, IngestEvent]], list[IngestEventResult]]:
+    """Validate every item; return (valid (index, event) pairs, invalid results)."""
+    valid: list[tuple[int, IngestEvent]] = []
+    invalid: list[IngestEventResult] = []
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, server_weighted(IngestEvent.model_validate(item))))
+        except ValidationError as exc:
+            event_id = item.get("event_id") if isinstance(item, dict) else None
+            invalid.append(
+                IngestEventResult(
+                    index=index,
+                    event_id=event_id if isinstance(event_id, str) else None,
+                    status="invalid",
+                    error=_first_error(exc),
+                )
+            )
+    return valid, invalid
+
+
+def _first_error(exc: ValidationError) -> str:
+    err = exc.errors()[0]
+    loc = ".".join(str(p) for p in err["loc"])
+    return f"{loc}: {err['msg']}" if loc else err["msg"]
+
+
+class IngestDeduper:
+    """Recently written (segment_id, event_id) keys, expiring after ttl_seconds.
+
+    Keys are only remembered once their write succeeded (or was found to be
+    a duplicate), so a failed event can always be retried. Per-process: a
+    replay that lands on another replica is still caught by the Cosmos id
+    conflict.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 600.0,
+        max_entries: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._clock = clock
+        self._seen: OrderedDict[tuple[str, str], float] = OrderedDict()
+
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        expires = self._seen.get(key)
+        return expires is not None and expires > self._clock()
+
+    def add(self, key: tuple[str, str]) -> None:
+        now = self._clock()
+        self._seen[key] = now + self._ttl
+        self._seen.move_to_end(key)
+        while self._seen:
+            oldest_key, expires = next(iter(self._seen.items()))
+            if expires > now and len(self._seen) <= self._max_entries:
+                break
+            del self._seen[oldest_key]
+
+    def __len__(self) -> int:
+        return len(self._seen)
@@ -0,0 +1,239 @@
+"""Lease-based leader election for singleton background loops.
+
+Every Container App replica runs the same lifespan, so without coordination
+each one repeats the evaluator sweep (Cosmos scans + state upserts) and the
+agent warmup pings. A LeaseElector competes for one named document in
+spine_leases; only the holder runs the work:
+
+- acquire: create the lease doc, or take it over with an ETag-guarded
+  replace once it has expired
+- renew: the holder replaces its own doc every renew_interval_seconds
+- expiry: each doc carries `ttl` (Cosmos hides it once expired, judged by
+  the server clock) and `expires_at` (for containers with TTL disabled)
+- release: a clean shutdown deletes the doc, so a follower takes over on
+  its next poll instead of waiting out the TTL
+
+A holder that cannot renew (Cosmos unreachable) steps down locally before
+its lease can expire, so two replicas never both believe they lead. A lost
+race or a taken-over lease is an ETag conflict, never an exception.
+
+A missing spine_leases container (or database) is a deployment error, not
+a lost race: try_acquire raises LeaseStoreMissingError, and run_as_leader
+logs it and runs the work on this replica without election rather than
+leaving every replica a follower.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import socket
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+from uuid import uuid4
+
+from azure.core import MatchConditions
+from azure.cosmos.aio import ContainerProxy
+from azure.cosmos.exceptions import (
+    CosmosAccessConditionFailedError,
+    CosmosResourceExistsError,
+    CosmosResourceNotFoundError,
+)
+from azure.cosmos.http_constants import SubStatusCodes
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEASE_TTL_SECONDS = 30
+
+EVALUATOR_LEASE = "spine-evaluator"
+ARCHIVE_LEASE = "spine-archive"
+WARMUP_LEASE = "agent-warmup"
+
+
+class LeaseStoreMissingError(RuntimeError):
+    """The lease container (or its database) does not exist."""
+
+
+class LeaseElector:
+    """Competes for (and holds) one named lease document."""
+
+    def __init__(
+        self,
+        container: ContainerProxy,
+        name: str,
+        owner_id: str | None = None,
+        ttl_seconds: int = DEFAULT_LEASE_TTL_SECONDS,
+        renew_interval_seconds: float | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._container = container
+        self.name = name
+        self.owner_id = owner_id or f"{socket.gethostname()}:{uuid4().hex[:8]}"
+        self._ttl = ttl_seconds
+        self.renew_interval = (
+            renew_interval_seconds
+            if renew_interval_seconds is not None
+            else ttl_seconds / 3
+        )
+        self._clock = clock
+        self._etag: str | None = None
+        self._held_until = 0.0
+
+    @property
+    def is_leader(self) -> bool:
+        return self._etag is not None and self._clock() < self._held_until
+
+    def _body(self, now: float, epoch: int) -> dict[str, Any]:
+        return {
+            "id": self.name,
+            "owner": self.owner_id,
+            "epoch": epoch,
+            "renewed_at": now,
+            "expires_at": now + self._ttl,
+            "ttl": self._ttl,
+        }
+
+    async def try_acquire(self) -> bool:
+        """Acquire or renew the lease; returns whether this replica holds it.
+
+        Cosmos errors other than conflicts propagate, but leadership is kept
+        until a safety margin before the last successful renewal expires.
+        Raises LeaseStoreMissingError if the lease container does not exist.
+        """
+        now = self._clock()
+        try:
+            try:
+                current = await self._container.read_item(
+                    item=self.name, partition_key=self.name
+                )
+            except CosmosResourceNotFoundError as exc:
+                if exc.sub_status == SubStatusCodes.OWNER_RESOURCE_NOT_FOUND:
+                    raise LeaseStoreMissingError(self.name) from exc
+                current = None
+
+            if current is None:
+                try:
+                    written = await self._container.create_item(body=self._body(now, 1))
+                except CosmosResourceNotFoundError as exc:
+                    # A create only 404s when the container itself is gone
+                    raise LeaseStoreMissingError(self.name) from exc
+            else:
+                mine = current.get("owner") == self.owner_id
+                if not mine and current.get("expires_at", 0) > now:
+                    self._step_down()
+                    return False
+                epoch = current.get("epoch", 0) + (0 if mine else 1)
+                written = await self._container.replace_item(
+                    item=self.name,
+                    body=self._body(now, epoch),
+                    etag=current["_etag"],
+                    match_condition=MatchConditions.IfNotModified,
+                )
+        except (
+            CosmosResourceExistsError,
+            CosmosAccessConditionFailedError,
+            CosmosResourceNotFoundError,
+        ):
+            self._step_down()  # another replica won the race
+            return False
+        except Exception:
+            # Renewal failed for an unrelated reason: stay leader only while
+            # the lease we last wrote is certainly still ours.
+            if self._clock() >= self._held_until - self.renew_interval:
+                self._step_down()
+            raise
+
+        if self._etag is None:
+            logger.info("Lease %s acquired by %s", self.name, self.owner_id)
+        self._etag = written.get("_etag", "")
+        self._held_until = now + self._ttl
+        return True
+
+    def _step_down(self) -> None:
+        if self._etag is not None:
+            logger.info("Lease %s lost by %s", self.name, self.owner_id)
+        self._etag = None
+        self._held_until = 0.0
+
+    async def release(self) -> None:
+        """Delete the lease if still held so a follower can take over at once."""
+        if self._etag is None:
+            return
+        etag, self._etag = self._etag, None
+        self._held_until = 0.0
+        try:
+            await self._container.delete_item(
+                item=self.name,
+                partition_key=self.name,
+                etag=etag,
+                match_condition=MatchConditions.IfNotModified,
+            )
+        except (CosmosAccessConditionFailedError, CosmosResourceNotFoundError):
+            pass  # already taken over or expired
+        except Exception:  # noqa: BLE001 - the lease still expires by TTL
+            logger.warning("Lease %s release failed", self.name, exc_info=True)
+
+
+async def run_as_leader(
+    elector: LeaseElector,
+    work: Callable[[], Awaitable[None]],
+    standby: Callable[[], Awaitable[None]] | None = None,
+) -> None:
+    """Run `work` only while `elector` holds its lease; `standby` otherwise.
+
+    Polls the lease every renew interval. Losing the lease cancels `work`;
+    a `work` coroutine that crashes is restarted on the next poll. Cancelling
+    this task (lifespan shutdown) cancels whichever coroutine is running and
+    releases the lease. If the lease container is missing, `work` runs here
+    without election (every replica then runs it, as with election off).
+    """
+    task: asyncio.Task | None = None
+    task_is_work = False
+
+    async def _stop() -> None:
+        nonlocal task
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
+            task = None
+
+    try:
+        while True:
+            try:
+                leader = await elector.try_acquire()
+            except LeaseStoreMissingError:
+                logger.error(
+                    "Lease %s: lease container or database not found; running "
+                    "without leader election. Create the spine_leases container "
+                    "or disable spine_leader_election_enabled.",
+                    elector.name,
+                )
+                await _stop()
+                await work()
+                return
+            except Exception:
+                logger.warning("Lease %s poll failed", elector.name, exc_info=True)
+                leader = elector.is_leader
+
+            if task is not None and task.done():
+                if not task.cancelled() and task.exception() is not None:
+                    logger.warning(
+                        "Lease %s task crashed; restarting",
+                        elector.name,
+                        exc_info=task.exception(),
+                    )
+                task = None
+            if task is not None and task_is_work != leader:
+                await _stop()
+            if task is None:
+                if leader:
+                    task, task_is_work = asyncio.create_task(work()), True
+                elif standby is not None:
+                    task, task_is_work = asyncio.create_task(standby()), False
+            await asyncio.sleep(elector.renew_interval)
+    finally:
+        await _stop()
+        await elector.release()
@@ -21,6 +21,7 @@ Approved decisions folded in (from `SPIKE-MEMO.md` round 3):
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Literal, TypedDict
 
 from second_brain.spine.audit.chains import EXPECTED_CHAINS, ExpectedSegment
@@ -87,3 +88,25 @@ def ledger_metadata_for(segment_id: str) -> _SegmentLedgerMetadata:
         segment_id,
         {"mode": "transactional", "empty_state_reason": None},
     )
+
+
+class ChainGaps(TypedDict):
+    """Chain coverage for one correlation, per LEDGER_EXPECTED_CHAINS."""
+
+    missing_required: list[str]
+    present_optional: list[str]
+    unexpected: list[str]
+
+
+def chain_gaps(kind: CorrelationKind, segments_seen: Iterable[str]) -> ChainGaps:
+    """Compare the segments a correlation touched against its ledger chain."""
+    seen = set(segments_seen)
+    chain = LEDGER_EXPECTED_CHAINS[kind]
+    chain_ids = {s.segment_id for s in chain}
+    required = {s.segment_id for s in chain if s.required}
+    optional = {s.segment_id for s in chain if not s.required}
+    return {
+        "missing_required": sorted(required - seen),
+        "present_optional": sorted(optional & seen),
+        "unexpected": sorted(seen - chain_ids),
+    }
@@ -1,4 +1,12 @@
-"""FastAPI middleware that emits a spine workload event per request."""
+"""ASGI middleware that emits a spine workload event per request.
+
+Raw ASGI rather than BaseHTTPMiddleware: no per-request task or body-stream
+wrapping, and the duration runs until the final response body message, so
+streamed (SSE) capture and investigation requests report their full length
+instead of the time to first header. The event is recorded after that final
+message has been handed to the server, i.e. once the client has the whole
+response.
+"""
 
 from __future__ import annotations
 
@@ -6,28 +14,30 @@ import logging
 import time
 from datetime import UTC, datetime
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from second_brain.spine.models import IngestEvent, WorkloadPayload, _WorkloadEvent
+from second_brain.spine.sampling import WorkloadSampler
 from second_brain.spine.storage import SpineRepository
 
 logger = logging.getLogger(__name__)
 
 
-class SpineWorkloadMiddleware(BaseHTTPMiddleware):
+class SpineWorkloadMiddleware:
     """Records a workload event per request (success/failure + duration)."""
 
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         repo: SpineRepository | None = None,
         segment_id: str = "backend_api",
+        sampler: WorkloadSampler | None = None,
     ) -> None:
-        super().__init__(app)
+        self.app = app
         self._repo = repo
         self._segment_id = segment_id
+        self._sampler = sampler
 
     def _resolve_repo(self, request: Request) -> SpineRepository | None:
         """Return self._repo, then app.state.spine_repo, then None.
@@ -41,67 +51,97 @@ class SpineWorkloadMiddleware(BaseHTTPMiddleware):
             return self._repo
         return getattr(request.app.state, "spine_repo", None)
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
+    def _resolve_sampler(self, request: Request) -> WorkloadSampler | None:
+        """Same fallback as _resolve_repo; no sampler means keep every event."""
+        if self._sampler is not None:
+            return self._sampler
+        return getattr(request.app.state, "spine_sampler", None)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         start = time.perf_counter()
-        operation = f"{request.method} {request.url.path}"
+        # Handlers set request.state.capture_trace_id; make sure they write to
+        # a dict this scope shares.
+        scope.setdefault("state", {})
+        status_code = 500
+        finished_at: float | None = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, finished_at
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                finished_at = time.perf_counter()
+            await send(message)
 
         try:
-            response = await call_next(request)
-            duration_ms = int((time.perf_counter() - start) * 1000)
-            outcome = "success" if response.status_code < 500 else "failure"
-            correlation_id = self._read_capture_trace_id(request)
-            event = _WorkloadEvent(
-                segment_id=self._segment_id,
-                event_type="workload",
-                timestamp=datetime.now(UTC),
-                payload=WorkloadPayload(
-                    operation=operation,
-                    outcome=outcome,
-                    duration_ms=duration_ms,
-                    correlation_kind="capture" if correlation_id else None,
-                    correlation_id=correlation_id,
-                    error_class=None
-                    if outcome == "success"
-                    else f"HTTP_{response.status_code}",
-                ),
-            )
-            ingest_event = IngestEvent(root=event)
-            repo = self._resolve_repo(request)
-            if repo is None:
-                return response
-            try:
-                await repo.record_event(ingest_event)
-            except Exception:  # noqa: BLE001 - never let spine break the request
-                logger.warning("Failed to record spine workload event", exc_info=True)
-            return response
+            await self.app(scope, receive, send_wrapper)
         except Exception as exc:
             duration_ms = int((time.perf_counter() - start) * 1000)
-            correlation_id = self._read_capture_trace_id(request)
-            event = _WorkloadEvent(
-                segment_id=self._segment_id,
-                event_type="workload",
-                timestamp=datetime.now(UTC),
-                payload=WorkloadPayload(
-                    operation=operation,
-                    outcome="failure",
-                    duration_ms=duration_ms,
-                    correlation_kind="capture" if correlation_id else None,
-                    correlation_id=correlation_id,
-                    error_class=type(exc).__name__,
-                ),
+            await self._record(
+                Request(scope), "failure", duration_ms, type(exc).__name__
             )
-            ingest_event = IngestEvent(root=event)
-            repo = self._resolve_repo(request)
-            if repo is None:
-                raise
-            try:
-                await repo.record_event(ingest_event)
-            except Exception:  # noqa: BLE001
-                logger.warning("Failed to record spine workload event", exc_info=True)
             raise
 
+        end = finished_at if finished_at is not None else time.perf_counter()
+        duration_ms = int((end - start) * 1000)
+        outcome = "success" if status_code < 500 else "failure"
+        await self._record(
+            Request(scope),
+            outcome,
+            duration_ms,
+            None if outcome == "success" else f"HTTP_{status_code}",
+        )
+
+    async def _record(
+        self,
+        request: Request,
+        outcome: str,
+        duration_ms: int,
+        error_class: str | None,
+    ) -> None:
+        """Build and record the workload event; never raises."""
+        operation = f"{request.method} {request.url.path}"
+        correlation_id = self._read_capture_trace_id(request)
+        weight = 1
+        sampler = self._resolve_sampler(request)
+        if sampler is not None:
+            # Failures are always kept; for them this only arms the streak reset.
+            weight = sampler.decide(
+                self._segment_id,
+                operation,
+                outcome,
+                correlated=correlation_id is not None,
+            )
+            if weight is None:
+                return
+        repo = self._resolve_repo(request)
+        if repo is None:
+            return
+        event = _WorkloadEvent(
+            segment_id=self._segment_id,
+            event_type="workload",
+            timestamp=datetime.now(UTC),
+            payload=WorkloadPayload(
+                operation=operation,
+                outcome=outcome,
+                duration_ms=duration_ms,
+                correlation_kind="capture" if correlation_id else None,
+                correlation_id=correlation_id,
+                error_class=error_class,
+                sample_weight=weight,
+            ),
+        )
+        try:
+            await repo.record_event(IngestEvent(root=event))
+        except Exception:  # noqa: BLE001 - never let spine break the request
+            logger.warning("Failed to record spine workload event", exc_info=True)
+
     @staticmethod
     def _read_capture_trace_id(request: Request) -> str | None:
         """Resolve the capture trace ID for correlation.
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Annotated, Any, Literal
 
 from pydantic import BaseModel, Field, RootModel
@@ -10,6 +10,9 @@ from pydantic import BaseModel, Field, RootModel
 STALE_FRESHNESS_SECONDS = 999_999
 """Sentinel freshness value meaning 'no data available' — used in status responses."""
 
+MAX_SAMPLE_WEIGHT = 1000
+"""Largest 1-in-N weight a sampler may stamp (a sample rate of 0.001)."""
+
 
 # ---------------------------------------------------------------------------
 # Ingest event payloads (discriminated by event_type)
@@ -45,6 +48,9 @@ class WorkloadPayload(BaseModel):
     correlation_kind: Literal["capture", "thread", "request", "crud"] | None = None
     correlation_id: str | None = None
     error_class: str | None = None
+    # Kept 1-in-N by a sampler (spine.sampling): this row stands for N events.
+    # Server-assigned: the public ingest routes reset it to 1.
+    sample_weight: int = Field(default=1, ge=1, le=MAX_SAMPLE_WEIGHT)
 
 
 # ---------------------------------------------------------------------------
@@ -52,11 +58,16 @@ class WorkloadPayload(BaseModel):
 # ---------------------------------------------------------------------------
 
 
+EventId = Annotated[str, Field(pattern=r"^[A-Za-z0-9._:-]{1,128}$")]
+"""Optional client-supplied idempotency key (becomes the spine_events id)."""
+
+
 class _LivenessEvent(BaseModel):
     segment_id: str
     event_type: Literal["liveness"]
     timestamp: datetime
     payload: LivenessPayload
+    event_id: EventId | None = None
 
 
 class _ReadinessEvent(BaseModel):
@@ -64,6 +75,7 @@ class _ReadinessEvent(BaseModel):
     event_type: Literal["readiness"]
     timestamp: datetime
     payload: ReadinessPayload
+    event_id: EventId | None = None
 
 
 class _WorkloadEvent(BaseModel):
@@ -71,6 +83,7 @@ class _WorkloadEvent(BaseModel):
     event_type: Literal["workload"]
     timestamp: datetime
     payload: WorkloadPayload
+    event_id: EventId | None = None
 
 
 class IngestEvent(
@@ -88,6 +101,36 @@ class IngestEvent(
     """
 
 
+# ---------------------------------------------------------------------------
+# Batch ingest responses
+# ---------------------------------------------------------------------------
+
+
+IngestResultStatus = Literal["accepted", "duplicate", "invalid", "failed"]
+
+
+class IngestEventResult(BaseModel):
+    """Outcome for one event of a batch, by position in the request."""
+
+    index: int
+    event_id: str | None = None
+    status: IngestResultStatus
+    error: str | None = None
+
+
+class BatchIngestResponse(BaseModel):
+    """Response shape for POST /api/spine/ingest/batch.
+
+    Only `failed` events are worth retrying; `invalid` ones never succeed.
+    """
+
+    accepted: int
+    duplicates: int
+    invalid: int
+    failed: int
+    results: list[IngestEventResult]
+
+
 # ---------------------------------------------------------------------------
 # Status responses
 # ---------------------------------------------------------------------------
@@ -229,6 +272,107 @@ class TransactionPathResponse(BaseModel):
     envelope: ResponseEnvelope
 
 
+# ---------------------------------------------------------------------------
+# Workload rollups (time series)
+# ---------------------------------------------------------------------------
+
+
+class WorkloadBucket(BaseModel):
+    """One pre-aggregated time bucket of workload events."""
+
+    bucket_start: datetime
+    count: int = 0
+    failures: int = 0
+    degraded: int = 0
+    duration_ms_sum: int = 0
+    duration_ms_max: int = 0
+
+
+class WorkloadRollupResponse(BaseModel):
+    """Response shape for GET /api/spine/segment/{id}/rollups.
+
+    Buckets are contiguous and oldest-first; buckets with no traffic are
+    zero-filled so charts can plot them directly.
+    """
+
+    segment_id: str
+    granularity: Literal["minute", "hour", "day"]
+    operation: str
+    buckets: list[WorkloadBucket]
+    envelope: ResponseEnvelope
+
+
+class AnalyticsResponse(BaseModel):
+    """Response shape for GET /api/spine/analytics/{query}."""
+
+    query: str
+    days: int
+    segment_id: str | None = None
+    rows: list[dict[str, Any]]
+    envelope: ResponseEnvelope
+
+
+class TimelineSpan(BaseModel):
+    """A contiguous run of one status (None = no data)."""
+
+    start: datetime
+    end: datetime
+    status: SegmentStatus | None
+
+
+class SegmentTimeline(BaseModel):
+    """One segment's downsampled status spans and time-in-status shares."""
+
+    segment_id: str
+    name: str
+    spans: list[TimelineSpan]
+    # Percent of the time with data spent in each status.
+    time_in_status: dict[str, float]
+
+
+class TimelineResponse(BaseModel):
+    """Response shape for GET /api/spine/timeline."""
+
+    start: datetime
+    end: datetime
+    resolution_seconds: int
+    segments: list[SegmentTimeline]
+    envelope: ResponseEnvelope
+
+
+class BurnRate(BaseModel):
+    """Error-budget burn over one trailing window.
+
+    burn_rate is error_rate / (1 - target): 1.0 spends exactly the budget
+    over the SLO period.
+    """
+
+    window_seconds: int
+    total: int
+    failures: int
+    error_rate: float
+    burn_rate: float
+
+
+class SegmentSlo(BaseModel):
+    """A segment's SLO objective, burn rates and remaining error budget."""
+
+    segment_id: str
+    name: str
+    target: float
+    period_seconds: int
+    burn_rates: list[BurnRate]
+    # Share of the period's error budget left (negative once overspent).
+    budget_remaining: float
+
+
+class SloResponse(BaseModel):
+    """Response shape for GET /api/spine/slo."""
+
+    segments: list[SegmentSlo]
+    envelope: ResponseEnvelope
+
+
 # ---------------------------------------------------------------------------
 # Segment detail responses
 # ---------------------------------------------------------------------------
@@ -249,3 +393,25 @@ class SegmentDetailResponse(BaseModel):
 def parse_cosmos_ts(s: str) -> datetime:
     """Parse an ISO timestamp returned by Cosmos (tolerates 'Z' suffix)."""
     return datetime.fromisoformat(s.replace("Z", "+00:00"))
+
+
+def epoch_ms(dt: datetime) -> int:
+    """Integer epoch milliseconds; naive datetimes are taken as UTC.
+
+    Spine documents carry this next to their ISO timestamp (`ts_ms`,
+    `last_updated_ms`) so range filters and ORDER BY compare numbers and
+    readers skip per-row ISO parsing.
+    """
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return int(dt.timestamp() * 1000)
+
+
+def from_epoch_ms(ms: int) -> datetime:
+    return datetime.fromtimestamp(ms / 1000, UTC)
+
+
+def row_epoch_ms(row: dict[str, Any]) -> int:
+    """A row's `ts_ms`, parsing `timestamp` only for rows written before it."""
+    ms = row.get("ts_ms")
+    return ms if ms is not None else epoch_ms(parse_cosmos_ts(row["timestamp"]))
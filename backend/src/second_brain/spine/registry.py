@@ -2,6 +2,13 @@
 
 Config lives in code (not in the database). New segment thresholds
 require a code change — intentional.
+
+Threshold keys are evaluator_inputs keys: workload_failure_rate,
+consecutive_failures, any_readiness_failed, and the latency quantiles
+latency_p50_ms / latency_p95_ms / latency_p99_ms (from the window sketch).
+
+An optional SloObjective declares the segment's availability SLO; the
+burn-rate engine (spine/slo.py) tracks its error budget.
 """
 
 from __future__ import annotations
@@ -10,6 +17,29 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
+@dataclass(frozen=True, slots=True)
+class SloObjective:
+    """Availability SLO: `target` share of weighted workload events succeed
+    over `period_seconds`. Failures spend the budget; degraded does not."""
+
+    target: float
+    period_seconds: int = 2592000  # 30 days
+
+    def __post_init__(self) -> None:
+        if not 0 < self.target < 1:
+            raise ValueError(f"SLO target must be in (0, 1), got {self.target}")
+        if self.period_seconds < 86400 or self.period_seconds % 3600:
+            raise ValueError(
+                f"SLO period_seconds ({self.period_seconds}) must be a whole "
+                "number of hours, at least one day"
+            )
+
+    @property
+    def error_budget(self) -> float:
+        """Allowed failure ratio (1 - target)."""
+        return 1 - self.target
+
+
 @dataclass(frozen=True, slots=True)
 class EvaluatorConfig:
     """Evaluator config for one segment."""
@@ -22,6 +52,7 @@ class EvaluatorConfig:
     yellow_thresholds: dict[str, Any] = field(default_factory=dict)
     red_thresholds: dict[str, Any] = field(default_factory=dict)
     display_name: str = ""
+    slo: SloObjective | None = None
 
     def name_or_id(self) -> str:
         return self.display_name or self.segment_id
@@ -79,6 +110,7 @@ def get_default_registry() -> SegmentRegistry:
                     "workload_failure_rate": 0.50,
                     "consecutive_failures": 3,
                 },
+                slo=SloObjective(target=0.995),
             ),
             EvaluatorConfig(
                 segment_id="classifier",
@@ -89,11 +121,14 @@ def get_default_registry() -> SegmentRegistry:
                 yellow_thresholds={
                     "workload_failure_rate": 0.20,
                     "any_readiness_failed": True,
+                    "latency_p95_ms": 30_000,
                 },
                 red_thresholds={
                     "workload_failure_rate": 0.50,
                     "consecutive_failures": 3,
+                    "latency_p95_ms": 60_000,
                 },
+                slo=SloObjective(target=0.99),
             ),
             EvaluatorConfig(
                 segment_id="admin",
@@ -104,11 +139,14 @@ def get_default_registry() -> SegmentRegistry:
                 yellow_thresholds={
                     "workload_failure_rate": 0.20,
                     "any_readiness_failed": True,
+                    "latency_p95_ms": 60_000,
                 },
                 red_thresholds={
                     "workload_failure_rate": 0.50,
                     "consecutive_failures": 3,
+                    "latency_p95_ms": 120_000,
                 },
+                slo=SloObjective(target=0.99),
             ),
             EvaluatorConfig(
                 segment_id="investigation",
@@ -124,6 +162,7 @@ def get_default_registry() -> SegmentRegistry:
                     "workload_failure_rate": 0.50,
                     "consecutive_failures": 3,
                 },
+                slo=SloObjective(target=0.99),
             ),
             EvaluatorConfig(
                 segment_id="cosmos",
@@ -139,6 +178,7 @@ def get_default_registry() -> SegmentRegistry:
                     "workload_failure_rate": 0.20,
                     "consecutive_failures": 5,
                 },
+                slo=SloObjective(target=0.999),
             ),
             EvaluatorConfig(
                 segment_id="external_services",
@@ -181,6 +221,7 @@ def get_default_registry() -> SegmentRegistry:
                     "workload_failure_rate": 0.30,
                     "consecutive_failures": 3,
                 },
+                slo=SloObjective(target=0.99),
             ),
             EvaluatorConfig(
                 segment_id="container_app",
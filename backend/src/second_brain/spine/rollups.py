@@ -0,0 +1,197 @@
+"""Pre-aggregated workload rollups for spine time-series views.
+
+Charting a segment's history from spine_events means scanning raw rows.
+WorkloadRollupAggregator instead folds every workload row it sees on the
+ingest path (SpineRepository listener) into minute, hour and day buckets,
+one per (segment, operation) plus a segment-wide total under
+ALL_OPERATIONS. Each bucket carries request count, failures, degraded count
+and duration sum/max, with sampled rows counted sample_weight times.
+
+Pending deltas of every granularity are merged into the spine_rollups
+container every flush_interval_seconds as increments (ETag
+read-modify-write, so replicas can share a bucket). Hour and day buckets
+are never rebuilt from their finer buckets: those expire first
+(ROLLUP_TTL_SECONDS), so a late or backdated event would otherwise
+overwrite an old hour or the never-expiring day with its own count, and a
+replica holding a stale read could overwrite a newer total.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from itertools import product
+from typing import TYPE_CHECKING, Any, Literal
+
+from second_brain.spine.models import parse_cosmos_ts
+from second_brain.spine.sampling import sample_weight
+
+if TYPE_CHECKING:
+    from second_brain.spine.storage import SpineRepository
+
+logger = logging.getLogger(__name__)
+
+RollupGranularity = Literal["minute", "hour", "day"]
+
+GRANULARITY_SECONDS: dict[str, int] = {"minute": 60, "hour": 3600, "day": 86400}
+
+ROLLUP_TTL_SECONDS: dict[str, int] = {
+    "minute": 172800,  # 2 days -- hour buckets take over after that
+    "hour": 3024000,  # 35 days
+    "day": -1,  # never expires
+}
+
+ALL_OPERATIONS = "*"
+"""Operation key of the segment-wide bucket (every operation combined)."""
+
+_COUNTERS = ("count", "failures", "degraded", "duration_ms_sum")
+
+
+def bucket_start(ts: datetime, granularity: str) -> datetime:
+    """Floor a timestamp to the start of its bucket (UTC)."""
+    step = GRANULARITY_SECONDS[granularity]
+    epoch = int(ts.astimezone(UTC).timestamp())
+    return datetime.fromtimestamp(epoch - epoch % step, tz=UTC)
+
+
+def rollup_id(
+    granularity: str, segment_id: str, operation: str, start: datetime
+) -> str:
+    return f"{granularity}:{segment_id}:{operation}:{start.isoformat()}"
+
+
+def empty_bucket(
+    granularity: str, segment_id: str, operation: str, start: datetime
+) -> dict[str, Any]:
+    return {
+        "id": rollup_id(granularity, segment_id, operation, start),
+        "segment_id": segment_id,
+        "granularity": granularity,
+        "operation": operation,
+        "bucket_start": start.isoformat(),
+        "count": 0,
+        "failures": 0,
+        "degraded": 0,
+        "duration_ms_sum": 0,
+        "duration_ms_max": 0,
+        "ttl": ROLLUP_TTL_SECONDS[granularity],
+    }
+
+
+def merge_bucket(target: dict[str, Any], source: dict[str, Any]) -> dict[str, Any]:
+    """Add `source`'s counters into `target` (in place) and return it."""
+    for field in _COUNTERS:
+        target[field] = target.get(field, 0) + source.get(field, 0)
+    target["duration_ms_max"] = max(
+        target.get("duration_ms_max", 0), source.get("duration_ms_max", 0)
+    )
+    return target
+
+
+class WorkloadRollupAggregator:
+    """Ingest-path listener that maintains minute/hour/day workload rollups."""
+
+    def __init__(
+        self,
+        repo: SpineRepository,
+        flush_interval_seconds: float = 30.0,
+    ) -> None:
+        self._repo = repo
+        self._flush_interval = flush_interval_seconds
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._closed = False
+
+    def observe(self, row: dict[str, Any]) -> None:
+        """Fold one spine_events row into the pending bucket deltas."""
+        if row.get("event_type") != "workload":
+            return
+        payload = row.get("payload", {})
+        outcome = payload.get("outcome")
+        duration_ms = payload.get("duration_ms") or 0
+        weight = sample_weight(payload)
+        ts = parse_cosmos_ts(row["timestamp"])
+        for granularity, operation in product(
+            GRANULARITY_SECONDS, (payload.get("operation") or "unknown", ALL_OPERATIONS)
+        ):
+            start = bucket_start(ts, granularity)
+            key = rollup_id(granularity, row["segment_id"], operation, start)
+            delta = self._pending.get(key)
+            if delta is None:
+                delta = self._pending[key] = empty_bucket(
+                    granularity, row["segment_id"], operation, start
+                )
+            delta["count"] += weight
+            delta["failures"] += (outcome == "failure") * weight
+            delta["degraded"] += (outcome == "degraded") * weight
+            delta["duration_ms_sum"] += duration_ms * weight
+            delta["duration_ms_max"] = max(delta["duration_ms_max"], duration_ms)
+
+    @property
+    def pending_buckets(self) -> int:
+        return len(self._pending)
+
+    def pending_deltas(
+        self, segment_id: str, granularity: str, operation: str = ALL_OPERATIONS
+    ) -> list[dict[str, Any]]:
+        """Deltas observed here but not yet merged into spine_rollups."""
+        return [
+            delta
+            for delta in self._pending.values()
+            if delta["segment_id"] == segment_id
+            and delta["granularity"] == granularity
+            and delta["operation"] == operation
+        ]
+
+    @contextlib.asynccontextmanager
+    async def paused(self) -> AsyncIterator[None]:
+        """Hold off flushes, so pending_deltas stays disjoint from the container.
+
+        A reader that queries spine_rollups and then adds pending_deltas
+        inside this block counts every locally observed row exactly once.
+        """
+        async with self._flush_lock:
+            yield
+
+    def start(self) -> asyncio.Task:
+        """Start the flush/compaction task. Idempotent."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        return self._task
+
+    async def flush(self) -> None:
+        """Merge pending deltas into their minute, hour and day buckets."""
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            deltas = list(self._pending.values())
+            self._pending = {}
+            failed = await self._repo.merge_rollup_buckets(deltas)
+            for delta in failed:
+                # Keep the counts for the next flush instead of losing them.
+                pending = self._pending.get(delta["id"])
+                self._pending[delta["id"]] = (
+                    merge_bucket(pending, delta) if pending else delta
+                )
+
+    async def close(self) -> None:
+        """Stop the task and flush what is pending (lifespan shutdown)."""
+        self._closed = True
+        self._wakeup.set()
+        if self._task is not None:
+            await self._task
+        await self.flush()
+
+    async def _run(self) -> None:
+        while not self._closed:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self._flush_interval)
+            try:
+                await self.flush()
+            except Exception:  # noqa: BLE001 - never let the flusher die
+                logger.warning("Rollup flush failed", exc_info=True)
@@ -0,0 +1,87 @@
+"""Weighted sampling of routine workload events.
+
+SpineWorkloadMiddleware sees every request, including health probes and
+polling endpoints, so most workload rows are uncorrelated successes that
+only ever contribute to a count. The policy keeps:
+
+- every failure / degraded outcome
+- every correlated event (the transaction ledger must stay complete)
+- the first success after a non-success in the segment, so the
+  consecutive-failure streak still resets exactly
+- 1 in `weight` of the remaining successes, each stamped
+  payload.sample_weight = weight
+
+Readers multiply by sample_weight (StatusEvaluator, the incremental
+evaluator, rollups), so totals and failure rates stay unbiased estimates.
+Weights are whole numbers: a configured rate r keeps 1 in round(1 / r),
+capped at MAX_SAMPLE_WEIGHT. Only the middleware stamps a weight; the public
+ingest routes reset any client-supplied one (spine.ingest.server_weighted).
+"""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from second_brain.spine.models import MAX_SAMPLE_WEIGHT
+
+
+def sample_weight(payload: Mapping[str, Any]) -> int:
+    """How many real events a stored workload payload stands for."""
+    return payload.get("sample_weight") or 1
+
+
+class WorkloadSampler:
+    """Per-(segment, operation) keep/drop decisions for workload events."""
+
+    def __init__(
+        self,
+        default_rate: float = 1.0,
+        rates: Mapping[str, float] | None = None,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        """`rates` keys are "segment_id" or "segment_id operation" overrides.
+
+        The operation form matches the middleware's "METHOD /path" operation,
+        e.g. {"backend_api GET /health": 0.01}.
+        """
+        self._default = self._weight(default_rate)
+        self._weights = {key: self._weight(rate) for key, rate in (rates or {}).items()}
+        self._rng = rng
+        self._failing: set[str] = set()
+
+    @staticmethod
+    def _weight(rate: float) -> int:
+        if not 1 / MAX_SAMPLE_WEIGHT <= rate <= 1:
+            raise ValueError(
+                f"sample rate must be in [{1 / MAX_SAMPLE_WEIGHT}, 1], got {rate}"
+            )
+        return max(1, round(1 / rate))
+
+    def weight_for(self, segment_id: str, operation: str) -> int:
+        weight = self._weights.get(f"{segment_id} {operation}")
+        if weight is None:
+            weight = self._weights.get(segment_id, self._default)
+        return weight
+
+    def decide(
+        self,
+        segment_id: str,
+        operation: str,
+        outcome: str,
+        correlated: bool,
+    ) -> int | None:
+        """Sample weight to record the event with, or None to drop it."""
+        if outcome != "success":
+            self._failing.add(segment_id)
+            return 1
+        if segment_id in self._failing:
+            self._failing.discard(segment_id)
+            return 1
+        if correlated:
+            return 1
+        weight = self.weight_for(segment_id, operation)
+        if weight == 1 or self._rng() * weight < 1:
+            return weight
+        return None
@@ -0,0 +1,246 @@
+"""Incremental SLO error-budget burn rates for spine segments.
+
+Segments whose EvaluatorConfig declares an SloObjective get a BurnRateWindow:
+weighted workload counts (total, failures) in per-minute buckets covering
+the last BURN_RATE_WINDOWS[-1] seconds and per-hour buckets covering the
+SLO period. A window's ratio is a sum over at most 360 minute or 720 hour
+buckets however much traffic the segment carried, so a 30-day SLO costs
+about what the evaluator's 5-minute window does.
+
+The buckets are fed like the rollups: SloEngine.observe is a
+SpineRepository listener. Cold start and every resync_interval_seconds
+(to fold in other replicas' traffic) reseed them from spine_rollups — one
+minute-bucket and one hour-bucket single-partition query — never from raw
+spine_events. The seed lacks this replica's deltas that the rollup
+aggregator has not flushed yet (up to its flush interval), so those are
+added on top while its flushes are held off. Without an aggregator, rows
+observed while the queries are in flight are replayed instead.
+
+burn rate = error rate / (1 - target). At 1.0 the budget lasts exactly the
+period; 14.4 sustained over 1 h spends 2% of a 30-day budget.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from second_brain.spine.models import (
+    BurnRate,
+    SegmentSlo,
+    parse_cosmos_ts,
+    row_epoch_ms,
+)
+from second_brain.spine.registry import EvaluatorConfig, SegmentRegistry, SloObjective
+from second_brain.spine.rollups import ALL_OPERATIONS, WorkloadRollupAggregator
+from second_brain.spine.sampling import sample_weight
+
+if TYPE_CHECKING:
+    from second_brain.spine.storage import SpineRepository
+
+logger = logging.getLogger(__name__)
+
+BURN_RATE_WINDOWS: tuple[int, ...] = (3600, 21600)
+"""Short burn-rate windows (1 h, 6 h); the SLO period is always reported too."""
+
+_MINUTE = 60
+_HOUR = 3600
+
+
+class BurnRateWindow:
+    """Minute and hour (total, failures) buckets for one segment."""
+
+    def __init__(self) -> None:
+        self._minutes: dict[int, list[int]] = {}
+        self._hours: dict[int, list[int]] = {}
+
+    def add(self, epoch_s: int, total: int, failures: int) -> None:
+        for buckets, step in ((self._minutes, _MINUTE), (self._hours, _HOUR)):
+            counts = buckets.setdefault(epoch_s - epoch_s % step, [0, 0])
+            counts[0] += total
+            counts[1] += failures
+
+    def seed(
+        self, minute_rows: list[dict[str, Any]], hour_rows: list[dict[str, Any]]
+    ) -> None:
+        """Replace the buckets with spine_rollups minute / hour buckets.
+
+        Rows sharing a bucket_start (a stored bucket and a pending delta)
+        are summed.
+        """
+        self._minutes = _bucket_counts(minute_rows)
+        self._hours = _bucket_counts(hour_rows)
+
+    def evict(self, now_s: int, period_seconds: int) -> None:
+        for buckets, horizon in (
+            (self._minutes, BURN_RATE_WINDOWS[-1]),
+            (self._hours, period_seconds),
+        ):
+            for start in [s for s in buckets if s <= now_s - horizon - _HOUR]:
+                del buckets[start]
+
+    def counts(self, now_s: int, window_seconds: int) -> tuple[int, int]:
+        """(total, failures) in the buckets overlapping (now - window, now]."""
+        if window_seconds <= BURN_RATE_WINDOWS[-1]:
+            buckets, step = self._minutes, _MINUTE
+        else:
+            buckets, step = self._hours, _HOUR
+        first = now_s - window_seconds + 1
+        first -= first % step
+        total = failures = 0
+        for start, (t, f) in buckets.items():
+            if first <= start <= now_s:
+                total += t
+                failures += f
+        return total, failures
+
+
+def _bucket_counts(rows: list[dict[str, Any]]) -> dict[int, list[int]]:
+    out: dict[int, list[int]] = {}
+    for row in rows:
+        start = int(parse_cosmos_ts(row["bucket_start"]).timestamp())
+        counts = out.setdefault(start, [0, 0])
+        counts[0] += row.get("count", 0)
+        counts[1] += row.get("failures", 0)
+    return out
+
+
+def burn_rate(
+    window_seconds: int, total: int, failures: int, error_budget: float
+) -> BurnRate:
+    error_rate = failures / total if total > 0 else 0.0
+    return BurnRate(
+        window_seconds=window_seconds,
+        total=total,
+        failures=failures,
+        error_rate=error_rate,
+        burn_rate=error_rate / error_budget,
+    )
+
+
+class SloEngine:
+    """Per-segment burn-rate windows for every segment with an SLO."""
+
+    def __init__(
+        self,
+        repo: SpineRepository,
+        registry: SegmentRegistry,
+        now: Callable[[], datetime] | None = None,
+        resync_interval_seconds: int = 300,
+        rollups: WorkloadRollupAggregator | None = None,
+    ) -> None:
+        self._repo = repo
+        self._registry = registry
+        self._rollups = rollups
+        self._now = now or (lambda: datetime.now(UTC))
+        self._resync_interval = timedelta(seconds=resync_interval_seconds)
+        self._windows: dict[str, BurnRateWindow] = {}
+        self._synced_at: dict[str, datetime] = {}
+        self._inflight: dict[str, list[dict[str, Any]]] = {}
+
+    def configs(self) -> list[EvaluatorConfig]:
+        return [cfg for cfg in self._registry.all() if cfg.slo is not None]
+
+    def observe(self, row: dict[str, Any]) -> None:
+        """Ingest-path hook: count a workload row into its segment's window."""
+        if row.get("event_type") != "workload":
+            return
+        segment_id = row.get("segment_id")
+        pending = self._inflight.get(segment_id)
+        if pending is not None:
+            pending.append(row)
+        window = self._windows.get(segment_id)
+        if window is not None:
+            _add_row(window, row)
+
+    async def rebuild(self, segment_id: str) -> None:
+        """Reseed a segment's window from spine_rollups (cold start / resync)."""
+        slo = self._objective(segment_id)
+        now = self._now()
+        rollups = self._rollups
+        self._inflight[segment_id] = []
+        try:
+            async with (
+                rollups.paused() if rollups is not None else contextlib.nullcontext()
+            ):
+                minute_rows = await self._repo.get_rollups(
+                    segment_id,
+                    "minute",
+                    now - timedelta(seconds=BURN_RATE_WINDOWS[-1] + _MINUTE),
+                    now + timedelta(seconds=_MINUTE),
+                    operation=ALL_OPERATIONS,
+                )
+                hour_rows = await self._repo.get_rollups(
+                    segment_id,
+                    "hour",
+                    now - timedelta(seconds=slo.period_seconds + _HOUR),
+                    now + timedelta(seconds=_HOUR),
+                    operation=ALL_OPERATIONS,
+                )
+                window = BurnRateWindow()
+                if rollups is not None:
+                    # Unflushed deltas include the rows observed meanwhile.
+                    window.seed(
+                        minute_rows + rollups.pending_deltas(segment_id, "minute"),
+                        hour_rows + rollups.pending_deltas(segment_id, "hour"),
+                    )
+                else:
+                    window.seed(minute_rows, hour_rows)
+                    for row in self._inflight[segment_id]:
+                        _add_row(window, row)
+        finally:
+            del self._inflight[segment_id]
+        self._windows[segment_id] = window
+        self._synced_at[segment_id] = now
+
+    async def report(self, segment_id: str) -> SegmentSlo:
+        """Current burn rates and remaining budget (rebuilds when due)."""
+        slo = self._objective(segment_id)
+        now = self._now()
+        synced_at = self._synced_at.get(segment_id)
+        if synced_at is None or now - synced_at >= self._resync_interval:
+            await self.rebuild(segment_id)
+        window = self._windows[segment_id]
+        now_s = int(now.timestamp())
+        window.evict(now_s, slo.period_seconds)
+
+        budget = slo.error_budget
+        rates = [
+            burn_rate(seconds, *window.counts(now_s, seconds), budget)
+            for seconds in (*BURN_RATE_WINDOWS, slo.period_seconds)
+        ]
+        period = rates[-1]
+        return SegmentSlo(
+            segment_id=segment_id,
+            name=self._registry.get(segment_id).name_or_id(),
+            target=slo.target,
+            period_seconds=slo.period_seconds,
+            burn_rates=rates,
+            budget_remaining=1 - period.error_rate / budget,
+        )
+
+    def _objective(self, segment_id: str) -> SloObjective:
+        """The segment's SLO; KeyError for unknown segments or ones without."""
+        slo = self._registry.get(segment_id).slo
+        if slo is None:
+            raise KeyError(segment_id)
+        return slo
+
+    def synced_age_seconds(self, segment_id: str) -> int:
+        synced_at = self._synced_at.get(segment_id)
+        if synced_at is None:
+            return 0
+        return int((self._now() - synced_at).total_seconds())
+
+
+def _add_row(window: BurnRateWindow, row: dict[str, Any]) -> None:
+    payload = row.get("payload", {})
+    weight = sample_weight(payload)
+    window.add(
+        row_epoch_ms(row) // 1000,
+        weight,
+        weight if payload.get("outcome") == "failure" else 0,
+    )
@@ -0,0 +1,117 @@
+"""In-memory status board snapshot + status-transition fan-out.
+
+The evaluator loop already computes every segment's state each tick; it
+records each upserted spine_segment_state document here, so GET
+/api/spine/status is served from memory instead of a cross-partition
+`SELECT *`. `version` bumps only when a segment's status or headline
+changes. The board's ETag hashes those same fields rather than reusing
+`version`, which each replica counts separately: the same board gets the
+same ETag on every replica, so a client moving between them never gets a
+304 for a board it has not seen.
+
+Status transitions (the same records record_status_change writes to
+spine_status_history) are pushed to every subscriber queue, which backs
+the SSE stream at /api/spine/status/stream. Slow subscribers lose their
+oldest queued transitions rather than blocking the evaluator.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+from second_brain.db.snapshots import content_etag
+
+
+class StatusSnapshot:
+    """Latest spine_segment_state documents, kept current by evaluator_loop."""
+
+    def __init__(self, subscriber_queue_size: int = 100) -> None:
+        self._states: dict[str, dict[str, Any]] = {}
+        self._subscribers: set[asyncio.Queue[dict[str, Any]]] = set()
+        self._queue_size = subscriber_queue_size
+        self.version = 0
+        self.loaded = False
+        self._etag: tuple[int, str] | None = None
+
+    @property
+    def etag(self) -> str:
+        """Weak ETag over every segment's status and headline."""
+        if self._etag is None or self._etag[0] != self.version:
+            board = sorted(
+                (s["segment_id"], s["status"], s["headline"])
+                for s in self._states.values()
+            )
+            self._etag = (self.version, content_etag(json.dumps(board)))
+        return self._etag[1]
+
+    def get(self, segment_id: str) -> dict[str, Any] | None:
+        return self._states.get(segment_id)
+
+    def states(self) -> list[dict[str, Any]]:
+        return list(self._states.values())
+
+    def update(self, state: dict[str, Any]) -> None:
+        """Record a freshly upserted segment state document."""
+        prev = self._states.get(state["segment_id"])
+        self._states[state["segment_id"]] = state
+        if prev is None or (prev["status"], prev["headline"]) != (
+            state["status"],
+            state["headline"],
+        ):
+            self.version += 1
+
+    def mark_loaded(self) -> None:
+        """Called after the first full evaluator sweep."""
+        if not self.loaded:
+            self.loaded = True
+            self.version += 1
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, transition: dict[str, Any]) -> None:
+        """Fan a status transition out to every subscriber (never blocks)."""
+        for queue in self._subscribers:
+            if queue.full():
+                with contextlib.suppress(asyncio.QueueEmpty):
+                    queue.get_nowait()
+            queue.put_nowait(transition)
+
+    @contextlib.asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[asyncio.Queue[dict[str, Any]]]:
+        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(self._queue_size)
+        self._subscribers.add(queue)
+        try:
+            yield queue
+        finally:
+            self._subscribers.discard(queue)
+
+
+async def status_change_events(
+    snapshot: StatusSnapshot,
+    keepalive_seconds: float = 15.0,
+) -> AsyncIterator[str]:
+    """SSE frames for one dashboard connection.
+
+    Opens with a `snapshot` event carrying the current board version (the
+    client refetches /status if it differs from what it holds), then one
+    `status_change` event per transition, with comment keepalives in between.
+    """
+    async with snapshot.subscribe() as queue:
+        yield _frame("snapshot", {"version": snapshot.version})
+        while True:
+            try:
+                transition = await asyncio.wait_for(queue.get(), keepalive_seconds)
+            except TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            yield _frame("status_change", {**transition, "version": snapshot.version})
+
+
+def _frame(event: str, data: dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
@@ -2,25 +2,195 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections import defaultdict
+from collections.abc import Callable, Iterator
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
+from azure.core import MatchConditions
 from azure.cosmos.aio import ContainerProxy
-from azure.cosmos.exceptions import CosmosResourceNotFoundError
+from azure.cosmos.exceptions import (
+    CosmosAccessConditionFailedError,
+    CosmosBatchOperationError,
+    CosmosResourceExistsError,
+    CosmosResourceNotFoundError,
+)
 
+from second_brain.spine.archive import merge_hot_and_archived
+from second_brain.spine.encoding import (
+    EVENT_TYPE_CODES,
+    decode_event,
+    encode_event,
+    interned_operation_id,
+)
+from second_brain.spine.ledger_policy import chain_gaps
 from second_brain.spine.models import (
     CorrelationKind,
     IngestEvent,
     SegmentStatus,
+    epoch_ms,
+    from_epoch_ms,
+    row_epoch_ms,
 )
+from second_brain.spine.rollups import merge_bucket
+
+if TYPE_CHECKING:
+    from second_brain.spine.archive import SpineArchive
+    from second_brain.spine.writer import SpineEventWriter
 
 logger = logging.getLogger(__name__)
 
+TRANSACTIONAL_BATCH_LIMIT = 100
+"""Cosmos caps a transactional batch at 100 operations per partition key."""
+
+CORRELATION_SUMMARY_DOC_TYPE = "correlation_summary"
+
+# Query projections: each read returns only what its callers use. Object
+# literals keep the row shape (`payload.outcome` etc.), and Cosmos omits
+# undefined properties, so legacy rows project cleanly. spine_events
+# projections also carry the compact (v2) columns, which the repository
+# decodes back into the same shape (see spine.encoding).
+_COMPACT_FIELDS = "c.v, c.t, c.p"
+EVALUATOR_FIELDS = (
+    "c.id, c.segment_id, c.event_type, c.timestamp, c.ts_ms,"
+    ' {"outcome": c.payload.outcome, "checks": c.payload.checks,'
+    ' "operation": c.payload.operation, "duration_ms": c.payload.duration_ms,'
+    f' "sample_weight": c.payload.sample_weight}} AS payload, c._ts,'
+    f" {_COMPACT_FIELDS}"
+)
+"""spine_events fields StatusEvaluator / IncrementalStatusEvaluator read
+(`_ts` is the incremental evaluator's catch-up high-water mark)."""
+LEDGER_FIELDS = f"c.segment_id, c.timestamp, c.ts_ms, c.payload, {_COMPACT_FIELDS}"
+TIMELINE_FIELDS = "c.segment_id, c.status, c.prev_status, c.ts_ms"
+HEARTBEAT_HISTORY_GAP_SECONDS = 600
+"""A heartbeat this long after an instance's previous one also writes a
+spine_events liveness row (the instance came back), as does the first
+heartbeat this process sees for an instance."""
+_SUMMARY_UPDATE_ATTEMPTS = 3
+
+OPERATION_DICTIONARY_ID = "_operations"
+OPERATION_DICTIONARY_DOC_TYPE = "operation_dictionary"
+MAX_INTERNED_OPERATIONS = 1000
+"""Per-segment cap; operations past it are stored as strings."""
+_WORKLOAD_CODE = EVENT_TYPE_CODES["workload"]
+
+
+def build_event_documents(
+    event: IngestEvent,
+) -> tuple[dict[str, Any], dict[str, Any] | None]:
+    """Build the spine_events row and (optional) spine_correlation row."""
+    inner = event.root  # the concrete _LivenessEvent / _ReadinessEvent / _WorkloadEvent
+    body = {
+        # A client-supplied event_id makes the write idempotent: a replay
+        # conflicts on (segment_id, id) instead of double-counting.
+        "id": inner.event_id or str(uuid4()),
+        "segment_id": inner.segment_id,
+        "event_type": inner.event_type,
+        "timestamp": inner.timestamp.isoformat(),
+        "ts_ms": epoch_ms(inner.timestamp),
+        "payload": inner.payload.model_dump(mode="json"),
+        "ingested_at": datetime.now(UTC).isoformat(),
+    }
+    if inner.event_type != "workload":
+        return body, None
+
+    payload = inner.payload  # WorkloadPayload
+    if not (payload.correlation_kind and payload.correlation_id):
+        return body, None
+
+    corr_status: SegmentStatus = (
+        "green"
+        if payload.outcome == "success"
+        else "yellow"
+        if payload.outcome == "degraded"
+        else "red"
+    )
+    corr_id = (
+        f"{payload.correlation_kind}:{payload.correlation_id}"
+        f":{inner.segment_id}:{body['id']}"
+    )
+    corr_body = {
+        "id": corr_id,
+        "correlation_kind": payload.correlation_kind,
+        "correlation_id": payload.correlation_id,
+        "segment_id": inner.segment_id,
+        "timestamp": inner.timestamp.isoformat(),
+        "ts_ms": epoch_ms(inner.timestamp),
+        "status": corr_status,
+        "headline": (
+            f"{payload.operation} {payload.outcome}"
+            + (f" ({payload.error_class})" if payload.error_class else "")
+        ),
+        "parent_correlation_kind": None,
+        "parent_correlation_id": None,
+        # Denormalized from the workload payload so the transaction path is
+        # served from this (single-partition) container alone.
+        "operation": payload.operation,
+        "outcome": payload.outcome,
+        "duration_ms": payload.duration_ms,
+        "error_class": payload.error_class,
+    }
+    return body, corr_body
+
+
+def correlation_summary_id(kind: str, correlation_id: str) -> str:
+    return f"{kind}:{correlation_id}:summary"
+
+
+def merge_correlation_summary(
+    current: dict[str, Any] | None,
+    corr_rows: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """Fold new correlation rows into a per-correlation summary document.
+
+    The summary lives in spine_correlation next to the rows it summarizes
+    (same correlation_kind partition). It carries `last_seen` rather than
+    `timestamp` so timestamp-range queries over rows never match it.
+    """
+    kind = corr_rows[0]["correlation_kind"]
+    correlation_id = corr_rows[0]["correlation_id"]
+    segments: dict[str, dict[str, Any]] = dict((current or {}).get("segments", {}))
+    for row in corr_rows:
+        prev = segments.get(row["segment_id"])
+        if prev is None or row["timestamp"] >= prev["timestamp"]:
+            segments[row["segment_id"]] = {
+                "timestamp": row["timestamp"],
+                "status": row["status"],
+                "operation": row.get("operation"),
+                "outcome": row.get("outcome"),
+                "duration_ms": row.get("duration_ms"),
+                "error_class": row.get("error_class"),
+            }
+    timestamps = [seg["timestamp"] for seg in segments.values()]
+    first_seen = (current or {}).get("first_seen")
+    return {
+        "id": correlation_summary_id(kind, correlation_id),
+        "doc_type": CORRELATION_SUMMARY_DOC_TYPE,
+        "correlation_kind": kind,
+        "correlation_id": correlation_id,
+        "segments": segments,
+        "segments_seen": sorted(segments),
+        **chain_gaps(kind, segments),
+        "first_seen": min([t for t in (first_seen, *timestamps) if t]),
+        "last_seen": max(timestamps),
+        "event_count": (current or {}).get("event_count", 0) + len(corr_rows),
+    }
+
+
+def _cutoff_ms(window_seconds: int) -> int:
+    return epoch_ms(datetime.now(UTC) - timedelta(seconds=window_seconds))
+
+
+def _chunks(items: list[Any], size: int) -> Iterator[list[Any]]:
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
 
 class SpineRepository:
-    """Async Cosmos repository for the 4 spine containers."""
+    """Async Cosmos repository for the spine containers."""
 
     def __init__(
         self,
@@ -28,58 +198,535 @@ class SpineRepository:
         segment_state_container: ContainerProxy,
         status_history_container: ContainerProxy,
         correlation_container: ContainerProxy,
+        rollups_container: ContainerProxy | None = None,
+        heartbeats_container: ContainerProxy | None = None,
+        compact_events: bool = False,
     ) -> None:
         self._events = events_container
         self._segment_state = segment_state_container
         self._status_history = status_history_container
         self._correlation = correlation_container
+        self._rollups = rollups_container
+        self._heartbeats = heartbeats_container
+        self._writer: SpineEventWriter | None = None
+        self._archive: SpineArchive | None = None
+        self._listeners: list[Callable[[dict[str, Any]], None]] = []
+        # (segment_id, instance_id) -> newest heartbeat ts_ms this process wrote.
+        self._heartbeat_seen: dict[tuple[str, str], int] = {}
+        # New spine_events rows use the compact schema; both shapes are read.
+        self._compact_events = compact_events
+        # segment_id -> its operation dictionary, both directions.
+        self._operation_ids: dict[str, dict[str, int]] = {}
+        self._operation_names: dict[str, dict[int, str]] = {}
 
     async def record_event(self, event: IngestEvent) -> None:
         """Append an ingest event and (for workloads with correlation)
         a correlation record.
+
+        When a write-behind writer is attached the documents are queued and
+        persisted by its flusher; otherwise both writes happen inline.
+        With a heartbeats container, liveness events upsert the instance's
+        heartbeat instead and only reach spine_events per record_heartbeat.
+        Listeners always see the legacy row shape.
         """
-        inner = (
-            event.root
-        )  # the concrete _LivenessEvent / _ReadinessEvent / _WorkloadEvent
-        body = {
-            "id": str(uuid4()),
-            "segment_id": inner.segment_id,
-            "event_type": inner.event_type,
-            "timestamp": inner.timestamp.isoformat(),
-            "payload": inner.payload.model_dump(mode="json"),
-            "ingested_at": datetime.now(UTC).isoformat(),
+        event_body, corr_body = build_event_documents(event)
+        if (
+            event_body["event_type"] == "liveness"
+            and self._heartbeats is not None
+            and not await self.record_heartbeat(event_body)
+        ):
+            self._notify(event_body)
+            return
+        if self._writer is not None and self._writer.accepting:
+            await self._writer.submit(event_body, corr_body)
+        else:
+            [stored] = await self._encode_events([event_body])
+            await self._events.create_item(body=stored)
+            if corr_body is not None:
+                await self._correlation.upsert_item(body=corr_body)
+                await self.update_correlation_summaries([corr_body])
+        self._notify(event_body)
+
+    def add_listener(self, listener: Callable[[dict[str, Any]], None]) -> None:
+        """Register a sync callback that sees every recorded spine_events row.
+
+        Listeners run inline on the ingest path, so they must be O(1) and
+        must not do I/O (e.g. IncrementalStatusEvaluator.observe).
+        """
+        self._listeners.append(listener)
+
+    def _notify(self, event_body: dict[str, Any]) -> None:
+        for listener in self._listeners:
+            try:
+                listener(event_body)
+            except Exception:  # noqa: BLE001 - a listener must never fail ingest
+                logger.warning("Spine event listener failed", exc_info=True)
+
+    def attach_writer(self, writer: SpineEventWriter | None) -> None:
+        """Route record_event through a write-behind writer (None detaches)."""
+        self._writer = writer
+
+    def attach_archive(self, archive: SpineArchive | None) -> None:
+        """Let range reads reach past Cosmos TTL into the cold archive."""
+        self._archive = archive
+
+    async def write_event_batch(
+        self,
+        documents: list[tuple[dict[str, Any], dict[str, Any] | None]],
+    ) -> int:
+        """Persist queued (event, correlation) documents; return the failed count.
+
+        Used by the write-behind flusher. See write_events for the batching.
+        """
+        outcomes = await self.write_events(documents)
+        return outcomes.count("failed")
+
+    async def record_event_batch(self, events: list[IngestEvent]) -> list[str]:
+        """Write a client batch synchronously; one outcome per event, in order.
+
+        Bypasses the write-behind queue so callers get real per-event results
+        ("written" / "duplicate" / "failed") they can retry on.
+        """
+        documents = [build_event_documents(event) for event in events]
+        outcomes = ["written"] * len(documents)
+        pending = list(range(len(documents)))
+        if self._heartbeats is not None:
+            liveness = [
+                i for i in pending if documents[i][0]["event_type"] == "liveness"
+            ]
+            results = await asyncio.gather(
+                *(self.record_heartbeat(documents[i][0]) for i in liveness),
+                return_exceptions=True,
+            )
+            skipped: set[int] = set()
+            for i, result in zip(liveness, results, strict=True):
+                if isinstance(result, BaseException):
+                    logger.warning(
+                        "Spine heartbeat upsert failed segment_id=%s",
+                        documents[i][0]["segment_id"],
+                        exc_info=result,
+                    )
+                    outcomes[i] = "failed"
+                if result is not True:
+                    skipped.add(i)
+            pending = [i for i in pending if i not in skipped]
+        written = await self.write_events([documents[i] for i in pending])
+        for i, outcome in zip(pending, written, strict=True):
+            outcomes[i] = outcome
+        for (event_body, _), outcome in zip(documents, outcomes, strict=True):
+            if outcome == "written":
+                self._notify(event_body)
+        return outcomes
+
+    async def record_heartbeat(self, event_body: dict[str, Any]) -> bool:
+        """Upsert the sending instance's spine_heartbeats document.
+
+        One document per (segment, instance) holds its last-seen time, so
+        steady liveness costs a point upsert instead of an ever-growing
+        spine_events partition. Returns True when the event should still be
+        appended to spine_events as a sparse history row: the first
+        heartbeat this process sees for the instance, or one arriving more
+        than HEARTBEAT_HISTORY_GAP_SECONDS after its previous one. A
+        heartbeat older than the one last written here is not upserted.
+        """
+        segment_id = event_body["segment_id"]
+        instance_id = event_body["payload"]["instance_id"]
+        ts_ms = event_body["ts_ms"]
+        key = (segment_id, instance_id)
+        previous = self._heartbeat_seen.get(key)
+        if previous is not None and ts_ms <= previous:
+            return False
+        await self._heartbeats.upsert_item(
+            body={
+                "id": instance_id,
+                "segment_id": segment_id,
+                "instance_id": instance_id,
+                "last_seen": event_body["timestamp"],
+                "last_seen_ms": ts_ms,
+            }
+        )
+        self._heartbeat_seen[key] = ts_ms
+        return (
+            previous is None or ts_ms - previous > HEARTBEAT_HISTORY_GAP_SECONDS * 1000
+        )
+
+    async def get_latest_heartbeat(self, segment_id: str) -> datetime | None:
+        """Newest last-seen time across a segment's instances (None if none)."""
+        if self._heartbeats is None:
+            return None
+        async for value in self._heartbeats.query_items(
+            query="SELECT VALUE MAX(c.last_seen_ms) FROM c",
+            partition_key=segment_id,
+        ):
+            return from_epoch_ms(value) if value is not None else None
+        return None
+
+    async def write_events(
+        self,
+        documents: list[tuple[dict[str, Any], dict[str, Any] | None]],
+    ) -> list[str]:
+        """Persist (event, correlation) documents grouped by partition.
+
+        Each partition's rows go out as Cosmos transactional batches (at most
+        TRANSACTIONAL_BATCH_LIMIT operations each) and all partitions are
+        written concurrently. A batch rejected because one of its creates
+        conflicted (a replayed client event id) is rolled back by Cosmos, so
+        that chunk is retried item by item and the conflicting rows reported
+        as "duplicate". Correlation rows are upserted for written and
+        duplicate events alike (idempotent), so retrying an event whose
+        correlation write failed repairs it.
+
+        Returns "written", "duplicate" or "failed" per document, in order.
+        Failures are logged, never raised.
+        """
+        outcomes = ["written"] * len(documents)
+        bodies = await self._encode_events([event_body for event_body, _ in documents])
+
+        event_chunks: list[tuple[str, list[int]]] = []
+        by_pk: dict[str, list[int]] = defaultdict(list)
+        for i, (event_body, _) in enumerate(documents):
+            by_pk[event_body["segment_id"]].append(i)
+        for pk, indices in by_pk.items():
+            for chunk in _chunks(indices, TRANSACTIONAL_BATCH_LIMIT):
+                event_chunks.append((pk, chunk))
+        chunk_outcomes = await asyncio.gather(
+            *(
+                self._create_event_chunk(pk, [bodies[i] for i in chunk])
+                for pk, chunk in event_chunks
+            )
+        )
+        for (_, chunk), results in zip(event_chunks, chunk_outcomes, strict=True):
+            for i, outcome in zip(chunk, results, strict=True):
+                outcomes[i] = outcome
+
+        corr_by_pk: dict[str, list[int]] = defaultdict(list)
+        for i, (_, corr_body) in enumerate(documents):
+            if corr_body is not None and outcomes[i] != "failed":
+                corr_by_pk[corr_body["correlation_kind"]].append(i)
+        corr_chunks = [
+            (pk, chunk)
+            for pk, indices in corr_by_pk.items()
+            for chunk in _chunks(indices, TRANSACTIONAL_BATCH_LIMIT)
+        ]
+        results = await asyncio.gather(
+            *(
+                self._correlation.execute_item_batch(
+                    batch_operations=[("upsert", (documents[i][1],)) for i in chunk],
+                    partition_key=pk,
+                )
+                for pk, chunk in corr_chunks
+            ),
+            return_exceptions=True,
+        )
+        summary_rows: list[dict[str, Any]] = []
+        for (pk, chunk), result in zip(corr_chunks, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "Spine batch upsert failed for partition=%s (%d docs)",
+                    pk,
+                    len(chunk),
+                    exc_info=result,
+                )
+                for i in chunk:
+                    outcomes[i] = "failed"
+                continue
+            summary_rows.extend(
+                documents[i][1] for i in chunk if outcomes[i] == "written"
+            )
+        if summary_rows:
+            await self.update_correlation_summaries(summary_rows)
+        return outcomes
+
+    async def _create_event_chunk(
+        self, partition_key: str, bodies: list[dict[str, Any]]
+    ) -> list[str]:
+        try:
+            await self._events.execute_item_batch(
+                batch_operations=[("create", (body,)) for body in bodies],
+                partition_key=partition_key,
+            )
+            return ["written"] * len(bodies)
+        except CosmosBatchOperationError:
+            # One operation failed (typically 409 on a replayed event id) and
+            # Cosmos rolled the whole batch back: settle each row on its own.
+            return list(
+                await asyncio.gather(*(self._create_event(body) for body in bodies))
+            )
+        except Exception as exc:  # noqa: BLE001 - reported per document
+            logger.warning(
+                "Spine batch create failed for partition=%s (%d docs)",
+                partition_key,
+                len(bodies),
+                exc_info=exc,
+            )
+            return ["failed"] * len(bodies)
+
+    async def _create_event(self, body: dict[str, Any]) -> str:
+        try:
+            await self._events.create_item(body=body)
+            return "written"
+        except CosmosResourceExistsError:
+            return "duplicate"
+        except Exception:  # noqa: BLE001 - reported per document
+            logger.warning("Spine event create failed id=%s", body["id"], exc_info=True)
+            return "failed"
+
+    async def _encode_events(
+        self, bodies: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """The documents to store for legacy-shaped spine_events bodies.
+
+        With compact_events the bodies are encoded to the v2 schema, first
+        interning any operation their segment's dictionary lacks. Interning
+        is best effort: an operation it could not add is stored as a string.
+        """
+        if not self._compact_events:
+            return bodies
+        operations: dict[str, set[str]] = defaultdict(set)
+        for body in bodies:
+            if body["event_type"] == "workload":
+                operations[body["segment_id"]].add(body["payload"]["operation"])
+        results = await asyncio.gather(
+            *(self._intern_operations(sid, ops) for sid, ops in operations.items()),
+            return_exceptions=True,
+        )
+        for segment_id, result in zip(operations, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "Spine operation interning failed segment_id=%s",
+                    segment_id,
+                    exc_info=result,
+                )
+        return [
+            encode_event(body, self._operation_ids.get(body["segment_id"], {}))
+            for body in bodies
+        ]
+
+    async def _intern_operations(self, segment_id: str, operations: set[str]) -> None:
+        """Add operations to the segment's dictionary document.
+
+        The dictionary lives in the segment's own spine_events partition
+        (no ts_ms, so no event query matches it) and never expires. Ids are
+        assigned in insertion order under an ETag guard, so concurrent
+        writers never hand one id to two operations.
+        """
+        if segment_id not in self._operation_ids:
+            await self._load_operations(segment_id)
+        known = self._operation_ids[segment_id]
+        missing = operations - known.keys()
+        if not missing or len(known) >= MAX_INTERNED_OPERATIONS:
+            return
+        built: dict[str, int] = {}
+
+        def build(current: dict[str, Any] | None) -> dict[str, Any]:
+            ids = dict((current or {}).get("operations", {}))
+            for operation in sorted(missing):
+                if operation not in ids and len(ids) < MAX_INTERNED_OPERATIONS:
+                    ids[operation] = len(ids)
+            built.clear()
+            built.update(ids)
+            return {
+                "id": OPERATION_DICTIONARY_ID,
+                "segment_id": segment_id,
+                "doc_type": OPERATION_DICTIONARY_DOC_TYPE,
+                "operations": ids,
+                "ttl": -1,
+            }
+
+        if await self._read_modify_write(
+            self._events, OPERATION_DICTIONARY_ID, segment_id, build
+        ):
+            self._cache_operations(segment_id, built)
+
+    async def _load_operations(self, segment_id: str) -> None:
+        try:
+            doc = await self._events.read_item(
+                item=OPERATION_DICTIONARY_ID, partition_key=segment_id
+            )
+        except CosmosResourceNotFoundError:
+            doc = {}
+        self._cache_operations(segment_id, doc.get("operations", {}))
+
+    def _cache_operations(self, segment_id: str, ids: dict[str, int]) -> None:
+        self._operation_ids[segment_id] = ids
+        self._operation_names[segment_id] = {i: op for op, i in ids.items()}
+
+    async def _decode_events(self, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Legacy-shaped rows for a mix of compact and legacy spine_events rows.
+
+        A segment whose interned ids are not all cached has its dictionary
+        re-read once; ids still unknown decode as "#<id>".
+        """
+        stale = {
+            row["segment_id"]
+            for row in rows
+            if (op := interned_operation_id(row)) is not None
+            and op not in self._operation_names.get(row["segment_id"], {})
         }
-        await self._events.create_item(body=body)
-
-        if inner.event_type == "workload":
-            payload = inner.payload  # WorkloadPayload
-            if payload.correlation_kind and payload.correlation_id:
-                corr_status: SegmentStatus = (
-                    "green"
-                    if payload.outcome == "success"
-                    else "yellow"
-                    if payload.outcome == "degraded"
-                    else "red"
+        results = await asyncio.gather(
+            *(self._load_operations(sid) for sid in stale), return_exceptions=True
+        )
+        for segment_id, result in zip(stale, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "Spine operation dictionary read failed segment_id=%s",
+                    segment_id,
+                    exc_info=result,
+                )
+        return [
+            decode_event(row, self._operation_names.get(row["segment_id"], {}))
+            for row in rows
+        ]
+
+    async def update_correlation_summaries(
+        self, corr_bodies: list[dict[str, Any]]
+    ) -> None:
+        """Fold correlation rows into their per-correlation summary docs.
+
+        One optimistic read-modify-write (ETag-guarded) per distinct
+        correlation, concurrently. The summary is derived data: failures are
+        logged and never fail the ingest.
+        """
+        grouped: dict[tuple[str, str], list[dict[str, Any]]] = defaultdict(list)
+        for body in corr_bodies:
+            grouped[(body["correlation_kind"], body["correlation_id"])].append(body)
+        results = await asyncio.gather(
+            *(self._update_correlation_summary(rows) for rows in grouped.values()),
+            return_exceptions=True,
+        )
+        for (kind, cid), result in zip(grouped, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "Correlation summary update failed for %s:%s",
+                    kind,
+                    cid,
+                    exc_info=result,
                 )
-                corr_id = (
-                    f"{payload.correlation_kind}:{payload.correlation_id}"
-                    f":{inner.segment_id}:{body['id']}"
+
+    async def _update_correlation_summary(self, rows: list[dict[str, Any]]) -> None:
+        kind = rows[0]["correlation_kind"]
+        await self._read_modify_write(
+            self._correlation,
+            correlation_summary_id(kind, rows[0]["correlation_id"]),
+            kind,
+            lambda current: merge_correlation_summary(current, rows),
+        )
+
+    async def _read_modify_write(
+        self,
+        container: ContainerProxy,
+        item_id: str,
+        partition_key: str,
+        build: Callable[[dict[str, Any] | None], dict[str, Any]],
+    ) -> bool:
+        """Optimistic (ETag-guarded) update of one derived document.
+
+        `build` receives the current document (None when absent) and returns
+        the replacement. Lost races re-read and retry up to
+        _SUMMARY_UPDATE_ATTEMPTS times; returns False when every attempt lost.
+        """
+        for _ in range(_SUMMARY_UPDATE_ATTEMPTS):
+            try:
+                current = await container.read_item(
+                    item=item_id, partition_key=partition_key
                 )
-                corr_body = {
-                    "id": corr_id,
-                    "correlation_kind": payload.correlation_kind,
-                    "correlation_id": payload.correlation_id,
-                    "segment_id": inner.segment_id,
-                    "timestamp": inner.timestamp.isoformat(),
-                    "status": corr_status,
-                    "headline": (
-                        f"{payload.operation} {payload.outcome}"
-                        + (f" ({payload.error_class})" if payload.error_class else "")
-                    ),
-                    "parent_correlation_kind": None,
-                    "parent_correlation_id": None,
-                }
-                await self._correlation.upsert_item(body=corr_body)
+            except CosmosResourceNotFoundError:
+                current = None
+            doc = build(current)
+            try:
+                if current is None:
+                    await container.create_item(body=doc)
+                else:
+                    await container.replace_item(
+                        item=item_id,
+                        body=doc,
+                        etag=current["_etag"],
+                        match_condition=MatchConditions.IfNotModified,
+                    )
+                return True
+            except (CosmosResourceExistsError, CosmosAccessConditionFailedError):
+                continue  # a concurrent writer won the race; re-read and retry
+        logger.warning(
+            "Spine document %s still contended after %d attempts",
+            item_id,
+            _SUMMARY_UPDATE_ATTEMPTS,
+        )
+        return False
+
+    async def merge_rollup_buckets(
+        self, deltas: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Add bucket deltas into spine_rollups; return the failed ones."""
+        if self._rollups is None:
+            return []
+        rollups = self._rollups
+
+        def _merge(delta: dict[str, Any]) -> Callable[[dict | None], dict]:
+            def build(current: dict[str, Any] | None) -> dict[str, Any]:
+                if current is None:
+                    return dict(delta)
+                doc = {k: v for k, v in current.items() if not k.startswith("_")}
+                return merge_bucket(doc, delta)
+
+            return build
+
+        results = await asyncio.gather(
+            *(
+                self._read_modify_write(
+                    rollups, delta["id"], delta["segment_id"], _merge(delta)
+                )
+                for delta in deltas
+            ),
+            return_exceptions=True,
+        )
+        failed: list[dict[str, Any]] = []
+        for delta, result in zip(deltas, results, strict=True):
+            if result is True:
+                continue
+            failed.append(delta)
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "Rollup merge failed for %s", delta["id"], exc_info=result
+                )
+        return failed
+
+    async def get_rollups(
+        self,
+        segment_id: str,
+        granularity: str,
+        start: datetime,
+        end: datetime,
+        operation: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return a segment's rollup buckets in [start, end), oldest first.
+
+        Single-partition query (spine_rollups is partitioned on segment_id).
+        `operation=None` returns every operation's buckets.
+        """
+        if self._rollups is None:
+            return []
+        query = (
+            "SELECT * FROM c WHERE c.segment_id = @sid"
+            " AND c.granularity = @granularity"
+            " AND c.bucket_start >= @start AND c.bucket_start < @end"
+        )
+        parameters: list[dict[str, Any]] = [
+            {"name": "@sid", "value": segment_id},
+            {"name": "@granularity", "value": granularity},
+            {"name": "@start", "value": start.isoformat()},
+            {"name": "@end", "value": end.isoformat()},
+        ]
+        if operation is not None:
+            query += " AND c.operation = @operation"
+            parameters.append({"name": "@operation", "value": operation})
+        results: list[dict[str, Any]] = []
+        async for item in self._rollups.query_items(
+            query=query + " ORDER BY c.bucket_start ASC",
+            parameters=parameters,
+            partition_key=segment_id,
+        ):
+            results.append(item)
+        return results
 
     async def upsert_segment_state(
         self,
@@ -88,16 +735,23 @@ class SpineRepository:
         headline: str,
         last_updated: datetime,
         evaluator_inputs: dict[str, Any],
-    ) -> None:
+        latency_sketches: dict[str, dict[str, Any]] | None = None,
+    ) -> dict[str, Any]:
+        """Upsert a segment's evaluated state; returns the written document."""
         body = {
             "id": segment_id,
             "segment_id": segment_id,
             "status": status,
             "headline": headline,
             "last_updated": last_updated.isoformat(),
+            "last_updated_ms": epoch_ms(last_updated),
             "evaluator_inputs": evaluator_inputs,
+            # Compact DDSketch per operation ("*" = whole segment) over the
+            # evaluator window; merge with LatencySketch.from_dict().
+            "latency_sketches": latency_sketches or {},
         }
         await self._segment_state.upsert_item(body=body)
+        return body
 
     async def get_segment_state(self, segment_id: str) -> dict[str, Any] | None:
         try:
@@ -125,7 +779,8 @@ class SpineRepository:
         headline: str,
         evaluator_outputs: dict[str, Any],
         timestamp: datetime,
-    ) -> None:
+    ) -> dict[str, Any]:
+        """Append a status transition; returns the written history record."""
         body = {
             "id": str(uuid4()),
             "segment_id": segment_id,
@@ -134,34 +789,222 @@ class SpineRepository:
             "headline": headline,
             "evaluator_outputs": evaluator_outputs,
             "timestamp": timestamp.isoformat(),
+            "ts_ms": epoch_ms(timestamp),
         }
         await self._status_history.create_item(body=body)
+        return body
+
+    async def get_events_written_since(
+        self,
+        segment_id: str,
+        since_ts: int,
+        fields: str = "*",
+    ) -> list[dict[str, Any]]:
+        """Events for a segment whose Cosmos `_ts` (write time, epoch seconds)
+        is >= since_ts, whatever their own timestamp. Inclusive because `_ts`
+        has one-second resolution; callers merge the repeated rows by id."""
+        results: list[dict[str, Any]] = []
+        async for item in self._events.query_items(
+            query=(
+                f"SELECT {fields} FROM c WHERE c.segment_id = @sid AND c._ts >= @since"
+            ),
+            parameters=[
+                {"name": "@sid", "value": segment_id},
+                {"name": "@since", "value": since_ts},
+            ],
+            partition_key=segment_id,
+        ):
+            results.append(item)
+        return await self._decode_events(results)
 
     async def get_recent_events(
         self,
         segment_id: str,
         window_seconds: int,
+        fields: str = "*",
     ) -> list[dict[str, Any]]:
-        cutoff = (datetime.now(UTC) - timedelta(seconds=window_seconds)).isoformat()
+        """Events for a segment within the window; `fields` is a SELECT list
+        (e.g. EVALUATOR_FIELDS) for callers that need less than the row."""
+        cutoff = _cutoff_ms(window_seconds)
         results: list[dict[str, Any]] = []
         async for item in self._events.query_items(
             query=(
-                "SELECT * FROM c WHERE c.segment_id = @sid AND c.timestamp >= @cutoff"
+                f"SELECT {fields} FROM c"
+                " WHERE c.segment_id = @sid AND c.ts_ms >= @cutoff"
             ),
             parameters=[
                 {"name": "@sid", "value": segment_id},
                 {"name": "@cutoff", "value": cutoff},
             ],
+            partition_key=segment_id,
+        ):
+            results.append(item)
+        return await self._decode_events(results)
+
+    async def get_events_between(
+        self,
+        segment_id: str,
+        start: datetime,
+        end: datetime,
+    ) -> list[dict[str, Any]]:
+        """Events for a segment with start <= timestamp < end, oldest first.
+
+        Rows already aged out of Cosmos are read from the archive (when
+        attached) for the part of the range before its watermark.
+        """
+        hot = await self._query_range(self._events, segment_id, start, end)
+        hot = await self._decode_events(hot)
+        return await self._with_archived("events", segment_id, start, end, hot)
+
+    async def get_status_history(
+        self,
+        segment_id: str,
+        start: datetime,
+        end: datetime,
+    ) -> list[dict[str, Any]]:
+        """Status transitions for a segment in [start, end), oldest first."""
+        hot = await self._query_range(self._status_history, segment_id, start, end)
+        return await self._with_archived("status_history", segment_id, start, end, hot)
+
+    async def get_status_transitions(
+        self,
+        start: datetime,
+        end: datetime,
+        segment_id: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Projected status transitions in [start, end), oldest first.
+
+        One query for every segment (cross-partition) or one segment.
+        Transitions are sparse and each carries prev_status, so these rows
+        alone describe a segment's status intervals over the range.
+        """
+        query = (
+            f"SELECT {TIMELINE_FIELDS} FROM c"
+            " WHERE c.ts_ms >= @start AND c.ts_ms < @end"
+        )
+        parameters: list[dict[str, Any]] = [
+            {"name": "@start", "value": epoch_ms(start)},
+            {"name": "@end", "value": epoch_ms(end)},
+        ]
+        kwargs: dict[str, Any] = {}
+        if segment_id is not None:
+            query += " AND c.segment_id = @sid"
+            parameters.append({"name": "@sid", "value": segment_id})
+            kwargs["partition_key"] = segment_id
+        results: list[dict[str, Any]] = []
+        async for item in self._status_history.query_items(
+            query=query + " ORDER BY c.ts_ms ASC",
+            parameters=parameters,
+            **kwargs,
         ):
             results.append(item)
         return results
 
+    async def _query_range(
+        self,
+        container: ContainerProxy,
+        segment_id: str,
+        start: datetime,
+        end: datetime,
+    ) -> list[dict[str, Any]]:
+        results: list[dict[str, Any]] = []
+        async for item in container.query_items(
+            query=(
+                "SELECT * FROM c WHERE c.segment_id = @sid"
+                " AND c.ts_ms >= @start AND c.ts_ms < @end"
+            ),
+            parameters=[
+                {"name": "@sid", "value": segment_id},
+                {"name": "@start", "value": epoch_ms(start)},
+                {"name": "@end", "value": epoch_ms(end)},
+            ],
+            partition_key=segment_id,
+        ):
+            results.append(item)
+        results.sort(key=row_epoch_ms)
+        return results
+
+    async def _with_archived(
+        self,
+        kind: str,
+        partition: str,
+        start: datetime,
+        end: datetime,
+        hot: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        if self._archive is None:
+            return hot
+        watermark = await self._archive.watermark(kind)
+        if not watermark or start.timestamp() > watermark:
+            return hot  # nothing in the range has been archived yet
+        archived = await self._archive.read(kind, partition, start, end)
+        return merge_hot_and_archived(hot, archived)
+
+    async def get_oldest_write_ts(self, kind: str) -> int:
+        """Oldest Cosmos `_ts` among archivable rows (0 when there are none).
+
+        Skips the derived documents get_rows_written_between never exports,
+        so a long-lived operation dictionary cannot pin the archive start.
+        """
+        async for value in self._archive_source(kind).query_items(
+            query="SELECT VALUE MIN(c._ts) FROM c WHERE NOT IS_DEFINED(c.doc_type)",
+        ):
+            return int(value) if value is not None else 0
+        return 0
+
+    async def get_rows_written_between(
+        self, kind: str, after_ts: int, until_ts: int
+    ) -> list[dict[str, Any]]:
+        """Rows of an archivable container with after_ts < _ts <= until_ts.
+
+        Correlation summary documents and operation dictionaries are derived
+        state, not history, and are never archived. Events are exported in
+        the legacy row shape so archive files read without the dictionary.
+        """
+        results: list[dict[str, Any]] = []
+        async for item in self._archive_source(kind).query_items(
+            query=(
+                "SELECT * FROM c WHERE c._ts > @after AND c._ts <= @until"
+                " AND NOT IS_DEFINED(c.doc_type)"
+            ),
+            parameters=[
+                {"name": "@after", "value": after_ts},
+                {"name": "@until", "value": until_ts},
+            ],
+        ):
+            results.append(item)
+        if kind == "events":
+            return await self._decode_events(results)
+        return results
+
+    def _archive_source(self, kind: str) -> ContainerProxy:
+        return {
+            "events": self._events,
+            "status_history": self._status_history,
+            "correlation": self._correlation,
+        }[kind]
+
     async def get_correlation_events(
         self,
         kind: CorrelationKind,
         correlation_id: str,
     ) -> list[dict[str, Any]]:
-        results: list[dict[str, Any]] = []
+        rows, _ = await self.get_correlation_path(kind, correlation_id)
+        return rows
+
+    async def get_correlation_path(
+        self,
+        kind: CorrelationKind,
+        correlation_id: str,
+    ) -> tuple[list[dict[str, Any]], dict[str, Any] | None]:
+        """Return (rows sorted by timestamp, summary doc or None).
+
+        One single-partition query (spine_correlation is partitioned on
+        correlation_kind) returns both the per-segment rows and the
+        correlation summary document.
+        """
+        rows: list[dict[str, Any]] = []
+        summary: dict[str, Any] | None = None
         async for item in self._correlation.query_items(
             query=(
                 "SELECT * FROM c"
@@ -171,10 +1014,14 @@ class SpineRepository:
                 {"name": "@kind", "value": kind},
                 {"name": "@cid", "value": correlation_id},
             ],
+            partition_key=kind,
         ):
-            results.append(item)
-        results.sort(key=lambda r: r["timestamp"])
-        return results
+            if item.get("doc_type") == CORRELATION_SUMMARY_DOC_TYPE:
+                summary = item
+            else:
+                rows.append(item)
+        rows.sort(key=lambda r: r["timestamp"])
+        return rows, summary
 
     async def get_recent_transaction_events(
         self,
@@ -188,29 +1035,32 @@ class SpineRepository:
         uncorrelated workload rows (for example GET /health probes) stay in
         native diagnostics and DO NOT appear in the ledger-first section.
         """
-        cutoff = (datetime.now(UTC) - timedelta(seconds=window_seconds)).isoformat()
+        cutoff = _cutoff_ms(window_seconds)
         results: list[dict[str, Any]] = []
         async for item in self._events.query_items(
             query=(
-                "SELECT * FROM c"
+                f"SELECT {LEDGER_FIELDS} FROM c"
                 " WHERE c.segment_id = @sid"
-                " AND c.timestamp >= @cutoff"
-                " AND c.event_type = 'workload'"
+                " AND c.ts_ms >= @cutoff"
+                " AND ((c.event_type = 'workload'"
                 " AND IS_DEFINED(c.payload.correlation_kind)"
                 " AND NOT IS_NULL(c.payload.correlation_kind)"
                 " AND IS_DEFINED(c.payload.correlation_id)"
-                " AND NOT IS_NULL(c.payload.correlation_id)"
-                " ORDER BY c.timestamp DESC"
+                " AND NOT IS_NULL(c.payload.correlation_id))"
+                f" OR (c.t = {_WORKLOAD_CODE}"
+                " AND IS_DEFINED(c.p.ck) AND IS_DEFINED(c.p.ci)))"
+                " ORDER BY c.ts_ms DESC"
             ),
             parameters=[
                 {"name": "@sid", "value": segment_id},
                 {"name": "@cutoff", "value": cutoff},
             ],
+            partition_key=segment_id,
         ):
             results.append(item)
             if len(results) >= limit:
                 break
-        return results
+        return await self._decode_events(results)
 
     async def get_workload_events_for_correlation(
         self,
@@ -220,19 +1070,21 @@ class SpineRepository:
     ) -> list[dict[str, Any]]:
         """Return raw workload events matching a correlation_id within the window.
 
-        Used to enrich CorrelationEvents with duration/operation. The
-        spine_correlation container has segment/status/headline but not
-        duration or operation; those live on the raw event row in spine_events.
+        Cross-partition scan of spine_events. Correlation rows now carry
+        operation/duration/outcome/error_class themselves; this is only the
+        enrichment fallback for rows written before that denormalization.
         """
-        cutoff = (datetime.now(UTC) - timedelta(seconds=window_seconds)).isoformat()
+        cutoff = _cutoff_ms(window_seconds)
         results: list[dict[str, Any]] = []
         async for item in self._events.query_items(
             query=(
                 "SELECT * FROM c"
-                " WHERE c.event_type = 'workload'"
-                " AND c.timestamp >= @cutoff"
+                " WHERE c.ts_ms >= @cutoff"
+                " AND ((c.event_type = 'workload'"
                 " AND c.payload.correlation_kind = @kind"
-                " AND c.payload.correlation_id = @cid"
+                " AND c.payload.correlation_id = @cid)"
+                f" OR (c.t = {_WORKLOAD_CODE}"
+                " AND c.p.ck = @kind AND c.p.ci = @cid))"
             ),
             parameters=[
                 {"name": "@cutoff", "value": cutoff},
@@ -241,7 +1093,73 @@ class SpineRepository:
             ],
         ):
             results.append(item)
-        return results
+        return await self._decode_events(results)
+
+    async def get_correlation_events_for_ids(
+        self,
+        kind: CorrelationKind,
+        correlation_ids: list[str],
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Batched get_correlation_events: rows per correlation_id, one query.
+
+        Single-partition (correlation_kind). Every requested id is a key;
+        summary documents are skipped.
+        """
+        by_id: dict[str, list[dict[str, Any]]] = {cid: [] for cid in correlation_ids}
+        if not by_id:
+            return by_id
+        async for item in self._correlation.query_items(
+            query=(
+                "SELECT * FROM c"
+                " WHERE c.correlation_kind = @kind"
+                " AND ARRAY_CONTAINS(@cids, c.correlation_id)"
+            ),
+            parameters=[
+                {"name": "@kind", "value": kind},
+                {"name": "@cids", "value": list(by_id)},
+            ],
+            partition_key=kind,
+        ):
+            if item.get("doc_type") == CORRELATION_SUMMARY_DOC_TYPE:
+                continue
+            by_id[item["correlation_id"]].append(item)
+        for rows in by_id.values():
+            rows.sort(key=lambda r: r["timestamp"])
+        return by_id
+
+    async def get_workload_events_for_correlations(
+        self,
+        correlation_ids: list[str],
+        window_seconds: int,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Workload events per correlation_id within the window, one query.
+
+        One cross-partition scan for a whole audit sample instead of a
+        per-segment window read for every trace. Every requested id is a key.
+        """
+        by_id: dict[str, list[dict[str, Any]]] = {cid: [] for cid in correlation_ids}
+        if not by_id:
+            return by_id
+        rows: list[dict[str, Any]] = []
+        async for item in self._events.query_items(
+            query=(
+                f"SELECT {EVALUATOR_FIELDS}, c.payload.correlation_id"
+                " AS correlation_id FROM c"
+                " WHERE c.ts_ms >= @cutoff"
+                " AND ((c.event_type = 'workload'"
+                " AND ARRAY_CONTAINS(@cids, c.payload.correlation_id))"
+                f" OR (c.t = {_WORKLOAD_CODE} AND ARRAY_CONTAINS(@cids, c.p.ci)))"
+            ),
+            parameters=[
+                {"name": "@cutoff", "value": _cutoff_ms(window_seconds)},
+                {"name": "@cids", "value": list(by_id)},
+            ],
+        ):
+            rows.append(item)
+        for item in await self._decode_events(rows):
+            correlation_id = item.pop("correlation_id", None)
+            by_id[correlation_id or item["payload"]["correlation_id"]].append(item)
+        return by_id
 
     async def get_recent_correlation_ids(
         self,
@@ -258,26 +1176,25 @@ class SpineRepository:
         if limit <= 0:
             return []
 
-        cutoff = (datetime.now(UTC) - timedelta(seconds=time_range_seconds)).isoformat()
+        cutoff = _cutoff_ms(time_range_seconds)
 
         # Pull rows newest-first; dedupe in Python (Cosmos GROUP BY is restricted
         # in cross-partition queries and we already constrain the result with TTL).
-        seen: dict[str, str] = {}
+        seen: dict[str, None] = {}
         async for item in self._correlation.query_items(
             query=(
-                "SELECT c.correlation_id, c.timestamp FROM c"
-                " WHERE c.correlation_kind = @kind AND c.timestamp >= @cutoff"
-                " ORDER BY c.timestamp DESC"
+                "SELECT c.correlation_id, c.ts_ms FROM c"
+                " WHERE c.correlation_kind = @kind AND c.ts_ms >= @cutoff"
+                " ORDER BY c.ts_ms DESC"
             ),
             parameters=[
                 {"name": "@kind", "value": kind},
                 {"name": "@cutoff", "value": cutoff},
             ],
+            partition_key=kind,
         ):
-            cid = item["correlation_id"]
-            if cid not in seen:
-                seen[cid] = item["timestamp"]
+            seen.setdefault(item["correlation_id"], None)
             if len(seen) >= limit:
                 break
 
-        return list(seen.keys())
+        return list(seen)
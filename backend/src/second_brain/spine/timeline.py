@@ -0,0 +1,109 @@
+"""Status-history timelines: contiguous status spans and time-in-status.
+
+spine_status_history only holds transitions, and each one carries
+prev_status, so a segment's intervals over a range come from its
+transitions in that range alone:
+
+- before the first transition: that transition's prev_status
+- no transitions at all: the segment's current status (segment_state)
+- a first-ever transition (prev_status None): no data before it
+
+build_intervals turns transitions into exact, merged spans (these feed the
+time-in-status percentages). downsample then folds them into fixed
+resolution buckets, each taking the most severe status seen in it so a
+short outage is never averaged away, and merges equal neighbours again.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Any
+
+from second_brain.spine.models import SegmentStatus
+
+# Interval: (start_ms, end_ms, status); None status = no data.
+Interval = tuple[int, int, SegmentStatus | None]
+
+STATUS_SEVERITY: dict[str | None, int] = {
+    None: 0,
+    "green": 1,
+    "stale": 2,
+    "yellow": 3,
+    "red": 4,
+}
+
+
+def build_intervals(
+    transitions: list[dict[str, Any]],
+    current_status: SegmentStatus | None,
+    start_ms: int,
+    end_ms: int,
+) -> list[Interval]:
+    """Merged status spans covering [start_ms, end_ms).
+
+    `transitions` are one segment's rows in the range, oldest first.
+    """
+    status = transitions[0].get("prev_status") if transitions else current_status
+    cursor = start_ms
+    intervals: list[Interval] = []
+    for row in transitions:
+        ts = min(max(row["ts_ms"], start_ms), end_ms)
+        _append(intervals, cursor, ts, status)
+        cursor, status = ts, row["status"]
+    _append(intervals, cursor, end_ms, status)
+    return intervals
+
+
+def downsample(
+    intervals: list[Interval],
+    start_ms: int,
+    end_ms: int,
+    resolution_ms: int,
+) -> list[Interval]:
+    """Fixed-resolution buckets (worst status in each), merged into spans."""
+    spans: list[Interval] = []
+    i = 0
+    bucket = start_ms
+    while bucket < end_ms:
+        bucket_end = min(bucket + resolution_ms, end_ms)
+        worst: SegmentStatus | None = None
+        while i < len(intervals) and intervals[i][1] <= bucket:
+            i += 1
+        j = i
+        while j < len(intervals) and intervals[j][0] < bucket_end:
+            status = intervals[j][2]
+            if STATUS_SEVERITY[status] > STATUS_SEVERITY[worst]:
+                worst = status
+            j += 1
+        _append(spans, bucket, bucket_end, worst)
+        bucket = bucket_end
+    return spans
+
+
+def time_in_status(intervals: list[Interval]) -> dict[str, float]:
+    """Share of the covered range (0-100) spent in each status.
+
+    Time with no data is excluded from the denominator.
+    """
+    durations: dict[str, int] = defaultdict(int)
+    for start, end, status in intervals:
+        if status is not None:
+            durations[status] += end - start
+    covered = sum(durations.values())
+    if covered == 0:
+        return {}
+    return {
+        status: round(100 * duration / covered, 3)
+        for status, duration in sorted(durations.items())
+    }
+
+
+def _append(
+    intervals: list[Interval], start: int, end: int, status: SegmentStatus | None
+) -> None:
+    if end <= start:
+        return
+    if intervals and intervals[-1][2] == status and intervals[-1][1] == start:
+        intervals[-1] = (intervals[-1][0], end, status)
+    else:
+        intervals.append((start, end, status))
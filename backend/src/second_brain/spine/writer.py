@@ -0,0 +1,145 @@
+"""Write-behind writer for spine ingest events.
+
+Request-path callers (SpineWorkloadMiddleware, spine_stream_wrapper,
+emit_agent_workload, the liveness emitter) go through
+SpineRepository.record_event. With a writer attached, that call only builds
+the documents and queues them; a single flusher task drains the queue in
+batches and hands them to SpineRepository.write_event_batch, which groups
+them by partition and issues Cosmos transactional batches.
+
+Overflow policy: the queue is bounded. When it is full, submit() first
+applies backpressure (wakes the flusher and waits up to
+enqueue_timeout_seconds for room), then drops the OLDEST queued event so
+the newest signal always lands. Drops are counted, never raised.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections import deque
+from typing import Any
+
+from second_brain.spine.storage import SpineRepository
+
+logger = logging.getLogger(__name__)
+
+_Documents = tuple[dict[str, Any], dict[str, Any] | None]
+
+
+class SpineEventWriter:
+    """Bounded in-process queue + batch flusher for spine event documents."""
+
+    def __init__(
+        self,
+        repo: SpineRepository,
+        max_queue_size: int = 5000,
+        batch_size: int = 200,
+        flush_interval_seconds: float = 1.0,
+        enqueue_timeout_seconds: float = 0.05,
+    ) -> None:
+        if max_queue_size < 1 or batch_size < 1:
+            raise ValueError("max_queue_size and batch_size must be >= 1")
+        self._repo = repo
+        self._max_queue_size = max_queue_size
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval_seconds
+        self._enqueue_timeout = enqueue_timeout_seconds
+        self._queue: deque[_Documents] = deque()
+        self._wakeup = asyncio.Event()
+        self._space = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+        self._closed = False
+        self.enqueued = 0
+        self.dropped = 0
+        self.written = 0
+        self.failed = 0
+
+    @property
+    def accepting(self) -> bool:
+        """True while the flusher is running and new events can be queued."""
+        return self._task is not None and not self._closed
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._queue)
+
+    def stats(self) -> dict[str, int]:
+        """Counters for operators (queue depth, drops, throughput)."""
+        return {
+            "queue_depth": len(self._queue),
+            "max_queue_size": self._max_queue_size,
+            "enqueued": self.enqueued,
+            "dropped": self.dropped,
+            "written": self.written,
+            "failed": self.failed,
+        }
+
+    def start(self) -> asyncio.Task:
+        """Start the flusher task. Idempotent."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        return self._task
+
+    async def submit(
+        self,
+        event_body: dict[str, Any],
+        corr_body: dict[str, Any] | None,
+    ) -> None:
+        """Queue one event's documents, applying backpressure then drop-oldest."""
+        if len(self._queue) >= self._max_queue_size and self._enqueue_timeout > 0:
+            self._space.clear()
+            self._wakeup.set()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._space.wait(), self._enqueue_timeout)
+        if len(self._queue) >= self._max_queue_size:
+            self._queue.popleft()
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning(
+                    "Spine write queue full (size=%d) -- dropped oldest event "
+                    "(total dropped=%d)",
+                    self._max_queue_size,
+                    self.dropped,
+                )
+        self._queue.append((event_body, corr_body))
+        self.enqueued += 1
+        if len(self._queue) >= self._batch_size:
+            self._wakeup.set()
+
+    async def flush(self) -> None:
+        """Drain the queue completely, one batch at a time."""
+        async with self._flush_lock:
+            while self._queue:
+                batch = [
+                    self._queue.popleft()
+                    for _ in range(min(self._batch_size, len(self._queue)))
+                ]
+                self._space.set()
+                try:
+                    failed = await self._repo.write_event_batch(batch)
+                except Exception:  # noqa: BLE001 - never let the flusher die
+                    logger.warning("Spine batch flush failed", exc_info=True)
+                    failed = len(batch)
+                self.failed += failed
+                self.written += len(batch) - failed
+
+    async def close(self) -> None:
+        """Stop the flusher and write everything still queued (lifespan shutdown)."""
+        self._closed = True
+        self._wakeup.set()
+        if self._task is not None:
+            # Let the flusher finish its in-flight batch instead of cancelling
+            # it mid-write (a cancelled batch would already be off the queue).
+            await self._task
+        await self.flush()
+        logger.info("Spine event writer closed: %s", self.stats())
+
+    async def _run(self) -> None:
+        while not self._closed:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self._flush_interval)
+            self._wakeup.clear()
+            await self.flush()
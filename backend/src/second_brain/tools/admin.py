@@ -21,6 +21,7 @@ from typing import Annotated
 from pydantic import Field
 
 from second_brain.db.cosmos import CosmosManager
+from second_brain.db.snapshots import list_snapshots
 from second_brain.models.documents import (
     AffinityRuleDocument,
     DestinationDocument,
@@ -28,6 +29,7 @@ from second_brain.models.documents import (
     TaskItem,
 )
 from second_brain.tools.classification import capture_trace_id_var
+from second_brain.tools.routing_cache import routing_cache
 
 logger = logging.getLogger(__name__)
 
@@ -46,54 +48,10 @@ async def build_routing_context(cosmos_manager: CosmosManager) -> str:
     """Build formatted routing context from destinations and affinity rules.
 
     Shared by the AdminTools.get_routing_context tool and admin_handoff.py.
-    Returns a formatted string for the Admin Agent's routing decisions.
+    Returns a formatted string for the Admin Agent's routing decisions,
+    served from the process-wide RoutingCache.
     """
-    # Query destinations
-    dest_container = cosmos_manager.get_container("Destinations")
-    destinations: list[dict] = []
-    async for item in dest_container.query_items(
-        query="SELECT * FROM c WHERE c.userId = 'will'",
-        partition_key="will",
-    ):
-        destinations.append(item)
-
-    # Query affinity rules
-    rules_container = cosmos_manager.get_container("AffinityRules")
-    rules: list[dict] = []
-    async for item in rules_container.query_items(
-        query="SELECT * FROM c WHERE c.userId = 'will'",
-        partition_key="will",
-    ):
-        rules.append(item)
-
-    # Format context
-    lines: list[str] = ["DESTINATIONS:"]
-    if destinations:
-        for dest in destinations:
-            slug = dest.get("slug", "unknown")
-            display = dest.get("displayName", slug)
-            dtype = dest.get("type", "physical")
-            lines.append(f"- {slug} ({display}, {dtype})")
-    else:
-        lines.append("- No destinations defined yet.")
-
-    lines.append("")
-    lines.append("ROUTING RULES:")
-    if rules:
-        for rule in rules:
-            nl = rule.get("naturalLanguage", "")
-            rtype = rule.get("ruleType", "item")
-            pattern = rule.get("itemPattern", "")
-            dest_slug = rule.get("destinationSlug", "")
-            lines.append(f'- "{nl}" ({rtype}: {pattern} -> {dest_slug})')
-        lines.append("")
-        lines.append("If no rule matches an item, set destination to 'unrouted'.")
-    else:
-        lines.append(
-            "No routing rules defined. Set all errand items to destination='unrouted'."
-        )
-
-    return "\n".join(lines)
+    return await routing_cache(cosmos_manager).routing_context()
 
 
 class AdminTools:
@@ -114,6 +72,8 @@ class AdminTools:
     def __init__(self, cosmos_manager: CosmosManager) -> None:
         """Store the CosmosManager reference."""
         self._manager = cosmos_manager
+        self._routing = routing_cache(cosmos_manager)
+        self._snapshots = list_snapshots(cosmos_manager)
 
     # ------------------------------------------------------------------
     # Helper: async query_items collection
@@ -183,6 +143,13 @@ class AdminTools:
                 logger.warning("Skipping item with empty name: %s", item_data)
                 continue
 
+            if destination == "unrouted":
+                # Deterministic fallback: a rule that clearly covers the
+                # item routes it even when the agent did not.
+                match = (await self._routing.matcher()).route(name)
+                if match is not None:
+                    destination = match.destination
+
             needs_routing = destination == "unrouted"
             source_name = item_data.get("sourceName")
             source_url = item_data.get("sourceUrl")
@@ -203,6 +170,7 @@ class AdminTools:
             )
             await container.create_item(body=doc.model_dump())
             destination_counts[destination] = destination_counts.get(destination, 0) + 1
+        self._snapshots.invalidate("errands")
 
         total = sum(destination_counts.values())
         if total == 0:
@@ -258,6 +226,7 @@ class AdminTools:
             )
             await container.create_item(body=doc.model_dump(mode="json"))
             added += 1
+        self._snapshots.invalidate("tasks")
 
         if added == 0:
             return "No tasks added (all tasks had empty names)"
@@ -331,6 +300,8 @@ class AdminTools:
         doc = DestinationDocument(id=slug, slug=slug, displayName=name, type=dtype)
         container = self._manager.get_container("Destinations")
         await container.create_item(body=doc.model_dump(mode="json"))
+        self._routing.invalidate("Destinations")
+        self._snapshots.invalidate("errands")
         return f"Created destination '{name}' (slug: {slug}, type: {dtype})."
 
     async def _destination_rename(
@@ -354,6 +325,8 @@ class AdminTools:
 
         container = self._manager.get_container("Destinations")
         await container.upsert_item(body=dest)
+        self._routing.invalidate("Destinations")
+        self._snapshots.invalidate("errands")
 
         parts = []
         if new_name:
@@ -395,6 +368,8 @@ class AdminTools:
 
         container = self._manager.get_container("Destinations")
         await container.delete_item(item=existing[0]["id"], partition_key="will")
+        self._routing.invalidate("Destinations")
+        self._snapshots.invalidate("errands")
         return f"Removed destination '{name}' (slug: {slug})."
 
     # ------------------------------------------------------------------
@@ -482,9 +457,7 @@ class AdminTools:
         auto_saved: bool,
     ) -> str:
         """Create a new affinity rule with conflict detection."""
-        existing_rules = await self._collect_query(
-            "AffinityRules", "SELECT * FROM c WHERE c.userId = 'will'"
-        )
+        existing_rules = await self._routing.get("AffinityRules")
         # Check for conflict (case-insensitive itemPattern match)
         for rule in existing_rules:
             if rule.get("itemPattern", "").lower() == item_pattern.lower():
@@ -504,6 +477,7 @@ class AdminTools:
         )
         container = self._manager.get_container("AffinityRules")
         await container.create_item(body=doc.model_dump(mode="json"))
+        self._routing.invalidate("AffinityRules")
         return (
             f"Created rule: '{natural_language}' "
             f"({rule_type}: {item_pattern} -> {destination_slug})."
@@ -519,9 +493,7 @@ class AdminTools:
         auto_saved: bool,
     ) -> str:
         """Update an existing affinity rule by itemPattern."""
-        existing_rules = await self._collect_query(
-            "AffinityRules", "SELECT * FROM c WHERE c.userId = 'will'"
-        )
+        existing_rules = await self._routing.get("AffinityRules")
         target = None
         for rule in existing_rules:
             if rule.get("itemPattern", "").lower() == item_pattern.lower():
@@ -540,6 +512,7 @@ class AdminTools:
 
         container = self._manager.get_container("AffinityRules")
         await container.upsert_item(body=target)
+        self._routing.invalidate("AffinityRules")
         return (
             f"Updated rule: '{natural_language}' "
             f"({rule_type}: {item_pattern} -> {destination_slug})."
@@ -547,9 +520,7 @@ class AdminTools:
 
     async def _rule_delete(self, item_pattern: str) -> str:
         """Delete an affinity rule by itemPattern."""
-        existing_rules = await self._collect_query(
-            "AffinityRules", "SELECT * FROM c WHERE c.userId = 'will'"
-        )
+        existing_rules = await self._routing.get("AffinityRules")
         target = None
         for rule in existing_rules:
             if rule.get("itemPattern", "").lower() == item_pattern.lower():
@@ -561,6 +532,7 @@ class AdminTools:
 
         container = self._manager.get_container("AffinityRules")
         await container.delete_item(item=target["id"], partition_key="will")
+        self._routing.invalidate("AffinityRules")
         return f"Deleted rule for '{item_pattern}'."
 
     # ------------------------------------------------------------------
@@ -585,12 +557,8 @@ class AdminTools:
         For 'what are my rules?' returns all rules. For 'where does X go?'
         returns the matching rule.
         """
-        rules = await self._collect_query(
-            "AffinityRules", "SELECT * FROM c WHERE c.userId = 'will'"
-        )
-        destinations = await self._collect_query(
-            "Destinations", "SELECT * FROM c WHERE c.userId = 'will'"
-        )
+        rules = await self._routing.get("AffinityRules")
+        destinations = await self._routing.get("Destinations")
 
         # Build destination slug->displayName lookup
         dest_names: dict[str, str] = {
@@ -606,12 +574,12 @@ class AdminTools:
             )
 
         # Check if the query is asking about a specific item
-        query_lower = query_text.lower().strip()
+        matched = (await self._routing.matcher()).rules_in(query_text)
 
-        # Try to find a specific item match
-        for rule in rules:
+        # Report the first rule whose pattern appears in the query
+        for rule in matched[:1]:
             pattern = rule.get("itemPattern", "").lower()
-            if pattern and pattern in query_lower:
+            if pattern:
                 dest_slug = rule.get("destinationSlug", "unknown")
                 dest_display = dest_names.get(dest_slug, dest_slug)
                 nl = rule.get("naturalLanguage", "")
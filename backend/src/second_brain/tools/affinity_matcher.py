@@ -0,0 +1,160 @@
+"""Compiled affinity-rule matcher for deterministic errand routing.
+
+AffinityMatcher compiles every rule's itemPattern and every exception
+pattern into one Aho-Corasick automaton over normalized text (lowercase,
+punctuation folded to spaces), so finding all rules in an item is a single
+pass over the item, independent of the number of rules.
+
+A pattern only counts on whole words; a trailing plural "s"/"es" on the
+item is tolerated ("egg" matches "eggs"). route() resolves an item to a
+destination only when that is unambiguous:
+
+- a rule match inside a longer rule match is dropped ("chicken broth"
+  beats "chicken" for "chicken broth")
+- an exception of a matched rule overrides that rule's destination
+- if the remaining matches still disagree on the destination, route()
+  returns None and the item is left to the Admin Agent
+"""
+
+import re
+from dataclasses import dataclass
+
+_NON_WORD = re.compile(r"[^a-z0-9']+")
+
+
+def normalize(text: str) -> str:
+    """Lowercase, fold curly apostrophes and punctuation runs to one space."""
+    return _NON_WORD.sub(" ", text.lower().replace("’", "'")).strip()
+
+
+@dataclass(frozen=True)
+class RuleMatch:
+    """An unambiguous routing decision for one item."""
+
+    destination: str
+    rule: dict
+    pattern: str  # the rule or exception pattern that decided it
+
+
+@dataclass(frozen=True)
+class _Pattern:
+    text: str
+    rule_index: int
+    destination: str
+    exception: bool
+
+
+class AffinityMatcher:
+    """Aho-Corasick matcher over AffinityRules documents."""
+
+    def __init__(self, rules: list[dict]) -> None:
+        self.rules = rules
+        self._patterns: list[_Pattern] = []
+        for i, rule in enumerate(rules):
+            self._add(rule.get("itemPattern", ""), i, rule, exception=False)
+            for exc in rule.get("exceptions") or []:
+                self._add(exc.get("pattern", ""), i, exc, exception=True)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[int]] = [[]]
+        for index, pattern in enumerate(self._patterns):
+            self._insert(pattern.text, index)
+        self._link()
+
+    def _add(self, text: str, rule_index: int, doc: dict, exception: bool) -> None:
+        pattern = normalize(text)
+        destination = (doc.get("destinationSlug") or "").lower()
+        if pattern and destination:
+            self._patterns.append(_Pattern(pattern, rule_index, destination, exception))
+
+    def _insert(self, text: str, index: int) -> None:
+        node = 0
+        for char in text:
+            nxt = self._goto[node].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append(index)
+
+    def _link(self) -> None:
+        queue = list(self._goto[0].values())
+        for node in queue:  # breadth-first; the list grows as we go
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def _find(self, text: str) -> list[tuple[int, int, _Pattern]]:
+        """Whole-word pattern occurrences as (start, end, pattern)."""
+        hits: list[tuple[int, int, _Pattern]] = []
+        node = 0
+        for pos, char in enumerate(text):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            for index in self._out[node]:
+                pattern = self._patterns[index]
+                start, end = pos + 1 - len(pattern.text), pos + 1
+                if (start == 0 or text[start - 1] == " ") and _word_end(text, end):
+                    hits.append((start, end, pattern))
+        return hits
+
+    def rules_in(self, text: str) -> list[dict]:
+        """Rules whose itemPattern occurs in text, in rule order."""
+        indices = {
+            pattern.rule_index
+            for _, _, pattern in self._find(normalize(text))
+            if not pattern.exception
+        }
+        return [self.rules[i] for i in sorted(indices)]
+
+    def route(self, item: str) -> RuleMatch | None:
+        """The destination the rules give this item, or None if unclear."""
+        hits = self._find(normalize(item))
+        rule_hits = [h for h in hits if not h[2].exception]
+        # Drop rule matches strictly inside a longer rule match.
+        specific = [
+            h
+            for h in rule_hits
+            if not any(
+                o[0] <= h[0] and h[1] <= o[1] and o[1] - o[0] > h[1] - h[0]
+                for o in rule_hits
+            )
+        ]
+        decisions: dict[str, RuleMatch] = {}
+        for _, _, pattern in specific:
+            exceptions = {
+                h[2].destination: h[2]
+                for h in hits
+                if h[2].exception and h[2].rule_index == pattern.rule_index
+            }
+            if len(exceptions) > 1:
+                return None
+            decided = next(iter(exceptions.values()), pattern)
+            decisions.setdefault(
+                decided.destination,
+                RuleMatch(
+                    destination=decided.destination,
+                    rule=self.rules[pattern.rule_index],
+                    pattern=decided.text,
+                ),
+            )
+        if len(decisions) != 1:
+            return None
+        return next(iter(decisions.values()))
+
+
+def _word_end(text: str, end: int) -> bool:
+    for suffix in ("", "s", "es"):
+        stop = end + len(suffix)
+        if text[end:stop] == suffix and (stop == len(text) or text[stop] == " "):
+            return True
+    return False
@@ -21,6 +21,7 @@ from uuid import uuid4
 from pydantic import Field
 
 from second_brain.db.cosmos import CosmosManager
+from second_brain.db.snapshots import list_snapshots
 from second_brain.models.documents import (
     CONTAINER_MODELS,
     VALID_BUCKETS,
@@ -258,6 +259,9 @@ class ClassifierTools:
         await target_container.create_item(
             body=bucket_doc.model_dump(mode="json"), **th
         )
+        if bucket == "Admin":
+            # GET /api/errands picks up new Admin items for processing
+            list_snapshots(self._manager).invalidate("errands")
 
         logger.info(
             "Filed to %s (%.2f, status=%s): %s",
@@ -364,6 +368,8 @@ class ClassifierTools:
         await target_container.create_item(
             body=bucket_doc.model_dump(mode="json"), **th
         )
+        if bucket == "Admin":
+            list_snapshots(self._manager).invalidate("errands")
 
         logger.info(
             "Follow-up filed to %s (%.2f, status=%s) in-place on %s: %s",
@@ -0,0 +1,163 @@
+"""Process-wide, versioned cache of the routing collections.
+
+Every Admin capture needs the full Destinations and AffinityRules sets
+(the routing context prompt, rule conflict checks, query_rules). Both are
+small and change rarely, so RoutingCache keeps them in memory per
+CosmosManager:
+
+- local writes (manage_destination / manage_affinity_rule, saved reroute
+  rules) call invalidate(), so the next read on this replica reloads
+- writes from other replicas are caught by a cheap fingerprint query
+  (document count + newest `_ts`) at most every check_interval_seconds;
+  a changed fingerprint reloads that collection
+- every reload that changes a collection bumps `version`; the formatted
+  routing context string and the compiled AffinityMatcher are memoized
+  per version
+
+An admin batch of N items therefore costs one read per collection, not
+one per item and tool call.
+"""
+
+import asyncio
+import time
+import weakref
+from collections.abc import Callable
+from typing import Any
+
+from second_brain.db.cosmos import CosmosManager
+from second_brain.tools.affinity_matcher import AffinityMatcher
+
+ROUTING_COLLECTIONS: tuple[str, ...] = ("Destinations", "AffinityRules")
+CHECK_INTERVAL_SECONDS = 30.0
+
+_FINGERPRINT_QUERY = "SELECT COUNT(1) AS n, MAX(c._ts) AS ts FROM c"
+
+
+def format_routing_context(destinations: list[dict], rules: list[dict]) -> str:
+    """Format destinations and affinity rules for the Admin Agent prompt."""
+    lines: list[str] = ["DESTINATIONS:"]
+    if destinations:
+        for dest in destinations:
+            slug = dest.get("slug", "unknown")
+            display = dest.get("displayName", slug)
+            dtype = dest.get("type", "physical")
+            lines.append(f"- {slug} ({display}, {dtype})")
+    else:
+        lines.append("- No destinations defined yet.")
+
+    lines.append("")
+    lines.append("ROUTING RULES:")
+    if rules:
+        for rule in rules:
+            nl = rule.get("naturalLanguage", "")
+            rtype = rule.get("ruleType", "item")
+            pattern = rule.get("itemPattern", "")
+            dest_slug = rule.get("destinationSlug", "")
+            lines.append(f'- "{nl}" ({rtype}: {pattern} -> {dest_slug})')
+        lines.append("")
+        lines.append("If no rule matches an item, set destination to 'unrouted'.")
+    else:
+        lines.append(
+            "No routing rules defined. Set all errand items to destination='unrouted'."
+        )
+
+    return "\n".join(lines)
+
+
+class _Entry:
+    """One cached collection."""
+
+    def __init__(self) -> None:
+        self.docs: list[dict] | None = None  # None = not loaded / invalidated
+        self.fingerprint: tuple[Any, Any] | None = None
+        self.checked_at = 0.0
+        self.lock = asyncio.Lock()
+
+
+class RoutingCache:
+    """Cached Destinations / AffinityRules for one CosmosManager."""
+
+    def __init__(
+        self,
+        cosmos_manager: CosmosManager,
+        check_interval_seconds: float = CHECK_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._manager = cosmos_manager
+        self._check_interval = check_interval_seconds
+        self._clock = clock
+        self._entries = {name: _Entry() for name in ROUTING_COLLECTIONS}
+        self.version = 0
+        self._context: tuple[int, str] | None = None
+        self._matcher: tuple[int, AffinityMatcher] | None = None
+
+    async def get(self, name: str) -> list[dict]:
+        """Current documents of a routing collection (shallow copies)."""
+        entry = self._entries[name]
+        async with entry.lock:
+            if entry.docs is None:
+                await self._load(name, entry)
+            elif self._clock() - entry.checked_at >= self._check_interval:
+                fingerprint = await self._fingerprint(name)
+                if fingerprint != entry.fingerprint:
+                    await self._load(name, entry)
+                else:
+                    entry.checked_at = self._clock()
+            return [dict(doc) for doc in entry.docs]
+
+    def invalidate(self, name: str) -> None:
+        """Drop a collection after a local write; the next get() reloads it."""
+        self._entries[name].docs = None
+
+    async def routing_context(self) -> str:
+        """Formatted routing context, rebuilt only when a collection changed."""
+        destinations = await self.get("Destinations")
+        rules = await self.get("AffinityRules")
+        if self._context is None or self._context[0] != self.version:
+            self._context = (self.version, format_routing_context(destinations, rules))
+        return self._context[1]
+
+    async def matcher(self) -> AffinityMatcher:
+        """Compiled matcher over the current rules, rebuilt on change."""
+        rules = await self.get("AffinityRules")
+        if self._matcher is None or self._matcher[0] != self.version:
+            self._matcher = (self.version, AffinityMatcher(rules))
+        return self._matcher[1]
+
+    async def _load(self, name: str, entry: _Entry) -> None:
+        container = self._manager.get_container(name)
+        docs: list[dict] = []
+        async for item in container.query_items(
+            query="SELECT * FROM c WHERE c.userId = 'will'",
+            partition_key="will",
+        ):
+            docs.append(item)
+        # The fingerprint comes from the loaded rows themselves, so a load
+        # costs one query and a later matching fingerprint means no change.
+        fingerprint = (len(docs), max((d.get("_ts", 0) for d in docs), default=None))
+        if docs != entry.docs:
+            self.version += 1
+        entry.docs = docs
+        entry.fingerprint = fingerprint
+        entry.checked_at = self._clock()
+
+    async def _fingerprint(self, name: str) -> tuple[Any, Any]:
+        container = self._manager.get_container(name)
+        async for row in container.query_items(
+            query=_FINGERPRINT_QUERY, partition_key="will"
+        ):
+            return row.get("n", 0), row.get("ts")
+        return 0, None
+
+
+_caches: "weakref.WeakKeyDictionary[CosmosManager, RoutingCache]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def routing_cache(cosmos_manager: CosmosManager) -> RoutingCache:
+    """The process-wide RoutingCache for a CosmosManager (created lazily)."""
+    cache = _caches.get(cosmos_manager)
+    if cache is None:
+        cache = _caches[cosmos_manager] = RoutingCache(cosmos_manager)
+    return cache
@@ -20,6 +20,7 @@ from second_brain.processing.admin_handoff import (
     process_admin_capture,
     process_admin_captures_batch,
 )
+from second_brain.tools.admin import AdminTools
 
 
 def _function_call(name: str, call_id: str) -> MagicMock:
@@ -850,3 +851,124 @@ class TestProcessAdminCapturesBatch:
         )
 
         mock_admin_agent.run.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Tests: deterministic pre-routing
+# ---------------------------------------------------------------------------
+
+
+def _setup_rules(mock_cosmos_manager, rules: list[dict]) -> None:
+    async def _rows(**kwargs):
+        for rule in rules:
+            yield rule
+
+    container = mock_cosmos_manager.get_container("AffinityRules")
+    container.query_items = MagicMock(side_effect=_rows)
+
+
+class TestPreRouting:
+    """List items covered by a rule are routed without the Admin Agent."""
+
+    RULES = [
+        {"itemPattern": "cat litter", "destinationSlug": "petsmart"},
+        {"itemPattern": "milk", "destinationSlug": "jewel"},
+    ]
+
+    async def test_fully_matched_list_skips_agent_and_files(
+        self, mock_admin_agent, mock_cosmos_manager
+    ):
+        _setup_rules(mock_cosmos_manager, self.RULES)
+
+        await process_admin_capture(
+            admin_agent=mock_admin_agent,
+            cosmos_manager=mock_cosmos_manager,
+            inbox_item_id="test-inbox-id",
+            raw_text="need cat litter, milk",
+        )
+
+        mock_admin_agent.run.assert_not_called()
+        errands = mock_cosmos_manager.get_container("Errands")
+        bodies = [c.kwargs["body"] for c in errands.create_item.call_args_list]
+        assert [(b["name"], b["destination"]) for b in bodies] == [
+            ("cat litter", "petsmart"),
+            ("milk", "jewel"),
+        ]
+        assert bodies[0]["sourceInboxItemId"] == "test-inbox-id"
+        inbox = mock_cosmos_manager.get_container("Inbox")
+        assert inbox.upsert_item.call_args_list[-1].kwargs["body"]["status"] == "filed"
+
+    async def test_only_unmatched_parts_reach_the_agent(
+        self, mock_admin_agent, mock_cosmos_manager
+    ):
+        _setup_rules(mock_cosmos_manager, self.RULES)
+
+        await process_admin_capture(
+            admin_agent=mock_admin_agent,
+            cosmos_manager=mock_cosmos_manager,
+            inbox_item_id="test-inbox-id",
+            raw_text="milk, book eye appointment",
+        )
+
+        text = mock_admin_agent.run.call_args.args[0]
+        assert text.endswith("User capture: book eye appointment")
+        errands = mock_cosmos_manager.get_container("Errands")
+        assert errands.create_item.call_args.kwargs["body"]["destination"] == "jewel"
+
+    async def test_ambiguous_or_non_list_captures_go_to_agent_whole(
+        self, mock_admin_agent, mock_cosmos_manager
+    ):
+        _setup_rules(mock_cosmos_manager, self.RULES)
+
+        for raw_text in ("need cat litter and milk", "where does milk go?"):
+            await process_admin_capture(
+                admin_agent=mock_admin_agent,
+                cosmos_manager=mock_cosmos_manager,
+                inbox_item_id="test-inbox-id",
+                raw_text=raw_text,
+            )
+            assert mock_admin_agent.run.call_args.args[0].endswith(raw_text)
+
+        errands = mock_cosmos_manager.get_container("Errands")
+        errands.create_item.assert_not_called()
+
+    async def test_parts_keep_the_users_capitalisation(
+        self, mock_admin_agent, mock_cosmos_manager
+    ):
+        _setup_rules(mock_cosmos_manager, self.RULES)
+
+        with patch.object(AdminTools, "add_errand_items", AsyncMock()) as add:
+            await process_admin_capture(
+                admin_agent=mock_admin_agent,
+                cosmos_manager=mock_cosmos_manager,
+                inbox_item_id="test-inbox-id",
+                raw_text="Milk, AAA batteries",
+            )
+
+        text = mock_admin_agent.run.call_args.args[0]
+        assert text.endswith("User capture: AAA batteries")
+        assert add.await_args.kwargs["items"] == [
+            {"name": "Milk", "destination": "jewel"}
+        ]
+
+    async def test_failed_pre_routed_write_does_not_fail_the_capture(
+        self, mock_admin_agent, mock_cosmos_manager
+    ):
+        _setup_rules(mock_cosmos_manager, self.RULES)
+        failing = AsyncMock(side_effect=RuntimeError("cosmos down"))
+
+        with patch.object(AdminTools, "add_errand_items", failing):
+            await process_admin_capture(
+                admin_agent=mock_admin_agent,
+                cosmos_manager=mock_cosmos_manager,
+                inbox_item_id="test-inbox-id",
+                raw_text="milk, book eye appointment",
+            )
+
+        failing.assert_awaited_once()
+        inbox = mock_cosmos_manager.get_container("Inbox")
+        statuses = [
+            c.kwargs["body"].get("adminProcessingStatus")
+            for c in inbox.upsert_item.call_args_list
+        ]
+        assert "failed" not in statuses
@@ -879,3 +879,108 @@ async def test_query_rules_specific_item_with_exceptions(
     assert "meat goes to Agora except fish" in result
     assert "Exception: fish" in result
     assert "Nick's Fishmarket" in result
+
+
+# ---------------------------------------------------------------------------
+# Tests: routing cache
+# ---------------------------------------------------------------------------
+
+
+async def test_routing_context_is_cached_across_a_batch(
+    mock_cosmos_manager: object,
+) -> None:
+    """Repeated routing reads cost one query per collection until a write."""
+    _setup_query_multi(
+        mock_cosmos_manager,
+        "Destinations",
+        [[{"slug": "jewel", "displayName": "Jewel-Osco", "type": "physical"}]],
+    )
+    rules = [{"id": "rule-1", "itemPattern": "chicken", "destinationSlug": "jewel"}]
+    _setup_query_multi(mock_cosmos_manager, "AffinityRules", [rules])
+
+    tools = _make_tools(mock_cosmos_manager)
+    contexts = [await tools.get_routing_context() for _ in range(5)]
+    await tools.query_rules(query_text="where does chicken go?")
+
+    assert len(set(contexts)) == 1
+    destinations = mock_cosmos_manager.get_container("Destinations")
+    rule_container = mock_cosmos_manager.get_container("AffinityRules")
+    assert destinations.query_items.call_count == 1
+    assert rule_container.query_items.call_count == 1
+
+    await tools.manage_affinity_rule(
+        action="delete",
+        natural_language="",
+        item_pattern="chicken",
+        destination_slug="",
+        rule_type="item",
+    )
+    await tools.get_routing_context()
+    assert rule_container.query_items.call_count == 2
+    assert destinations.query_items.call_count == 1
+
+
+async def test_routing_cache_reloads_when_fingerprint_changes(
+    mock_cosmos_manager: object,
+) -> None:
+    """A write from another replica is picked up after the check interval."""
+    from second_brain.tools.routing_cache import RoutingCache
+
+    clock = {"now": 0.0}
+    old = [{"id": "rule-1", "itemPattern": "chicken", "_ts": 100}]
+    new = [*old, {"id": "rule-2", "itemPattern": "fish", "_ts": 200}]
+    _setup_query_multi(
+        mock_cosmos_manager,
+        "AffinityRules",
+        [old, [{"n": 1, "ts": 100}], [{"n": 2, "ts": 200}], new],
+    )
+    cache = RoutingCache(
+        mock_cosmos_manager, check_interval_seconds=30, clock=lambda: clock["now"]
+    )
+
+    assert len(await cache.get("AffinityRules")) == 1
+    version = cache.version
+    clock["now"] = 31.0
+    assert len(await cache.get("AffinityRules")) == 1  # fingerprint unchanged
+    assert cache.version == version
+    clock["now"] = 62.0
+    assert len(await cache.get("AffinityRules")) == 2  # changed -> reload
+    assert cache.version == version + 1
+    queries = [
+        c.kwargs["query"]
+        for c in mock_cosmos_manager.get_container(
+            "AffinityRules"
+        ).query_items.call_args_list
+    ]
+    assert [q.startswith("SELECT COUNT(1)") for q in queries] == [
+        False,
+        True,
+        True,
+        False,
+    ]
+
+
+async def test_add_items_unrouted_item_covered_by_rule_is_routed(
+    mock_cosmos_manager: object,
+) -> None:
+    """An item the agent left unrouted is routed when a rule clearly covers it."""
+    _setup_echo(mock_cosmos_manager, "Errands")
+    _setup_query_multi(
+        mock_cosmos_manager,
+        "AffinityRules",
+        [[{"itemPattern": "chicken", "destinationSlug": "agora"}]],
+    )
+
+    tools = _make_tools(mock_cosmos_manager)
+    await tools.add_errand_items(
+        items=[
+            {"name": "chicken thighs", "destination": "unrouted"},
+            {"name": "paper towels", "destination": "unrouted"},
+        ]
+    )
+
+    bodies = _get_all_bodies(mock_cosmos_manager, "Errands")
+    assert [(b["destination"], b["needsRouting"]) for b in bodies] == [
+        ("agora", False),
+        ("unrouted", True),
+    ]
@@ -0,0 +1,47 @@
+"""Tests for the compiled affinity-rule matcher."""
+
+from second_brain.tools.affinity_matcher import AffinityMatcher, normalize
+
+RULES = [
+    {"itemPattern": "chicken", "destinationSlug": "agora"},
+    {"itemPattern": "chicken broth", "destinationSlug": "jewel"},
+    {
+        "itemPattern": "meat",
+        "destinationSlug": "agora",
+        "exceptions": [{"pattern": "fish", "destinationSlug": "nicks_fishmarket"}],
+    },
+    {"itemPattern": "Luna’s food", "destinationSlug": "PetSmart"},
+    {"itemPattern": "egg", "destinationSlug": "jewel"},
+]
+
+
+def test_normalize_folds_case_punctuation_and_apostrophes() -> None:
+    assert normalize("  Luna’s  FOOD!! ") == "luna's food"
+
+
+def test_route_whole_words_and_plurals() -> None:
+    matcher = AffinityMatcher(RULES)
+
+    assert matcher.route("2 lbs chicken thighs").destination == "agora"
+    assert matcher.route("a dozen eggs").destination == "jewel"
+    assert matcher.route("Luna's food").destination == "petsmart"
+    assert matcher.route("eggplant") is None  # not a whole word
+    assert matcher.route("milk") is None
+
+
+def test_longer_pattern_and_exceptions_win() -> None:
+    matcher = AffinityMatcher(RULES)
+
+    match = matcher.route("low sodium chicken broth")
+    assert (match.destination, match.pattern) == ("jewel", "chicken broth")
+    assert matcher.route("meat and fish").destination == "nicks_fishmarket"
+
+
+def test_conflicting_rules_are_ambiguous() -> None:
+    matcher = AffinityMatcher(RULES)
+
+    assert matcher.route("chicken and eggs") is None
+    assert [r["itemPattern"] for r in matcher.rules_in("chicken and eggs?")] == [
+        "chicken",
+        "egg",
+    ]
@@ -169,3 +169,56 @@ async def test_audit_endpoint_validates_sample_size_bounds():
             json={"correlation_kind": "capture", "sample_size": 100},
         )
     assert r.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_audit_endpoint_streams_ndjson_records():
+    import json
+    from datetime import UTC, datetime
+    from unittest.mock import MagicMock
+
+    from second_brain.spine.audit.models import (
+        AuditStreamSummary,
+        AuditStreamTrace,
+        TimeWindow,
+        TraceAudit,
+        build_summary,
+    )
+
+    now = datetime(2026, 4, 18, 12, 0, tzinfo=UTC)
+    trace = TraceAudit(
+        correlation_kind="capture",
+        correlation_id="abc-1",
+        verdict="clean",
+        headline="ok",
+        trace_window=TimeWindow(start=now, end=now),
+    )
+
+    async def _records(**_):
+        yield AuditStreamTrace(trace=trace)
+        yield AuditStreamSummary(
+            correlation_kind="capture",
+            sample_size_requested=50,
+            sample_size_returned=1,
+            time_range_seconds=86400,
+            summary=build_summary([trace]),
+        )
+
+    auditor = AsyncMock()
+    auditor.audit_sample_stream = MagicMock(side_effect=_records)
+    app = _make_app(auditor)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+        r = await c.post(
+            "/api/spine/audit/correlation",
+            headers={"Authorization": f"Bearer {TEST_API_KEY}"},
+            json={"correlation_kind": "capture", "sample_size": 50, "stream": "ndjson"},
+        )
+
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in r.text.splitlines()]
+    assert [line["record"] for line in lines] == ["trace", "summary"]
+    assert lines[0]["trace"]["correlation_id"] == "abc-1"
+    assert lines[1]["summary"]["clean_count"] == 1
+    auditor.audit_sample.assert_not_called()
@@ -20,6 +20,18 @@ def _corr_record(segment_id: str, correlation_id: str = "abc-1"):
     }
 
 
+def _records_by_id(*segment_ids: str):
+    """get_correlation_events_for_ids stand-in: same chain for every id."""
+    return lambda kind, ids: {
+        cid: [_corr_record(seg, cid) for seg in segment_ids] for cid in ids
+    }
+
+
+def _rows_by_id(rows: list[dict]):
+    """NativeLookup *_for_many stand-in: same native rows for every id."""
+    return lambda ids, time_range_seconds: {cid: list(rows) for cid in ids}
+
+
 @pytest.mark.asyncio
 async def test_instrumentation_warning_when_required_segment_absent_from_all_native():
     """When backend_api appears in every trace's spine chain but native lookup
@@ -28,22 +40,24 @@ async def test_instrumentation_warning_when_required_segment_absent_from_all_nat
     """
     repo = AsyncMock()
     repo.get_recent_correlation_ids.return_value = ["abc-1", "abc-2"]
-    repo.get_correlation_events.side_effect = lambda kind, cid: [
-        _corr_record("mobile_capture", cid),
-        _corr_record("backend_api", cid),
-        _corr_record("classifier", cid),
-    ]
-    repo.get_recent_events.return_value = []
+    repo.get_correlation_events_for_ids.side_effect = _records_by_id(
+        "mobile_capture",
+        "backend_api",
+        "classifier",
+    )
+    repo.get_workload_events_for_correlations.return_value = {}
 
     lookup = AsyncMock()
     # Native lookup returns spans for mobile_capture + classifier but never
     # backend_api — that's the instrumentation regression we want to surface.
-    lookup.spans.return_value = [
-        {"Component": "mobile_capture", "Name": "capture_button_press"},
-        {"Component": "classifier", "Name": "classify"},
-    ]
-    lookup.exceptions.return_value = []
-    lookup.cosmos.return_value = []
+    lookup.spans_for_many.side_effect = _rows_by_id(
+        [
+            {"Component": "mobile_capture", "Name": "capture_button_press"},
+            {"Component": "classifier", "Name": "classify"},
+        ]
+    )
+    lookup.exceptions_for_many.side_effect = _rows_by_id([])
+    lookup.cosmos_for_many.side_effect = _rows_by_id([])
 
     auditor = CorrelationAuditor(repo=repo, lookup=lookup)
     report = await auditor.audit_sample(
@@ -58,21 +72,23 @@ async def test_instrumentation_warning_when_required_segment_absent_from_all_nat
 async def test_no_instrumentation_warning_when_at_least_one_trace_has_native_data():
     repo = AsyncMock()
     repo.get_recent_correlation_ids.return_value = ["abc-1", "abc-2"]
-    repo.get_correlation_events.side_effect = lambda kind, cid: [
-        _corr_record("mobile_capture", cid),
-        _corr_record("backend_api", cid),
-        _corr_record("classifier", cid),
-    ]
-    repo.get_recent_events.return_value = []
+    repo.get_correlation_events_for_ids.side_effect = _records_by_id(
+        "mobile_capture",
+        "backend_api",
+        "classifier",
+    )
+    repo.get_workload_events_for_correlations.return_value = {}
 
     lookup = AsyncMock()
     # backend_api has native data, just no exceptions → no warning expected.
-    lookup.spans.return_value = [
-        {"Component": "backend_api", "Name": "POST /api/capture"},
-        {"Component": "classifier", "Name": "classify"},
-    ]
-    lookup.exceptions.return_value = []
-    lookup.cosmos.return_value = []
+    lookup.spans_for_many.side_effect = _rows_by_id(
+        [
+            {"Component": "backend_api", "Name": "POST /api/capture"},
+            {"Component": "classifier", "Name": "classify"},
+        ]
+    )
+    lookup.exceptions_for_many.side_effect = _rows_by_id([])
+    lookup.cosmos_for_many.side_effect = _rows_by_id([])
 
     auditor = CorrelationAuditor(repo=repo, lookup=lookup)
     report = await auditor.audit_sample(
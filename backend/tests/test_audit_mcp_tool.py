@@ -35,7 +35,7 @@ async def test_audit_correlation_calls_spine_endpoint():
 
         result = await audit_correlation(
             correlation_kind="capture",
-            correlation_id=None,
+            correlation_id="abc-1",
             sample_size=5,
             time_range_seconds=86400,
             ctx=None,
@@ -43,6 +43,48 @@ async def test_audit_correlation_calls_spine_endpoint():
     assert result == expected_response
 
 
+@pytest.mark.asyncio
+async def test_audit_correlation_sample_mode_streams_and_reports_progress():
+    """Sample mode reads the NDJSON stream, reporting each trace as progress."""
+    trace = {"correlation_id": "abc-1", "verdict": "clean", "headline": "ok"}
+    summary_record = {
+        "record": "summary",
+        "correlation_kind": "capture",
+        "sample_size_requested": 5,
+        "sample_size_returned": 1,
+        "time_range_seconds": 86400,
+        "summary": {"overall_verdict": "clean"},
+        "instrumentation_warning": None,
+    }
+    sent: dict = {}
+
+    async def _fake_stream(path, body, on_record):
+        sent.update(path=path, body=body)
+        await on_record({"record": "trace", "trace": trace})
+        await on_record(summary_record)
+
+    ctx = AsyncMock()
+    with patch("mcp.server._spine_post_ndjson", new=_fake_stream):
+        from mcp.server import audit_correlation
+
+        result = await audit_correlation(
+            correlation_kind="capture",
+            correlation_id=None,
+            sample_size=5,
+            time_range_seconds=86400,
+            ctx=ctx,
+        )
+
+    assert sent["path"] == "/api/spine/audit/correlation"
+    assert "correlation_id" not in sent["body"]
+    assert result["traces"] == [trace]
+    assert result["summary"] == {"overall_verdict": "clean"}
+    assert "record" not in result
+    ctx.report_progress.assert_awaited_once_with(
+        progress=1, total=5, message="abc-1: clean"
+    )
+
+
 @pytest.mark.asyncio
 async def test_audit_correlation_returns_error_on_exception():
     with patch(
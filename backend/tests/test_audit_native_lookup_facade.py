@@ -54,3 +54,23 @@ async def test_facade_returns_empty_when_lookup_unconfigured():
     assert await lookup.spans("abc", time_range_seconds=600) == []
     assert await lookup.exceptions("abc", time_range_seconds=600) == []
     assert await lookup.cosmos("abc", time_range_seconds=600) == []
+
+
+@pytest.mark.asyncio
+async def test_for_many_prefers_batch_fetcher_and_falls_back_to_single():
+    batch = AsyncMock(return_value={"a": [{"Name": "GET /x"}]})
+    single = AsyncMock(side_effect=lambda correlation_id, **_: [{"id": correlation_id}])
+    lookup = NativeLookup(
+        spans_fetcher=single,
+        exceptions_fetcher=single,
+        cosmos_fetcher=None,
+        spans_batch_fetcher=batch,
+    )
+
+    spans = await lookup.spans_for_many(["a", "b"], time_range_seconds=600)
+    assert spans == {"a": [{"Name": "GET /x"}], "b": []}
+    batch.assert_awaited_once_with(correlation_ids=["a", "b"], time_range_seconds=600)
+
+    exceptions = await lookup.exceptions_for_many(["a", "b"], time_range_seconds=600)
+    assert exceptions == {"a": [{"id": "a"}], "b": [{"id": "b"}]}
+    assert await lookup.cosmos_for_many(["a"], time_range_seconds=600) == {"a": []}
@@ -12,6 +12,7 @@ from second_brain.observability.queries import (
     fetch_audit_cosmos_diagnostics_for_correlation,
     fetch_audit_exceptions_for_correlation,
     fetch_audit_spans_for_correlation,
+    fetch_audit_spans_for_correlations,
 )
 
 
@@ -211,3 +212,44 @@ async def test_fetch_audit_cosmos_rejects_invalid_correlation_id():
             time_range_seconds=3600,
         )
     client.query_workspace.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_fetch_audit_spans_for_correlations_splits_rows_per_id():
+    client = AsyncMock()
+    columns = ["timestamp", "Name", "Component", "CorrelationId", "MatchedId"]
+    client.query_workspace.return_value = _mock_response(
+        rows=[
+            {"Name": "POST /api/capture", "CorrelationId": "a-1", "MatchedId": "a-1"},
+            {"Name": "classify", "CorrelationId": "a-2", "MatchedId": "a-2"},
+            {"Name": "GET /x", "CorrelationId": "a-1", "MatchedId": "a-1"},
+        ],
+        columns=columns,
+    )
+    by_id = await fetch_audit_spans_for_correlations(
+        client,
+        workspace_id="ws-123",
+        correlation_ids=["a-1", "a-2", "a-3"],
+        time_range_seconds=3600,
+    )
+
+    client.query_workspace.assert_awaited_once()
+    query = client.query_workspace.call_args.kwargs["query"]
+    assert 'dynamic(["a-1", "a-2", "a-3"])' in query
+    assert [r["Name"] for r in by_id["a-1"]] == ["POST /api/capture", "GET /x"]
+    assert [r["Name"] for r in by_id["a-2"]] == ["classify"]
+    assert by_id["a-3"] == []
+    assert "MatchedId" not in by_id["a-1"][0]
+
+
+@pytest.mark.asyncio
+async def test_fetch_audit_spans_for_correlations_rejects_any_invalid_id():
+    client = AsyncMock()
+    with pytest.raises(ValueError, match="Invalid correlation_id"):
+        await fetch_audit_spans_for_correlations(
+            client,
+            workspace_id="ws-123",
+            correlation_ids=["ok-1", 'bad"]); AppRequests //'],
+            time_range_seconds=3600,
+        )
+    client.query_workspace.assert_not_called()
@@ -20,21 +20,33 @@ def _corr_record(segment_id: str, correlation_id: str = "abc-1"):
     }
 
 
+def _records_by_id(*segment_ids: str):
+    """get_correlation_events_for_ids stand-in: same chain for every id."""
+    return lambda kind, ids: {
+        cid: [_corr_record(seg, cid) for seg in segment_ids] for cid in ids
+    }
+
+
+def _rows_by_id(rows: list[dict]):
+    """NativeLookup *_for_many stand-in: same native rows for every id."""
+    return lambda ids, time_range_seconds: {cid: list(rows) for cid in ids}
+
+
 @pytest.mark.asyncio
 async def test_audit_sample_returns_one_audit_per_id():
     repo = AsyncMock()
     repo.get_recent_correlation_ids.return_value = ["abc-1", "abc-2", "abc-3"]
-    repo.get_correlation_events.side_effect = lambda kind, cid: [
-        _corr_record("mobile_capture", cid),
-        _corr_record("backend_api", cid),
-        _corr_record("classifier", cid),
-    ]
-    repo.get_recent_events.return_value = []
+    repo.get_correlation_events_for_ids.side_effect = _records_by_id(
+        "mobile_capture",
+        "backend_api",
+        "classifier",
+    )
+    repo.get_workload_events_for_correlations.return_value = {}
 
     lookup = AsyncMock()
-    lookup.spans.return_value = []
-    lookup.exceptions.return_value = []
-    lookup.cosmos.return_value = []
+    lookup.spans_for_many.side_effect = _rows_by_id([])
+    lookup.exceptions_for_many.side_effect = _rows_by_id([])
+    lookup.cosmos_for_many.side_effect = _rows_by_id([])
 
     auditor = CorrelationAuditor(repo=repo, lookup=lookup)
     report = await auditor.audit_sample(
@@ -51,17 +63,17 @@ async def test_audit_sample_returns_one_audit_per_id():
 async def test_audit_sample_returns_fewer_when_not_enough_traces():
     repo = AsyncMock()
     repo.get_recent_correlation_ids.return_value = ["abc-1"]
-    repo.get_correlation_events.side_effect = lambda kind, cid: [
-        _corr_record("mobile_capture", cid),
-        _corr_record("backend_api", cid),
-        _corr_record("classifier", cid),
-    ]
-    repo.get_recent_events.return_value = []
+    repo.get_correlation_events_for_ids.side_effect = _records_by_id(
+        "mobile_capture",
+        "backend_api",
+        "classifier",
+    )
+    repo.get_workload_events_for_correlations.return_value = {}
 
     lookup = AsyncMock()
-    lookup.spans.return_value = []
-    lookup.exceptions.return_value = []
-    lookup.cosmos.return_value = []
+    lookup.spans_for_many.side_effect = _rows_by_id([])
+    lookup.exceptions_for_many.side_effect = _rows_by_id([])
+    lookup.cosmos_for_many.side_effect = _rows_by_id([])
 
     auditor = CorrelationAuditor(repo=repo, lookup=lookup)
     report = await auditor.audit_sample(
@@ -77,16 +89,16 @@ async def test_audit_sample_summary_aggregates_missing_required():
     repo = AsyncMock()
     repo.get_recent_correlation_ids.return_value = ["abc-1", "abc-2"]
     # Both traces missing classifier.
-    repo.get_correlation_events.side_effect = lambda kind, cid: [
-        _corr_record("mobile_capture", cid),
-        _corr_record("backend_api", cid),
-    ]
-    repo.get_recent_events.return_value = []
+    repo.get_correlation_events_for_ids.side_effect = _records_by_id(
+        "mobile_capture",
+        "backend_api",
+    )
+    repo.get_workload_events_for_correlations.return_value = {}
 
     lookup = AsyncMock()
-    lookup.spans.return_value = []
-    lookup.exceptions.return_value = []
-    lookup.cosmos.return_value = []
+    lookup.spans_for_many.side_effect = _rows_by_id([])
+    lookup.exceptions_for_many.side_effect = _rows_by_id([])
+    lookup.cosmos_for_many.side_effect = _rows_by_id([])
 
     auditor = CorrelationAuditor(repo=repo, lookup=lookup)
     report = await auditor.audit_sample(
@@ -96,3 +108,85 @@ async def test_audit_sample_summary_aggregates_missing_required():
     assert report.summary.overall_verdict == "broken"
     assert report.summary.broken_count == 2
     assert report.summary.segments_with_missing_required == {"classifier": 2}
+
+
+@pytest.mark.asyncio
+async def test_audit_sample_batches_spine_and_native_reads():
+    """A whole sample costs a fixed number of lookups, split per trace."""
+    repo = AsyncMock()
+    repo.get_recent_correlation_ids.return_value = ["abc-1", "abc-2"]
+    repo.get_correlation_events_for_ids.side_effect = _records_by_id(
+        "mobile_capture", "backend_api", "classifier"
+    )
+    repo.get_workload_events_for_correlations.return_value = {
+        "abc-1": [
+            {
+                "segment_id": "backend_api",
+                "event_type": "workload",
+                "payload": {"outcome": "success", "operation": "POST /api/capture"},
+            }
+        ],
+        "abc-2": [],
+    }
+
+    lookup = AsyncMock()
+    lookup.spans_for_many.return_value = {"abc-1": [], "abc-2": []}
+    lookup.exceptions_for_many.return_value = {
+        "abc-1": [{"Component": "backend_api", "ExceptionType": "Boom"}],
+        "abc-2": [],
+    }
+    lookup.cosmos_for_many.return_value = {"abc-1": [], "abc-2": []}
+
+    auditor = CorrelationAuditor(repo=repo, lookup=lookup)
+    report = await auditor.audit_sample(
+        kind="capture", sample_size=2, time_range_seconds=86400
+    )
+
+    repo.get_correlation_events_for_ids.assert_awaited_once_with(
+        "capture", ["abc-1", "abc-2"]
+    )
+    repo.get_workload_events_for_correlations.assert_awaited_once()
+    lookup.spans_for_many.assert_awaited_once()
+    repo.get_correlation_events.assert_not_called()
+    repo.get_recent_events.assert_not_called()
+    lookup.spans.assert_not_called()
+
+    first, second = report.traces
+    assert [m.check for m in first.misattributions] == ["outcome"]
+    assert second.misattributions == []
+
+
+@pytest.mark.asyncio
+async def test_audit_sample_stream_yields_traces_then_summary():
+    ids = [f"abc-{i}" for i in range(7)]
+    repo = AsyncMock()
+    repo.get_recent_correlation_ids.return_value = ids
+    repo.get_correlation_events_for_ids.side_effect = _records_by_id(
+        "mobile_capture", "backend_api"
+    )
+    repo.get_workload_events_for_correlations.return_value = {}
+
+    lookup = AsyncMock()
+    lookup.spans_for_many.side_effect = _rows_by_id([])
+    lookup.exceptions_for_many.side_effect = _rows_by_id([])
+    lookup.cosmos_for_many.side_effect = _rows_by_id([])
+
+    auditor = CorrelationAuditor(repo=repo, lookup=lookup)
+    records = [
+        r
+        async for r in auditor.audit_sample_stream(
+            kind="capture",
+            sample_size=7,
+            time_range_seconds=86400,
+            batch_size=3,
+            concurrency=2,
+        )
+    ]
+
+    *traces, summary = records
+    assert {r.trace.correlation_id for r in traces} == set(ids)
+    assert summary.record == "summary"
+    assert summary.sample_size_returned == 7
+    assert summary.summary.broken_count == 7  # classifier missing everywhere
+    batches = [c.args[1] for c in repo.get_correlation_events_for_ids.call_args_list]
+    assert sorted(len(b) for b in batches) == [1, 3, 3]
@@ -114,20 +114,16 @@ def _setup_inbox_notifications(
 ) -> None:
     """Configure Inbox container mock for notification queries.
 
-    The Inbox container query_items is called for both admin processing
-    queries and notification queries. This sets up a side_effect that
-    returns the right data based on query content.
+    A single Inbox query returns both unprocessed Admin items and completed
+    items with an agent response; notification rows are completed ones.
     """
     if notifications is None:
         notifications = []
+    rows = [{"adminProcessingStatus": "completed", **n} for n in notifications]
     inbox_container = mock_cosmos_manager.get_container("Inbox")
 
     def inbox_query_side_effect(**kwargs):
-        query = kwargs.get("query", "")
-        if "adminProcessingStatus = 'completed'" in query:
-            return _make_async_iterator(notifications)(**kwargs)
-        # Default: no unprocessed items
-        return _make_async_iterator([])(**kwargs)
+        return _make_async_iterator(rows)(**kwargs)
 
     inbox_container.query_items = MagicMock(side_effect=inbox_query_side_effect)
 
@@ -707,14 +703,10 @@ def _setup_trigger_mocks(
     _setup_destinations(mock_cosmos_manager, [SAMPLE_DESTINATIONS[0]])
     _setup_destination_items(mock_cosmos_manager, {"jewel": JEWEL_ITEMS})
 
-    # Inbox query: return unprocessed items for trigger, empty for notifications
+    # Inbox query: only unprocessed items, no notifications
     inbox_container = mock_cosmos_manager.get_container("Inbox")
 
     def inbox_query_side_effect(**kwargs):
-        query = kwargs.get("query", "")
-        if "adminProcessingStatus = 'completed'" in query:
-            return _make_inbox_async_iterator([])(**kwargs)
-        # Admin trigger query
         return _make_inbox_async_iterator(inbox_items)(**kwargs)
 
     inbox_container.query_items = MagicMock(side_effect=inbox_query_side_effect)
@@ -944,3 +936,87 @@ async def test_get_errands_no_trigger_when_no_admin_client(
     assert response.status_code == 200
     data = response.json()
     assert data["processingCount"] == 0
+
+
+@pytest.mark.asyncio
+async def test_get_errands_splits_single_inbox_query(
+    errands_app: FastAPI,
+    mock_cosmos_manager: MagicMock,
+) -> None:
+    """One Inbox query yields both the processing trigger and notifications."""
+    _setup_trigger_mocks(
+        errands_app,
+        mock_cosmos_manager,
+        [
+            {"id": "inbox-1", "rawText": "need milk"},
+            {
+                "id": "notif-1",
+                "adminProcessingStatus": "completed",
+                "adminAgentResponse": "Added milk to Jewel-Osco",
+            },
+        ],
+    )
+    errands_app.state.admin_agent = AsyncMock()
+    errands_app.state.background_tasks = set()
+
+    with patch(
+        "second_brain.api.errands.asyncio.create_task",
+        side_effect=_close_coroutine,
+    ):
+        transport = httpx.ASGITransport(app=errands_app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            response = await client.get(
+                "/api/errands",
+                headers={"Authorization": f"Bearer {TEST_API_KEY}"},
+            )
+
+    data = response.json()
+    assert data["processingCount"] == 1
+    assert [n["inboxItemId"] for n in data["adminNotifications"]] == ["notif-1"]
+    inbox_container = mock_cosmos_manager.get_container("Inbox")
+    assert inbox_container.query_items.call_count == 1
+    # Errands: one projected query per destination plus 'unrouted'
+    errands_container = mock_cosmos_manager.get_container("Errands")
+    assert [
+        c.kwargs["partition_key"] for c in errands_container.query_items.call_args_list
+    ] == ["jewel", "unrouted"]
+    assert "SELECT *" not in errands_container.query_items.call_args.kwargs["query"]
+
+
+@pytest.mark.asyncio
+async def test_get_errands_snapshot_304_until_write(
+    errands_app: FastAPI,
+    mock_cosmos_manager: MagicMock,
+) -> None:
+    """A settled listing is cached: If-None-Match polls get 304 with no reads."""
+    _setup_destinations(mock_cosmos_manager, [SAMPLE_DESTINATIONS[0]])
+    _setup_destination_items(mock_cosmos_manager, {"jewel": JEWEL_ITEMS})
+    _setup_inbox_notifications(mock_cosmos_manager)
+    errands_container = mock_cosmos_manager.get_container("Errands")
+    inbox_container = mock_cosmos_manager.get_container("Inbox")
+    headers = {"Authorization": f"Bearer {TEST_API_KEY}"}
+
+    transport = httpx.ASGITransport(app=errands_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        first = await client.get("/api/errands", headers=headers)
+        etag = first.headers["ETag"]
+        reads = errands_container.query_items.call_count
+        cached = await client.get(
+            "/api/errands", headers={**headers, "If-None-Match": etag}
+        )
+        assert cached.status_code == 304
+        assert errands_container.query_items.call_count == reads
+        assert inbox_container.query_items.call_count == 1
+
+        await client.delete("/api/errands/j1?destination=jewel", headers=headers)
+        rebuilt = await client.get(
+            "/api/errands", headers={**headers, "If-None-Match": etag}
+        )
+
+    # Same mocked contents, so the content ETag still matches, but the
+    # listing was rebuilt from Cosmos after the delete.
+    assert rebuilt.status_code == 304
+    assert errands_container.query_items.call_count == 2 * reads
+    assert inbox_container.query_items.call_count == 2
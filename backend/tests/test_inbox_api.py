@@ -74,6 +74,34 @@ SAMPLE_PENDING_ITEM = {
 }
 
 
+class _Pager:
+    """Stand-in for query_items(...).by_page(token): one page of items."""
+
+    def __init__(self, items: list[dict], next_token: str | None) -> None:
+        self._pages = [items]
+        self.continuation_token = next_token
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._pages:
+            raise StopAsyncIteration
+
+        async def _page():
+            for item in self._pages.pop():
+                yield item
+
+        return _page()
+
+
+def _paged_result(items: list[dict], next_token: str | None = None) -> MagicMock:
+    """A query_items result whose by_page() yields one page of items."""
+    result = MagicMock()
+    result.by_page = MagicMock(return_value=_Pager(items, next_token))
+    return result
+
+
 @pytest.fixture
 def inbox_app(mock_cosmos_manager: MagicMock) -> FastAPI:
     """Create a FastAPI app with the inbox router and mock Cosmos."""
@@ -109,16 +137,15 @@ async def test_list_inbox_excludes_filed_status(
 
     captured_queries: list[str] = []
 
-    def _async_iter(items):
-        async def _iter(*args, **kwargs):
+    def _paged(items):
+        def _query(*args, **kwargs):
             captured_queries.append(kwargs.get("query", ""))
-            for item in items:
-                yield item
+            return _paged_result(items)
 
-        return _iter
+        return _query
 
     inbox_container = mock_cosmos_manager.get_container("Inbox")
-    inbox_container.query_items = MagicMock(side_effect=_async_iter([classified_doc]))
+    inbox_container.query_items = MagicMock(side_effect=_paged([classified_doc]))
 
     transport = httpx.ASGITransport(app=inbox_app)
     async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
@@ -141,6 +168,64 @@ async def test_list_inbox_excludes_filed_status(
     assert "NOT IS_DEFINED" in sql
 
 
+@pytest.mark.asyncio
+async def test_list_inbox_cursor_pagination(
+    inbox_app: FastAPI,
+    mock_cosmos_manager: MagicMock,
+) -> None:
+    """GET /api/inbox pages by continuation token, not OFFSET."""
+    doc = {"id": "inbox-1", "rawText": "x", "status": "classified", "createdAt": ""}
+    inbox_container = mock_cosmos_manager.get_container("Inbox")
+    inbox_container.query_items = MagicMock(
+        return_value=_paged_result([doc], next_token="ct-42")
+    )
+    headers = {"Authorization": f"Bearer {TEST_API_KEY}"}
+
+    transport = httpx.ASGITransport(app=inbox_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        first = await client.get("/api/inbox?limit=1", headers=headers)
+        cursor = first.json()["nextCursor"]
+        resumed = _paged_result([doc])
+        inbox_container.query_items.return_value = resumed
+        second = await client.get(
+            "/api/inbox", params={"limit": 1, "cursor": cursor}, headers=headers
+        )
+
+    assert first.json()["count"] == 1
+    assert second.json()["nextCursor"] is None
+    call = inbox_container.query_items.call_args
+    assert "OFFSET" not in call.kwargs["query"]
+    assert call.kwargs["max_item_count"] == 1
+    resumed.by_page.assert_called_once_with("ct-42")
+
+
+@pytest.mark.asyncio
+async def test_list_inbox_legacy_offset_still_supported(
+    inbox_app: FastAPI,
+    mock_cosmos_manager: MagicMock,
+) -> None:
+    """A non-zero offset without a cursor keeps the OFFSET/LIMIT query."""
+    captured: dict = {}
+
+    async def _iter(**kwargs):
+        captured.update(kwargs)
+        yield {"id": "inbox-21", "rawText": "y", "status": "classified"}
+
+    inbox_container = mock_cosmos_manager.get_container("Inbox")
+    inbox_container.query_items = MagicMock(side_effect=_iter)
+
+    transport = httpx.ASGITransport(app=inbox_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get(
+            "/api/inbox?limit=20&offset=20",
+            headers={"Authorization": f"Bearer {TEST_API_KEY}"},
+        )
+
+    assert response.json()["count"] == 1
+    assert response.json()["nextCursor"] is None
+    assert "OFFSET @offset LIMIT @limit" in captured["query"]
+
+
 @pytest.mark.asyncio
 async def test_recategorize_success(
     inbox_app: FastAPI,
@@ -0,0 +1,28 @@
+"""Tests for the in-memory errands/tasks listing snapshots."""
+
+from second_brain.db.snapshots import ListSnapshots, content_etag, etag_matches
+
+
+def test_stale_build_is_not_stored_and_entries_expire() -> None:
+    now = [0.0]
+    snapshots = ListSnapshots(max_age_seconds=30, clock=lambda: now[0])
+
+    # A build that overlaps a write must not be cached.
+    generation = snapshots.generation("tasks")
+    snapshots.invalidate("tasks")
+    etag = snapshots.put("tasks", generation, {"old": True}, '{"old":true}')
+    assert etag == content_etag('{"old":true}')
+    assert snapshots.get("tasks") is None
+
+    snapshots.put("tasks", snapshots.generation("tasks"), {"n": 1}, '{"n":1}')
+    assert snapshots.get("tasks").value == {"n": 1}
+    now[0] = 30.0
+    assert snapshots.get("tasks") is None
+
+
+def test_etag_matches_lists_and_wildcard() -> None:
+    etag = content_etag("{}")
+    assert etag.startswith('W/"')
+    assert etag_matches(f'W/"other", {etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
@@ -0,0 +1,141 @@
+"""Tests for the stale-while-revalidate segment detail cache."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from second_brain.spine.adapters.cache import CachedAdapter, range_bucket
+from second_brain.spine.adapters.registry import AdapterRegistry
+from second_brain.spine.api import build_spine_router
+
+
+class _CountingAdapter:
+    segment_id = "backend_api"
+    native_url_template = "https://portal.azure.com"
+
+    def __init__(self) -> None:
+        self.calls: list[tuple] = []
+        self.gate: asyncio.Event | None = None
+        self.fail = False
+
+    async def fetch_detail(
+        self, correlation_kind=None, correlation_id=None, time_range_seconds=3600
+    ) -> dict:
+        self.calls.append((correlation_kind, correlation_id, time_range_seconds))
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.fail:
+            raise RuntimeError("log analytics throttled")
+        return {"schema": "azure_monitor_app_insights", "n": len(self.calls)}
+
+
+def _cached(adapter, now):
+    return CachedAdapter(
+        adapter, ttl_seconds=30, stale_seconds=60, clock=lambda: now["t"]
+    )
+
+
+def test_range_bucket_rounds_up_to_the_minute() -> None:
+    assert range_bucket(3600) == 3600
+    assert range_bucket(3590) == 3600
+    assert range_bucket(1) == 60
+
+
+@pytest.mark.asyncio
+async def test_fresh_hit_then_stale_served_while_refreshing() -> None:
+    adapter = _CountingAdapter()
+    now = {"t": 0.0}
+    cache = _cached(adapter, now)
+
+    data, age = await cache.fetch_detail_with_age(time_range_seconds=3600)
+    assert (data["n"], age) == (1, 0.0)
+    now["t"] = 10
+    data, age = await cache.fetch_detail_with_age(time_range_seconds=3590)
+    assert (data["n"], age) == (1, 10)
+    assert len(adapter.calls) == 1
+
+    now["t"] = 45  # stale: old value served, one refresh in the background
+    data, age = await cache.fetch_detail_with_age(time_range_seconds=3600)
+    assert (data["n"], age) == (1, 45)
+    await asyncio.sleep(0)
+    data, age = await cache.fetch_detail_with_age(time_range_seconds=3600)
+    assert (data["n"], age) == (2, 0)
+    assert len(adapter.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_fetched_inline() -> None:
+    adapter = _CountingAdapter()
+    now = {"t": 0.0}
+    cache = _cached(adapter, now)
+    await cache.fetch_detail(time_range_seconds=3600)
+    now["t"] = 91
+    data, age = await cache.fetch_detail_with_age(time_range_seconds=3600)
+    assert (data["n"], age) == (2, 0.0)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_fetch() -> None:
+    adapter = _CountingAdapter()
+    adapter.gate = asyncio.Event()
+    cache = _cached(adapter, {"t": 0.0})
+
+    waiters = [
+        asyncio.create_task(cache.fetch_detail("capture", "t-1", 600)) for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    adapter.gate.set()
+    results = await asyncio.gather(*waiters)
+    assert adapter.calls == [("capture", "t-1", 600)]
+    assert all(r is results[0] for r in results)
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_stale_entry_and_failed_miss_raises() -> None:
+    adapter = _CountingAdapter()
+    now = {"t": 0.0}
+    cache = _cached(adapter, now)
+    await cache.fetch_detail()
+
+    adapter.fail = True
+    now["t"] = 40
+    data, _ = await cache.fetch_detail_with_age()
+    await asyncio.sleep(0)
+    data, age = await cache.fetch_detail_with_age()
+    assert (data["n"], age) == (1, 40)
+
+    with pytest.raises(RuntimeError):
+        await cache.fetch_detail(correlation_id="other")
+    assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_segment_detail_reports_cache_age_as_freshness() -> None:
+    adapter = _CountingAdapter()
+    now = {"t": 0.0}
+    app = FastAPI()
+
+    async def _no_auth() -> None:
+        return None
+
+    app.include_router(
+        build_spine_router(
+            repo=AsyncMock(),
+            evaluator=AsyncMock(),
+            adapter_registry=AdapterRegistry([_cached(adapter, now)]),
+            segment_registry=AsyncMock(),
+            auth_dependency=_no_auth,
+        )
+    )
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+        first = await c.get("/api/spine/segment/backend_api")
+        now["t"] = 12.5
+        second = await c.get("/api/spine/segment/backend_api")
+
+    assert first.json()["envelope"]["freshness_seconds"] == 0
+    assert second.json()["envelope"]["freshness_seconds"] == 12
+    assert second.json()["data"]["n"] == 1
@@ -0,0 +1,152 @@
+"""Tests for the embedded DuckDB spine analytics mirror."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from second_brain.spine.api import build_spine_router
+
+NOW = datetime.now(UTC).replace(minute=30, second=0, microsecond=0)
+
+
+def _workload(
+    i: int,
+    outcome: str = "success",
+    duration_ms: int = 100,
+    hours_ago: float = 1,
+    op: str = "capture",
+    weight: int = 1,
+) -> dict:
+    payload = {
+        "operation": op,
+        "outcome": outcome,
+        "duration_ms": duration_ms,
+        "error_class": "TimeoutError" if outcome == "failure" else None,
+    }
+    if weight != 1:
+        payload["sample_weight"] = weight
+    return {
+        "id": f"e{i}",
+        "segment_id": "backend_api",
+        "event_type": "workload",
+        "timestamp": (NOW - timedelta(hours=hours_ago)).isoformat(),
+        "payload": payload,
+    }
+
+
+@pytest.fixture
+def analytics():
+    pytest.importorskip("duckdb")
+    from second_brain.spine.analytics import SpineAnalytics
+
+    repo = AsyncMock()
+    repo.get_events_between.return_value = [
+        _workload(1, duration_ms=100),
+        _workload(2, duration_ms=900, op="classify"),
+        _workload(3, "failure", duration_ms=50),
+        {**_workload(4), "event_type": "liveness"},
+    ]
+    return SpineAnalytics(repo, ["backend_api"])
+
+
+async def test_backfill_then_live_rows_are_stored_once(analytics) -> None:
+    assert await analytics.backfill(now=NOW) == 3
+
+    analytics.observe(_workload(3, "failure", duration_ms=50))  # already stored
+    analytics.observe(_workload(5, duration_ms=300, hours_ago=0.1, weight=10))
+    analytics.observe({**_workload(6), "event_type": "readiness"})
+    assert await analytics.flush() == 2
+
+    rows = await analytics.query("slowest_operations", days=1)
+    by_op = {r["operation"]: r for r in rows}
+    assert rows[0]["operation"] == "classify"
+    assert by_op["capture"]["count"] == 12  # weighted
+    assert by_op["capture"]["max_ms"] == 300
+
+    # Restart-style backfill only asks for rows after the newest stored one
+    await analytics.backfill(now=NOW)
+    start = analytics._repo.get_events_between.await_args.args[1]
+    assert start > NOW - timedelta(hours=1)
+    await analytics.close()
+
+
+async def test_failure_rate_by_hour_and_top_errors(analytics) -> None:
+    await analytics.backfill(now=NOW)
+
+    hours = await analytics.query("failure_rate_by_hour", days=1)
+    assert len(hours) == 1
+    assert (hours[0]["total"], hours[0]["failures"]) == (3, 1)
+    assert hours[0]["failure_rate"] == pytest.approx(1 / 3)
+    assert hours[0]["hour_ms"] % 3_600_000 == 0
+
+    errors = await analytics.query("top_errors", days=1, segment_id="backend_api")
+    assert [(e["error_class"], e["failures"]) for e in errors] == [("TimeoutError", 1)]
+    assert await analytics.query("top_errors", days=1, segment_id="other") == []
+    await analytics.close()
+
+
+def _app(analytics) -> FastAPI:
+    app = FastAPI()
+
+    async def _no_auth() -> None:
+        return None
+
+    app.include_router(
+        build_spine_router(
+            repo=AsyncMock(),
+            evaluator=AsyncMock(),
+            adapter_registry=AsyncMock(),
+            segment_registry=AsyncMock(),
+            auth_dependency=_no_auth,
+            analytics=analytics,
+        )
+    )
+    return app
+
+
+async def test_analytics_endpoint_runs_named_query() -> None:
+    fake = MagicMock()
+    fake.query = AsyncMock(return_value=[{"segment_id": "backend_api", "p95_ms": 9}])
+    fake.freshness_seconds = 3
+    fake.window_days = 7
+    transport = httpx.ASGITransport(app=_app(fake))
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+        ok = await c.get(
+            "/api/spine/analytics/slowest_operations",
+            params={"days": 30, "segment_id": "backend_api"},
+        )
+        bad = await c.get("/api/spine/analytics/drop_table")
+
+    assert ok.json()["rows"] == [{"segment_id": "backend_api", "p95_ms": 9}]
+    assert ok.json()["envelope"]["freshness_seconds"] == 3
+    assert ok.json()["days"] == 7  # capped at the backfill window
+    fake.query.assert_awaited_once_with(
+        "slowest_operations", days=7, segment_id="backend_api", limit=50
+    )
+    assert bad.status_code == 422
+
+
+async def test_analytics_endpoint_503_when_not_configured() -> None:
+    transport = httpx.ASGITransport(app=_app(None))
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+        resp = await c.get("/api/spine/analytics/top_errors")
+    assert resp.status_code == 503
+
+
+async def test_mcp_tool_calls_analytics_endpoint() -> None:
+    with patch(
+        "mcp.server._spine_call", new=AsyncMock(return_value={"rows": []})
+    ) as call:
+        from mcp.server import spine_analytics
+
+        result = await spine_analytics(query="top_errors", days=3, ctx=None)
+
+    assert result == {"rows": []}
+    call.assert_awaited_once_with(
+        "/api/spine/analytics/top_errors", params={"days": 3, "limit": 50}
+    )
@@ -313,20 +313,23 @@ async def test_segment_ledger_returns_native_only_metadata_for_native_only_segme
 async def test_transaction_path_enriches_with_operation_and_duration(
     client_factory,
 ) -> None:
-    """Correlation rows carry headline/status; raw events carry
+    """Legacy correlation rows carry only headline/status; raw events carry
     operation/duration. The route must join them by (segment_id, timestamp)."""
     repo = AsyncMock()
     # "Which segments" — from spine_correlation
-    repo.get_correlation_events.return_value = [
-        {
-            "correlation_kind": "capture",
-            "correlation_id": "trace-1",
-            "segment_id": "classifier",
-            "timestamp": "2026-04-14T12:00:00Z",
-            "status": "green",
-            "headline": "classify success",
-        },
-    ]
+    repo.get_correlation_path.return_value = (
+        [
+            {
+                "correlation_kind": "capture",
+                "correlation_id": "trace-1",
+                "segment_id": "classifier",
+                "timestamp": "2026-04-14T12:00:00Z",
+                "status": "green",
+                "headline": "classify success",
+            },
+        ],
+        None,
+    )
     # "Operation/duration" — from spine_events filtered by correlation
     repo.get_workload_events_for_correlation.return_value = [
         _cosmos_workload_row(
@@ -356,6 +359,49 @@ async def test_transaction_path_enriches_with_operation_and_duration(
     assert event["duration_ms"] == 250
 
 
+@pytest.mark.asyncio
+async def test_transaction_path_denormalized_rows_skip_spine_events_scan(
+    client_factory,
+) -> None:
+    """Rows that already carry operation/duration are served from the single
+    correlation read; the cross-partition spine_events lookup is not issued.
+    Segments recorded in the summary doc count towards chain coverage."""
+    repo = AsyncMock()
+    repo.get_correlation_path.return_value = (
+        [
+            {
+                "correlation_kind": "capture",
+                "correlation_id": "trace-2",
+                "segment_id": "classifier",
+                "timestamp": "2026-04-14T12:00:00Z",
+                "status": "red",
+                "headline": "classify failure (Timeout)",
+                "operation": "classify",
+                "outcome": "failure",
+                "duration_ms": 900,
+                "error_class": "Timeout",
+            },
+        ],
+        {
+            "doc_type": "correlation_summary",
+            "segments_seen": ["backend_api", "classifier", "mobile_capture"],
+        },
+    )
+    app, *_ = client_factory(repo=repo)
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/api/spine/ledger/correlation/capture/trace-2")
+    assert response.status_code == 200
+    body = response.json()
+    repo.get_workload_events_for_correlation.assert_not_called()
+    event = body["events"][0]
+    assert event["operation"] == "classify"
+    assert event["duration_ms"] == 900
+    assert event["error_class"] == "Timeout"
+    assert body["missing_required"] == []
+
+
 @pytest.mark.asyncio
 async def test_transaction_path_reports_missing_required_segments_from_ledger_policy(
     client_factory,
@@ -364,16 +410,19 @@ async def test_transaction_path_reports_missing_required_segments_from_ledger_po
     Correlation only shows backend_api — the other two required segments
     must surface in missing_required."""
     repo = AsyncMock()
-    repo.get_correlation_events.return_value = [
-        {
-            "correlation_kind": "capture",
-            "correlation_id": "trace-99",
-            "segment_id": "backend_api",
-            "timestamp": "2026-04-14T12:00:00Z",
-            "status": "green",
-            "headline": "ok",
-        },
-    ]
+    repo.get_correlation_path.return_value = (
+        [
+            {
+                "correlation_kind": "capture",
+                "correlation_id": "trace-99",
+                "segment_id": "backend_api",
+                "timestamp": "2026-04-14T12:00:00Z",
+                "status": "green",
+                "headline": "ok",
+            },
+        ],
+        None,
+    )
     repo.get_workload_events_for_correlation.return_value = []
     app, *_ = client_factory(repo=repo)
     async with AsyncClient(
@@ -392,16 +441,19 @@ async def test_transaction_path_reports_missing_required_segments_from_ledger_po
 async def test_transaction_path_reports_unexpected_segments(client_factory) -> None:
     """A segment not listed in the capture chain must show up as unexpected."""
     repo = AsyncMock()
-    repo.get_correlation_events.return_value = [
-        {
-            "correlation_kind": "capture",
-            "correlation_id": "trace-77",
-            "segment_id": "investigation",  # investigation is NOT in capture chain
-            "timestamp": "2026-04-14T12:00:00Z",
-            "status": "green",
-            "headline": "unexpected",
-        },
-    ]
+    repo.get_correlation_path.return_value = (
+        [
+            {
+                "correlation_kind": "capture",
+                "correlation_id": "trace-77",
+                "segment_id": "investigation",  # investigation is NOT in capture chain
+                "timestamp": "2026-04-14T12:00:00Z",
+                "status": "green",
+                "headline": "unexpected",
+            },
+        ],
+        None,
+    )
     repo.get_workload_events_for_correlation.return_value = []
     app, *_ = client_factory(repo=repo)
     async with AsyncClient(
@@ -418,16 +470,19 @@ async def test_transaction_path_reports_present_optional(client_factory) -> None
     """Optional segments in the chain that DID appear are surfaced in
     present_optional so the UI can confirm the happy-path drift."""
     repo = AsyncMock()
-    repo.get_correlation_events.return_value = [
-        {
-            "correlation_kind": "capture",
-            "correlation_id": "trace-ok",
-            "segment_id": "admin",  # optional in the capture chain
-            "timestamp": "2026-04-14T12:00:00Z",
-            "status": "green",
-            "headline": "admin handoff",
-        },
-    ]
+    repo.get_correlation_path.return_value = (
+        [
+            {
+                "correlation_kind": "capture",
+                "correlation_id": "trace-ok",
+                "segment_id": "admin",  # optional in the capture chain
+                "timestamp": "2026-04-14T12:00:00Z",
+                "status": "green",
+                "headline": "admin handoff",
+            },
+        ],
+        None,
+    )
     repo.get_workload_events_for_correlation.return_value = []
     app, *_ = client_factory(repo=repo)
     async with AsyncClient(
@@ -0,0 +1,129 @@
+"""Tests for the spine cold archive (spine.archive + repository range reads)."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
+from second_brain.spine.archive import (
+    LocalArchiveStore,
+    SpineArchive,
+    SpineArchiver,
+    decode_rows,
+)
+from second_brain.spine.storage import SpineRepository
+
+NOW = datetime(2026, 4, 14, 12, 0, tzinfo=UTC)
+
+
+def _row(row_id: str, hours_ago: float, segment_id: str = "seg1") -> dict:
+    ts = NOW - timedelta(hours=hours_ago)
+    return {
+        "id": row_id,
+        "segment_id": segment_id,
+        "event_type": "workload",
+        "timestamp": ts.isoformat(),
+        "payload": {"outcome": "success"},
+        "_ts": int(ts.timestamp()),
+        "_etag": '"x"',
+        "_rid": "r",
+    }
+
+
+class _Repo:
+    """Rows by kind; answers the archiver's _ts-window queries."""
+
+    def __init__(self, rows: dict[str, list[dict]]) -> None:
+        self.rows = rows
+        self.windows: list[tuple[str, int, int]] = []
+
+    async def get_oldest_write_ts(self, kind: str) -> int:
+        return min((r["_ts"] for r in self.rows.get(kind, [])), default=0)
+
+    async def get_rows_written_between(self, kind, after_ts, until_ts):
+        self.windows.append((kind, after_ts, until_ts))
+        return [r for r in self.rows.get(kind, []) if after_ts < r["_ts"] <= until_ts]
+
+
+async def test_archiver_exports_aged_rows_once_by_partition_and_day(tmp_path) -> None:
+    repo = _Repo(
+        {
+            "events": [
+                _row("old-a", 30),
+                _row("old-b", 26, segment_id="seg2"),
+                _row("fresh", 1),
+            ]
+        }
+    )
+    archive = SpineArchive(LocalArchiveStore(tmp_path))
+    archiver = SpineArchiver(repo, archive, archive_after_seconds=24 * 3600)
+
+    assert (await archiver.run_once(now=NOW))["events"] == 2
+    files = await archive.store.list("events/")
+    assert sorted(f.split("/")[1] for f in files if f.endswith(".gz")) == [
+        "seg1",
+        "seg2",
+    ]
+    seg1 = next(f for f in files if f.startswith("events/seg1/2026-04-13/"))
+    [row] = decode_rows(await archive.store.get(seg1))
+    assert row["id"] == "old-a" and "_etag" not in row
+
+    # Resumes from the watermark: nothing re-exported, fresh row still hot.
+    repo.windows.clear()
+    assert (await archiver.run_once(now=NOW))["events"] == 0
+    assert repo.windows == []
+    assert await archive.watermark("events") == int(NOW.timestamp()) - 24 * 3600
+
+
+async def test_range_read_merges_archive_with_hot_rows(tmp_path) -> None:
+    archive = SpineArchive(LocalArchiveStore(tmp_path))
+    await archive.export(
+        "events", [_row("cold", 72), _row("both", 30), _row("other", 40, "x")], "r1"
+    )
+    await archive.set_watermark("events", int((NOW - timedelta(hours=24)).timestamp()))
+
+    events = AsyncMock()
+
+    async def _hot(**kwargs):
+        for row in [{**_row("both", 30), "hot": True}, _row("new", 2)]:
+            yield row
+
+    events.query_items = lambda **kwargs: _hot(**kwargs)
+    repo = SpineRepository(events, AsyncMock(), AsyncMock(), AsyncMock())
+
+    assert len(await repo.get_events_between("seg1", NOW - timedelta(days=5), NOW)) == 2
+    repo.attach_archive(archive)
+    rows = await repo.get_events_between("seg1", NOW - timedelta(days=5), NOW)
+
+    assert [r["id"] for r in rows] == ["cold", "both", "new"]
+    assert rows[1].get("hot") is True  # the hot copy wins
+
+    # A range entirely newer than the watermark never touches the archive.
+    recent = await repo.get_events_between("seg1", NOW - timedelta(hours=3), NOW)
+    assert [r["id"] for r in recent] == ["both", "new"]
+
+
+class _CountingStore(LocalArchiveStore):
+    def __init__(self, root) -> None:
+        super().__init__(root)
+        self.prefixes: list[str] = []
+
+    async def list(self, prefix: str) -> list[str]:
+        self.prefixes.append(prefix)
+        return await super().list(prefix)
+
+
+async def test_read_lists_only_the_days_in_range(tmp_path) -> None:
+    store = _CountingStore(tmp_path)
+    archive = SpineArchive(store)
+    await archive.export("events", [_row(f"r{d}", 24 * d) for d in range(10)], "r1")
+
+    start, end = NOW - timedelta(days=3, hours=1), NOW - timedelta(days=1, hours=1)
+    rows = await archive.read("events", "seg1", start, end)
+
+    assert [r["id"] for r in rows] == ["r3", "r2"]
+    assert store.prefixes == [
+        "events/seg1/2026-04-11/",
+        "events/seg1/2026-04-12/",
+        "events/seg1/2026-04-13/",
+    ]
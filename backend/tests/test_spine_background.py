@@ -31,6 +31,7 @@ class _FakeEvaluator:
             status="green",
             headline="all good",
             evaluator_inputs={"workload_total": 0},
+            latency_sketches={},
         )
 
 
@@ -0,0 +1,272 @@
+"""Tests for batch spine ingest (decode, dedupe, repository writes, route)."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from azure.cosmos.exceptions import (
+    CosmosBatchOperationError,
+    CosmosResourceExistsError,
+    CosmosResourceNotFoundError,
+)
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from second_brain.spine.api import build_spine_router
+from second_brain.spine.ingest import (
+    MAX_BATCH_EVENTS,
+    MAX_DECODED_BYTES,
+    MAX_ENCODED_BYTES,
+    BatchDecodeError,
+    IngestDeduper,
+    decode_batch_body,
+)
+from second_brain.spine.models import IngestEvent
+from second_brain.spine.storage import SpineRepository, build_event_documents
+
+
+def _event(event_id: str | None = None, segment_id: str = "mobile_ui", **payload):
+    body = {
+        "segment_id": segment_id,
+        "event_type": "workload",
+        "timestamp": "2026-04-14T12:00:00Z",
+        "payload": {
+            "operation": "screen_load",
+            "outcome": "success",
+            "duration_ms": 40,
+            **payload,
+        },
+    }
+    if event_id is not None:
+        body["event_id"] = event_id
+    return body
+
+
+# ---------------------------------------------------------------------------
+# Decoding and dedupe
+# ---------------------------------------------------------------------------
+
+
+def test_decode_accepts_gzip_and_events_wrapper() -> None:
+    raw = gzip.compress(json.dumps({"events": [_event("a")]}).encode())
+    assert decode_batch_body(raw, "gzip") == [_event("a")]
+    assert decode_batch_body(json.dumps([_event()]).encode(), None) == [_event()]
+
+
+@pytest.mark.parametrize(
+    ("raw", "encoding"),
+    [
+        (b"{not json", None),
+        (b'{"events": 3}', None),
+        (b"[]", "br"),
+        (b"not gzip", "gzip"),
+        (json.dumps([{}] * (MAX_BATCH_EVENTS + 1)).encode(), None),
+        (b"[" + b" " * MAX_DECODED_BYTES + b"]", None),
+        (b"[" + b" " * MAX_DECODED_BYTES + b"]", "identity"),
+        (b"\x1f\x8b" + b"\0" * MAX_ENCODED_BYTES, "gzip"),
+    ],
+)
+def test_decode_rejects_bad_bodies(raw: bytes, encoding: str | None) -> None:
+    with pytest.raises(BatchDecodeError):
+        decode_batch_body(raw, encoding)
+
+
+def test_event_id_becomes_document_id() -> None:
+    event_body, corr_body = build_event_documents(
+        IngestEvent.model_validate(
+            _event("evt-1", correlation_kind="capture", correlation_id="t1")
+        )
+    )
+    assert event_body["id"] == "evt-1"
+    assert corr_body is not None and corr_body["id"].endswith(":evt-1")
+
+
+def test_deduper_expires_and_caps_entries() -> None:
+    clock = {"t": 0.0}
+    dedupe = IngestDeduper(ttl_seconds=10, max_entries=2, clock=lambda: clock["t"])
+    dedupe.add(("s", "a"))
+    assert ("s", "a") in dedupe
+    clock["t"] = 11
+    assert ("s", "a") not in dedupe
+
+    for key in ("b", "c", "d"):
+        dedupe.add(("s", key))
+    assert len(dedupe) == 2
+    assert ("s", "b") not in dedupe
+
+
+# ---------------------------------------------------------------------------
+# SpineRepository.write_events / record_event_batch
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def containers() -> dict[str, AsyncMock]:
+    correlation = AsyncMock()
+    correlation.read_item.side_effect = CosmosResourceNotFoundError(
+        status_code=404, message="Not found"
+    )
+    return {
+        "events": AsyncMock(),
+        "segment_state": AsyncMock(),
+        "status_history": AsyncMock(),
+        "correlation": correlation,
+    }
+
+
+@pytest.fixture
+def repo(containers: dict[str, AsyncMock]) -> SpineRepository:
+    return SpineRepository(
+        containers["events"],
+        containers["segment_state"],
+        containers["status_history"],
+        containers["correlation"],
+    )
+
+
+async def test_conflicting_batch_is_settled_per_item(
+    repo: SpineRepository, containers: dict[str, AsyncMock]
+) -> None:
+    containers["events"].execute_item_batch.side_effect = CosmosBatchOperationError(
+        error_index=1, headers={}, status_code=409, message="Conflict"
+    )
+
+    async def _create(body):
+        if body["id"] == "dup":
+            raise CosmosResourceExistsError(status_code=409, message="exists")
+
+    containers["events"].create_item.side_effect = _create
+    seen: list[str] = []
+    repo.add_listener(lambda row: seen.append(row["id"]))
+
+    events = [
+        IngestEvent.model_validate(
+            _event(eid, correlation_kind="capture", correlation_id="t1")
+        )
+        for eid in ("new", "dup")
+    ]
+    outcomes = await repo.record_event_batch(events)
+
+    assert outcomes == ["written", "duplicate"]
+    assert seen == ["new"]  # listeners only see rows that were actually written
+    # Correlation rows are re-upserted for duplicates too (idempotent repair).
+    ops = containers["correlation"].execute_item_batch.call_args.kwargs[
+        "batch_operations"
+    ]
+    assert len(ops) == 2
+    # ...but the summary only counts the newly written event.
+    created = containers["correlation"].create_item.call_args.kwargs["body"]
+    assert created["event_count"] == 1
+
+
+async def test_throttled_batch_reports_failed(
+    repo: SpineRepository, containers: dict[str, AsyncMock]
+) -> None:
+    containers["events"].execute_item_batch.side_effect = RuntimeError("429")
+    outcomes = await repo.record_event_batch([IngestEvent.model_validate(_event("a"))])
+    assert outcomes == ["failed"]
+    containers["events"].create_item.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# POST /api/spine/ingest/batch
+# ---------------------------------------------------------------------------
+
+
+def _client(repo: AsyncMock) -> AsyncClient:
+    async def fake_auth() -> None:
+        return None
+
+    app = FastAPI()
+    app.include_router(
+        build_spine_router(
+            repo=repo,
+            evaluator=AsyncMock(),
+            adapter_registry=MagicMock(),
+            segment_registry=MagicMock(),
+            auth_dependency=fake_auth,
+        )
+    )
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+async def test_batch_route_reports_per_event_results() -> None:
+    repo = AsyncMock()
+    repo.record_event_batch.side_effect = lambda events: [
+        "failed" if e.root.event_id == "flaky" else "written" for e in events
+    ]
+    batch = [
+        _event("a"),
+        {"segment_id": "mobile_ui", "event_type": "workload"},  # invalid
+        _event("a"),  # repeated within the batch
+        _event("flaky"),
+        _event(),  # no event_id: always written
+    ]
+    async with _client(repo) as client:
+        response = await client.post(
+            "/api/spine/ingest/batch",
+            content=gzip.compress(json.dumps(batch).encode()),
+            headers={"Content-Encoding": "gzip", "Content-Type": "application/json"},
+        )
+        replay = await client.post("/api/spine/ingest/batch", json=[_event("a")])
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [r["status"] for r in body["results"]] == [
+        "accepted",
+        "invalid",
+        "duplicate",
+        "failed",
+        "accepted",
+    ]
+    assert (body["accepted"], body["duplicates"], body["invalid"], body["failed"]) == (
+        2,
+        1,
+        1,
+        1,
+    )
+    assert body["results"][1]["error"]
+    written = repo.record_event_batch.call_args_list[0].args[0]
+    assert len(written) == 3
+
+    # The replay is dropped by the dedupe window without touching Cosmos.
+    assert replay.json()["results"][0]["status"] == "duplicate"
+    assert repo.record_event_batch.call_args_list[1].args[0] == []
+
+
+async def test_ingest_routes_reset_client_sample_weight() -> None:
+    repo = AsyncMock()
+    repo.record_event_batch.side_effect = lambda events: ["written"] * len(events)
+    async with _client(repo) as client:
+        single = await client.post("/api/spine/ingest", json=_event(sample_weight=1000))
+        batch = await client.post(
+            "/api/spine/ingest/batch",
+            json=[_event(sample_weight=1000), _event(sample_weight=10**9)],
+        )
+
+    assert single.status_code == 204
+    assert repo.record_event.call_args.args[0].root.payload.sample_weight == 1
+    # Out-of-range weights are invalid; in-range ones are still reset.
+    assert [r["status"] for r in batch.json()["results"]] == ["accepted", "invalid"]
+    written = repo.record_event_batch.call_args.args[0]
+    assert [e.root.payload.sample_weight for e in written] == [1]
+
+
+async def test_batch_route_rejects_undecodable_body() -> None:
+    async with _client(AsyncMock()) as client:
+        response = await client.post(
+            "/api/spine/ingest/batch",
+            content=b"[",
+            headers={"Content-Type": "application/json"},
+        )
+        oversized = await client.post(
+            "/api/spine/ingest/batch",
+            content=b"[" + b" " * MAX_DECODED_BYTES * 2 + b"]",
+            headers={"Content-Type": "application/json"},
+        )
+    assert response.status_code == 400
+    assert oversized.status_code == 400
+    assert "exceeds" in oversized.json()["detail"]
@@ -58,6 +58,7 @@ def _readiness(timestamp: datetime, all_ok: bool = True) -> dict:
 @pytest.mark.asyncio
 async def test_no_events_returns_stale() -> None:
     repo = AsyncMock()
+    repo.get_latest_heartbeat.return_value = None
     repo.get_recent_events.return_value = []
     registry = SegmentRegistry([_cfg()])
     evaluator = StatusEvaluator(
@@ -71,6 +72,7 @@ async def test_no_events_returns_stale() -> None:
 async def test_recent_liveness_only_returns_green() -> None:
     now = datetime(2026, 4, 14, 12, 0, tzinfo=UTC)
     repo = AsyncMock()
+    repo.get_latest_heartbeat.return_value = None
     repo.get_recent_events.return_value = [_liveness(now - timedelta(seconds=10))]
     registry = SegmentRegistry([_cfg()])
     evaluator = StatusEvaluator(repo=repo, registry=registry, now=lambda: now)
@@ -82,6 +84,7 @@ async def test_recent_liveness_only_returns_green() -> None:
 async def test_workload_failure_rate_above_yellow_threshold_returns_yellow() -> None:
     now = datetime(2026, 4, 14, 12, 0, tzinfo=UTC)
     repo = AsyncMock()
+    repo.get_latest_heartbeat.return_value = None
     events = [_liveness(now - timedelta(seconds=10))]
     # 11% failure rate (1 fail in 9)
     events.extend([_workload(now - timedelta(seconds=60), "success") for _ in range(8)])
@@ -97,6 +100,7 @@ async def test_workload_failure_rate_above_yellow_threshold_returns_yellow() ->
 async def test_workload_failure_rate_above_red_threshold_returns_red() -> None:
     now = datetime(2026, 4, 14, 12, 0, tzinfo=UTC)
     repo = AsyncMock()
+    repo.get_latest_heartbeat.return_value = None
     events = [_liveness(now - timedelta(seconds=10))]
     # 60% failure rate
     events.extend([_workload(now - timedelta(seconds=60), "success") for _ in range(4)])
@@ -114,6 +118,7 @@ async def test_workload_failure_rate_above_red_threshold_returns_red() -> None:
 async def test_three_consecutive_failures_returns_red() -> None:
     now = datetime(2026, 4, 14, 12, 0, tzinfo=UTC)
     repo = AsyncMock()
+    repo.get_latest_heartbeat.return_value = None
     events = [_liveness(now - timedelta(seconds=10))]
     # Most recent 3 are all failures (highest priority over rate)
     events.extend(
@@ -137,6 +142,7 @@ async def test_three_consecutive_failures_returns_red() -> None:
 async def test_readiness_failure_promotes_to_yellow() -> None:
     now = datetime(2026, 4, 14, 12, 0, tzinfo=UTC)
     repo = AsyncMock()
+    repo.get_latest_heartbeat.return_value = None
     repo.get_recent_events.return_value = [
         _liveness(now - timedelta(seconds=10)),
         _readiness(now - timedelta(seconds=20), all_ok=False),
@@ -151,6 +157,7 @@ async def test_readiness_failure_promotes_to_yellow() -> None:
 async def test_freshness_seconds_reflects_most_recent_event() -> None:
     now = datetime(2026, 4, 14, 12, 0, tzinfo=UTC)
     repo = AsyncMock()
+    repo.get_latest_heartbeat.return_value = None
     repo.get_recent_events.return_value = [_liveness(now - timedelta(seconds=10))]
     registry = SegmentRegistry([_cfg()])
     evaluator = StatusEvaluator(repo=repo, registry=registry, now=lambda: now)
@@ -168,6 +175,7 @@ async def test_red_headline_uses_configured_consecutive_threshold_not_hardcoded(
     # to the rate message.
     now = datetime(2026, 4, 14, 12, 0, tzinfo=UTC)
     repo = AsyncMock()
+    repo.get_latest_heartbeat.return_value = None
     events = [_liveness(now - timedelta(seconds=10))]
     events.append(_workload(now - timedelta(seconds=40), "success"))
     events.append(_workload(now - timedelta(seconds=20), "failure", "Boom"))
@@ -186,6 +194,7 @@ async def test_green_headline_uses_configured_window_not_hardcoded_5min() -> Non
     # hardcoded "5min". A 60-second window must display "1min".
     now = datetime(2026, 4, 14, 12, 0, tzinfo=UTC)
     repo = AsyncMock()
+    repo.get_latest_heartbeat.return_value = None
     repo.get_recent_events.return_value = [
         _liveness(now - timedelta(seconds=10)),
         _workload(now - timedelta(seconds=20), "success"),
@@ -221,3 +230,90 @@ def test_exceeds_bool_threshold_does_not_fall_through_to_numeric_branch() -> Non
         )
         is True
     )
+
+
+def _timed(timestamp: datetime, duration_ms: int, operation: str = "op") -> dict:
+    return {
+        "event_type": "workload",
+        "timestamp": timestamp.isoformat(),
+        "payload": {
+            "operation": operation,
+            "outcome": "success",
+            "duration_ms": duration_ms,
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_slow_but_succeeding_segment_turns_yellow_on_p95() -> None:
+    now = datetime(2026, 4, 14, 12, 0, tzinfo=UTC)
+    events = [_liveness(now - timedelta(seconds=5))] + [
+        _timed(now - timedelta(seconds=60 - i), 9_000 if i >= 18 else 200)
+        for i in range(20)
+    ]
+    repo = AsyncMock()
+    repo.get_latest_heartbeat.return_value = None
+    repo.get_recent_events.return_value = events
+    registry = SegmentRegistry(
+        [_cfg(yellow_thresholds={"latency_p95_ms": 5_000}, red_thresholds={})]
+    )
+    result = await StatusEvaluator(repo, registry, now=lambda: now).evaluate("seg1")
+
+    assert result.status == "yellow"
+    assert result.headline.startswith("p95 latency")
+    assert 180 <= result.evaluator_inputs["latency_p50_ms"] <= 220
+    assert result.evaluator_inputs["latency_p95_ms"] >= 5_000
+    assert set(result.latency_sketches) == {"*", "op"}
+    assert result.latency_sketches["*"]["n"] == 20
+
+
+@pytest.mark.asyncio
+async def test_latency_inputs_are_none_without_workload() -> None:
+    now = datetime(2026, 4, 14, 12, 0, tzinfo=UTC)
+    repo = AsyncMock()
+    repo.get_latest_heartbeat.return_value = None
+    repo.get_recent_events.return_value = [_liveness(now - timedelta(seconds=5))]
+    registry = SegmentRegistry([_cfg(red_thresholds={"latency_p99_ms": 1})])
+    result = await StatusEvaluator(repo, registry, now=lambda: now).evaluate("seg1")
+    assert result.status == "green"
+    assert result.evaluator_inputs["latency_p99_ms"] is None
+    assert result.latency_sketches == {}
+
+
+@pytest.mark.asyncio
+async def test_failure_rate_headline_wins_over_latency_breach() -> None:
+    now = datetime(2026, 4, 14, 12, 0, tzinfo=UTC)
+    events = [_liveness(now - timedelta(seconds=5))] + [
+        _workload(now - timedelta(seconds=30 - i), o)
+        for i, o in enumerate(["failure", "success", "failure", "success"])
+    ]
+    repo = AsyncMock()
+    repo.get_latest_heartbeat.return_value = None
+    repo.get_recent_events.return_value = events
+    registry = SegmentRegistry(
+        [
+            _cfg(
+                red_thresholds={"workload_failure_rate": 0.5, "latency_p50_ms": 50},
+            )
+        ]
+    )
+    result = await StatusEvaluator(repo, registry, now=lambda: now).evaluate("seg1")
+    assert result.status == "red"
+    assert result.headline == "50% failure rate (2/4)"
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_keeps_segment_live_without_liveness_rows() -> None:
+    now = datetime(2026, 4, 14, 12, 0, tzinfo=UTC)
+    repo = AsyncMock()
+    repo.get_latest_heartbeat.return_value = now - timedelta(seconds=20)
+    repo.get_recent_events.return_value = [
+        _liveness(now - timedelta(seconds=280)),
+        _workload(now - timedelta(seconds=40), "success"),
+    ]
+    registry = SegmentRegistry([_cfg()])
+    evaluator = StatusEvaluator(repo=repo, registry=registry, now=lambda: now)
+    result = await evaluator.evaluate("seg1")
+    assert result.status == "green"
+    assert result.freshness_seconds == 20
+    repo.get_latest_heartbeat.assert_awaited_once_with("seg1")
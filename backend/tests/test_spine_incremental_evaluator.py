@@ -0,0 +1,358 @@
+"""Tests for the incremental (in-memory window) status evaluator."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from itertools import count
+from unittest.mock import AsyncMock
+
+import pytest
+
+from second_brain.spine.evaluator import StatusEvaluator
+from second_brain.spine.incremental import IncrementalStatusEvaluator
+from second_brain.spine.models import IngestEvent
+from second_brain.spine.registry import EvaluatorConfig, SegmentRegistry
+from second_brain.spine.storage import SpineRepository
+
+NOW = datetime(2026, 4, 14, 12, 0, tzinfo=UTC)
+_ids = count()
+
+
+def _cfg(**overrides) -> EvaluatorConfig:
+    base = dict(
+        segment_id="seg1",
+        liveness_interval_seconds=30,
+        host_segment=None,
+        workload_window_seconds=300,
+        yellow_thresholds={"workload_failure_rate": 0.10, "any_readiness_failed": True},
+        red_thresholds={"workload_failure_rate": 0.50, "consecutive_failures": 3},
+    )
+    base.update(overrides)
+    return EvaluatorConfig(**base)
+
+
+def _row(event_type: str, ago: float, payload: dict) -> dict:
+    return {
+        "id": f"e{next(_ids)}",
+        "segment_id": "seg1",
+        "event_type": event_type,
+        "timestamp": (NOW - timedelta(seconds=ago)).isoformat(),
+        "payload": payload,
+        "_ts": int((NOW - timedelta(seconds=ago)).timestamp()),
+    }
+
+
+def _liveness(ago: float) -> dict:
+    return _row("liveness", ago, {"instance_id": "i1"})
+
+
+def _workload(
+    ago: float, outcome: str, duration_ms: int = 5, op: str = "op", weight: int = 1
+) -> dict:
+    payload = {"operation": op, "outcome": outcome, "duration_ms": duration_ms}
+    if weight != 1:
+        payload["sample_weight"] = weight
+    return _row("workload", ago, payload)
+
+
+def _readiness(ago: float, ok: bool) -> dict:
+    status = "ok" if ok else "failing"
+    return _row("readiness", ago, {"checks": [{"name": "dep", "status": status}]})
+
+
+def _in_window(rows: list[dict], cfg: EvaluatorConfig, now: datetime) -> list[dict]:
+    cutoff = now - timedelta(seconds=cfg.workload_window_seconds)
+    return [r for r in rows if datetime.fromisoformat(r["timestamp"]) >= cutoff]
+
+
+SCENARIOS = {
+    "no_events": [],
+    "liveness_only": [_liveness(10)],
+    "stale_liveness": [_liveness(200), _workload(5, "success")],
+    "yellow_rate": [_liveness(5)]
+    + [_workload(100 - i, "success") for i in range(8)]
+    + [_workload(50, "failure"), _workload(1, "success")],
+    "red_streak": [
+        _liveness(5),
+        _workload(40, "success"),
+        _workload(30, "failure"),
+        _workload(20, "failure"),
+        _workload(10, "failure"),
+    ],
+    "degraded_breaks_streak": [
+        _liveness(5),
+        _workload(30, "failure"),
+        _workload(20, "degraded"),
+        _workload(10, "failure"),
+    ],
+    "readiness_failing": [_liveness(5), _readiness(20, ok=False)],
+    "evicted_failures": [
+        _liveness(5),
+        _workload(400, "failure"),
+        _workload(350, "failure"),
+        _workload(20, "success"),
+    ],
+    "latency_spread_with_eviction": [
+        _liveness(5),
+        _workload(450, "success", 90_000, op="slow"),
+        _workload(320, "success", 60_000, op="slow"),
+        _workload(200, "success", 1_200, op="slow"),
+        _workload(40, "success", 15),
+        _workload(30, "success", 0),
+        _workload(10, "success", 250),
+    ],
+    "sampled_weights_with_eviction": [
+        _liveness(5),
+        _workload(400, "success", 80, weight=10),
+        _workload(90, "success", 20, weight=10),
+        _workload(60, "failure", 900),
+        _workload(30, "success", 25, op="other", weight=4),
+    ],
+    "out_of_order": [
+        _liveness(5),
+        _workload(10, "failure"),
+        _workload(30, "failure"),
+        _workload(5, "failure"),
+        _workload(20, "success"),
+    ],
+}
+
+
+@pytest.mark.parametrize("name", sorted(SCENARIOS))
+async def test_fed_incrementally_matches_full_evaluate(name: str) -> None:
+    rows = SCENARIOS[name]
+    cfg = _cfg()
+    registry = SegmentRegistry([cfg])
+
+    full_repo = AsyncMock()
+    full_repo.get_latest_heartbeat.return_value = None
+    full_repo.get_recent_events.return_value = _in_window(rows, cfg, NOW)
+    expected = await StatusEvaluator(full_repo, registry, now=lambda: NOW).evaluate(
+        "seg1"
+    )
+
+    inc_repo = AsyncMock()
+    inc_repo.get_latest_heartbeat.return_value = None
+    inc_repo.get_recent_events.return_value = []
+    inc = IncrementalStatusEvaluator(inc_repo, registry, now=lambda: NOW)
+    await inc.rebuild("seg1")  # cold start on an empty container
+    for row in rows:
+        inc.observe(row)
+    actual = await inc.evaluate("seg1")
+
+    assert actual.status == expected.status
+    assert actual.headline == expected.headline
+    assert actual.evaluator_inputs == expected.evaluator_inputs
+    assert actual.last_event_at == expected.last_event_at
+    assert actual.freshness_seconds == expected.freshness_seconds
+    assert actual.latency_sketches == expected.latency_sketches
+
+
+@pytest.mark.parametrize("name", sorted(SCENARIOS))
+async def test_cold_start_rebuild_matches_full_evaluate(name: str) -> None:
+    cfg = _cfg()
+    registry = SegmentRegistry([cfg])
+    repo = AsyncMock()
+    repo.get_latest_heartbeat.return_value = None
+    repo.get_recent_events.return_value = _in_window(SCENARIOS[name], cfg, NOW)
+
+    expected = await StatusEvaluator(repo, registry, now=lambda: NOW).evaluate("seg1")
+    actual = await IncrementalStatusEvaluator(repo, registry, now=lambda: NOW).evaluate(
+        "seg1"
+    )
+    assert (actual.status, actual.headline, actual.evaluator_inputs) == (
+        expected.status,
+        expected.headline,
+        expected.evaluator_inputs,
+    )
+
+
+async def test_ticks_after_cold_start_only_catch_up() -> None:
+    clock = {"now": NOW}
+    registry = SegmentRegistry([_cfg()])
+    repo = AsyncMock()
+    repo.get_latest_heartbeat.return_value = None
+    repo.get_recent_events.return_value = [_liveness(5)]
+    inc = IncrementalStatusEvaluator(repo, registry, now=lambda: clock["now"])
+
+    first = await inc.evaluate("seg1")
+    assert first.status == "green"
+    for i in range(3):
+        clock["now"] = NOW + timedelta(seconds=1 + i)
+        inc.observe(_workload(-1 - i, "failure"))
+        await inc.evaluate("seg1")
+
+    # one full-window rebuild, then each tick reads only rows written at or
+    # past the newest `_ts` fetched so far
+    assert repo.get_recent_events.await_count == 1
+    since = [
+        c.kwargs["since_ts"] for c in repo.get_events_written_since.await_args_list
+    ]
+    assert since == [int(NOW.timestamp()) - 5] * 3
+    result = await inc.evaluate("seg1")
+    assert result.status == "red"
+    assert result.evaluator_inputs["consecutive_failures"] == 3
+
+
+async def test_unchanged_window_reuses_result_but_refreshes_freshness() -> None:
+    clock = {"now": NOW}
+    registry = SegmentRegistry([_cfg()])
+    repo = AsyncMock()
+    repo.get_latest_heartbeat.return_value = None
+    repo.get_recent_events.return_value = [_liveness(5)]
+    inc = IncrementalStatusEvaluator(repo, registry, now=lambda: clock["now"])
+
+    first = await inc.evaluate("seg1")
+    clock["now"] = NOW + timedelta(seconds=10)
+    second = await inc.evaluate("seg1")
+    assert second is first
+    assert second.freshness_seconds == 15
+
+
+async def test_liveness_ageing_out_flips_to_stale_without_new_events() -> None:
+    clock = {"now": NOW}
+    registry = SegmentRegistry([_cfg()])
+    repo = AsyncMock()
+    repo.get_latest_heartbeat.return_value = None
+    repo.get_recent_events.return_value = [_liveness(5)]
+    inc = IncrementalStatusEvaluator(repo, registry, now=lambda: clock["now"])
+
+    assert (await inc.evaluate("seg1")).status == "green"
+    clock["now"] = NOW + timedelta(seconds=120)
+    assert (await inc.evaluate("seg1")).status == "stale"
+
+
+async def test_other_replicas_heartbeat_is_read_before_reporting_stale() -> None:
+    clock = {"now": NOW}
+    registry = SegmentRegistry([_cfg()])
+    repo = AsyncMock()
+    repo.get_latest_heartbeat.return_value = NOW - timedelta(seconds=5)
+    repo.get_recent_events.return_value = []
+    inc = IncrementalStatusEvaluator(repo, registry, now=lambda: clock["now"])
+
+    assert (await inc.evaluate("seg1")).status == "green"
+    clock["now"] = NOW + timedelta(seconds=30)
+    assert (await inc.evaluate("seg1")).status == "green"
+    assert repo.get_latest_heartbeat.await_count == 1  # still fresh, no read
+
+    clock["now"] = NOW + timedelta(seconds=120)
+    repo.get_latest_heartbeat.return_value = NOW + timedelta(seconds=110)
+    result = await inc.evaluate("seg1")
+    assert result.status == "green"
+    assert result.freshness_seconds == 10
+    assert repo.get_recent_events.await_count == 1  # no rebuild
+
+    clock["now"] = NOW + timedelta(seconds=240)
+    assert (await inc.evaluate("seg1")).status == "stale"
+
+
+async def test_row_written_by_another_replica_is_in_next_evaluate() -> None:
+    clock = {"now": NOW}
+    registry = SegmentRegistry([_cfg()])
+    repo = AsyncMock()
+    repo.get_latest_heartbeat.return_value = None
+    seen = [_liveness(5)] + [_workload(40 + i, "success") for i in range(4)]
+    seen += [_workload(20, "failure"), _workload(10, "failure")]
+    repo.get_recent_events.return_value = seen
+    inc = IncrementalStatusEvaluator(repo, registry, now=lambda: clock["now"])
+    assert (await inc.evaluate("seg1")).status == "yellow"
+
+    clock["now"] = NOW + timedelta(seconds=5)
+    # recorded by another replica, so never observed here; the catch-up
+    # re-returns rows of the same `_ts` second, which must not count twice
+    late = {**_workload(1, "failure"), "_ts": int(NOW.timestamp()) + 4}
+    repo.get_events_written_since.return_value = [seen[1], late]
+    result = await inc.evaluate("seg1")
+    assert (
+        repo.get_events_written_since.await_args.kwargs["since_ts"]
+        == int(NOW.timestamp()) - 5
+    )
+    assert result.status == "red"
+    assert result.evaluator_inputs["consecutive_failures"] == 3
+    assert result.evaluator_inputs["workload_total"] == 7
+
+    await inc.evaluate("seg1")  # the mark moved past the other replica's row
+    since = repo.get_events_written_since.await_args.kwargs["since_ts"]
+    assert since == late["_ts"]
+
+
+async def test_reset_drops_windows_until_next_rebuild() -> None:
+    registry = SegmentRegistry([_cfg()])
+    repo = AsyncMock()
+    repo.get_latest_heartbeat.return_value = None
+    repo.get_recent_events.return_value = [_liveness(5)]
+    inc = IncrementalStatusEvaluator(repo, registry, now=lambda: NOW)
+    await inc.evaluate("seg1")
+
+    inc.reset()  # stood by: ingest is no longer folded in
+    inc.observe(_workload(1, "failure"))
+    result = await inc.evaluate("seg1")
+    assert repo.get_recent_events.await_count == 2  # rebuilt, not caught up
+    assert result.evaluator_inputs["workload_total"] == 0
+
+
+async def test_resync_interval_rebuilds_from_cosmos() -> None:
+    clock = {"now": NOW}
+    registry = SegmentRegistry([_cfg()])
+    repo = AsyncMock()
+    repo.get_latest_heartbeat.return_value = None
+    repo.get_recent_events.return_value = [_liveness(5)]
+    inc = IncrementalStatusEvaluator(
+        repo, registry, now=lambda: clock["now"], resync_interval_seconds=60
+    )
+    await inc.evaluate("seg1")
+    clock["now"] = NOW + timedelta(seconds=61)
+    repo.get_recent_events.return_value = [_liveness(-60)]  # another replica's row
+    result = await inc.evaluate("seg1")
+    assert repo.get_recent_events.await_count == 2
+    assert result.status == "green"
+
+
+async def test_rows_recorded_during_rebuild_are_merged_once() -> None:
+    registry = SegmentRegistry([_cfg()])
+    live = _workload(1, "failure")
+    persisted = _liveness(5)
+    gate = asyncio.Event()
+
+    async def _slow_query(
+        segment_id: str, window_seconds: int, fields: str = "*"
+    ) -> list[dict]:
+        await gate.wait()
+        return [persisted, live]  # the live row was flushed before the read
+
+    repo = AsyncMock()
+    repo.get_latest_heartbeat.return_value = None
+    repo.get_recent_events.side_effect = _slow_query
+    inc = IncrementalStatusEvaluator(repo, registry, now=lambda: NOW)
+
+    task = asyncio.create_task(inc.evaluate("seg1"))
+    await asyncio.sleep(0)
+    inc.observe(live)
+    inc.observe(_workload(0, "failure"))
+    gate.set()
+    result = await task
+    assert result.evaluator_inputs["workload_total"] == 2
+    assert result.evaluator_inputs["consecutive_failures"] == 2
+
+
+async def test_repository_record_event_feeds_listener() -> None:
+    repo = SpineRepository(AsyncMock(), AsyncMock(), AsyncMock(), AsyncMock())
+    repo.get_recent_events = AsyncMock(return_value=[])  # type: ignore[method-assign]
+    registry = SegmentRegistry([_cfg()])
+    inc = IncrementalStatusEvaluator(repo, registry, now=lambda: NOW)
+    repo.add_listener(inc.observe)
+    await inc.rebuild("seg1")
+
+    await repo.record_event(
+        IngestEvent.model_validate(
+            {
+                "segment_id": "seg1",
+                "event_type": "liveness",
+                "timestamp": NOW.isoformat(),
+                "payload": {"instance_id": "i1"},
+            }
+        )
+    )
+    result = inc.evaluate_cached(registry.get("seg1"), NOW)
+    assert result.status == "green"
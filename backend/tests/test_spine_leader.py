@@ -0,0 +1,207 @@
+"""Tests for lease-based leader election (spine.leader)."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import Any
+
+import pytest
+from azure.cosmos.exceptions import (
+    CosmosAccessConditionFailedError,
+    CosmosResourceExistsError,
+    CosmosResourceNotFoundError,
+)
+
+from second_brain.spine.background import follow_segment_states
+from second_brain.spine.leader import (
+    LeaseElector,
+    LeaseStoreMissingError,
+    run_as_leader,
+)
+from second_brain.spine.snapshot import StatusSnapshot
+
+
+class _LeaseContainer:
+    """In-memory stand-in for spine_leases with Cosmos ETag semantics."""
+
+    def __init__(self) -> None:
+        self.docs: dict[str, dict[str, Any]] = {}
+        self._etags = 0
+        self.fail = False
+
+    def _stamp(self, body: dict[str, Any]) -> dict[str, Any]:
+        self._etags += 1
+        doc = {**body, "_etag": f"e{self._etags}"}
+        self.docs[doc["id"]] = doc
+        return dict(doc)
+
+    def _check(self, item: str, etag: str) -> None:
+        if item not in self.docs:
+            raise CosmosResourceNotFoundError(status_code=404, message="gone")
+        if self.docs[item]["_etag"] != etag:
+            raise CosmosAccessConditionFailedError(status_code=412, message="etag")
+
+    async def read_item(self, item: str, partition_key: str) -> dict[str, Any]:
+        if self.fail:
+            raise RuntimeError("503")
+        if item not in self.docs:
+            raise CosmosResourceNotFoundError(status_code=404, message="gone")
+        return dict(self.docs[item])
+
+    async def create_item(self, body: dict[str, Any]) -> dict[str, Any]:
+        if body["id"] in self.docs:
+            raise CosmosResourceExistsError(status_code=409, message="exists")
+        return self._stamp(body)
+
+    async def replace_item(self, item, body, etag, match_condition):
+        self._check(item, etag)
+        return self._stamp(body)
+
+    async def delete_item(self, item, partition_key, etag, match_condition):
+        self._check(item, etag)
+        del self.docs[item]
+
+
+def _electors(container, clock):
+    return (
+        LeaseElector(container, "loop", owner_id="a", ttl_seconds=30, clock=clock),
+        LeaseElector(container, "loop", owner_id="b", ttl_seconds=30, clock=clock),
+    )
+
+
+async def test_single_holder_until_expiry_then_takeover() -> None:
+    container = _LeaseContainer()
+    now = {"t": 1000.0}
+    a, b = _electors(container, lambda: now["t"])
+
+    assert await a.try_acquire()
+    assert not await b.try_acquire()
+    now["t"] += 20
+    assert await a.try_acquire()  # renewal pushes expiry out
+    now["t"] += 20
+    assert not await b.try_acquire()
+
+    now["t"] += 31  # a stopped renewing (crashed)
+    assert await b.try_acquire()
+    assert container.docs["loop"]["owner"] == "b"
+    assert container.docs["loop"]["epoch"] == 2
+    assert not await a.try_acquire()
+    assert not a.is_leader
+
+
+async def test_release_hands_over_immediately() -> None:
+    container = _LeaseContainer()
+    a, b = _electors(container, lambda: 0.0)
+    assert await a.try_acquire()
+    await a.release()
+    assert "loop" not in container.docs
+    assert await b.try_acquire()
+
+
+async def test_holder_steps_down_before_lease_can_expire() -> None:
+    container = _LeaseContainer()
+    now = {"t": 0.0}
+    a, _ = _electors(container, lambda: now["t"])
+    assert await a.try_acquire()
+
+    container.fail = True
+    now["t"] = 10
+    with contextlib.suppress(RuntimeError):
+        await a.try_acquire()
+    assert a.is_leader  # still well inside the lease
+    now["t"] = 21  # within one renew interval of expiry
+    with contextlib.suppress(RuntimeError):
+        await a.try_acquire()
+    assert not a.is_leader
+
+
+class _MissingContainer:
+    """spine_leases was never created: every call 404s."""
+
+    def __init__(self, read_sub_status: int | None = 1003) -> None:
+        self._read_sub_status = read_sub_status
+
+    async def read_item(self, item: str, partition_key: str) -> dict[str, Any]:
+        raise CosmosResourceNotFoundError(
+            status_code=404, message="container", sub_status=self._read_sub_status
+        )
+
+    async def create_item(self, body: dict[str, Any]) -> dict[str, Any]:
+        raise CosmosResourceNotFoundError(status_code=404, message="container")
+
+
+@pytest.mark.parametrize("read_sub_status", [1003, None])
+async def test_missing_lease_container_is_not_a_lost_race(read_sub_status) -> None:
+    elector = LeaseElector(_MissingContainer(read_sub_status), "loop", owner_id="a")
+    with pytest.raises(LeaseStoreMissingError):
+        await elector.try_acquire()
+
+
+async def test_run_as_leader_runs_work_when_lease_container_missing(caplog) -> None:
+    elector = LeaseElector(_MissingContainer(), "loop", owner_id="a")
+    ran = asyncio.Event()
+
+    async def work() -> None:
+        ran.set()
+
+    async def standby() -> None:
+        raise AssertionError("must not stand by")
+
+    await asyncio.wait_for(run_as_leader(elector, work, standby), timeout=1)
+    assert ran.is_set()
+    assert "lease container or database not found" in caplog.text
+
+
+async def test_run_as_leader_swaps_work_and_standby() -> None:
+    container = _LeaseContainer()
+    other = LeaseElector(container, "loop", owner_id="other", ttl_seconds=30)
+    assert await other.try_acquire()
+    me = LeaseElector(
+        container, "loop", owner_id="me", ttl_seconds=30, renew_interval_seconds=0.01
+    )
+    running: list[str] = []
+
+    async def _forever(name: str) -> None:
+        running.append(name)
+        await asyncio.Event().wait()
+
+    task = asyncio.create_task(
+        run_as_leader(me, lambda: _forever("work"), lambda: _forever("standby"))
+    )
+    await asyncio.sleep(0.05)
+    assert running == ["standby"]
+
+    await other.release()
+    await asyncio.sleep(0.05)
+    assert running == ["standby", "work"]
+    assert container.docs["loop"]["owner"] == "me"
+
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+    assert "loop" not in container.docs  # released on shutdown
+
+
+async def test_follower_refresh_publishes_transitions() -> None:
+    states = [{"segment_id": "a", "status": "green", "headline": "ok"}]
+
+    class _Repo:
+        async def get_all_segment_states(self) -> list[dict]:
+            return [dict(s) for s in states]
+
+    snap = StatusSnapshot()
+    async with snap.subscribe() as queue:
+        task = asyncio.create_task(
+            follow_segment_states(_Repo(), snap, interval_seconds=0.01)
+        )
+        await asyncio.sleep(0.03)
+        assert snap.loaded and queue.empty()
+        states[0].update(status="red", headline="down")
+        transition = await asyncio.wait_for(queue.get(), 1)
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    assert (transition["prev_status"], transition["status"]) == ("green", "red")
+    assert snap.get("a")["status"] == "red"
@@ -132,6 +132,8 @@ async def test_wire_spine_without_logs_client_omits_backend_api_adapter(
             t.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await t
+        await app.state.spine_rollups.close()
+        await app.state.spine_writer.close()
 
 
 async def test_wire_spine_full_happy_path(settings_stub) -> None:
@@ -147,6 +149,15 @@ async def test_wire_spine_full_happy_path(settings_stub) -> None:
         assert len(liveness_tasks) == 9
         assert isinstance(app.state.spine_repo, SpineRepository)
         assert app.state.spine_adapter_registry.has("backend_api")
+        # Write-behind writer attached by default
+        assert app.state.spine_writer is not None
+        assert app.state.spine_writer.accepting
+        # Workload rollup aggregator wired by default
+        assert app.state.spine_rollups is not None
+        # Evaluator runs behind the spine_leases lease by default
+        assert app.state.spine_leases is not None
+        # Liveness goes to per-instance heartbeat docs by default
+        assert app.state.spine_repo._heartbeats is not None
         # Spine router mounted
         assert any(getattr(r, "path", "").startswith("/api/spine") for r in app.routes)
     finally:
@@ -154,6 +165,8 @@ async def test_wire_spine_full_happy_path(settings_stub) -> None:
             t.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await t
+        await app.state.spine_rollups.close()
+        await app.state.spine_writer.close()
 
 
 async def test_wire_spine_shutdown_cancels_tasks_cleanly(settings_stub) -> None:
@@ -175,6 +188,11 @@ async def test_wire_spine_shutdown_cancels_tasks_cleanly(settings_stub) -> None:
     # All tasks done after cancellation
     assert evaluator_task.done()
     assert all(t.done() for t in liveness_tasks)
+    # Shutdown flush drains the rollups and the write-behind queue
+    await app.state.spine_rollups.close()
+    await app.state.spine_writer.close()
+    assert app.state.spine_writer.queue_depth == 0
+    assert not app.state.spine_writer.accepting
 
 
 async def test_wire_spine_partial_failure_leaves_no_stale_state(
@@ -206,4 +224,7 @@ async def test_wire_spine_partial_failure_leaves_no_stale_state(
     assert liveness_tasks == []
     assert app.state.spine_repo is None
     assert app.state.spine_adapter_registry is None
+    assert app.state.spine_writer is None
+    assert app.state.spine_rollups is None
+    assert app.state.spine_leases is None
     assert not any(getattr(r, "path", "").startswith("/api/spine") for r in app.routes)
@@ -202,3 +202,72 @@ async def test_middleware_without_repo_reraises_handler_exception() -> None:
             await client.get("/boom")
     # If the None-guard had been broken, we'd have seen AttributeError
     # surfaced from inside middleware.record_event(...) on a None repo.
+
+
+@pytest.mark.asyncio
+async def test_streamed_response_duration_covers_the_whole_body() -> None:
+    """Duration runs to the final body message, not to the response headers."""
+    import asyncio
+
+    from fastapi.responses import StreamingResponse
+
+    repo = AsyncMock()
+    app = FastAPI()
+    app.add_middleware(SpineWorkloadMiddleware, repo=repo, segment_id="backend_api")
+
+    async def _chunks():
+        for i in range(3):
+            await asyncio.sleep(0.03)
+            yield f"data: {i}\n\n"
+
+    @app.get("/stream")
+    async def _stream() -> StreamingResponse:
+        return StreamingResponse(_chunks(), media_type="text/event-stream")
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/stream")
+
+    assert response.text.count("data:") == 3
+    event = repo.record_event.call_args.args[0]
+    assert event.root.payload.outcome == "success"
+    assert event.root.payload.duration_ms >= 90
+
+
+@pytest.mark.asyncio
+async def test_event_is_recorded_after_the_final_body_message() -> None:
+    order: list[str] = []
+    repo = AsyncMock()
+    repo.record_event.side_effect = lambda event: order.append("record")
+
+    async def _app(scope, receive, send) -> None:
+        await send({"type": "http.response.start", "status": 503, "headers": []})
+        await send({"type": "http.response.body", "body": b"a", "more_body": True})
+        await send({"type": "http.response.body", "body": b"b"})
+
+    async def _send(message) -> None:
+        order.append(message["type"])
+
+    middleware = SpineWorkloadMiddleware(_app, repo=repo)
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/x",
+        "headers": [],
+        "query_string": b"",
+        "app": FastAPI(),
+    }
+    await middleware(scope, AsyncMock(), _send)
+
+    assert order == [
+        "http.response.start",
+        "http.response.body",
+        "http.response.body",
+        "record",
+    ]
+    event = repo.record_event.call_args.args[0]
+    assert (event.root.payload.outcome, event.root.payload.error_class) == (
+        "failure",
+        "HTTP_503",
+    )
@@ -1,5 +1,7 @@
 """Tests for spine Pydantic models."""
 
+from datetime import UTC, datetime
+
 import pytest
 from pydantic import ValidationError
 
@@ -11,6 +13,9 @@ from second_brain.spine.models import (
     SegmentStatusResponse,
     StatusBoardResponse,
     WorkloadPayload,
+    epoch_ms,
+    from_epoch_ms,
+    row_epoch_ms,
 )
 
 
@@ -122,3 +127,15 @@ def test_status_response_envelope_present() -> None:
     serialized = response.model_dump()
     assert "envelope" in serialized
     assert "generated_at" in serialized["envelope"]
+
+
+def test_epoch_ms_round_trips_and_treats_naive_as_utc() -> None:
+    aware = datetime(2026, 4, 14, 12, 0, 0, 123000, tzinfo=UTC)
+    assert epoch_ms(aware) == 1776168000123
+    assert epoch_ms(aware.replace(tzinfo=None)) == 1776168000123
+    assert from_epoch_ms(epoch_ms(aware)) == aware
+
+
+def test_row_epoch_ms_falls_back_to_iso_timestamp_for_legacy_rows() -> None:
+    assert row_epoch_ms({"ts_ms": 5, "timestamp": "2026-04-14T12:00:00Z"}) == 5
+    assert row_epoch_ms({"timestamp": "2026-04-14T12:00:00Z"}) == 1776168000000
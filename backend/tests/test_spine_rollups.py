@@ -0,0 +1,299 @@
+"""Tests for spine workload rollups (aggregator, repository merge, API)."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from azure.cosmos.exceptions import (
+    CosmosAccessConditionFailedError,
+    CosmosResourceNotFoundError,
+)
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from second_brain.spine.api import build_spine_router
+from second_brain.spine.models import parse_cosmos_ts
+from second_brain.spine.rollups import (
+    ALL_OPERATIONS,
+    WorkloadRollupAggregator,
+    bucket_start,
+    empty_bucket,
+    merge_bucket,
+)
+from second_brain.spine.storage import SpineRepository
+
+T0 = datetime(2026, 4, 14, 12, 0, tzinfo=UTC)
+
+
+def _row(
+    seconds: float,
+    outcome: str = "success",
+    duration_ms: int = 10,
+    operation: str = "POST /api/capture",
+    segment_id: str = "backend_api",
+) -> dict[str, Any]:
+    return {
+        "id": f"e{seconds}",
+        "segment_id": segment_id,
+        "event_type": "workload",
+        "timestamp": (T0 + timedelta(seconds=seconds)).isoformat(),
+        "payload": {
+            "operation": operation,
+            "outcome": outcome,
+            "duration_ms": duration_ms,
+        },
+    }
+
+
+class _MemoryRollupRepo:
+    """In-memory stand-in for the SpineRepository rollup methods."""
+
+    def __init__(self) -> None:
+        self.docs: dict[str, dict[str, Any]] = {}
+        self.fail_merges = False
+
+    async def merge_rollup_buckets(self, deltas: list[dict]) -> list[dict]:
+        if self.fail_merges:
+            return list(deltas)
+        for delta in deltas:
+            current = self.docs.get(delta["id"])
+            self.docs[delta["id"]] = (
+                merge_bucket(dict(current), delta) if current else dict(delta)
+            )
+        return []
+
+    async def get_rollups(self, segment_id, granularity, start, end, operation=None):
+        return [
+            d
+            for d in self.docs.values()
+            if d["segment_id"] == segment_id
+            and d["granularity"] == granularity
+            and start.isoformat() <= d["bucket_start"] < end.isoformat()
+            and (operation is None or d["operation"] == operation)
+        ]
+
+    def doc(self, granularity: str, operation: str, start: datetime) -> dict:
+        return self.docs[f"{granularity}:backend_api:{operation}:{start.isoformat()}"]
+
+
+def test_bucket_start_floors_to_granularity() -> None:
+    ts = datetime(2026, 4, 14, 12, 34, 56, tzinfo=UTC)
+    assert bucket_start(ts, "minute") == datetime(2026, 4, 14, 12, 34, tzinfo=UTC)
+    assert bucket_start(ts, "hour") == datetime(2026, 4, 14, 12, tzinfo=UTC)
+    assert bucket_start(ts, "day") == datetime(2026, 4, 14, tzinfo=UTC)
+
+
+async def test_observe_and_flush_builds_minute_hour_and_day_buckets() -> None:
+    repo = _MemoryRollupRepo()
+    agg = WorkloadRollupAggregator(repo)  # type: ignore[arg-type]
+    agg.observe(_row(5, "success", 10))
+    agg.observe(_row(20, "failure", 40))
+    agg.observe(_row(65, "degraded", 25))
+    agg.observe(_row(70, operation="GET /api/inbox"))
+    agg.observe({"segment_id": "backend_api", "event_type": "liveness"})
+    await agg.flush()
+
+    minute = repo.doc("minute", ALL_OPERATIONS, T0)
+    assert (minute["count"], minute["failures"], minute["duration_ms_max"]) == (
+        2,
+        1,
+        40,
+    )
+    capture = repo.doc("minute", "POST /api/capture", T0 + timedelta(minutes=1))
+    assert (capture["count"], capture["degraded"]) == (1, 1)
+
+    hour = repo.doc("hour", ALL_OPERATIONS, T0)
+    assert (hour["count"], hour["failures"], hour["degraded"]) == (4, 1, 1)
+    assert repo.doc("hour", "GET /api/inbox", T0)["count"] == 1
+    assert repo.doc("day", ALL_OPERATIONS, bucket_start(T0, "day"))["count"] == 4
+    assert agg.pending_buckets == 0
+
+
+async def test_second_flush_adds_to_existing_buckets() -> None:
+    repo = _MemoryRollupRepo()
+    agg = WorkloadRollupAggregator(repo)  # type: ignore[arg-type]
+    agg.observe(_row(5))
+    await agg.flush()
+    agg.observe(_row(10))
+    agg.observe(_row(3600 + 5))  # next hour
+    await agg.flush()
+
+    assert repo.doc("minute", ALL_OPERATIONS, T0)["count"] == 2
+    assert repo.doc("hour", ALL_OPERATIONS, T0)["count"] == 2
+    assert repo.doc("hour", ALL_OPERATIONS, T0 + timedelta(hours=1))["count"] == 1
+    assert repo.doc("day", ALL_OPERATIONS, bucket_start(T0, "day"))["count"] == 3
+
+
+async def test_failed_merge_keeps_deltas_pending() -> None:
+    repo = _MemoryRollupRepo()
+    repo.fail_merges = True
+    agg = WorkloadRollupAggregator(repo)  # type: ignore[arg-type]
+    agg.observe(_row(5))
+    await agg.flush()
+    assert agg.pending_buckets == 6  # minute/hour/day x (operation, ALL)
+
+    repo.fail_merges = False
+    agg.observe(_row(6))
+    await agg.flush()
+    assert repo.doc("minute", ALL_OPERATIONS, T0)["count"] == 2
+
+
+async def test_late_event_increments_old_buckets_instead_of_rebuilding() -> None:
+    repo = _MemoryRollupRepo()
+    day = bucket_start(T0, "day")
+    # Minute buckets of this hour have expired; only hour and day remain.
+    for granularity, start in (("hour", T0), ("day", day)):
+        stored = empty_bucket(granularity, "backend_api", ALL_OPERATIONS, start)
+        repo.docs[stored["id"]] = merge_bucket(stored, {"count": 500, "failures": 5})
+    agg = WorkloadRollupAggregator(repo)  # type: ignore[arg-type]
+    agg.observe(_row(5, "failure"))  # backdated into that hour
+    await agg.flush()
+
+    assert repo.doc("hour", ALL_OPERATIONS, T0)["count"] == 501
+    assert repo.doc("day", ALL_OPERATIONS, day)["failures"] == 6
+    assert repo.doc("minute", ALL_OPERATIONS, T0)["count"] == 1
+
+
+async def test_close_flushes_pending_buckets() -> None:
+    repo = _MemoryRollupRepo()
+    agg = WorkloadRollupAggregator(repo, flush_interval_seconds=3600)  # type: ignore[arg-type]
+    agg.start()
+    agg.observe(_row(5))
+    await agg.close()
+    assert repo.doc("minute", ALL_OPERATIONS, T0)["count"] == 1
+
+
+# ---------------------------------------------------------------------------
+# SpineRepository rollup methods
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def rollups_container() -> AsyncMock:
+    container = AsyncMock()
+    container.read_item.side_effect = CosmosResourceNotFoundError(
+        status_code=404, message="Not found"
+    )
+    return container
+
+
+@pytest.fixture
+def repo(rollups_container: AsyncMock) -> SpineRepository:
+    return SpineRepository(
+        AsyncMock(), AsyncMock(), AsyncMock(), AsyncMock(), rollups_container
+    )
+
+
+async def test_merge_rollup_buckets_creates_then_replaces_with_etag(
+    repo: SpineRepository, rollups_container: AsyncMock
+) -> None:
+    delta = merge_bucket(
+        empty_bucket("minute", "backend_api", "*", T0),
+        {"count": 2, "failures": 1, "duration_ms_sum": 30},
+    )
+    assert await repo.merge_rollup_buckets([delta]) == []
+    rollups_container.create_item.assert_awaited_once()
+
+    existing = {**delta, "_etag": "v1", "_rid": "r"}
+    rollups_container.read_item.side_effect = None
+    rollups_container.read_item.return_value = existing
+    assert await repo.merge_rollup_buckets([delta]) == []
+
+    kwargs = rollups_container.replace_item.call_args.kwargs
+    assert kwargs["etag"] == "v1"
+    assert kwargs["body"]["count"] == 4
+    assert "_etag" not in kwargs["body"]
+
+
+async def test_merge_rollup_buckets_reports_contended_deltas(
+    repo: SpineRepository, rollups_container: AsyncMock
+) -> None:
+    delta = empty_bucket("minute", "backend_api", "*", T0)
+    rollups_container.read_item.side_effect = None
+    rollups_container.read_item.return_value = {**delta, "_etag": "v1"}
+    rollups_container.replace_item.side_effect = CosmosAccessConditionFailedError(
+        status_code=412, message="Precondition failed"
+    )
+    assert await repo.merge_rollup_buckets([delta]) == [delta]
+
+
+async def test_get_rollups_is_single_partition(
+    repo: SpineRepository, rollups_container: AsyncMock
+) -> None:
+    async def _empty():
+        return
+        yield
+
+    rollups_container.query_items = MagicMock(return_value=_empty())
+    await repo.get_rollups(
+        "backend_api", "hour", T0, T0 + timedelta(days=1), operation="*"
+    )
+    kwargs = rollups_container.query_items.call_args.kwargs
+    assert kwargs["partition_key"] == "backend_api"
+    assert "c.operation = @operation" in kwargs["query"]
+
+
+# ---------------------------------------------------------------------------
+# GET /api/spine/segment/{id}/rollups
+# ---------------------------------------------------------------------------
+
+
+def _client(repo: AsyncMock) -> AsyncClient:
+    async def fake_auth() -> None:
+        return None
+
+    app = FastAPI()
+    app.include_router(
+        build_spine_router(
+            repo=repo,
+            evaluator=AsyncMock(),
+            adapter_registry=MagicMock(),
+            segment_registry=MagicMock(),
+            auth_dependency=fake_auth,
+        )
+    )
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+async def test_rollups_endpoint_zero_fills_missing_buckets() -> None:
+    now_minute = bucket_start(datetime.now(UTC), "minute")
+    stored = merge_bucket(
+        empty_bucket("minute", "backend_api", "*", now_minute),
+        {"count": 7, "failures": 2, "duration_ms_sum": 70},
+    )
+    repo = AsyncMock()
+    repo.get_rollups.return_value = [stored]
+
+    async with _client(repo) as client:
+        response = await client.get(
+            "/api/spine/segment/backend_api/rollups",
+            params={"granularity": "minute", "window_seconds": 600},
+        )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["operation"] == "*"
+    buckets = body["buckets"]
+    assert len(buckets) == 11
+    starts = [parse_cosmos_ts(b["bucket_start"]) for b in buckets]
+    assert starts == sorted(starts)
+    assert buckets[-1]["count"] == 7
+    assert buckets[-1]["failures"] == 2
+    assert all(b["count"] == 0 for b in buckets[:-1])
+
+    args = repo.get_rollups.call_args
+    assert args.args[:2] == ("backend_api", "minute")
+    assert args.kwargs["operation"] == "*"
+
+
+async def test_rollups_endpoint_rejects_too_many_buckets() -> None:
+    repo = AsyncMock()
+    async with _client(repo) as client:
+        response = await client.get(
+            "/api/spine/segment/backend_api/rollups",
+            params={"granularity": "minute", "window_seconds": 7 * 86400},
+        )
+    assert response.status_code == 400
+    repo.get_rollups.assert_not_called()
@@ -0,0 +1,128 @@
+"""Tests for weighted sampling of workload events (spine.sampling)."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from second_brain.spine.evaluator import StatusEvaluator
+from second_brain.spine.middleware import SpineWorkloadMiddleware
+from second_brain.spine.registry import EvaluatorConfig, SegmentRegistry
+from second_brain.spine.rollups import WorkloadRollupAggregator
+from second_brain.spine.sampling import WorkloadSampler
+
+NOW = datetime(2026, 4, 14, 12, 0, tzinfo=UTC)
+
+
+def _sampler(rate: float = 0.1, **kwargs) -> WorkloadSampler:
+    # rng always draws the "drop" side, so only forced keeps survive.
+    return WorkloadSampler(default_rate=rate, rng=lambda: 0.99, **kwargs)
+
+
+def test_rate_becomes_whole_weight_and_overrides_win() -> None:
+    sampler = WorkloadSampler(
+        default_rate=0.3, rates={"seg": 0.5, "seg GET /health": 0.01}
+    )
+    assert sampler.weight_for("other", "GET /x") == 3
+    assert sampler.weight_for("seg", "GET /x") == 2
+    assert sampler.weight_for("seg", "GET /health") == 100
+    with pytest.raises(ValueError):
+        WorkloadSampler(default_rate=0)
+    with pytest.raises(ValueError):
+        WorkloadSampler(rates={"seg": 0.0001})
+
+
+def test_failures_correlated_and_streak_reset_are_always_kept() -> None:
+    sampler = _sampler()
+    assert sampler.decide("seg", "GET /a", "success", correlated=False) is None
+    assert sampler.decide("seg", "GET /a", "success", correlated=True) == 1
+    assert sampler.decide("seg", "GET /a", "failure", correlated=False) == 1
+    # First success after a failure (any operation) resets the streak.
+    assert sampler.decide("seg", "GET /b", "success", correlated=False) == 1
+    assert sampler.decide("seg", "GET /b", "success", correlated=False) is None
+
+
+def test_kept_successes_carry_their_weight() -> None:
+    sampler = WorkloadSampler(default_rate=0.1, rng=lambda: 0.05)
+    assert sampler.decide("seg", "GET /a", "success", correlated=False) == 10
+
+
+def _weighted_rows(ago: float, outcome: str, weight: int = 1) -> dict:
+    payload = {"operation": "op", "outcome": outcome, "duration_ms": 10}
+    if weight != 1:
+        payload["sample_weight"] = weight
+    return {
+        "id": f"w{ago}",
+        "segment_id": "seg1",
+        "event_type": "workload",
+        "timestamp": (NOW - timedelta(seconds=ago)).isoformat(),
+        "payload": payload,
+    }
+
+
+async def test_evaluator_counts_are_weighted() -> None:
+    cfg = EvaluatorConfig(
+        segment_id="seg1",
+        liveness_interval_seconds=30,
+        host_segment=None,
+        workload_window_seconds=300,
+        yellow_thresholds={"workload_failure_rate": 0.10},
+        red_thresholds={"workload_failure_rate": 0.50},
+    )
+    repo = AsyncMock()
+    repo.get_latest_heartbeat.return_value = None
+    repo.get_recent_events.return_value = [
+        {**_weighted_rows(1, "success"), "event_type": "liveness", "payload": {}},
+        _weighted_rows(30, "success", weight=10),
+        _weighted_rows(20, "success", weight=10),
+        _weighted_rows(10, "failure"),
+    ]
+    result = await StatusEvaluator(
+        repo, SegmentRegistry([cfg]), now=lambda: NOW
+    ).evaluate("seg1")
+
+    # Unweighted this would read 1/3 failing (yellow); weighted it is 1/21.
+    assert result.evaluator_inputs["workload_total"] == 21
+    assert result.evaluator_inputs["workload_failures"] == 1
+    assert result.status == "green"
+    assert result.latency_sketches["*"]["n"] == 21
+
+
+def test_rollups_scale_by_weight() -> None:
+    rollups = WorkloadRollupAggregator(repo=AsyncMock())
+    rollups.observe(_weighted_rows(5, "success", weight=10))
+    rollups.observe(_weighted_rows(4, "failure"))
+    bucket = next(b for b in rollups._pending.values() if b["operation"] == "*")
+    assert (bucket["count"], bucket["failures"], bucket["duration_ms_sum"]) == (
+        11,
+        1,
+        110,
+    )
+
+
+async def test_middleware_drops_sampled_out_requests() -> None:
+    app = FastAPI()
+    repo = AsyncMock()
+    repo.get_latest_heartbeat.return_value = None
+    app.add_middleware(
+        SpineWorkloadMiddleware, repo=repo, segment_id="backend_api", sampler=_sampler()
+    )
+
+    @app.get("/poll")
+    async def poll() -> dict:
+        return {"ok": True}
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        await client.get("/poll")
+        await client.get("/poll", headers={"X-Trace-Id": "t1"})
+
+    repo.record_event.assert_called_once()
+    payload = repo.record_event.call_args.args[0].root.payload
+    assert payload.correlation_id == "t1"
+    assert payload.sample_weight == 1
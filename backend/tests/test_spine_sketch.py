@@ -0,0 +1,69 @@
+"""Tests for the DDSketch latency sketch."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from second_brain.spine.sketch import LatencySketch, latency_inputs
+
+
+def _exact(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+@pytest.mark.parametrize("q", [0.5, 0.9, 0.95, 0.99])
+def test_quantiles_within_relative_accuracy(q: float) -> None:
+    rng = random.Random(7)
+    values = [rng.lognormvariate(5, 1.2) for _ in range(5000)]
+    sketch = LatencySketch(relative_accuracy=0.01)
+    for v in values:
+        sketch.add(v)
+    expected = _exact(values, q)
+    assert sketch.quantile(q) == pytest.approx(expected, rel=0.01)
+
+
+def test_merge_equals_single_sketch_over_union() -> None:
+    a, b, union = LatencySketch(), LatencySketch(), LatencySketch()
+    for v in range(1, 500):
+        (a if v % 2 else b).add(v)
+        union.add(v)
+    a.merge(b)
+    assert a.to_dict() == union.to_dict()
+
+
+def test_remove_undoes_add_exactly() -> None:
+    sketch, reference = LatencySketch(), LatencySketch()
+    for v in (0, 3, 120, 120, 4500):
+        sketch.add(v)
+    for v in (3, 4500):
+        reference.add(v)
+    for v in (0, 120, 120):
+        sketch.remove(v)
+    assert sketch.to_dict() == reference.to_dict()
+
+
+def test_round_trip_and_zero_durations() -> None:
+    sketch = LatencySketch()
+    for v in (0, 0, 12, 15, 900):
+        sketch.add(v)
+    restored = LatencySketch.from_dict(sketch.to_dict())
+    assert restored.to_dict() == sketch.to_dict()
+    assert restored.quantile(0.0) == 0.0
+    assert restored.quantile(1.0) == pytest.approx(900, rel=0.01)
+
+
+def test_merge_rejects_mismatched_accuracy() -> None:
+    with pytest.raises(ValueError):
+        LatencySketch(0.01).merge(LatencySketch(0.02))
+
+
+def test_latency_inputs_for_empty_sketch() -> None:
+    assert latency_inputs(None) == {
+        "latency_p50_ms": None,
+        "latency_p95_ms": None,
+        "latency_p99_ms": None,
+    }
+    assert latency_inputs(LatencySketch())["latency_p95_ms"] is None
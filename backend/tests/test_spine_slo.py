@@ -0,0 +1,218 @@
+"""Tests for the SLO error-budget burn-rate engine."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from second_brain.spine.api import build_spine_router
+from second_brain.spine.registry import (
+    EvaluatorConfig,
+    SegmentRegistry,
+    SloObjective,
+)
+from second_brain.spine.rollups import (
+    ALL_OPERATIONS,
+    WorkloadRollupAggregator,
+    empty_bucket,
+)
+from second_brain.spine.slo import SloEngine
+
+NOW = datetime(2026, 4, 14, 12, 0, 30, tzinfo=UTC)
+
+
+def _registry() -> SegmentRegistry:
+    return SegmentRegistry(
+        [
+            EvaluatorConfig(
+                segment_id="seg1",
+                display_name="Segment One",
+                liveness_interval_seconds=30,
+                host_segment=None,
+                slo=SloObjective(target=0.99),
+            ),
+            EvaluatorConfig(
+                segment_id="no_slo", liveness_interval_seconds=30, host_segment=None
+            ),
+        ]
+    )
+
+
+def _bucket(granularity: str, start: datetime, count: int, failures: int) -> dict:
+    bucket = empty_bucket(granularity, "seg1", ALL_OPERATIONS, start)
+    bucket.update(count=count, failures=failures)
+    return bucket
+
+
+def _rollups_repo(minutes: list[dict], hours: list[dict]) -> AsyncMock:
+    repo = AsyncMock()
+
+    async def _get_rollups(segment_id, granularity, start, end, operation=None):
+        assert operation == ALL_OPERATIONS
+        return minutes if granularity == "minute" else hours
+
+    repo.get_rollups.side_effect = _get_rollups
+    return repo
+
+
+def _workload(ago: float, outcome: str, weight: int = 1) -> dict:
+    payload = {"operation": "op", "outcome": outcome, "duration_ms": 5}
+    if weight != 1:
+        payload["sample_weight"] = weight
+    return {
+        "segment_id": "seg1",
+        "event_type": "workload",
+        "timestamp": (NOW - timedelta(seconds=ago)).isoformat(),
+        "payload": payload,
+    }
+
+
+def test_slo_objective_validates_target_and_period() -> None:
+    with pytest.raises(ValueError, match="target"):
+        SloObjective(target=1.0)
+    with pytest.raises(ValueError, match="whole number of hours"):
+        SloObjective(target=0.99, period_seconds=3600)
+    assert SloObjective(target=0.99).error_budget == pytest.approx(0.01)
+
+
+@pytest.mark.asyncio
+async def test_report_combines_rollup_seed_with_observed_rows() -> None:
+    minute = datetime(2026, 4, 14, 11, 30, tzinfo=UTC)
+    old_minute = datetime(2026, 4, 14, 8, 0, tzinfo=UTC)
+    hour = datetime(2026, 4, 14, 11, 0, tzinfo=UTC)
+    old_hour = datetime(2026, 3, 30, 0, 0, tzinfo=UTC)
+    repo = _rollups_repo(
+        minutes=[
+            _bucket("minute", minute, 100, 2),
+            _bucket("minute", old_minute, 50, 5),
+        ],
+        hours=[_bucket("hour", hour, 100, 2), _bucket("hour", old_hour, 850, 1)],
+    )
+    engine = SloEngine(repo, _registry(), now=lambda: NOW)
+
+    await engine.report("seg1")
+    engine.observe(_workload(10, "failure", weight=10))
+    engine.observe(_workload(5, "degraded"))
+    report = await engine.report("seg1")
+
+    by_window = {r.window_seconds: r for r in report.burn_rates}
+    assert (by_window[3600].total, by_window[3600].failures) == (111, 12)
+    assert (by_window[21600].total, by_window[21600].failures) == (161, 17)
+    assert (by_window[2592000].total, by_window[2592000].failures) == (961, 13)
+    assert by_window[3600].burn_rate == pytest.approx(12 / 111 / 0.01)
+    assert report.budget_remaining == pytest.approx(1 - (13 / 961) / 0.01)
+    assert report.name == "Segment One"
+    assert repo.get_rollups.await_count == 2  # seeded once, no raw-event scan
+
+
+@pytest.mark.asyncio
+async def test_idle_segment_has_full_budget_and_resyncs_on_interval() -> None:
+    clock = {"now": NOW}
+    repo = _rollups_repo([], [])
+    engine = SloEngine(
+        repo, _registry(), now=lambda: clock["now"], resync_interval_seconds=60
+    )
+
+    report = await engine.report("seg1")
+    assert report.budget_remaining == 1.0
+    assert all(r.burn_rate == 0.0 for r in report.burn_rates)
+
+    clock["now"] = NOW + timedelta(seconds=61)
+    await engine.report("seg1")
+    assert repo.get_rollups.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_rows_observed_during_rebuild_are_replayed() -> None:
+    gate = asyncio.Event()
+    repo = AsyncMock()
+
+    async def _slow_rollups(*args, **kwargs) -> list[dict]:
+        await gate.wait()
+        return []
+
+    repo.get_rollups.side_effect = _slow_rollups
+    engine = SloEngine(repo, _registry(), now=lambda: NOW)
+
+    task = asyncio.create_task(engine.report("seg1"))
+    await asyncio.sleep(0)
+    engine.observe(_workload(1, "failure"))
+    gate.set()
+    report = await task
+    assert report.burn_rates[0].failures == 1
+
+
+@pytest.mark.asyncio
+async def test_rebuild_adds_unflushed_rollup_deltas_and_holds_off_flushes() -> None:
+    minute = datetime(2026, 4, 14, 12, 0, tzinfo=UTC)
+    repo = _rollups_repo([_bucket("minute", minute, 10, 1)], [])
+    repo.merge_rollup_buckets.return_value = []
+    gate = asyncio.Event()
+    seeded = repo.get_rollups.side_effect
+
+    async def _slow_rollups(*args, **kwargs) -> list[dict]:
+        await gate.wait()
+        return await seeded(*args, **kwargs)
+
+    repo.get_rollups.side_effect = _slow_rollups
+    rollups = WorkloadRollupAggregator(repo)
+    engine = SloEngine(repo, _registry(), now=lambda: NOW, rollups=rollups)
+    for row in (_workload(20, "failure"), _workload(10, "success")):
+        rollups.observe(row)
+        engine.observe(row)
+
+    task = asyncio.create_task(engine.report("seg1"))
+    await asyncio.sleep(0)
+    flush = asyncio.create_task(rollups.flush())
+    late = _workload(1, "failure", weight=5)
+    rollups.observe(late)
+    engine.observe(late)
+    await asyncio.sleep(0)
+    assert repo.merge_rollup_buckets.await_count == 0  # held off by the rebuild
+    gate.set()
+    report = await task
+    await flush
+
+    by_window = {r.window_seconds: r for r in report.burn_rates}
+    assert (by_window[3600].total, by_window[3600].failures) == (17, 7)
+    # The hour seed is empty; the pending hour delta alone fills it.
+    assert by_window[2592000].total == 7
+    assert rollups.pending_deltas("seg1", "hour") == []
+
+
+@pytest.mark.asyncio
+async def test_slo_endpoint_lists_declared_segments_and_404s_others() -> None:
+    app = FastAPI()
+
+    async def _no_auth() -> None:
+        return None
+
+    app.include_router(
+        build_spine_router(
+            repo=AsyncMock(),
+            evaluator=AsyncMock(),
+            adapter_registry=AsyncMock(),
+            segment_registry=_registry(),
+            auth_dependency=_no_auth,
+            slo_engine=SloEngine(_rollups_repo([], []), _registry()),
+        )
+    )
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+        board = await c.get("/api/spine/slo")
+        one = await c.get("/api/spine/slo", params={"segment_id": "seg1"})
+        missing = await c.get("/api/spine/slo", params={"segment_id": "no_slo"})
+
+    assert board.status_code == 200
+    assert [s["segment_id"] for s in board.json()["segments"]] == ["seg1"]
+    assert [r["window_seconds"] for r in one.json()["segments"][0]["burn_rates"]] == [
+        3600,
+        21600,
+        2592000,
+    ]
+    assert missing.status_code == 404
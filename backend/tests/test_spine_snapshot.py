@@ -0,0 +1,186 @@
+"""Tests for the in-memory status snapshot, its SSE stream, and /status caching."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from second_brain.spine.api import build_spine_router
+from second_brain.spine.background import evaluator_loop
+from second_brain.spine.snapshot import StatusSnapshot, status_change_events
+
+
+def _state(segment_id: str, status: str = "green", headline: str = "ok") -> dict:
+    return {
+        "id": segment_id,
+        "segment_id": segment_id,
+        "status": status,
+        "headline": headline,
+        "last_updated": datetime.now(UTC).isoformat(),
+        "evaluator_inputs": {},
+    }
+
+
+def test_version_bumps_only_when_status_or_headline_changes() -> None:
+    snap = StatusSnapshot()
+    snap.update(_state("a"))
+    v1 = snap.version
+    snap.update(_state("a"))  # same status/headline, new last_updated
+    assert snap.version == v1
+    snap.update(_state("a", "red", "3 consecutive failures"))
+    assert snap.version == v1 + 1
+
+
+def test_etag_depends_on_board_content_not_version() -> None:
+    ours, theirs = StatusSnapshot(), StatusSnapshot()
+    ours.update(_state("a"))
+    ours.update(_state("b", "red", "down"))
+    theirs.update(_state("b", "yellow", "slow"))  # different history
+    theirs.update(_state("b", "red", "down"))
+    theirs.update(_state("a"))
+    assert ours.version != theirs.version
+    assert ours.etag == theirs.etag
+
+    theirs.update(_state("a", "yellow", "slow"))
+    assert ours.etag != theirs.etag
+
+
+async def test_publish_drops_oldest_for_slow_subscriber() -> None:
+    snap = StatusSnapshot(subscriber_queue_size=2)
+    async with snap.subscribe() as queue:
+        for i in range(3):
+            snap.publish({"n": i})
+        assert [queue.get_nowait()["n"] for _ in range(2)] == [1, 2]
+    assert snap.subscriber_count == 0
+
+
+async def test_status_change_events_frames() -> None:
+    snap = StatusSnapshot()
+    stream = status_change_events(snap, keepalive_seconds=0.01)
+    first = await anext(stream)
+    assert first.startswith("event: snapshot\n")
+    assert await anext(stream) == ": keepalive\n\n"
+
+    snap.publish({"segment_id": "a", "status": "red", "prev_status": "green"})
+    frame = await anext(stream)
+    assert frame.startswith("event: status_change\n")
+    data = json.loads(frame.split("data: ", 1)[1])
+    assert (data["segment_id"], data["status"]) == ("a", "red")
+    await stream.aclose()
+    assert snap.subscriber_count == 0
+
+
+class _Repo:
+    def __init__(self, primed: list[dict]) -> None:
+        self.primed = primed
+        self.point_reads = 0
+        self.transitions: list[dict] = []
+
+    async def get_all_segment_states(self) -> list[dict]:
+        return self.primed
+
+    async def get_segment_state(self, segment_id: str) -> dict | None:
+        self.point_reads += 1
+        return None
+
+    async def upsert_segment_state(self, **kwargs) -> dict:
+        return _state(kwargs["segment_id"], kwargs["status"], kwargs["headline"])
+
+    async def record_status_change(self, **kwargs) -> dict:
+        self.transitions.append(kwargs)
+        return {"segment_id": kwargs["segment_id"], "status": kwargs["status"]}
+
+
+async def test_evaluator_loop_primes_updates_and_publishes() -> None:
+    repo = _Repo(primed=[_state("a", "green")])
+    evaluator = AsyncMock()
+    evaluator.evaluate.return_value = SimpleNamespace(
+        status="red", headline="down", evaluator_inputs={}, latency_sketches={}
+    )
+    registry = MagicMock()
+    registry.all.return_value = [SimpleNamespace(segment_id="a")]
+    snap = StatusSnapshot()
+
+    async with snap.subscribe() as queue:
+        task = asyncio.create_task(
+            evaluator_loop(
+                evaluator, repo, registry, interval_seconds=3600, snapshot=snap
+            )
+        )
+        transition = await asyncio.wait_for(queue.get(), 1)
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    assert snap.loaded
+    assert transition == {"segment_id": "a", "status": "red"}
+    assert repo.transitions[0]["prev_status"] == "green"
+    assert repo.point_reads == 0  # prev status came from the primed snapshot
+    assert snap.get("a")["status"] == "red"
+
+
+def _client(repo: AsyncMock, snapshot: StatusSnapshot | None) -> AsyncClient:
+    async def fake_auth() -> None:
+        return None
+
+    registry = MagicMock()
+    cfg = MagicMock(segment_id="a", host_segment=None)
+    cfg.name_or_id.return_value = "A"
+    registry.all.return_value = [cfg]
+    app = FastAPI()
+    app.include_router(
+        build_spine_router(
+            repo=repo,
+            evaluator=AsyncMock(),
+            adapter_registry=MagicMock(),
+            segment_registry=registry,
+            auth_dependency=fake_auth,
+            snapshot=snapshot,
+        )
+    )
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+async def test_status_served_from_snapshot_with_etag() -> None:
+    repo = AsyncMock()
+    snap = StatusSnapshot()
+    snap.update(_state("a", "yellow", "slow"))
+    snap.mark_loaded()
+
+    async with _client(repo, snap) as client:
+        first = await client.get("/api/spine/status")
+        etag = first.headers["ETag"]
+        cached = await client.get("/api/spine/status", headers={"If-None-Match": etag})
+        snap.update(_state("a", "red", "down"))
+        changed = await client.get("/api/spine/status", headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert first.json()["segments"][0]["status"] == "yellow"
+    assert cached.status_code == 304
+    assert changed.status_code == 200
+    assert changed.json()["segments"][0]["status"] == "red"
+    assert changed.headers["ETag"] != etag
+    repo.get_all_segment_states.assert_not_called()
+
+
+async def test_status_falls_back_to_cosmos_until_snapshot_loaded() -> None:
+    repo = AsyncMock()
+    repo.get_all_segment_states.return_value = [_state("a")]
+    async with _client(repo, StatusSnapshot()) as client:
+        response = await client.get("/api/spine/status")
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
+    repo.get_all_segment_states.assert_awaited_once()
+
+
+async def test_status_stream_requires_snapshot() -> None:
+    async with _client(AsyncMock(), None) as client:
+        response = await client.get("/api/spine/status/stream")
+    assert response.status_code == 503
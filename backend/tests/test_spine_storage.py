@@ -5,24 +5,35 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from azure.cosmos.exceptions import (
+    CosmosAccessConditionFailedError,
     CosmosHttpResponseError,
     CosmosResourceNotFoundError,
 )
 
+from second_brain.spine.encoding import decode_event, encode_event
 from second_brain.spine.models import (
     IngestEvent,
 )
-from second_brain.spine.storage import SpineRepository
+from second_brain.spine.storage import (
+    SpineRepository,
+    build_event_documents,
+    merge_correlation_summary,
+)
 
 
 @pytest.fixture
 def mock_containers() -> dict[str, AsyncMock]:
     """Four mocked Cosmos container clients."""
+    correlation = AsyncMock()
+    # No correlation summary exists yet unless a test says otherwise.
+    correlation.read_item.side_effect = CosmosResourceNotFoundError(
+        status_code=404, message="Not found"
+    )
     return {
         "events": AsyncMock(),
         "segment_state": AsyncMock(),
         "status_history": AsyncMock(),
-        "correlation": AsyncMock(),
+        "correlation": correlation,
     }
 
 
@@ -175,6 +186,35 @@ async def test_get_recent_events_queries_by_segment_and_window(
     assert len(events) == 1
 
 
+@pytest.mark.asyncio
+async def test_get_events_written_since_filters_on_cosmos_write_time(
+    repo: SpineRepository, mock_containers: dict[str, AsyncMock]
+) -> None:
+    async def async_iter():
+        yield {"segment_id": "backend_api", "event_type": "workload", "_ts": 1700}
+
+    mock_containers["events"].query_items = MagicMock(return_value=async_iter())
+    events = await repo.get_events_written_since("backend_api", since_ts=1700)
+    assert events[0]["_ts"] == 1700
+    kwargs = mock_containers["events"].query_items.call_args.kwargs
+    assert "c._ts >= @since" in kwargs["query"]
+    assert {"name": "@since", "value": 1700} in kwargs["parameters"]
+    assert kwargs["partition_key"] == "backend_api"
+
+
+@pytest.mark.asyncio
+async def test_get_oldest_write_ts_skips_derived_documents(
+    repo: SpineRepository, mock_containers: dict[str, AsyncMock]
+) -> None:
+    async def async_iter():
+        yield 1700
+
+    mock_containers["events"].query_items = MagicMock(return_value=async_iter())
+    assert await repo.get_oldest_write_ts("events") == 1700
+    query = mock_containers["events"].query_items.call_args.kwargs["query"]
+    assert "NOT IS_DEFINED(c.doc_type)" in query
+
+
 @pytest.mark.asyncio
 async def test_get_correlation_events_queries_correlation_container(
     repo: SpineRepository, mock_containers: dict[str, AsyncMock]
@@ -198,6 +238,52 @@ async def test_get_correlation_events_queries_correlation_container(
     assert events[0]["segment_id"] == "backend_api"
 
 
+@pytest.mark.asyncio
+async def test_get_correlation_events_for_ids_splits_rows_in_one_query(
+    repo: SpineRepository, mock_containers: dict[str, AsyncMock]
+) -> None:
+    rows = [
+        {"correlation_id": "t-2", "segment_id": "classifier", "timestamp": "2"},
+        {"correlation_id": "t-1", "segment_id": "backend_api", "timestamp": "3"},
+        {"correlation_id": "t-1", "doc_type": "correlation_summary"},
+        {"correlation_id": "t-1", "segment_id": "mobile_capture", "timestamp": "1"},
+    ]
+
+    async def async_iter():
+        for item in rows:
+            yield item
+
+    mock_containers["correlation"].query_items = MagicMock(return_value=async_iter())
+    by_id = await repo.get_correlation_events_for_ids("capture", ["t-1", "t-2", "t-3"])
+
+    mock_containers["correlation"].query_items.assert_called_once()
+    kwargs = mock_containers["correlation"].query_items.call_args.kwargs
+    assert kwargs["partition_key"] == "capture"
+    assert {"name": "@cids", "value": ["t-1", "t-2", "t-3"]} in kwargs["parameters"]
+    assert [r["segment_id"] for r in by_id["t-1"]] == ["mobile_capture", "backend_api"]
+    assert [r["segment_id"] for r in by_id["t-2"]] == ["classifier"]
+    assert by_id["t-3"] == []
+
+
+@pytest.mark.asyncio
+async def test_get_workload_events_for_correlations_groups_by_id(
+    repo: SpineRepository, mock_containers: dict[str, AsyncMock]
+) -> None:
+    async def async_iter():
+        yield {"segment_id": "backend_api", "correlation_id": "t-1"}
+        yield {"segment_id": "classifier", "correlation_id": "t-2"}
+
+    mock_containers["events"].query_items = MagicMock(return_value=async_iter())
+    by_id = await repo.get_workload_events_for_correlations(["t-1", "t-2"], 3600)
+
+    assert by_id == {
+        "t-1": [{"segment_id": "backend_api"}],
+        "t-2": [{"segment_id": "classifier"}],
+    }
+    query = mock_containers["events"].query_items.call_args.kwargs["query"]
+    assert "ARRAY_CONTAINS(@cids, c.payload.correlation_id)" in query
+
+
 # ---------------------------------------------------------------------------
 # Phase 19.2-03: transaction-ledger read paths
 # ---------------------------------------------------------------------------
@@ -248,7 +334,7 @@ async def test_get_recent_transaction_events_filters_to_correlated_workload_rows
         ]:
             yield item
 
-    def fake_query(*, query: str, parameters: list) -> object:
+    def fake_query(*, query: str, parameters: list, partition_key: str) -> object:
         captured["query"] = query
         captured["parameters"] = parameters
         return async_iter()
@@ -262,7 +348,7 @@ async def test_get_recent_transaction_events_filters_to_correlated_workload_rows
     assert "c.event_type = 'workload'" in captured["query"]
     assert "IS_DEFINED(c.payload.correlation_kind)" in captured["query"]
     assert "IS_DEFINED(c.payload.correlation_id)" in captured["query"]
-    assert "ORDER BY c.timestamp DESC" in captured["query"]
+    assert "ORDER BY c.ts_ms DESC" in captured["query"]
     # Verify parameters (segment_id + cutoff)
     param_names = {p["name"] for p in captured["parameters"]}
     assert "@sid" in param_names
@@ -277,7 +363,7 @@ async def test_get_recent_transaction_events_orders_desc(
     sequence preserves DESC when Cosmos honors the ORDER BY clause."""
 
     async def async_iter():
-        # Emulate Cosmos honoring ORDER BY c.timestamp DESC
+        # Emulate Cosmos honoring ORDER BY c.ts_ms DESC
         for item in [
             _workload_row("backend_api", "2026-04-14T12:00:03Z"),
             _workload_row("backend_api", "2026-04-14T12:00:02Z"),
@@ -313,14 +399,14 @@ async def test_get_recent_transaction_events_respects_limit(
 async def test_get_recent_transaction_events_honors_cutoff(
     repo: SpineRepository, mock_containers: dict[str, AsyncMock]
 ) -> None:
-    """The cutoff parameter must be an ISO timestamp computed from window_seconds."""
+    """The cutoff parameter must be epoch ms computed from window_seconds."""
     captured: dict = {}
 
     async def async_iter():
         if False:
             yield {}  # pragma: no cover
 
-    def fake_query(*, query: str, parameters: list) -> object:
+    def fake_query(*, query: str, parameters: list, partition_key: str) -> object:
         captured["parameters"] = {p["name"]: p["value"] for p in parameters}
         return async_iter()
 
@@ -328,7 +414,7 @@ async def test_get_recent_transaction_events_honors_cutoff(
     await repo.get_recent_transaction_events("backend_api", window_seconds=60)
     cutoff = captured["parameters"]["@cutoff"]
     # Round-trip parse should succeed; window is 60s — cutoff is recent
-    parsed = datetime.fromisoformat(cutoff)
+    parsed = datetime.fromtimestamp(cutoff / 1000, UTC)
     now = datetime.now(UTC)
     delta = (now - parsed).total_seconds()
     # Accept a tiny slack for execution time
@@ -397,3 +483,296 @@ async def test_get_workload_events_for_correlation_matches_kind_and_id(
     assert "c.event_type = 'workload'" in captured["query"]
     assert "c.payload.correlation_kind = @kind" in captured["query"]
     assert "c.payload.correlation_id = @cid" in captured["query"]
+
+
+# ---------------------------------------------------------------------------
+# Correlation index: denormalized rows + per-correlation summary
+# ---------------------------------------------------------------------------
+
+
+def _corr_event(segment_id: str, outcome: str = "success") -> IngestEvent:
+    return IngestEvent.model_validate(
+        {
+            "segment_id": segment_id,
+            "event_type": "workload",
+            "timestamp": "2026-04-14T12:00:00Z",
+            "payload": {
+                "operation": "POST /api/capture",
+                "outcome": outcome,
+                "duration_ms": 321,
+                "correlation_kind": "capture",
+                "correlation_id": "trace-1",
+                "error_class": None if outcome == "success" else "HTTP_500",
+            },
+        }
+    )
+
+
+def test_correlation_row_carries_denormalized_workload_fields() -> None:
+    _, corr = build_event_documents(_corr_event("backend_api", "failure"))
+    assert corr is not None
+    assert corr["operation"] == "POST /api/capture"
+    assert corr["outcome"] == "failure"
+    assert corr["duration_ms"] == 321
+    assert corr["error_class"] == "HTTP_500"
+
+
+def test_event_documents_carry_epoch_ms_timestamp() -> None:
+    body, corr = build_event_documents(_corr_event("backend_api"))
+    assert corr is not None
+    expected = int(datetime.fromisoformat(body["timestamp"]).timestamp() * 1000)
+    assert body["ts_ms"] == corr["ts_ms"] == expected
+
+
+def test_merge_correlation_summary_tracks_segments_and_gaps() -> None:
+    _, first = build_event_documents(_corr_event("backend_api"))
+    summary = merge_correlation_summary(None, [first])
+    assert summary["id"] == "capture:trace-1:summary"
+    assert summary["doc_type"] == "correlation_summary"
+    assert summary["segments_seen"] == ["backend_api"]
+    assert summary["missing_required"] == ["classifier", "mobile_capture"]
+    assert "timestamp" not in summary  # never matched by row range queries
+
+    _, second = build_event_documents(_corr_event("classifier"))
+    _, third = build_event_documents(_corr_event("mobile_capture"))
+    summary = merge_correlation_summary(summary, [second, third])
+    assert summary["missing_required"] == []
+    assert summary["event_count"] == 3
+    assert summary["segments"]["classifier"]["duration_ms"] == 321
+
+
+@pytest.mark.asyncio
+async def test_record_event_creates_summary_when_absent(
+    repo: SpineRepository, mock_containers: dict[str, AsyncMock]
+) -> None:
+    await repo.record_event(_corr_event("backend_api"))
+    mock_containers["correlation"].create_item.assert_called_once()
+    body = mock_containers["correlation"].create_item.call_args.kwargs["body"]
+    assert body["doc_type"] == "correlation_summary"
+    assert body["segments_seen"] == ["backend_api"]
+
+
+@pytest.mark.asyncio
+async def test_summary_update_retries_on_etag_conflict(
+    repo: SpineRepository, mock_containers: dict[str, AsyncMock]
+) -> None:
+    _, existing_row = build_event_documents(_corr_event("mobile_capture"))
+    existing = {**merge_correlation_summary(None, [existing_row]), "_etag": "e1"}
+    mock_containers["correlation"].read_item.side_effect = None
+    mock_containers["correlation"].read_item.return_value = existing
+    mock_containers["correlation"].replace_item.side_effect = [
+        CosmosAccessConditionFailedError(status_code=412, message="etag"),
+        None,
+    ]
+    _, row = build_event_documents(_corr_event("classifier"))
+    await repo.update_correlation_summaries([row])
+
+    assert mock_containers["correlation"].replace_item.call_count == 2
+    kwargs = mock_containers["correlation"].replace_item.call_args.kwargs
+    assert kwargs["etag"] == "e1"
+    assert kwargs["body"]["segments_seen"] == ["classifier", "mobile_capture"]
+    assert "_etag" not in kwargs["body"]
+
+
+@pytest.mark.asyncio
+async def test_get_correlation_path_splits_rows_and_summary(
+    repo: SpineRepository, mock_containers: dict[str, AsyncMock]
+) -> None:
+    _, row = build_event_documents(_corr_event("backend_api"))
+    summary = merge_correlation_summary(None, [row])
+
+    async def async_iter():
+        for item in [summary, row]:
+            yield item
+
+    mock_containers["correlation"].query_items = MagicMock(return_value=async_iter())
+    rows, found = await repo.get_correlation_path("capture", "trace-1")
+    assert rows == [row]
+    assert found == summary
+    kwargs = mock_containers["correlation"].query_items.call_args.kwargs
+    assert kwargs["partition_key"] == "capture"
+
+
+def _liveness_event(timestamp: str, instance_id: str = "host-a") -> IngestEvent:
+    return IngestEvent.model_validate(
+        {
+            "segment_id": "backend_api",
+            "event_type": "liveness",
+            "timestamp": timestamp,
+            "payload": {"instance_id": instance_id},
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_liveness_upserts_heartbeat_and_writes_sparse_history(
+    mock_containers: dict[str, AsyncMock],
+) -> None:
+    heartbeats = AsyncMock()
+    repo = SpineRepository(
+        events_container=mock_containers["events"],
+        segment_state_container=mock_containers["segment_state"],
+        status_history_container=mock_containers["status_history"],
+        correlation_container=mock_containers["correlation"],
+        heartbeats_container=heartbeats,
+    )
+    seen: list[dict] = []
+    repo.add_listener(seen.append)
+
+    await repo.record_event(_liveness_event("2026-04-14T12:00:00Z"))
+    await repo.record_event(_liveness_event("2026-04-14T12:00:30Z"))
+    await repo.record_event(_liveness_event("2026-04-14T12:00:10Z"))  # late
+    await repo.record_event(_liveness_event("2026-04-14T12:30:00Z"))  # returned
+
+    assert heartbeats.upsert_item.await_count == 3
+    body = heartbeats.upsert_item.await_args.kwargs["body"]
+    assert body["id"] == "host-a"
+    assert body["segment_id"] == "backend_api"
+    assert body["last_seen_ms"] == 1776169800000
+    # Only the first sighting and the return after a gap hit spine_events
+    assert mock_containers["events"].create_item.await_count == 2
+    assert len(seen) == 4
+
+
+@pytest.mark.asyncio
+async def test_record_event_batch_routes_liveness_to_heartbeats(
+    mock_containers: dict[str, AsyncMock],
+) -> None:
+    heartbeats = AsyncMock()
+    heartbeats.upsert_item.side_effect = [None, RuntimeError("throttled")]
+    repo = SpineRepository(
+        events_container=mock_containers["events"],
+        segment_state_container=mock_containers["segment_state"],
+        status_history_container=mock_containers["status_history"],
+        correlation_container=mock_containers["correlation"],
+        heartbeats_container=heartbeats,
+    )
+    outcomes = await repo.record_event_batch(
+        [
+            _liveness_event("2026-04-14T12:00:00Z", "host-a"),
+            _liveness_event("2026-04-14T12:00:00Z", "host-b"),
+            _corr_event("backend_api"),
+        ]
+    )
+
+    assert outcomes == ["written", "failed", "written"]
+    ops = mock_containers["events"].execute_item_batch.await_args.kwargs[
+        "batch_operations"
+    ]
+    assert [op[1][0]["event_type"] for op in ops] == ["liveness", "workload"]
+
+
+@pytest.mark.asyncio
+async def test_get_latest_heartbeat_reads_max_last_seen(
+    mock_containers: dict[str, AsyncMock], repo: SpineRepository
+) -> None:
+    assert await repo.get_latest_heartbeat("backend_api") is None
+
+    heartbeats = MagicMock()
+
+    async def _rows():
+        yield 1776169800000
+
+    heartbeats.query_items = MagicMock(return_value=_rows())
+    repo = SpineRepository(
+        events_container=mock_containers["events"],
+        segment_state_container=mock_containers["segment_state"],
+        status_history_container=mock_containers["status_history"],
+        correlation_container=mock_containers["correlation"],
+        heartbeats_container=heartbeats,
+    )
+    latest = await repo.get_latest_heartbeat("backend_api")
+
+    assert latest == datetime(2026, 4, 14, 12, 30, tzinfo=UTC)
+    assert heartbeats.query_items.call_args.kwargs["partition_key"] == "backend_api"
+
+
+def test_compact_encoding_round_trips_every_event_type() -> None:
+    readiness = IngestEvent.model_validate(
+        {
+            "segment_id": "backend_api",
+            "event_type": "readiness",
+            "timestamp": "2026-04-14T12:00:00.250Z",
+            "payload": {
+                "checks": [
+                    {"name": "cosmos", "status": "ok"},
+                    {"name": "foundry", "status": "failing", "detail": "timeout"},
+                ]
+            },
+        }
+    )
+    for event in (
+        _corr_event("backend_api", "failure"),
+        _liveness_event("2026-04-14T12:00:00Z"),
+        readiness,
+    ):
+        body, _ = build_event_documents(event)
+        compact = encode_event(body, {"POST /api/capture": 0})
+        assert set(compact) == {"id", "segment_id", "ts_ms", "v", "t", "p"}
+        decoded = decode_event(compact, {0: "POST /api/capture"})
+        legacy = {k: v for k, v in body.items() if k != "ingested_at"}
+        assert decoded == {**legacy, "timestamp": decoded["timestamp"]}
+        assert decoded["timestamp"].startswith(body["timestamp"][:23])
+    assert decode_event(body, {}) is body  # legacy rows pass through
+
+
+@pytest.mark.asyncio
+async def test_compact_writes_intern_operations_once_per_segment(
+    mock_containers: dict[str, AsyncMock],
+) -> None:
+    events = mock_containers["events"]
+    events.read_item.side_effect = CosmosResourceNotFoundError(
+        status_code=404, message="Not found"
+    )
+    repo = SpineRepository(
+        events_container=events,
+        segment_state_container=mock_containers["segment_state"],
+        status_history_container=mock_containers["status_history"],
+        correlation_container=mock_containers["correlation"],
+        compact_events=True,
+    )
+    seen: list[dict] = []
+    repo.add_listener(seen.append)
+
+    await repo.record_event_batch([_corr_event("backend_api")])
+    await repo.record_event_batch([_corr_event("backend_api", "degraded")])
+
+    dictionary = events.create_item.await_args.kwargs["body"]
+    assert events.create_item.await_count == 1
+    assert dictionary["operations"] == {"POST /api/capture": 0}
+    assert dictionary["doc_type"] == "operation_dictionary"
+    ops = events.execute_item_batch.await_args.kwargs["batch_operations"]
+    stored = ops[0][1][0]
+    assert stored["v"] == 2
+    assert stored["p"] == {
+        "o": 0,
+        "r": 2,
+        "d": 321,
+        "ck": "capture",
+        "ci": "trace-1",
+        "e": "HTTP_500",
+    }
+    assert [e["payload"]["operation"] for e in seen] == ["POST /api/capture"] * 2
+
+
+@pytest.mark.asyncio
+async def test_reads_decode_compact_rows_next_to_legacy_rows(
+    repo: SpineRepository, mock_containers: dict[str, AsyncMock]
+) -> None:
+    compact, _ = build_event_documents(_corr_event("backend_api"))
+    legacy = _workload_row("backend_api", "2026-04-14T11:00:00Z")
+
+    async def async_iter():
+        yield encode_event(compact, {"POST /api/capture": 7})
+        yield legacy
+
+    events = mock_containers["events"]
+    events.query_items = MagicMock(return_value=async_iter())
+    events.read_item.return_value = {"operations": {"POST /api/capture": 7}}
+    rows = await repo.get_recent_events("backend_api", window_seconds=300)
+
+    assert rows[0]["event_type"] == "workload"
+    assert rows[0]["payload"]["operation"] == "POST /api/capture"
+    assert rows[0]["payload"]["correlation_id"] == "trace-1"
+    assert rows[1] is legacy
+    events.read_item.assert_awaited_once()
@@ -0,0 +1,140 @@
+"""Tests for the status-history timeline (spans, downsampling, endpoint)."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from second_brain.spine.api import build_spine_router
+from second_brain.spine.registry import EvaluatorConfig, SegmentRegistry
+from second_brain.spine.storage import SpineRepository
+from second_brain.spine.timeline import build_intervals, downsample, time_in_status
+
+H = 3_600_000  # one hour in ms
+
+
+def _transition(ts_ms: int, status: str, prev: str | None) -> dict:
+    return {"segment_id": "seg1", "status": status, "prev_status": prev, "ts_ms": ts_ms}
+
+
+def test_intervals_start_from_prev_status_and_merge() -> None:
+    rows = [
+        _transition(2 * H, "red", "green"),
+        _transition(3 * H, "green", "red"),
+        _transition(5 * H, "green", "green"),  # no-op change merges away
+    ]
+    assert build_intervals(rows, "yellow", 0, 10 * H) == [
+        (0, 2 * H, "green"),
+        (2 * H, 3 * H, "red"),
+        (3 * H, 10 * H, "green"),
+    ]
+
+
+def test_no_transitions_uses_current_status_and_first_ever_has_no_data() -> None:
+    assert build_intervals([], "green", 0, H) == [(0, H, "green")]
+    assert build_intervals([], None, 0, H) == [(0, H, None)]
+    first = [_transition(H // 2, "green", None)]
+    assert build_intervals(first, "green", 0, H) == [
+        (0, H // 2, None),
+        (H // 2, H, "green"),
+    ]
+
+
+def test_downsample_keeps_short_outages_and_merges_equal_buckets() -> None:
+    intervals = [
+        (0, 2 * H + 60_000, "green"),
+        (2 * H + 60_000, 2 * H + 120_000, "red"),
+        (2 * H + 120_000, 6 * H, "green"),
+    ]
+    assert downsample(intervals, 0, 6 * H, H) == [
+        (0, 2 * H, "green"),
+        (2 * H, 3 * H, "red"),
+        (3 * H, 6 * H, "green"),
+    ]
+
+
+def test_time_in_status_excludes_no_data() -> None:
+    intervals = [(0, H, None), (H, 4 * H, "green"), (4 * H, 5 * H, "red")]
+    assert time_in_status(intervals) == {"green": 75.0, "red": 25.0}
+    assert time_in_status([(0, H, None)]) == {}
+
+
+@pytest.mark.asyncio
+async def test_get_status_transitions_projects_one_query() -> None:
+    history = MagicMock()
+
+    async def _rows():
+        yield _transition(H, "red", "green")
+
+    history.query_items = MagicMock(return_value=_rows())
+    repo = SpineRepository(AsyncMock(), AsyncMock(), history, AsyncMock())
+
+    rows = await repo.get_status_transitions(
+        datetime(2026, 4, 1, tzinfo=UTC), datetime(2026, 4, 2, tzinfo=UTC)
+    )
+
+    assert rows[0]["status"] == "red"
+    kwargs = history.query_items.call_args.kwargs
+    assert "c.prev_status" in kwargs["query"]
+    assert "SELECT *" not in kwargs["query"]
+    assert "partition_key" not in kwargs  # every segment in one query
+
+
+def _app(repo: AsyncMock) -> FastAPI:
+    app = FastAPI()
+
+    async def _no_auth() -> None:
+        return None
+
+    registry = SegmentRegistry(
+        [
+            EvaluatorConfig(
+                segment_id=sid, liveness_interval_seconds=30, host_segment=None
+            )
+            for sid in ("seg1", "seg2")
+        ]
+    )
+    app.include_router(
+        build_spine_router(
+            repo=repo,
+            evaluator=AsyncMock(),
+            adapter_registry=AsyncMock(),
+            segment_registry=registry,
+            auth_dependency=_no_auth,
+        )
+    )
+    return app
+
+
+@pytest.mark.asyncio
+async def test_timeline_endpoint_returns_spans_for_every_segment() -> None:
+    repo = AsyncMock()
+    repo.get_status_transitions.return_value = []
+    repo.get_all_segment_states.return_value = [
+        {"segment_id": "seg1", "status": "green"}
+    ]
+    transport = httpx.ASGITransport(app=_app(repo))
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+        resp = await c.get(
+            "/api/spine/timeline",
+            params={"window_seconds": 86400, "resolution_seconds": 3600},
+        )
+        too_fine = await c.get(
+            "/api/spine/timeline",
+            params={"window_seconds": 2592000, "resolution_seconds": 60},
+        )
+        unknown = await c.get("/api/spine/timeline", params={"segment_id": "nope"})
+
+    body = resp.json()
+    seg1, seg2 = body["segments"]
+    assert [s["status"] for s in seg1["spans"]] == ["green"]
+    assert seg1["time_in_status"] == {"green": 100.0}
+    assert [s["status"] for s in seg2["spans"]] == [None]
+    assert seg2["time_in_status"] == {}
+    repo.get_status_transitions.assert_awaited_once()
+    assert too_fine.status_code == 400
+    assert unknown.status_code == 404
@@ -0,0 +1,224 @@
+"""Tests for the spine write-behind writer and the batched repository write."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from azure.cosmos.exceptions import CosmosResourceNotFoundError
+
+from second_brain.spine.models import IngestEvent
+from second_brain.spine.storage import SpineRepository, build_event_documents
+from second_brain.spine.writer import SpineEventWriter
+
+
+def _workload(segment_id: str = "backend_api", cid: str | None = "trace-1"):
+    payload: dict = {
+        "operation": "POST /api/capture",
+        "outcome": "success",
+        "duration_ms": 12,
+    }
+    if cid:
+        payload["correlation_kind"] = "capture"
+        payload["correlation_id"] = cid
+    return IngestEvent.model_validate(
+        {
+            "segment_id": segment_id,
+            "event_type": "workload",
+            "timestamp": "2026-04-14T12:00:00Z",
+            "payload": payload,
+        }
+    )
+
+
+@pytest.fixture
+def containers() -> dict[str, AsyncMock]:
+    correlation = AsyncMock()
+    correlation.read_item.side_effect = CosmosResourceNotFoundError(
+        status_code=404, message="Not found"
+    )
+    return {
+        "events": AsyncMock(),
+        "segment_state": AsyncMock(),
+        "status_history": AsyncMock(),
+        "correlation": correlation,
+    }
+
+
+@pytest.fixture
+def repo(containers: dict[str, AsyncMock]) -> SpineRepository:
+    return SpineRepository(
+        events_container=containers["events"],
+        segment_state_container=containers["segment_state"],
+        status_history_container=containers["status_history"],
+        correlation_container=containers["correlation"],
+    )
+
+
+class _RecordingRepo:
+    """Stands in for SpineRepository.write_event_batch."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.batches: list[list] = []
+        self._fail = fail
+
+    async def write_event_batch(self, documents: list) -> int:
+        self.batches.append(list(documents))
+        if self._fail:
+            raise RuntimeError("cosmos down")
+        return 0
+
+
+# ---------------------------------------------------------------------------
+# SpineRepository.write_event_batch
+# ---------------------------------------------------------------------------
+
+
+async def test_write_event_batch_groups_by_partition(
+    repo: SpineRepository, containers: dict[str, AsyncMock]
+) -> None:
+    docs = [
+        build_event_documents(_workload("backend_api")),
+        build_event_documents(_workload("backend_api", cid=None)),
+        build_event_documents(_workload("classifier")),
+    ]
+    failed = await repo.write_event_batch(docs)
+
+    assert failed == 0
+    event_calls = containers["events"].execute_item_batch.call_args_list
+    assert sorted(c.kwargs["partition_key"] for c in event_calls) == [
+        "backend_api",
+        "classifier",
+    ]
+    by_pk = {c.kwargs["partition_key"]: c.kwargs for c in event_calls}
+    assert len(by_pk["backend_api"]["batch_operations"]) == 2
+    assert by_pk["backend_api"]["batch_operations"][0][0] == "create"
+
+    corr_calls = containers["correlation"].execute_item_batch.call_args_list
+    assert len(corr_calls) == 1
+    assert corr_calls[0].kwargs["partition_key"] == "capture"
+    ops = corr_calls[0].kwargs["batch_operations"]
+    assert [op for op, _ in ops] == ["upsert", "upsert"]
+    containers["events"].create_item.assert_not_called()
+
+
+async def test_write_event_batch_chunks_at_transactional_limit(
+    repo: SpineRepository, containers: dict[str, AsyncMock]
+) -> None:
+    docs = [build_event_documents(_workload(cid=None)) for _ in range(250)]
+    await repo.write_event_batch(docs)
+    sizes = [
+        len(c.kwargs["batch_operations"])
+        for c in containers["events"].execute_item_batch.call_args_list
+    ]
+    assert sorted(sizes) == [50, 100, 100]
+
+
+async def test_write_event_batch_reports_failed_partition(
+    repo: SpineRepository, containers: dict[str, AsyncMock]
+) -> None:
+    async def _batch(batch_operations, partition_key):
+        if partition_key == "classifier":
+            raise RuntimeError("429")
+        return []
+
+    containers["events"].execute_item_batch.side_effect = _batch
+    docs = [
+        build_event_documents(_workload("backend_api", cid=None)),
+        build_event_documents(_workload("classifier", cid=None)),
+        build_event_documents(_workload("classifier", cid=None)),
+    ]
+    assert await repo.write_event_batch(docs) == 2
+
+
+# ---------------------------------------------------------------------------
+# SpineEventWriter
+# ---------------------------------------------------------------------------
+
+
+async def test_record_event_enqueues_when_writer_attached(
+    repo: SpineRepository, containers: dict[str, AsyncMock]
+) -> None:
+    writer = SpineEventWriter(repo=repo, flush_interval_seconds=3600)
+    writer.start()
+    repo.attach_writer(writer)
+
+    await repo.record_event(_workload())
+
+    containers["events"].create_item.assert_not_called()
+    containers["correlation"].upsert_item.assert_not_called()
+    assert writer.queue_depth == 1
+
+    await writer.close()
+    assert writer.queue_depth == 0
+    assert writer.written == 1
+    containers["events"].execute_item_batch.assert_called_once()
+    containers["correlation"].execute_item_batch.assert_called_once()
+
+
+async def test_record_event_writes_inline_after_writer_closed(
+    repo: SpineRepository, containers: dict[str, AsyncMock]
+) -> None:
+    writer = SpineEventWriter(repo=repo)
+    writer.start()
+    repo.attach_writer(writer)
+    await writer.close()
+
+    await repo.record_event(_workload())
+    containers["events"].create_item.assert_called_once()
+    containers["correlation"].upsert_item.assert_called_once()
+
+
+async def test_full_queue_drops_oldest() -> None:
+    fake = _RecordingRepo()
+    writer = SpineEventWriter(
+        repo=fake,  # type: ignore[arg-type]
+        max_queue_size=2,
+        batch_size=10,
+        enqueue_timeout_seconds=0,
+    )
+    for i in range(3):
+        await writer.submit({"id": str(i), "segment_id": "s"}, None)
+
+    assert writer.dropped == 1
+    assert writer.stats()["queue_depth"] == 2
+    await writer.flush()
+    assert [e["id"] for e, _ in fake.batches[0]] == ["1", "2"]
+
+
+async def test_backpressure_lets_flusher_drain_before_dropping() -> None:
+    fake = _RecordingRepo()
+    writer = SpineEventWriter(
+        repo=fake,  # type: ignore[arg-type]
+        max_queue_size=2,
+        batch_size=10,
+        flush_interval_seconds=3600,
+        enqueue_timeout_seconds=1.0,
+    )
+    writer.start()
+    for i in range(3):
+        await writer.submit({"id": str(i), "segment_id": "s"}, None)
+
+    assert writer.dropped == 0
+    await writer.close()
+    flushed = [e["id"] for batch in fake.batches for e, _ in batch]
+    assert flushed == ["0", "1", "2"]
+
+
+async def test_flusher_batches_and_counts_failures() -> None:
+    fake = _RecordingRepo(fail=True)
+    writer = SpineEventWriter(
+        repo=fake,  # type: ignore[arg-type]
+        batch_size=2,
+        flush_interval_seconds=0.01,
+    )
+    writer.start()
+    for i in range(3):
+        await writer.submit({"id": str(i), "segment_id": "s"}, None)
+    await asyncio.sleep(0.05)
+    await writer.close()
+
+    assert [len(b) for b in fake.batches] == [2, 1]
+    assert writer.failed == 3
+    assert writer.written == 0
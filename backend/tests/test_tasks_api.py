@@ -48,12 +48,44 @@ def tasks_client(app_with_tasks: FastAPI) -> httpx.AsyncClient:
     return httpx.AsyncClient(transport=transport, base_url="http://test")
 
 
-def _mock_query_items(items: list[dict]):
-    """Create an async iterator mock for query_items."""
-    async def _aiter(*args, **kwargs):
-        for item in items:
+class _Pager:
+    """Stand-in for query_items(...).by_page(token): one page of items."""
+
+    def __init__(self, items: list[dict], next_token: str | None) -> None:
+        self._pages = [items]
+        self.continuation_token = next_token
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._pages:
+            raise StopAsyncIteration
+
+        async def _page():
+            for item in self._pages.pop():
+                yield item
+
+        return _page()
+
+
+class _Query:
+    """Stand-in for a query_items result: iterable, or one page via by_page."""
+
+    def __init__(self, items: list[dict], next_token: str | None = None) -> None:
+        self._items = items
+        self.by_page = MagicMock(return_value=_Pager(items, next_token))
+
+    async def __aiter__(self):
+        for item in self._items:
             yield item
-    return _aiter
+
+
+def _mock_query_items(items: list[dict], next_token: str | None = None):
+    """Create a query_items result (unpaged, or by_page yields one page)."""
+    def _query(*args, **kwargs):
+        return _Query(items, next_token)
+    return _query
 
 
 async def test_get_tasks_empty(
@@ -146,3 +178,100 @@ async def test_get_tasks_no_cosmos(tasks_client: httpx.AsyncClient) -> None:
         headers={"Authorization": f"Bearer {TEST_API_KEY}"},
     )
     assert res.status_code == 503
+
+
+async def test_get_tasks_snapshot_etag_and_invalidation(
+    app_with_tasks: FastAPI,
+    tasks_client: httpx.AsyncClient,
+) -> None:
+    """Repeat polls are served from the snapshot; a delete invalidates it."""
+    container = app_with_tasks.state.cosmos_manager.get_container("Tasks")
+    tasks = [{"id": "t1", "name": "Book eye appointments"}]
+    container.query_items = MagicMock(
+        side_effect=lambda **kwargs: _mock_query_items(list(tasks))()
+    )
+    headers = {"Authorization": f"Bearer {TEST_API_KEY}"}
+
+    first = await tasks_client.get("/api/tasks", headers=headers)
+    etag = first.headers["ETag"]
+    again = await tasks_client.get(
+        "/api/tasks", headers={**headers, "If-None-Match": etag}
+    )
+    assert again.status_code == 304
+    assert again.headers["ETag"] == etag
+    assert container.query_items.call_count == 1  # 304 without a Cosmos read
+
+    tasks.clear()
+    await tasks_client.delete("/api/tasks/t1", headers=headers)
+    after = await tasks_client.get(
+        "/api/tasks", headers={**headers, "If-None-Match": etag}
+    )
+    assert after.status_code == 200
+    assert after.json()["totalCount"] == 0
+    assert after.headers["ETag"] != etag
+    assert container.query_items.call_count == 2
+
+
+async def test_get_tasks_pages_with_cursor(
+    app_with_tasks: FastAPI,
+    tasks_client: httpx.AsyncClient,
+) -> None:
+    """GET /api/tasks returns an opaque nextCursor and resumes from it."""
+    container = app_with_tasks.state.cosmos_manager.get_container("Tasks")
+    tokens: list[str | None] = []
+
+    def _query(**kwargs):
+        if "COUNT(1)" in kwargs["query"]:
+            return _Query([2])
+        paged = MagicMock()
+
+        def _by_page(token=None):
+            tokens.append(token)
+            name = "Call mom" if token is None else "Pay rent"
+            return _Pager([{"id": name, "name": name}], None if token else "tok-1")
+
+        paged.by_page = _by_page
+        return paged
+
+    container.query_items = MagicMock(side_effect=_query)
+    headers = {"Authorization": f"Bearer {TEST_API_KEY}"}
+
+    first = await tasks_client.get("/api/tasks?limit=1", headers=headers)
+    cursor = first.json()["nextCursor"]
+    assert cursor and "tok-1" not in cursor
+    assert first.json()["totalCount"] == 2  # overall, not this page
+    second = await tasks_client.get(
+        "/api/tasks", params={"limit": 1, "cursor": cursor}, headers=headers
+    )
+    assert second.json()["tasks"][0]["name"] == "Pay rent"
+    assert second.json()["nextCursor"] is None
+    assert tokens == [None, "tok-1"]
+    paged_calls = [
+        c for c in container.query_items.call_args_list
+        if "max_item_count" in c.kwargs
+    ]
+    assert paged_calls[-1].kwargs["max_item_count"] == 1
+
+    bad = await tasks_client.get("/api/tasks?cursor=not-base64!", headers=headers)
+    assert bad.status_code == 400
+    too_big = await tasks_client.get("/api/tasks?limit=500", headers=headers)
+    assert too_big.status_code == 422
+
+
+async def test_get_tasks_without_paging_params_returns_every_task(
+    app_with_tasks: FastAPI,
+    tasks_client: httpx.AsyncClient,
+) -> None:
+    """Clients that never send limit/cursor still get the full list."""
+    container = app_with_tasks.state.cosmos_manager.get_container("Tasks")
+    tasks = [{"id": f"t{i}", "name": f"Task {i}"} for i in range(150)]
+    container.query_items = MagicMock(side_effect=_mock_query_items(tasks))
+
+    res = await tasks_client.get(
+        "/api/tasks", headers={"Authorization": f"Bearer {TEST_API_KEY}"}
+    )
+    data = res.json()
+    assert len(data["tasks"]) == 150
+    assert data["totalCount"] == 150
+    assert data["nextCursor"] is None
+    assert "max_item_count" not in container.query_items.call_args.kwargs
@@ -1,6 +1,6 @@
 #!/usr/bin/env bash
 #
-# Provision the 4 Cosmos SQL containers backing the spine observability layer.
+# Provision the Cosmos SQL containers backing the spine observability layer.
 #
 # This project does not have a checked-in Bicep/IaC pipeline for Cosmos;
 # container lifecycle is managed with az CLI. This script is the source of
@@ -43,6 +43,30 @@ az cosmosdb sql container create -g "$RG" -a "$ACCOUNT" -d "$DB" \
   --partition-key-path /correlation_kind \
   --ttl=2592000
 
+# 5. Workload rollups — minute/hour/day buckets, keyed on segment_id. The
+#    container default is "on, no expiry"; each bucket carries its own ttl
+#    (minute 2 days, hour 35 days, day never).
+az cosmosdb sql container create -g "$RG" -a "$ACCOUNT" -d "$DB" \
+  --name spine_rollups \
+  --partition-key-path /segment_id \
+  --ttl=-1
+
+# 6. Leader-election leases — one tiny doc per singleton loop, keyed on id.
+#    Each lease carries its own ttl (30s by default) so a crashed holder's
+#    lease disappears without a cleanup job.
+az cosmosdb sql container create -g "$RG" -a "$ACCOUNT" -d "$DB" \
+  --name spine_leases \
+  --partition-key-path /id \
+  --ttl=-1
+
+# 7. Liveness heartbeats — one doc per segment + instance, upserted in place
+#    with its last-seen time. 1-day retention so retired instances' docs
+#    (old revisions, scaled-in replicas) age out.
+az cosmosdb sql container create -g "$RG" -a "$ACCOUNT" -d "$DB" \
+  --name spine_heartbeats \
+  --partition-key-path /segment_id \
+  --ttl=86400
+
 echo "Done. Verifying..."
 az cosmosdb sql container list -g "$RG" -a "$ACCOUNT" -d "$DB" \
   --query "[?starts_with(name, 'spine_')].{name:name, partitionKey:resource.partitionKey.paths[0], ttl:resource.defaultTtl}" \
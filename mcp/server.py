@@ -8,9 +8,11 @@ IMPORTANT: All logging goes to stderr. Stdout is reserved for JSON-RPC
 messages (stdio transport protocol).
 """
 
+import json
 import logging
 import os
 import sys
+from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import timedelta
@@ -112,6 +114,28 @@ async def _spine_post(path: str, json_body: dict[str, Any]) -> dict[str, Any]:
         return resp.json()  # type: ignore[no-any-return]
 
 
+async def _spine_post_ndjson(
+    path: str,
+    json_body: dict[str, Any],
+    on_record: Callable[[dict[str, Any]], Awaitable[None]],
+) -> None:
+    """POST to a streaming spine endpoint; await on_record per NDJSON line."""
+    async with (
+        httpx.AsyncClient() as client,
+        client.stream(
+            "POST",
+            f"{SPINE_BASE_URL}{path}",
+            json={**json_body, "stream": "ndjson"},
+            headers={"Authorization": f"Bearer {_SPINE_API_KEY['value']}"},
+            timeout=httpx.Timeout(60.0, read=None),
+        ) as resp,
+    ):
+        resp.raise_for_status()
+        async for line in resp.aiter_lines():
+            if line:
+                await on_record(json.loads(line))
+
+
 def _time_range_to_seconds(time_range: str) -> int:
     """Convert a TIME_RANGE_MAP key to an integer number of seconds.
 
@@ -608,7 +632,9 @@ async def audit_correlation(
     metrics like throughput and latency) — this tool covers structural
     correctness of the spine's correlation records.
 
-    Returns per-trace verdicts plus an aggregate roll-up.
+    Returns per-trace verdicts plus an aggregate roll-up. Sampled audits
+    stream from the spine, so each trace verdict is reported as progress
+    as soon as it is ready.
 
     Args:
         correlation_kind: One of 'capture', 'thread', 'request', 'crud'.
@@ -628,12 +654,68 @@ async def audit_correlation(
         # None or empty-string → fall through to sample mode (intentional).
         if correlation_id:
             body["correlation_id"] = correlation_id
-        return await _spine_post("/api/spine/audit/correlation", body)
+            return await _spine_post("/api/spine/audit/correlation", body)
+
+        # Sample mode streams: report each trace verdict as progress while
+        # the rest of the sample is still being audited.
+        traces: list[dict[str, Any]] = []
+        report: dict[str, Any] = {}
+
+        async def _on_record(record: dict[str, Any]) -> None:
+            if record.get("record") == "trace":
+                trace = record["trace"]
+                traces.append(trace)
+                if ctx is not None:
+                    await ctx.report_progress(
+                        progress=len(traces),
+                        total=sample_size,
+                        message=f"{trace['correlation_id']}: {trace['verdict']}",
+                    )
+            else:
+                report.update(record)
+
+        await _spine_post_ndjson("/api/spine/audit/correlation", body, _on_record)
+        report.pop("record", None)
+        return {**report, "traces": traces}
     except Exception as exc:
         logger.error("audit_correlation failed: %s", exc, exc_info=True)
         return {"error": True, "message": str(exc), "type": type(exc).__name__}
 
 
+@mcp.tool()
+async def spine_analytics(
+    query: str,
+    days: int = 7,
+    segment_id: str | None = None,
+    limit: int = 50,
+    ctx: Context[ServerSession, AppContext] = None,
+) -> dict:
+    """Run an aggregate query over spine workload events (multi-day).
+
+    Use for questions like "slowest operations per segment last week" or
+    "failure rate by hour" — answered from the backend's embedded analytics
+    mirror without a Log Analytics round trip. Times are epoch ms.
+
+    Args:
+        query: One of 'slowest_operations' (count, avg/p95/max ms per
+            segment + operation), 'failure_rate_by_hour' (total, failures,
+            failure_rate per segment + hour), or 'top_errors' (failures per
+            segment + operation + error_class).
+        days: Look-back window in days (1-90).
+        segment_id: Restrict to one segment (e.g. 'backend_api'). Pass null
+            for all segments.
+        limit: Maximum rows returned (1-1000).
+    """
+    try:
+        params: dict[str, Any] = {"days": days, "limit": limit}
+        if segment_id:
+            params["segment_id"] = segment_id
+        return await _spine_call(f"/api/spine/analytics/{query}", params=params)
+    except Exception as exc:
+        logger.error("spine_analytics failed: %s", exc, exc_info=True)
+        return {"error": True, "message": str(exc), "type": type(exc).__name__}
+
+
 # ---------------------------------------------------------------------------
 # Entry point
 # ---------------------------------------------------------------------------
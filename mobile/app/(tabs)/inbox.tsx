@@ -32,6 +32,7 @@ export default function InboxScreen() {
   const [refreshing, setRefreshing] = useState(false);
   const [loadingMore, setLoadingMore] = useState(false);
   const [hasMore, setHasMore] = useState(true);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [selectedItem, setSelectedItem] = useState<InboxItemData | null>(null);
   const [isRecategorizing, setIsRecategorizing] = useState(false);
   const [recategorizeToast, setRecategorizeToast] = useState<string | null>(
@@ -45,11 +46,13 @@ export default function InboxScreen() {
   const navigation = useNavigation();
 
   const fetchInbox = useCallback(
-    async (offset = 0, append = false) => {
+    async (cursor: string | null = null, append = false) => {
       if (!API_KEY) return;
       try {
+        const params = new URLSearchParams({ limit: String(PAGE_SIZE) });
+        if (cursor) params.set("cursor", cursor);
         const res = await fetch(
-          `${API_BASE_URL}/api/inbox?limit=${PAGE_SIZE}&offset=${offset}`,
+          `${API_BASE_URL}/api/inbox?${params.toString()}`,
           {
             headers: { Authorization: `Bearer ${API_KEY}` },
           },
@@ -63,8 +66,11 @@ export default function InboxScreen() {
           });
           return;
         }
-        const data: { items: InboxItemData[]; count: number } =
-          await res.json();
+        const data: {
+          items: InboxItemData[];
+          count: number;
+          nextCursor?: string | null;
+        } = await res.json();
         if (append) {
           setItems((prev) => {
             const existingIds = new Set(prev.map((i) => i.id));
@@ -76,7 +82,8 @@ export default function InboxScreen() {
         } else {
           setItems(data.items);
         }
-        setHasMore(data.items.length === PAGE_SIZE);
+        setNextCursor(data.nextCursor ?? null);
+        setHasMore(data.nextCursor != null);
       } catch (err) {
         void reportError({
           eventType: "crud_failure",
@@ -112,16 +119,16 @@ export default function InboxScreen() {
 
   const handleRefresh = useCallback(async () => {
     setRefreshing(true);
-    await fetchInbox(0, false);
+    await fetchInbox(null, false);
     setRefreshing(false);
   }, [fetchInbox]);
 
   const handleLoadMore = useCallback(async () => {
     if (loadingMore || !hasMore) return;
     setLoadingMore(true);
-    await fetchInbox(items.length, true);
+    await fetchInbox(nextCursor, true);
     setLoadingMore(false);
-  }, [loadingMore, hasMore, items.length, fetchInbox]);
+  }, [loadingMore, hasMore, nextCursor, fetchInbox]);
 
   const handleDeleteItem = useCallback(
     (itemId: string) => {
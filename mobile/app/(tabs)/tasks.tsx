@@ -41,6 +41,19 @@ interface AdminNotification {
   message: string;
 }
 
+interface ErrandsResponse {
+  destinations: {
+    destination: string;
+    displayName: string;
+    type: string;
+    items: ErrandItem[];
+    count: number;
+  }[];
+  totalCount: number;
+  processingCount?: number;
+  adminNotifications?: AdminNotification[];
+}
+
 type SectionItem = ErrandItem | TaskItem;
 
 interface SectionData {
@@ -52,6 +65,71 @@ interface SectionData {
   destinationType?: "physical" | "online" | "unrouted";
 }
 
+/** A list response body and the ETag the backend served it with. */
+interface CachedListing<T> {
+  etag: string;
+  body: T;
+}
+
+interface ListingResult<T> {
+  status: number;
+  body: T | null;
+}
+
+/**
+ * GET a list endpoint with If-None-Match from `cache`. A 304 hands back the
+ * cached body, so sections are rebuilt from the last server state (which
+ * also undoes a failed optimistic delete); a 200 with an ETag replaces it.
+ */
+async function fetchListing<T>(
+  path: string,
+  cache: { current: CachedListing<T> | null },
+): Promise<ListingResult<T>> {
+  const headers: Record<string, string> = {
+    Authorization: `Bearer ${API_KEY}`,
+  };
+  if (cache.current) headers["If-None-Match"] = cache.current.etag;
+  const res = await fetch(`${API_BASE_URL}${path}`, { headers });
+  if (res.status === 304 && cache.current) {
+    return { status: 304, body: cache.current.body };
+  }
+  if (!res.ok) return { status: res.status, body: null };
+  const body: T = await res.json();
+  const etag = res.headers.get("ETag");
+  cache.current = etag ? { etag, body } : null;
+  return { status: res.status, body };
+}
+
+interface TasksPage {
+  tasks: TaskItem[];
+  nextCursor?: string | null;
+}
+
+/**
+ * Every task. GET /api/tasks without limit/cursor returns them all (and is
+ * the request that carries If-None-Match); any nextCursor is still followed,
+ * so a paged response is never truncated.
+ */
+async function fetchAllTasks(cache: {
+  current: CachedListing<TasksPage> | null;
+}): Promise<ListingResult<TaskItem[]>> {
+  const first = await fetchListing("/api/tasks", cache);
+  if (!first.body) return { status: first.status, body: null };
+  const tasks = [...first.body.tasks];
+  let cursor = first.body.nextCursor ?? null;
+  while (cursor) {
+    const res = await fetch(
+      `${API_BASE_URL}/api/tasks?cursor=${encodeURIComponent(cursor)}`,
+      { headers: { Authorization: `Bearer ${API_KEY}` } },
+    );
+    if (!res.ok) return { status: res.status, body: null };
+    const page: TasksPage = await res.json();
+    tasks.push(...page.tasks);
+    cursor = page.nextCursor ?? null;
+  }
+  return { status: first.status, body: tasks };
+}
+
 /**
  * Tasks screen displaying errands grouped by destination + general tasks.
  *
@@ -74,6 +152,8 @@ export default function TasksScreen() {
     AdminNotification[]
   >([]);
   const pollingRef = useRef<ReturnType<typeof setInterval> | null>(null);
+  const errandsCacheRef = useRef<CachedListing<ErrandsResponse> | null>(null);
+  const tasksCacheRef = useRef<CachedListing<TasksPage> | null>(null);
 
   const fetchData = useCallback(async () => {
     if (!API_KEY) {
@@ -82,29 +162,14 @@ export default function TasksScreen() {
     }
     try {
       const [errandsRes, tasksRes] = await Promise.all([
-        fetch(`${API_BASE_URL}/api/errands`, {
-          headers: { Authorization: `Bearer ${API_KEY}` },
-        }),
-        fetch(`${API_BASE_URL}/api/tasks`, {
-          headers: { Authorization: `Bearer ${API_KEY}` },
-        }),
+        fetchListing("/api/errands", errandsCacheRef),
+        fetchAllTasks(tasksCacheRef),
       ]);
 
       const allSections: SectionData[] = [];
 
-      if (errandsRes.ok) {
-        const errandsData: {
-          destinations: {
-            destination: string;
-            displayName: string;
-            type: string;
-            items: ErrandItem[];
-            count: number;
-          }[];
-          totalCount: number;
-          processingCount?: number;
-          adminNotifications?: AdminNotification[];
-        } = await errandsRes.json();
+      if (errandsRes.body) {
+        const errandsData = errandsRes.body;
 
         const errandSections: SectionData[] = errandsData.destinations.map(
           (s) => ({
@@ -137,18 +202,13 @@ export default function TasksScreen() {
         });
       }
 
-      if (tasksRes.ok) {
-        const tasksData: {
-          tasks: TaskItem[];
-          totalCount: number;
-        } = await tasksRes.json();
-
-        if (tasksData.tasks.length > 0) {
+      if (tasksRes.body) {
+        if (tasksRes.body.length > 0) {
           allSections.push({
             type: "task",
             title: "Tasks",
-            count: tasksData.totalCount,
-            data: tasksData.tasks,
+            count: tasksRes.body.length,
+            data: tasksRes.body,
             key: "tasks",
           });
         }